@@ -4,26 +4,51 @@ Endpoints:
   GET  /healthz       - liveness + index status
   GET  /sources       - list configured sources
   POST /ask           - retrieve + answer with citations
+  POST /ask/stream    - SSE: citations first, then answer tokens as generated
+
+Retrieval uses sync Cohere/Pinecone clients, so it runs in the threadpool;
+generation uses the answerer's long-lived async clients. Both stages are
+bounded by semaphores so a burst of questions queues instead of exhausting
+threads or provider rate limits.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
+from ..config import get_settings
 from ..rag.generation import Answerer
+from ..rag.rerank import RerankerName, RerankerUnavailable
 from ..rag.retrieval import RetrievalFilters, Retriever
+from ..rag.vectorstore import VectorHit
 from ..sources.models import AccessClass, EvidenceType
 from ..sources.registry import SOURCE_REGISTRY
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Autism Research RAG", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    if _answerer is not None:
+        await _answerer.aclose()
+
+
+app = FastAPI(title="Autism Research RAG", version="0.1.0", lifespan=lifespan)
 
 _retriever: Retriever | None = None
 _answerer: Answerer | None = None
+_retrieval_slots: asyncio.Semaphore | None = None
+_generation_slots: asyncio.Semaphore | None = None
 
 
 def get_retriever() -> Retriever:
@@ -40,6 +65,20 @@ def get_answerer() -> Answerer:
     return _answerer
 
 
+def get_retrieval_slots() -> asyncio.Semaphore:
+    global _retrieval_slots
+    if _retrieval_slots is None:
+        _retrieval_slots = asyncio.Semaphore(get_settings().api_max_concurrent_retrievals)
+    return _retrieval_slots
+
+
+def get_generation_slots() -> asyncio.Semaphore:
+    global _generation_slots
+    if _generation_slots is None:
+        _generation_slots = asyncio.Semaphore(get_settings().api_max_concurrent_generations)
+    return _generation_slots
+
+
 class AskRequest(BaseModel):
     question: str
     top_k: int | None = Field(default=None, ge=1, le=50)
@@ -49,6 +88,7 @@ class AskRequest(BaseModel):
     corpus: str | None = None
     min_year: int | None = None
     rerank: bool | None = None
+    reranker: RerankerName | None = None
 
 
 @app.get("/healthz")
@@ -77,8 +117,7 @@ def list_sources() -> list[dict]:
     ]
 
 
-@app.post("/ask")
-def ask(payload: AskRequest) -> dict:
+async def _retrieve(payload: AskRequest) -> list[VectorHit]:
     if not payload.question.strip():
         raise HTTPException(status_code=400, detail="question is required")
     filters = RetrievalFilters(
@@ -88,11 +127,53 @@ def ask(payload: AskRequest) -> dict:
         namespace_prefix=payload.corpus,
         min_year=payload.min_year,
     )
-    hits = get_retriever().search(
-        payload.question,
-        top_k=payload.top_k,
-        filters=filters,
-        rerank=payload.rerank,
-    )
-    response = get_answerer().answer(payload.question, hits)
+    retriever = get_retriever()
+    async with get_retrieval_slots():
+        try:
+            return await run_in_threadpool(
+                retriever.search,
+                payload.question,
+                top_k=payload.top_k,
+                filters=filters,
+                rerank=payload.rerank,
+                reranker=payload.reranker,
+            )
+        except RerankerUnavailable as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/ask")
+async def ask(payload: AskRequest) -> dict:
+    hits = await _retrieve(payload)
+    async with get_generation_slots():
+        response = await get_answerer().aanswer(payload.question, hits)
     return response.to_dict()
+
+
+@app.post("/ask/stream")
+async def ask_stream(payload: AskRequest) -> StreamingResponse:
+    hits = await _retrieve(payload)
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async with get_generation_slots():
+                async for event in get_answerer().astream(payload.question, hits):
+                    if event["type"] == "citations":
+                        event = {
+                            "type": "citations",
+                            "citations": [c.to_dict() for c in event["citations"]],
+                        }
+                    yield _sse(event)
+        except Exception as exc:  # pragma: no cover - stream already started
+            logger.exception("Streaming answer failed")
+            yield _sse({"type": "error", "message": str(exc)})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: dict) -> str:
+    return f"data: {json.dumps(event)}\n\n"
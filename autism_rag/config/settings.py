@@ -18,6 +18,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 RAW_DIR = DATA_DIR / "raw"
 PROCESSED_DIR = DATA_DIR / "processed"
+CACHE_DIR = DATA_DIR / "cache"
 
 
 class Settings(BaseSettings):
@@ -39,6 +40,12 @@ class Settings(BaseSettings):
 
     rerank_enabled: bool = Field(default=True)
     rerank_model: str = Field(default="rerank-english-v3.0")
+    reranker: Literal["cohere", "fusion", "cross_encoder"] = Field(default="cohere")
+    rerank_fusion_alpha: float = Field(default=0.5, ge=0.0, le=1.0)
+    cross_encoder_model_dir: str = Field(default="")
+    cross_encoder_batch_size: int = Field(default=16)
+    cross_encoder_max_length: int = Field(default=512)
+    cross_encoder_threads: int = Field(default=2)
 
     pinecone_api_key: str = Field(default="")
     pinecone_index: str = Field(default="autism-research-rag")
@@ -53,6 +60,15 @@ class Settings(BaseSettings):
     ncbi_tool: str = Field(default="autism_research_rag")
     ncbi_email: str = Field(default="")
 
+    chunk_strategy: Literal["tokens", "chars"] = Field(default="tokens")
+    # Optional HuggingFace tokenizer.json for exact token counts; without it
+    # the chunker uses a word-piece estimate.
+    chunk_tokenizer_path: str = Field(default="")
+
+    source_fetch_concurrency: int = Field(default=4, ge=1)
+    http_cache_enabled: bool = Field(default=True)
+    http_cache_ttl_seconds: float = Field(default=86400.0)
+
     openai_api_key: str = Field(default="")
     answer_model: str = Field(default="gpt-4o-mini")
     anthropic_api_key: str = Field(default="")
@@ -64,13 +80,23 @@ class Settings(BaseSettings):
 
     default_top_k: int = Field(default=8)
 
+    api_max_concurrent_retrievals: int = Field(default=8, ge=1)
+    api_max_concurrent_generations: int = Field(default=16, ge=1)
+
+    retrieval_cache_enabled: bool = Field(default=True)
+    retrieval_cache_ttl_seconds: float = Field(default=3600.0)
+    retrieval_cache_max_entries: int = Field(default=1024)
+    retrieval_cache_persist: bool = Field(default=False)
+
     project_root: Path = Field(default=PROJECT_ROOT)
     raw_dir: Path = Field(default=RAW_DIR)
     processed_dir: Path = Field(default=PROCESSED_DIR)
+    cache_dir: Path = Field(default=CACHE_DIR)
 
     def ensure_dirs(self) -> None:
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
 
 @lru_cache(maxsize=1)
@@ -7,6 +7,7 @@ from .guardrails import (
     SourceClassCheck,
     run_guardrails,
 )
+from .ranking import ndcg_at_k, weak_relevance
 
 __all__ = [
     "CitationCheck",
@@ -17,5 +18,7 @@ __all__ = [
     "RetrievalReport",
     "SafetyCheck",
     "SourceClassCheck",
+    "ndcg_at_k",
     "run_guardrails",
+    "weak_relevance",
 ]
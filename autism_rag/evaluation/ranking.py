@@ -0,0 +1,45 @@
+"""Ranking quality metrics for comparing rerankers.
+
+The starter eval set has no per-passage judgments, so relevance is graded
+weakly from what each :class:`EvalQuestion` already declares: a hit earns
+one point for an expected evidence type and one for containing every
+``must_include_terms`` entry.
+"""
+
+from __future__ import annotations
+
+import math
+
+from ..rag.vectorstore import VectorHit
+from .dataset import EvalQuestion
+
+
+def weak_relevance(hit: VectorHit, question: EvalQuestion) -> int:
+    grade = 0
+    expected = {et.value for et in question.expected_evidence_types}
+    if not expected or hit.metadata.get("evidence_type") in expected:
+        grade += 1
+    text = f"{hit.metadata.get('title', '')} {hit.text}".lower()
+    if question.must_include_terms and all(
+        term.lower() in text for term in question.must_include_terms
+    ):
+        grade += 1
+    return grade
+
+
+def dcg(relevances: list[float]) -> float:
+    return sum((2**rel - 1) / math.log2(rank + 2) for rank, rel in enumerate(relevances))
+
+
+def ndcg_at_k(relevances: list[float], k: int, *, pool: list[float] | None = None) -> float:
+    """nDCG@k of ``relevances`` (in ranked order).
+
+    ``pool`` is the full candidate set used to compute the ideal ordering;
+    it defaults to ``relevances`` itself.
+    """
+
+    ideal = sorted(pool if pool is not None else relevances, reverse=True)[:k]
+    ideal_dcg = dcg(ideal)
+    if ideal_dcg == 0:
+        return 0.0
+    return dcg(relevances[:k]) / ideal_dcg
@@ -1,4 +1,4 @@
-from .chunker import chunk_document
+from .chunker import Chunker, chunk_document, chunk_documents
 from .pipeline import IngestionPipeline, IngestionResult
 
-__all__ = ["IngestionPipeline", "IngestionResult", "chunk_document"]
+__all__ = ["Chunker", "IngestionPipeline", "IngestionResult", "chunk_document", "chunk_documents"]
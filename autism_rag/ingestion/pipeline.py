@@ -2,9 +2,11 @@
 
 Steps:
   1. Adapter -> normalized ``SourceDocument`` stream.
-  2. Chunker -> ``DocumentChunk`` per source document.
+  2. Chunker -> sentence-packed ``DocumentChunk`` list for the whole batch.
   3. Embedding provider -> dense vectors with ``input_type=search_document``.
-  4. Vector store -> upsert into the chunk's namespace.
+  4. Vector store -> delete each document's previous chunks, then upsert
+     into the chunk's namespace.
+  5. Index generation bump -> invalidates cached retrieval results.
 
 The pipeline writes the chunk text into Pinecone metadata so retrieval can
 return human-readable context without a secondary lookup.
@@ -20,14 +22,18 @@ from pathlib import Path
 from typing import Any
 
 from ..config import Settings, get_settings
+from ..rag.cache import IndexGeneration, get_index_generation
 from ..rag.embeddings import EmbeddingProvider, InputType, get_embedding_provider
 from ..rag.vectorstore import VectorRecord, VectorStore, get_vector_store
 from ..sources.adapters import BaseAdapter
 from ..sources.models import DocumentChunk, SourceDocument
-from .chunker import chunk_document
+from .chunker import Chunker
 
 logger = logging.getLogger(__name__)
 
+# Pinecone caps ``$in`` filters; delete stale chunks in batches of documents.
+DELETE_BATCH_SIZE = 1000
+
 
 @dataclass
 class IngestionResult:
@@ -36,6 +42,7 @@ class IngestionResult:
     chunks: int = 0
     upserts_by_namespace: dict[str, int] = field(default_factory=dict)
     sample_ids: list[str] = field(default_factory=list)
+    index_generation: int | None = None
 
 
 class IngestionPipeline:
@@ -45,10 +52,14 @@ class IngestionPipeline:
         embedder: EmbeddingProvider | None = None,
         vector_store: VectorStore | None = None,
         settings: Settings | None = None,
+        index_generation: IndexGeneration | None = None,
+        chunker: Chunker | None = None,
     ) -> None:
         self.settings = settings or get_settings()
         self.embedder = embedder or get_embedding_provider("cohere")
         self.vector_store = vector_store or get_vector_store("pinecone")
+        self.index_generation = index_generation or get_index_generation(self.settings)
+        self.chunker = chunker or Chunker.from_settings(self.settings)
 
     def prepare_index(self) -> None:
         self.vector_store.ensure_index(
@@ -79,9 +90,7 @@ class IngestionPipeline:
         if save_raw:
             _save_raw(self.settings.processed_dir / f"{adapter.source_key}-{_safe_slug(query)}.jsonl", docs)
 
-        chunks: list[DocumentChunk] = []
-        for doc in docs:
-            chunks.extend(chunk_document(doc))
+        chunks: list[DocumentChunk] = self.chunker.chunk_many(docs)
         result.chunks = len(chunks)
         if not chunks:
             return result
@@ -108,21 +117,36 @@ class IngestionPipeline:
             namespace = _target_namespace(chunk.namespace, clean_prefix)
             per_namespace.setdefault(namespace, []).append(record)
 
-        replaced_namespaces: set[str] = set()
         for namespace, records in per_namespace.items():
-            if replace_source and namespace not in replaced_namespaces:
+            if replace_source:
                 self.vector_store.delete(
                     namespace=namespace,
                     metadata_filter={"source_key": {"$eq": adapter.source_key}},
                 )
-                replaced_namespaces.add(namespace)
+            else:
+                # A re-chunked document can end up with fewer chunks than
+                # before; drop its old ``#chunk-N`` vectors so none linger.
+                self._delete_documents(namespace, adapter.source_key, records)
             self.vector_store.upsert(records, namespace=namespace)
             result.upserts_by_namespace[namespace] = (
                 result.upserts_by_namespace.get(namespace, 0) + len(records)
             )
             result.sample_ids.extend(r.id for r in records[:3])
+        if per_namespace:
+            result.index_generation = self.index_generation.bump()
         return result
 
+    def _delete_documents(self, namespace: str, source_key: str, records: list[VectorRecord]) -> None:
+        source_ids = sorted({str(r.metadata["source_id"]) for r in records})
+        for start in range(0, len(source_ids), DELETE_BATCH_SIZE):
+            self.vector_store.delete(
+                namespace=namespace,
+                metadata_filter={
+                    "source_key": {"$eq": source_key},
+                    "source_id": {"$in": source_ids[start : start + DELETE_BATCH_SIZE]},
+                },
+            )
+
 
 def _safe_slug(value: str) -> str:
     return "".join(c if c.isalnum() else "_" for c in value[:60]).strip("_") or "all"
@@ -0,0 +1,267 @@
+"""Layered retrieval cache.
+
+Repeat questions from the Django proxy and the evaluation harness should not
+pay for a Cohere embed, a Pinecone query, and a Cohere rerank every time.
+Two layers sit in front of those calls:
+
+  - query -> vector, keyed by embedding model and normalized query text
+  - (query, filters, top_k, rerank) -> hits, keyed additionally by the
+    index generation so any ingestion run invalidates stale result sets
+
+Each layer is a size-bounded LRU with a TTL, optionally backed by a small
+SQLite file so warm entries survive process restarts. The index generation
+is a counter on disk that :class:`~autism_rag.ingestion.IngestionPipeline`
+bumps after every upsert/delete.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from ..config import Settings, get_settings
+from .vectorstore import VectorHit
+
+logger = logging.getLogger(__name__)
+
+GENERATION_FILENAME = "index_generation"
+DISK_CACHE_FILENAME = "retrieval_cache.sqlite3"
+
+
+class IndexGeneration:
+    """Monotonic counter persisted next to the cache.
+
+    Readers only need a cheap file read per query; writers replace the file
+    atomically so a concurrent reader never sees a partial value.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def current(self) -> int:
+        try:
+            return int(self.path.read_text(encoding="utf-8").strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def bump(self) -> int:
+        with self._lock:
+            value = self.current() + 1
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".generation-")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(str(value))
+            os.replace(tmp_name, self.path)
+            return value
+
+
+def get_index_generation(settings: Settings | None = None) -> IndexGeneration:
+    settings = settings or get_settings()
+    return IndexGeneration(settings.cache_dir / GENERATION_FILENAME)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl_seconds``.
+
+    Values must be JSON-serializable when a ``disk`` store is attached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        name: str = "default",
+        disk: DiskStore | None = None,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+        if self.disk is not None:
+            stored = self.disk.get(self.name, key, now=now)
+            if stored is not None:
+                expires_at, value = stored
+                self._remember(key, value, expires_at)
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        self._remember(key, value, expires_at)
+        if self.disk is not None:
+            self.disk.set(self.name, key, value, expires_at=expires_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk is not None:
+            self.disk.clear(self.name)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskStore:
+    """SQLite-backed persistence shared by every :class:`TTLCache` layer."""
+
+    def __init__(self, path: Path, *, max_entries: int = 10_000) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " layer TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " PRIMARY KEY (layer, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires_at)")
+        self._conn.commit()
+
+    def get(self, layer: str, key: str, *, now: float) -> tuple[float, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE layer = ? AND key = ?",
+                (layer, key),
+            ).fetchone()
+        if row is None or row[1] <= now:
+            return None
+        return row[1], json.loads(row[0])
+
+    def set(self, layer: str, key: str, value: Any, *, expires_at: float) -> None:
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (layer, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (layer, key, payload, expires_at),
+            )
+            self._prune()
+            self._conn.commit()
+
+    def clear(self, layer: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE layer = ?", (layer,))
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE rowid IN ("
+                " SELECT rowid FROM cache ORDER BY expires_at LIMIT ?)",
+                (overflow,),
+            )
+
+
+class RetrievalCache:
+    """Query-vector and result-set caches used by :class:`Retriever`."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        generation: IndexGeneration | None = None,
+        disk_path: Path | None = None,
+    ) -> None:
+        disk = DiskStore(disk_path, max_entries=max_entries * 2) if disk_path else None
+        self.vectors = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds, name="vectors", disk=disk
+        )
+        self.results = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds, name="results", disk=disk
+        )
+        self.generation = generation
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RetrievalCache:
+        disk_path = (
+            settings.cache_dir / DISK_CACHE_FILENAME
+            if settings.retrieval_cache_persist
+            else None
+        )
+        return cls(
+            max_entries=settings.retrieval_cache_max_entries,
+            ttl_seconds=settings.retrieval_cache_ttl_seconds,
+            generation=get_index_generation(settings),
+            disk_path=disk_path,
+        )
+
+    def get_vector(self, *, model: str, query: str) -> list[float] | None:
+        return self.vectors.get(_digest({"model": model, "query": normalize_query(query)}))
+
+    def set_vector(self, *, model: str, query: str, vector: list[float]) -> None:
+        self.vectors.set(_digest({"model": model, "query": normalize_query(query)}), list(vector))
+
+    def get_hits(self, key: dict[str, Any]) -> list[VectorHit] | None:
+        cached = self.results.get(self._results_key(key))
+        if cached is None:
+            return None
+        # Fresh models per call: rerank and callers mutate hit scores.
+        return [VectorHit.model_validate(item) for item in cached]
+
+    def set_hits(self, key: dict[str, Any], hits: list[VectorHit]) -> None:
+        self.results.set(
+            self._results_key(key),
+            [hit.model_dump(mode="json") for hit in hits],
+        )
+
+    def clear(self) -> None:
+        self.vectors.clear()
+        self.results.clear()
+
+    def _results_key(self, key: dict[str, Any]) -> str:
+        generation = self.generation.current() if self.generation else 0
+        return _digest({"generation": generation, **key, "query": normalize_query(key["query"])})
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split())
+
+
+def _digest(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
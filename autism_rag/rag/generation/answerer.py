@@ -9,11 +9,16 @@ We prompt the model to:
 The model is configurable. When no answer model is reachable (e.g., no
 ``OPENAI_API_KEY``), the answerer falls back to a deterministic extractive
 summary so retrieval can still be inspected end-to-end.
+
+Provider clients are created once per :class:`Answerer` and reused; the
+async clients back :meth:`Answerer.astream`, which yields citations first
+and then answer tokens as the model generates them.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -130,25 +135,90 @@ def build_context(hits: list[VectorHit]) -> tuple[str, list[Citation]]:
 class Answerer:
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
+        self._clients: dict[str, Any] = {}
 
     def answer(self, question: str, hits: list[VectorHit]) -> AnswerResponse:
         context, citations = build_context(hits)
         if not citations:
-            return AnswerResponse(
-                answer=(
-                    "No supporting passages were retrieved. Try a different query "
-                    "or widen the source/access filters."
-                ),
-                citations=[],
-                used_model="none",
-                retrieval=hits,
-            )
+            return _no_passages_response(hits)
         if self.settings.anthropic_api_key or self.settings.anthropic_bedrock_enabled:
             return self._answer_with_anthropic(question, context, citations, hits)
         if self.settings.openai_api_key:
             return self._answer_with_openai(question, context, citations, hits)
         return self._extractive_fallback(question, citations, hits)
 
+    async def aanswer(self, question: str, hits: list[VectorHit]) -> AnswerResponse:
+        """Async counterpart of :meth:`answer` built on :meth:`astream`."""
+
+        parts: list[str] = []
+        citations: list[Citation] = []
+        model = "none"
+        async for event in self.astream(question, hits):
+            if event["type"] == "citations":
+                citations = event["citations"]
+            elif event["type"] == "chunk":
+                parts.append(event["content"])
+            elif event["type"] == "done":
+                model = event["model"]
+        return AnswerResponse(
+            answer="".join(parts).strip(),
+            citations=citations,
+            used_model=model,
+            retrieval=hits,
+        )
+
+    async def astream(self, question: str, hits: list[VectorHit]) -> AsyncIterator[dict[str, Any]]:
+        """Yield ``citations``, then ``chunk`` events, then a final ``done``.
+
+        ``citations`` carries :class:`Citation` objects; callers serialize
+        them with :meth:`Citation.to_dict`.
+        """
+
+        context, citations = build_context(hits)
+        yield {"type": "citations", "citations": citations}
+        if not citations:
+            response = _no_passages_response(hits)
+            yield {"type": "chunk", "content": response.answer}
+            yield {"type": "done", "model": response.used_model}
+            return
+
+        streams = []
+        if self.settings.anthropic_api_key or self.settings.anthropic_bedrock_enabled:
+            streams.append((self._anthropic_model(), self._stream_anthropic))
+        if self.settings.openai_api_key:
+            streams.append((self.settings.answer_model, self._stream_openai))
+        for model, stream in streams:
+            emitted = False
+            try:
+                async for text in stream(question, context):
+                    emitted = True
+                    yield {"type": "chunk", "content": text}
+                yield {"type": "done", "model": model}
+                return
+            except Exception as exc:  # pragma: no cover - external service guard
+                logger.warning("Streaming generation failed (%s); falling back.", exc)
+                if emitted:
+                    yield {
+                        "type": "chunk",
+                        "content": (
+                            "\n\n**Note:** The streaming connection was interrupted, "
+                            "so this answer may be incomplete."
+                        ),
+                    }
+                    yield {"type": "done", "model": model}
+                    return
+        response = self._extractive_fallback(question, citations, hits)
+        yield {"type": "chunk", "content": response.answer}
+        yield {"type": "done", "model": response.used_model}
+
+    async def aclose(self) -> None:
+        """Close long-lived async HTTP clients (call on app shutdown)."""
+
+        for key in ("anthropic_async", "openai_async"):
+            client = self._clients.pop(key, None)
+            if client is not None:
+                await client.close()
+
     def _build_user_prompt(self, question: str, context: str) -> str:
         return (
             "Question:\n"
@@ -165,6 +235,67 @@ class Answerer:
             "chat bubble, so keep structure compact."
         )
 
+    def _anthropic_model(self) -> str:
+        if self.settings.anthropic_api_key:
+            return self.settings.anthropic_answer_model
+        return self.settings.anthropic_bedrock_model
+
+    def _anthropic_client(self, *, asynchronous: bool = False) -> Any:
+        key = "anthropic_async" if asynchronous else "anthropic"
+        if key not in self._clients:
+            import anthropic  # noqa: WPS433
+
+            if self.settings.anthropic_api_key:
+                factory = anthropic.AsyncAnthropic if asynchronous else anthropic.Anthropic
+                self._clients[key] = factory(api_key=self.settings.anthropic_api_key)
+            else:
+                factory = (
+                    anthropic.AsyncAnthropicBedrock if asynchronous else anthropic.AnthropicBedrock
+                )
+                self._clients[key] = factory(aws_region=self.settings.aws_region)
+        return self._clients[key]
+
+    def _openai_client(self, *, asynchronous: bool = False) -> Any:
+        key = "openai_async" if asynchronous else "openai"
+        if key not in self._clients:
+            import openai  # noqa: WPS433
+
+            factory = openai.AsyncOpenAI if asynchronous else openai.OpenAI
+            self._clients[key] = factory(api_key=self.settings.openai_api_key)
+        return self._clients[key]
+
+    async def _stream_anthropic(self, question: str, context: str) -> AsyncIterator[str]:
+        client = self._anthropic_client(asynchronous=True)
+        async with client.messages.stream(
+            model=self._anthropic_model(),
+            max_tokens=4096,
+            system=SYSTEM_PROMPT,
+            messages=[
+                {"role": "user", "content": self._build_user_prompt(question, context)},
+            ],
+        ) as stream:
+            async for text in stream.text_stream:
+                if text:
+                    yield text
+
+    async def _stream_openai(self, question: str, context: str) -> AsyncIterator[str]:
+        client = self._openai_client(asynchronous=True)
+        stream = await client.chat.completions.create(
+            model=self.settings.answer_model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_user_prompt(question, context)},
+            ],
+            temperature=0.1,
+            stream=True,
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if text:
+                yield text
+
     def _answer_with_anthropic(
         self,
         question: str,
@@ -173,18 +304,8 @@ class Answerer:
         hits: list[VectorHit],
     ) -> AnswerResponse:
         try:
-            if self.settings.anthropic_api_key:
-                from anthropic import Anthropic  # noqa: WPS433
-
-                client = Anthropic(api_key=self.settings.anthropic_api_key)
-                model = self.settings.anthropic_answer_model
-            else:
-                from anthropic import AnthropicBedrock  # noqa: WPS433
-
-                client = AnthropicBedrock(aws_region=self.settings.aws_region)
-                model = self.settings.anthropic_bedrock_model
-
-            response = client.messages.create(
+            model = self._anthropic_model()
+            response = self._anthropic_client().messages.create(
                 model=model,
                 max_tokens=4096,
                 system=SYSTEM_PROMPT,
@@ -215,11 +336,8 @@ class Answerer:
         hits: list[VectorHit],
     ) -> AnswerResponse:
         try:
-            from openai import OpenAI  # noqa: WPS433
-
-            client = OpenAI(api_key=self.settings.openai_api_key)
             user_prompt = self._build_user_prompt(question, context)
-            response = client.chat.completions.create(
+            response = self._openai_client().chat.completions.create(
                 model=self.settings.answer_model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
@@ -261,3 +379,15 @@ class Answerer:
             used_model="extractive-fallback",
             retrieval=hits,
         )
+
+
+def _no_passages_response(hits: list[VectorHit]) -> AnswerResponse:
+    return AnswerResponse(
+        answer=(
+            "No supporting passages were retrieved. Try a different query "
+            "or widen the source/access filters."
+        ),
+        citations=[],
+        used_model="none",
+        retrieval=hits,
+    )
@@ -0,0 +1,17 @@
+from .base import RERANKER_NAMES, Reranker, RerankError, RerankerName, RerankerUnavailable
+from .cohere import CohereReranker
+from .cross_encoder import OnnxCrossEncoderReranker
+from .factory import get_reranker
+from .fusion import FusionReranker
+
+__all__ = [
+    "CohereReranker",
+    "FusionReranker",
+    "OnnxCrossEncoderReranker",
+    "RERANKER_NAMES",
+    "RerankError",
+    "Reranker",
+    "RerankerName",
+    "RerankerUnavailable",
+    "get_reranker",
+]
@@ -0,0 +1,32 @@
+"""Reranker interface.
+
+Retrieval over-fetches candidates from Pinecone and hands them to a
+reranker. Keeping the interface this small lets the API pick a remote
+(Cohere) or local CPU implementation per request.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Literal, get_args
+
+from ..vectorstore import VectorHit
+
+RerankerName = Literal["cohere", "fusion", "cross_encoder"]
+RERANKER_NAMES: tuple[str, ...] = get_args(RerankerName)
+
+
+class RerankError(RuntimeError):
+    """The reranker could not score the hits (e.g. the remote call failed)."""
+
+
+class RerankerUnavailable(ValueError):
+    """The requested reranker is not configured on this deployment."""
+
+
+class Reranker(ABC):
+    name: str = ""
+
+    @abstractmethod
+    def rerank(self, query: str, hits: list[VectorHit], *, top_n: int) -> list[VectorHit]:
+        """Return ``hits`` reordered (and possibly truncated) by relevance."""
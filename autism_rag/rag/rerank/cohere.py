@@ -0,0 +1,48 @@
+"""Remote Cohere rerank."""
+
+from __future__ import annotations
+
+import logging
+from importlib import import_module
+
+from ...config import Settings, get_settings
+from ..vectorstore import VectorHit
+from .base import RerankError, Reranker
+
+logger = logging.getLogger(__name__)
+
+
+class CohereReranker(Reranker):
+    name = "cohere"
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        self.settings = settings or get_settings()
+        self._model = self.settings.rerank_model
+        self._client = None
+        if self.settings.cohere_api_key:
+            # One long-lived client so repeated queries reuse its HTTP pool.
+            cohere = import_module("cohere")
+            self._client = cohere.ClientV2(api_key=self.settings.cohere_api_key)
+
+    def rerank(self, query: str, hits: list[VectorHit], *, top_n: int) -> list[VectorHit]:
+        if self._client is None:
+            logger.info("Rerank disabled: no Cohere API key.")
+            return hits
+        documents = [hit.text or hit.metadata.get("title", "") for hit in hits]
+        try:
+            response = self._client.rerank(
+                model=self._model,
+                query=query,
+                documents=documents,
+                top_n=min(top_n, len(documents)),
+            )
+        except Exception as exc:  # pragma: no cover - external service guard
+            raise RerankError(f"Cohere rerank failed: {exc}") from exc
+        ordered: list[VectorHit] = []
+        for result in response.results:
+            index = result.index
+            if 0 <= index < len(hits):
+                hit = hits[index]
+                hit.score = float(getattr(result, "relevance_score", hit.score))
+                ordered.append(hit)
+        return ordered
@@ -0,0 +1,78 @@
+"""Optional local ONNX cross-encoder reranker.
+
+Point ``CROSS_ENCODER_MODEL_DIR`` at an exported MS MARCO-style
+cross-encoder (for example ``cross-encoder/ms-marco-MiniLM-L-6-v2``) that
+contains ``model.onnx`` and ``tokenizer.json``. Pairs are scored in batches
+on CPU; ``onnxruntime`` and ``tokenizers`` are imported lazily so the rest
+of the package does not depend on them.
+"""
+
+from __future__ import annotations
+
+import logging
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+from ...config import Settings, get_settings
+from ..vectorstore import VectorHit
+from .base import Reranker, RerankerUnavailable
+
+logger = logging.getLogger(__name__)
+
+
+class OnnxCrossEncoderReranker(Reranker):
+    name = "cross_encoder"
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        self.settings = settings or get_settings()
+        model_dir = Path(self.settings.cross_encoder_model_dir) if self.settings.cross_encoder_model_dir else None
+        if model_dir is None or not (model_dir / "model.onnx").exists():
+            raise RerankerUnavailable(
+                "CROSS_ENCODER_MODEL_DIR must point at a directory containing model.onnx "
+                "and tokenizer.json."
+            )
+        ort: Any = import_module("onnxruntime")
+        tokenizers: Any = import_module("tokenizers")
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = max(1, self.settings.cross_encoder_threads)
+        self._session = ort.InferenceSession(
+            str(model_dir / "model.onnx"),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+        self._tokenizer = tokenizers.Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=self.settings.cross_encoder_max_length)
+        self._tokenizer.enable_padding()
+        self._batch_size = max(1, self.settings.cross_encoder_batch_size)
+
+    def rerank(self, query: str, hits: list[VectorHit], *, top_n: int) -> list[VectorHit]:
+        if not hits:
+            return hits
+        documents = [hit.text or hit.metadata.get("title", "") for hit in hits]
+        scores: list[float] = []
+        for start in range(0, len(documents), self._batch_size):
+            batch = documents[start : start + self._batch_size]
+            scores.extend(self._score_batch(query, batch))
+        order = sorted(range(len(hits)), key=lambda i: scores[i], reverse=True)
+        ordered: list[VectorHit] = []
+        for index in order[:top_n]:
+            hit = hits[index]
+            hit.score = scores[index]
+            ordered.append(hit)
+        return ordered
+
+    def _score_batch(self, query: str, documents: list[str]) -> list[float]:
+        np: Any = import_module("numpy")
+        encodings = self._tokenizer.encode_batch([(query, doc) for doc in documents])
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        feeds = {name: value for name, value in feeds.items() if name in self._input_names}
+        logits = np.asarray(self._session.run(None, feeds)[0])
+        if logits.ndim == 2:
+            logits = logits[:, -1]
+        return [float(v) for v in logits]
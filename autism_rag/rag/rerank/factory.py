@@ -0,0 +1,23 @@
+"""Reranker factory."""
+
+from __future__ import annotations
+
+from ...config import Settings, get_settings
+from .base import Reranker
+from .cohere import CohereReranker
+from .cross_encoder import OnnxCrossEncoderReranker
+from .fusion import FusionReranker
+
+
+def get_reranker(name: str = "cohere", *, settings: Settings | None = None) -> Reranker:
+    settings = settings or get_settings()
+    if name == "cohere":
+        return CohereReranker(settings=settings)
+    if name == "fusion":
+        return FusionReranker(settings=settings)
+    if name == "cross_encoder":
+        return OnnxCrossEncoderReranker(settings=settings)
+    raise ValueError(
+        f"Unknown reranker {name!r}. "
+        "Add a new Reranker subclass and register it here."
+    )
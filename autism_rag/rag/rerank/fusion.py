@@ -0,0 +1,96 @@
+"""Local BM25 + vector-score fusion reranker.
+
+Runs entirely on CPU with no model download. BM25 statistics are computed
+over the over-fetched candidate set, which is small (top_k * 3), so the
+whole rerank is a few hundred microseconds per query.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+from ...config import Settings, get_settings
+from ..vectorstore import VectorHit
+from .base import Reranker
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by does for from how in is it of on or such that the "
+    "their there these this to was what when which who why with".split()
+)
+
+
+class FusionReranker(Reranker):
+    name = "fusion"
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        *,
+        alpha: float | None = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self.alpha = self.settings.rerank_fusion_alpha if alpha is None else alpha
+        self.k1 = k1
+        self.b = b
+
+    def rerank(self, query: str, hits: list[VectorHit], *, top_n: int) -> list[VectorHit]:
+        if not hits:
+            return hits
+        lexical = _min_max(self._bm25_scores(query, hits))
+        dense = _min_max([hit.score for hit in hits])
+        fused = [
+            self.alpha * lex + (1.0 - self.alpha) * vec
+            for lex, vec in zip(lexical, dense, strict=True)
+        ]
+        order = sorted(range(len(hits)), key=lambda i: fused[i], reverse=True)
+        ordered: list[VectorHit] = []
+        for index in order[:top_n]:
+            hit = hits[index]
+            hit.score = fused[index]
+            ordered.append(hit)
+        return ordered
+
+    def _bm25_scores(self, query: str, hits: list[VectorHit]) -> list[float]:
+        query_terms = set(tokenize(query))
+        if not query_terms:
+            return [0.0] * len(hits)
+        docs = [Counter(tokenize(_hit_text(hit))) for hit in hits]
+        lengths = [sum(doc.values()) for doc in docs]
+        avg_length = (sum(lengths) / len(lengths)) or 1.0
+        n_docs = len(docs)
+        idf = {
+            term: math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for term in query_terms
+            for df in [sum(1 for doc in docs if term in doc)]
+        }
+        scores: list[float] = []
+        for doc, length in zip(docs, lengths, strict=True):
+            score = 0.0
+            norm = self.k1 * (1.0 - self.b + self.b * length / avg_length)
+            for term in query_terms:
+                tf = doc.get(term, 0)
+                if tf:
+                    score += idf[term] * tf * (self.k1 + 1.0) / (tf + norm)
+            scores.append(score)
+        return scores
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _hit_text(hit: VectorHit) -> str:
+    title = hit.metadata.get("title", "")
+    return f"{title} {hit.text}" if title else hit.text
+
+
+def _min_max(values: list[float]) -> list[float]:
+    low, high = min(values), max(values)
+    if high - low <= 1e-12:
+        return [1.0 if high > 0 else 0.0 for _ in values]
+    return [(v - low) / (high - low) for v in values]
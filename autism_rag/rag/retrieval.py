@@ -1,20 +1,24 @@
 """Retrieval orchestration.
 
 Embeds the query with ``input_type=search_query``, searches Pinecone with
-metadata filters, optionally reranks with Cohere, and returns hits ready
-for citation.
+metadata filters, optionally reranks (Cohere, or a local CPU reranker from
+:mod:`autism_rag.rag.rerank`), and returns hits ready
+for citation. Query vectors and final hit lists are served from
+:class:`~autism_rag.rag.cache.RetrievalCache` when available.
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from ..config import Settings, get_settings
 from ..sources.models import AccessClass, EvidenceType
 from ..sources.registry import SOURCE_REGISTRY
+from .cache import RetrievalCache
 from .embeddings import EmbeddingProvider, InputType, get_embedding_provider
+from .rerank import Reranker, RerankError, get_reranker
 from .vectorstore import VectorHit, VectorStore, get_vector_store
 
 logger = logging.getLogger(__name__)
@@ -38,6 +42,9 @@ class RetrievalFilters:
             terms["published_year"] = {"$gte": self.min_year}
         return terms or None
 
+    def cache_key(self) -> dict[str, Any]:
+        return asdict(self)
+
 
 class Retriever:
     def __init__(
@@ -46,10 +53,15 @@ class Retriever:
         embedder: EmbeddingProvider | None = None,
         vector_store: VectorStore | None = None,
         settings: Settings | None = None,
+        cache: RetrievalCache | None = None,
     ) -> None:
         self.settings = settings or get_settings()
         self.embedder = embedder or get_embedding_provider("cohere")
         self.vector_store = vector_store or get_vector_store("pinecone")
+        if cache is None and self.settings.retrieval_cache_enabled:
+            cache = RetrievalCache.from_settings(self.settings)
+        self.cache = cache
+        self._rerankers: dict[str, Reranker] = {}
 
     def search(
         self,
@@ -58,12 +70,48 @@ class Retriever:
         top_k: int | None = None,
         filters: RetrievalFilters | None = None,
         rerank: bool | None = None,
+        reranker: str | None = None,
+        use_cache: bool = True,
     ) -> list[VectorHit]:
         top_k = top_k or self.settings.default_top_k
         filters = filters or RetrievalFilters(
             access_classes=[AccessClass.PUBLIC_OPEN, AccessClass.PUBLIC_METADATA_ONLY]
         )
-        vector = self.embedder.embed([query], input_type=InputType.QUERY)[0]
+        should_rerank = rerank if rerank is not None else self.settings.rerank_enabled
+        reranker_name = (reranker or self.settings.reranker) if should_rerank else None
+        cache = self.cache if use_cache else None
+        result_key = {
+            "query": query,
+            "filters": filters.cache_key(),
+            "top_k": top_k,
+            "rerank": reranker_name,
+            "embedding_model": self.embedder.model_name,
+        }
+        if cache is not None:
+            cached_hits = cache.get_hits(result_key)
+            if cached_hits is not None:
+                return cached_hits
+
+        hits, complete = self._search_uncached(
+            query, top_k=top_k, filters=filters, reranker_name=reranker_name, cache=cache
+        )
+        # A failed rerank degrades to vector order; that answer is not
+        # cached under the rerank key, so the next call retries the rerank.
+        if cache is not None and complete:
+            cache.set_hits(result_key, hits)
+        return hits
+
+    def _search_uncached(
+        self,
+        query: str,
+        *,
+        top_k: int,
+        filters: RetrievalFilters,
+        reranker_name: str | None,
+        cache: RetrievalCache | None,
+    ) -> tuple[list[VectorHit], bool]:
+        """Return ``(hits, complete)``; ``complete`` is False when the rerank failed."""
+        vector = self._embed_query(query, cache=cache)
         namespaces = filters.namespaces or default_namespaces(
             filters.access_classes,
             namespace_prefix=filters.namespace_prefix,
@@ -75,15 +123,32 @@ class Retriever:
             top_k=max(top_k * 3, top_k),  # over-fetch so rerank has signal
             metadata_filter=filters.to_pinecone_filter(),
         )
-        if (rerank if rerank is not None else self.settings.rerank_enabled) and hits:
-            hits = _rerank_with_cohere(
-                query=query,
-                hits=hits,
-                model=self.settings.rerank_model,
-                api_key=self.settings.cohere_api_key,
-                top_n=top_k,
-            )
-        return hits[:top_k]
+        complete = True
+        if reranker_name and hits:
+            try:
+                hits = self.get_reranker(reranker_name).rerank(query, hits, top_n=top_k)
+            except RerankError as exc:
+                logger.warning("%s; returning vector-ordered hits uncached.", exc)
+                complete = False
+        return hits[:top_k], complete
+
+    def get_reranker(self, name: str) -> Reranker:
+        """Return a long-lived reranker instance, building it on first use."""
+
+        if name not in self._rerankers:
+            self._rerankers[name] = get_reranker(name, settings=self.settings)
+        return self._rerankers[name]
+
+    def _embed_query(self, query: str, *, cache: RetrievalCache | None) -> list[float]:
+        model = self.embedder.model_name
+        if cache is not None:
+            vector = cache.get_vector(model=model, query=query)
+            if vector is not None:
+                return vector
+        vector = self.embedder.embed([query], input_type=InputType.QUERY)[0]
+        if cache is not None:
+            cache.set_vector(model=model, query=query, vector=vector)
+        return vector
 
 
 def default_namespaces(
@@ -115,37 +180,3 @@ def _safe_namespace_prefix(value: str | None) -> str | None:
     prefix = "".join(c.lower() if c.isalnum() else "_" for c in value[:40]).strip("_")
     return prefix or None
 
-
-def _rerank_with_cohere(
-    *,
-    query: str,
-    hits: list[VectorHit],
-    model: str,
-    api_key: str,
-    top_n: int,
-) -> list[VectorHit]:
-    if not api_key:
-        logger.info("Rerank disabled: no Cohere API key.")
-        return hits
-    try:
-        import cohere  # noqa: WPS433
-
-        client = cohere.ClientV2(api_key=api_key)
-        documents = [hit.text or hit.metadata.get("title", "") for hit in hits]
-        response = client.rerank(
-            model=model,
-            query=query,
-            documents=documents,
-            top_n=min(top_n, len(documents)),
-        )
-        ordered: list[VectorHit] = []
-        for result in response.results:
-            index = result.index
-            if 0 <= index < len(hits):
-                hit = hits[index]
-                hit.score = float(getattr(result, "relevance_score", hit.score))
-                ordered.append(hit)
-        return ordered
-    except Exception as exc:  # pragma: no cover - external service guard
-        logger.warning("Cohere rerank failed (%s); returning raw hits.", exc)
-        return hits
@@ -0,0 +1,96 @@
+"""Compare chunking strategies on throughput and embedding cost.
+
+Reads documents saved by the ingestion pipeline (``data/processed/*.jsonl``)
+or explicit ``--jsonl`` files, chunks them with each strategy in one batch,
+and reports chunks/sec plus the tokens that would be sent to the embedder
+per document. Token counts come from the same counter the chunker uses, so
+set ``CHUNK_TOKENIZER_PATH`` for exact numbers.
+
+    python3 -m autism_rag.scripts.benchmark_chunker --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from ..config import get_settings
+from ..ingestion.chunker import Chunker
+from ..sources.models import SourceDocument
+
+STRATEGIES = ("chars", "tokens")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark document chunkers.")
+    parser.add_argument(
+        "--jsonl",
+        nargs="*",
+        type=Path,
+        default=None,
+        help="SourceDocument JSONL files. Defaults to everything in PROCESSED_DIR.",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per strategy.")
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args(argv)
+
+
+def load_documents(paths: list[Path]) -> list[SourceDocument]:
+    docs: list[SourceDocument] = []
+    for path in paths:
+        with path.open(encoding="utf-8") as fh:
+            docs.extend(SourceDocument.model_validate_json(line) for line in fh if line.strip())
+    return docs
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    settings = get_settings()
+    paths = args.jsonl if args.jsonl is not None else sorted(settings.processed_dir.glob("*.jsonl"))
+    docs = load_documents(paths)
+    if not docs:
+        print("No documents found; run an ingest first or pass --jsonl.", file=sys.stderr)
+        return 1
+
+    base = Chunker.from_settings(settings)
+    summary: dict[str, dict] = {}
+    for strategy in STRATEGIES:
+        chunker = Chunker(strategy=strategy, token_counter=base.count_tokens)
+        timings: list[float] = []
+        chunks = []
+        for _ in range(max(1, args.repeats)):
+            started = time.perf_counter()
+            chunks = chunker.chunk_many(docs)
+            timings.append(time.perf_counter() - started)
+        tokens = [c.metadata["token_count"] for c in chunks]
+        seconds = statistics.median(timings)
+        summary[strategy] = {
+            "documents": len(docs),
+            "chunks": len(chunks),
+            "chunks_per_sec": round(len(chunks) / seconds, 1) if seconds else None,
+            "chunks_per_doc": round(len(chunks) / len(docs), 2),
+            "tokens_per_doc": round(sum(tokens) / len(docs), 1),
+            "max_chunk_tokens": max(tokens, default=0),
+        }
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    print(
+        f"{'strategy':<10} {'chunks':>8} {'chunks/s':>10} {'chunks/doc':>11} "
+        f"{'tokens/doc':>11} {'max tokens':>11}"
+    )
+    for strategy, row in summary.items():
+        print(
+            f"{strategy:<10} {row['chunks']:>8} {row['chunks_per_sec']:>10} "
+            f"{row['chunks_per_doc']:>11} {row['tokens_per_doc']:>11} {row['max_chunk_tokens']:>11}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Compare reranker latency and ranking quality on the eval questions.
+
+Candidates are retrieved once per question (no rerank, 3x over-fetch, cache
+bypassed) and every reranker reorders a copy of the same candidate list, so
+the comparison isolates the reranker itself.
+
+    python3 -m autism_rag.scripts.benchmark_rerankers --rerankers cohere fusion
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+
+from ..evaluation import EVAL_QUESTIONS, ndcg_at_k, weak_relevance
+from ..rag.rerank import RERANKER_NAMES
+from ..rag.retrieval import RetrievalFilters, Retriever
+from ..sources.models import AccessClass
+
+BASELINE = "none"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark rerankers on the eval set.")
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument(
+        "--rerankers",
+        nargs="*",
+        choices=RERANKER_NAMES,
+        default=["cohere", "fusion"],
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per question.")
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    args = parse_args(argv)
+    retriever = Retriever()
+    names = [BASELINE, *args.rerankers]
+    latencies: dict[str, list[float]] = {name: [] for name in names}
+    ndcgs: dict[str, list[float]] = {name: [] for name in names}
+    filters = RetrievalFilters(
+        access_classes=[AccessClass.PUBLIC_OPEN, AccessClass.CONTROLLED_METADATA],
+    )
+
+    for question in EVAL_QUESTIONS:
+        candidates = retriever.search(
+            question.question,
+            top_k=args.top_k * 3,
+            filters=filters,
+            rerank=False,
+            use_cache=False,
+        )
+        if not candidates:
+            continue
+        pool = [weak_relevance(hit, question) for hit in candidates]
+        for name in names:
+            ranked = candidates
+            for _ in range(max(1, args.repeats)):
+                copies = [hit.model_copy() for hit in candidates]
+                started = time.perf_counter()
+                if name != BASELINE:
+                    ranked = retriever.get_reranker(name).rerank(
+                        question.question, copies, top_n=args.top_k
+                    )
+                latencies[name].append((time.perf_counter() - started) * 1000)
+            relevances = [weak_relevance(hit, question) for hit in ranked[: args.top_k]]
+            ndcgs[name].append(ndcg_at_k(relevances, args.top_k, pool=pool))
+
+    summary = {
+        name: {
+            "questions": len(ndcgs[name]),
+            "ndcg_at_k": round(statistics.fmean(ndcgs[name]), 4) if ndcgs[name] else None,
+            "latency_ms_p50": round(statistics.median(latencies[name]), 3) if latencies[name] else None,
+            "latency_ms_max": round(max(latencies[name]), 3) if latencies[name] else None,
+        }
+        for name in names
+    }
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    print(f"{'reranker':<14} {'nDCG@' + str(args.top_k):>9} {'p50 ms':>10} {'max ms':>10}")
+    for name, row in summary.items():
+        print(
+            f"{name:<14} {row['ndcg_at_k'] if row['ndcg_at_k'] is not None else '-':>9} "
+            f"{row['latency_ms_p50'] if row['latency_ms_p50'] is not None else '-':>10} "
+            f"{row['latency_ms_max'] if row['latency_ms_max'] is not None else '-':>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -45,6 +45,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Explicit URLs (used by firecrawl_web).",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Checkpoint paged API pulls under CACHE_DIR/checkpoints and resume "
+            "an interrupted run of the same query from its last completed page."
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -73,6 +81,8 @@ def main(argv: list[str] | None = None) -> int:
         extra["csv_url"] = args.csv_url
     if args.urls:
         extra["urls"] = args.urls
+    if args.resume:
+        extra["checkpoint"] = True
 
     if args.dry_run:
         docs = list(adapter.fetch(query=args.query, limit=args.limit, **extra))
@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Any
 
 from ..ingestion import IngestionPipeline
-from ..ingestion.chunker import chunk_document
+from ..ingestion.chunker import chunk_documents
 from ..sources.adapters import get_adapter
 
 RARE_NDD_CORPUS = "rare_ndd"
@@ -208,7 +208,7 @@ def _run_target(
     adapter = get_adapter(source_key)()
     if dry_run:
         docs = list(adapter.fetch(query=query, limit=limit, **adapter_kwargs))
-        chunks = [chunk for doc in docs for chunk in chunk_document(doc)]
+        chunks = chunk_documents(docs)
         return {
             "source": source_key,
             "query": query,
@@ -8,6 +8,7 @@ import logging
 import sys
 
 from ..rag.generation import Answerer
+from ..rag.rerank import RERANKER_NAMES
 from ..rag.retrieval import RetrievalFilters, Retriever
 from ..sources.models import AccessClass, EvidenceType
 
@@ -46,7 +47,13 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--no-rerank",
         action="store_true",
-        help="Disable Cohere rerank for this query.",
+        help="Disable reranking for this query.",
+    )
+    parser.add_argument(
+        "--reranker",
+        choices=RERANKER_NAMES,
+        default=None,
+        help="Reranker to use (defaults to RERANKER from settings).",
     )
     parser.add_argument(
         "--json",
@@ -72,6 +79,7 @@ def main(argv: list[str] | None = None) -> int:
         top_k=args.top_k,
         filters=filters,
         rerank=not args.no_rerank,
+        reranker=args.reranker,
     )
     answerer = Answerer()
     response = answerer.answer(args.question, hits)
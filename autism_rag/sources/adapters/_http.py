@@ -3,42 +3,217 @@
 We use ``requests`` because some public research APIs (e.g.
 ClinicalTrials.gov via Cloudflare) reject httpx's TLS fingerprint. Centralizing
 the session here keeps headers, timeouts, and retry policy consistent.
+
+Each source gets one long-lived :class:`HttpClient` with a pooled session,
+a per-source token-bucket rate limit, retry/backoff (honoring
+``Retry-After``) in which every attempt takes a rate-limit token, and an
+optional on-disk response cache. Clients are thread-safe
+enough for the adapters' page fetchers to share one across worker threads.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json as jsonlib
+import threading
+import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from ...config import Settings, get_settings
+from ...rag.cache import DiskStore
 
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_UA = "Mozilla/5.0 (compatible; autism_research_rag/0.1)"
+HTTP_CACHE_FILENAME = "http_cache.sqlite3"
+
+# Requests per second. NCBI allows 3/s anonymously and 10/s with an API key;
+# NIH RePORTER asks clients to stay at or below 1/s.
+SOURCE_RATE_LIMITS: dict[str, float] = {
+    "pubmed": 3.0,
+    "clinicaltrials": 5.0,
+    "nih_reporter": 1.0,
+    "openalex": 10.0,
+    "sfari_gene": 2.0,
+}
+NCBI_KEYED_RATE_LIMIT = 10.0
+DEFAULT_RATE_LIMIT = 5.0
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 10.0
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+class RateLimiter:
+    """Thread-safe token bucket. ``acquire`` blocks until a token is free."""
+
+    def __init__(self, rate_per_second: float, *, burst: int = 1) -> None:
+        self.rate = max(rate_per_second, 0.001)
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
 
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
 
-def session(*, headers: dict[str, str] | None = None) -> requests.Session:
+
+def session(*, headers: dict[str, str] | None = None, pool_size: int = 10) -> requests.Session:
     s = requests.Session()
     s.headers.update({"User-Agent": DEFAULT_UA, "Accept": "application/json"})
     if headers:
         s.headers.update(headers)
+    # No transport-level retries: HttpClient retries through its rate limiter.
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     return s
 
 
+class HttpClient:
+    def __init__(
+        self,
+        *,
+        rate_per_second: float = DEFAULT_RATE_LIMIT,
+        cache: DiskStore | None = None,
+        cache_ttl_seconds: float = 86400.0,
+        pool_size: int = 10,
+        max_attempts: int = MAX_ATTEMPTS,
+    ) -> None:
+        self.session = session(pool_size=pool_size)
+        self.max_attempts = max(1, max_attempts)
+        self.limiter = RateLimiter(rate_per_second)
+        self.cache = cache
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.requests_sent = 0
+
+    def get_json(self, url: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, timeout: float = DEFAULT_TIMEOUT, use_cache: bool = True) -> Any:
+        return jsonlib.loads(self._request("GET", url, params=params, headers=headers, timeout=timeout, use_cache=use_cache))
+
+    def post_json(self, url: str, *, json: Any, headers: dict[str, str] | None = None, timeout: float = DEFAULT_TIMEOUT, use_cache: bool = True) -> Any:
+        return jsonlib.loads(self._request("POST", url, json=json, headers=headers, timeout=timeout, use_cache=use_cache))
+
+    def get_text(self, url: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, timeout: float = DEFAULT_TIMEOUT, use_cache: bool = True, cache_params: dict[str, Any] | None = None) -> str:
+        return self._request("GET", url, params=params, headers=headers, timeout=timeout, use_cache=use_cache, cache_params=cache_params)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        headers: dict[str, str] | None = None,
+        timeout: float,
+        use_cache: bool,
+        cache_params: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Send the request, retrying connection errors and 429/5xx responses.
+        ``cache_params`` replaces ``params`` in the cache key, for requests
+        whose params carry a per-session handle (PubMed's WebEnv).
+        """
+        cache = self.cache if use_cache else None
+        key = _cache_key(method, url, cache_params or params, json) if cache is not None else ""
+        if cache is not None:
+            cached = cache.get("http", key, now=time.time())
+            if cached is not None:
+                return cached[1]
+        for attempt in range(1, self.max_attempts + 1):
+            self.limiter.acquire()
+            self.requests_sent += 1
+            try:
+                response = self.session.request(
+                    method, url, params=params, json=json, headers=headers, timeout=timeout
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_attempts:
+                    raise
+                time.sleep(_backoff(attempt))
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < self.max_attempts:
+                time.sleep(_backoff(attempt, response.headers.get("Retry-After")))
+                continue
+            response.raise_for_status()
+            break
+        text = response.text
+        if cache is not None:
+            cache.set("http", key, text, expires_at=time.time() + self.cache_ttl_seconds)
+        return text
+
+
+def _backoff(attempt: int, retry_after: str | None = None) -> float:
+    """Seconds to wait before the next attempt: ``Retry-After`` or 1, 2, 4 ... s."""
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER_SECONDS)
+        except ValueError:
+            pass  # an HTTP date; fall back to exponential backoff
+    return min(2.0 ** (attempt - 1), MAX_BACKOFF_SECONDS)
+
+
+_clients: dict[str, HttpClient] = {}
+_clients_lock = threading.Lock()
+_disk_cache: DiskStore | None = None
+
+
+def client_for(source_key: str, settings: Settings | None = None) -> HttpClient:
+    """Return the shared client for ``source_key``, creating it on first use."""
+
+    with _clients_lock:
+        if source_key not in _clients:
+            settings = settings or get_settings()
+            _clients[source_key] = HttpClient(
+                rate_per_second=rate_limit_for(source_key, settings),
+                cache=_shared_disk_cache(settings) if settings.http_cache_enabled else None,
+                cache_ttl_seconds=settings.http_cache_ttl_seconds,
+                pool_size=max(2, settings.source_fetch_concurrency),
+            )
+        return _clients[source_key]
+
+
+def rate_limit_for(source_key: str, settings: Settings) -> float:
+    if source_key == "pubmed" and settings.ncbi_api_key:
+        return NCBI_KEYED_RATE_LIMIT
+    return SOURCE_RATE_LIMITS.get(source_key, DEFAULT_RATE_LIMIT)
+
+
+def _shared_disk_cache(settings: Settings) -> DiskStore:
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = DiskStore(settings.cache_dir / HTTP_CACHE_FILENAME, max_entries=50_000)
+    return _disk_cache
+
+
+def _cache_key(method: str, url: str, params: dict[str, Any] | None, body: Any) -> str:
+    # API keys are stripped so rotating a key does not invalidate the cache.
+    safe_params = {k: v for k, v in (params or {}).items() if k not in {"api_key", "apiKey"}}
+    encoded = jsonlib.dumps([method, url, safe_params, body], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
 def get_json(url: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, timeout: float = DEFAULT_TIMEOUT) -> Any:
-    with session(headers=headers) as s:
-        response = s.get(url, params=params, timeout=timeout)
-        response.raise_for_status()
-        return response.json()
+    return client_for("default").get_json(url, params=params, headers=headers, timeout=timeout)
 
 
 def post_json(url: str, *, json: Any, headers: dict[str, str] | None = None, timeout: float = DEFAULT_TIMEOUT) -> Any:
-    with session(headers=headers) as s:
-        response = s.post(url, json=json, timeout=timeout)
-        response.raise_for_status()
-        return response.json()
+    return client_for("default").post_json(url, json=json, headers=headers, timeout=timeout)
 
 
 def get_text(url: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, timeout: float = DEFAULT_TIMEOUT) -> str:
-    with session(headers=headers) as s:
-        response = s.get(url, params=params, timeout=timeout)
-        response.raise_for_status()
-        return response.text
+    return client_for("default").get_text(url, params=params, headers=headers, timeout=timeout)
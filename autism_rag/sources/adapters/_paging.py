@@ -0,0 +1,148 @@
+"""Pagination and checkpoint helpers shared by the API adapters.
+
+Two paging shapes cover every source we ingest:
+
+  - cursor paging (OpenAlex ``cursor``, ClinicalTrials.gov ``pageToken``):
+    inherently sequential, one page at a time
+  - offset paging (NIH RePORTER ``offset``, PubMed ``retstart``): pages are
+    independent, so they are fetched concurrently in waves
+
+Both record progress in a :class:`PageCheckpoint` after every page (or
+wave) when checkpointing is enabled, so an interrupted large pull resumes
+from the last completed page instead of starting over.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ...config import Settings
+from ..models import SourceDocument
+
+logger = logging.getLogger(__name__)
+
+CursorPage = Callable[[Any], tuple[list[SourceDocument], Any]]
+OffsetPage = Callable[[int, int], tuple[list[SourceDocument], int]]
+
+
+class PageCheckpoint:
+    """Cursor state plus the documents fetched so far, stored on disk."""
+
+    def __init__(self, path: Path) -> None:
+        self.state_path = path.with_suffix(".json")
+        self.docs_path = path.with_suffix(".jsonl")
+
+    @classmethod
+    def for_query(cls, settings: Settings, source_key: str, **params: Any) -> PageCheckpoint:
+        digest = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        return cls(settings.cache_dir / "checkpoints" / f"{source_key}-{digest}")
+
+    def load(self) -> tuple[Any, list[SourceDocument]] | None:
+        if not self.state_path.exists():
+            return None
+        state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        docs: list[SourceDocument] = []
+        if self.docs_path.exists():
+            with self.docs_path.open(encoding="utf-8") as fh:
+                docs = [SourceDocument.model_validate_json(line) for line in fh if line.strip()]
+        # The state file is written after the page's docs, so any trailing
+        # docs beyond ``doc_count`` belong to a page that never committed.
+        docs = docs[: state.get("doc_count", len(docs))]
+        logger.info("Resuming %s from checkpoint (%d docs)", self.state_path.stem, len(docs))
+        return state.get("cursor"), docs
+
+    def save(self, cursor: Any, new_docs: list[SourceDocument], *, doc_count: int) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.docs_path.open("a", encoding="utf-8") as fh:
+            for doc in new_docs:
+                fh.write(doc.model_dump_json() + "\n")
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"cursor": cursor, "doc_count": doc_count}), encoding="utf-8")
+        os.replace(tmp, self.state_path)
+
+    def clear(self) -> None:
+        for path in (self.state_path, self.docs_path):
+            path.unlink(missing_ok=True)
+
+
+def collect_cursor_pages(
+    fetch_page: CursorPage,
+    *,
+    first_cursor: Any,
+    limit: int,
+    checkpoint: PageCheckpoint | None = None,
+) -> list[SourceDocument]:
+    """Follow ``next_cursor`` until it is ``None`` or ``limit`` docs are in hand."""
+
+    cursor, docs = first_cursor, []
+    resumed = checkpoint.load() if checkpoint else None
+    if resumed is not None:
+        cursor, docs = resumed
+    while cursor is not None and len(docs) < limit:
+        page_docs, next_cursor = fetch_page(cursor)
+        docs.extend(page_docs)
+        if checkpoint:
+            checkpoint.save(next_cursor, page_docs, doc_count=len(docs))
+        if next_cursor == cursor:
+            break
+        cursor = next_cursor
+    if checkpoint:
+        checkpoint.clear()
+    return docs[:limit]
+
+
+def collect_offset_pages(
+    fetch_page: OffsetPage,
+    *,
+    page_size: int,
+    limit: int,
+    concurrency: int,
+    total: int | None = None,
+    checkpoint: PageCheckpoint | None = None,
+) -> list[SourceDocument]:
+    """Fetch offset pages ``concurrency`` at a time, preserving page order.
+
+    ``fetch_page(offset, size)`` returns the page's documents and the total
+    result count reported by the API. ``size`` is ``page_size`` except on
+    the last page, where it is trimmed to what ``limit`` still needs.
+    ``total`` may be passed when it is already known (e.g. from a PubMed
+    esearch).
+    """
+
+    offset, docs = 0, []
+    resumed = checkpoint.load() if checkpoint else None
+    if resumed is not None:
+        offset, docs = resumed
+    workers = max(1, concurrency)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while len(docs) < limit and (total is None or offset < total):
+            remaining = limit - len(docs)
+            if total is None:
+                # Learn the total from the first page before fanning out.
+                pages = 1
+            else:
+                remaining = min(remaining, total - offset)
+                pages = min(workers, -(-remaining // page_size))
+            offsets = [offset + i * page_size for i in range(pages)]
+            sizes = [min(page_size, remaining - i * page_size) for i in range(pages)]
+            results = list(pool.map(fetch_page, offsets, sizes))
+            wave_docs: list[SourceDocument] = []
+            for page_docs, page_total in results:
+                wave_docs.extend(page_docs)
+                total = page_total if total is None else total
+            docs.extend(wave_docs)
+            offset = offsets[-1] + sizes[-1]
+            if checkpoint:
+                checkpoint.save(offset, wave_docs, doc_count=len(docs))
+    if checkpoint:
+        checkpoint.clear()
+    return docs[:limit]
@@ -8,6 +8,8 @@ from collections.abc import Iterable
 from ...config import Settings, get_settings
 from ..models import SourceDocument, SourceRecord
 from ..registry import get_source
+from . import _http
+from ._paging import PageCheckpoint
 
 
 class BaseAdapter(ABC):
@@ -27,6 +29,19 @@ class BaseAdapter(ABC):
         self.settings = settings or get_settings()
         self.source: SourceRecord = get_source(self.source_key)
 
+    @property
+    def http(self) -> _http.HttpClient:
+        """Pooled, rate-limited, cached HTTP client shared by this source."""
+
+        return _http.client_for(self.source_key, self.settings)
+
+    def checkpoint(self, enabled: bool, **params: object) -> PageCheckpoint | None:
+        """Checkpoint for one paged pull, keyed by the request parameters."""
+
+        if not enabled:
+            return None
+        return PageCheckpoint.for_query(self.settings, self.source_key, **params)
+
     @abstractmethod
     def fetch(self, query: str, *, limit: int = 25, **kwargs) -> Iterable[SourceDocument]:
         """Yield normalized documents for the given query.
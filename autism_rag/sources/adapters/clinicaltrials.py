@@ -3,7 +3,8 @@
 The v2 API returns JSON with structured "protocolSection" subfields. We
 flatten the most useful sections (eligibility, conditions, interventions,
 description, outcomes) into a single document, with the NCT identifier as
-the source-side primary key.
+the source-side primary key. Result sets larger than one page are walked
+with ``pageToken``/``nextPageToken``.
 """
 
 from __future__ import annotations
@@ -12,43 +13,48 @@ import logging
 from collections.abc import Iterable
 from datetime import datetime, timezone
 
-from tenacity import retry, stop_after_attempt, wait_exponential
-
 from ..models import AccessClass, EvidenceType, SourceDocument
-from . import _http
+from ._paging import collect_cursor_pages
 from .base import BaseAdapter
 
 logger = logging.getLogger(__name__)
 
 CT_API_BASE = "https://clinicaltrials.gov/api/v2/studies"
+CT_PAGE_SIZE = 1000  # API maximum; pages beyond the first follow nextPageToken
 
 
 class ClinicalTrialsAdapter(BaseAdapter):
     source_key = "clinicaltrials"
 
-    @retry(
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
     def fetch(
         self,
         query: str,
         *,
         limit: int = 25,
         location: str | None = None,
+        checkpoint: bool = False,
         **_: object,
     ) -> Iterable[SourceDocument]:
         params: dict[str, str | int] = {
             "query.cond": query or "autism spectrum disorder",
-            "pageSize": min(limit, 100),
+            "pageSize": min(limit, CT_PAGE_SIZE),
             "format": "json",
         }
         if location:
             params["query.locn"] = location
-        data = _http.get_json(CT_API_BASE, params=params)
-        studies = data.get("studies", [])
-        return list(self._normalize(studies))
+        return collect_cursor_pages(
+            lambda token: self._fetch_page(params, token),
+            first_cursor="",
+            limit=limit,
+            checkpoint=self.checkpoint(checkpoint, **params),
+        )
+
+    def _fetch_page(
+        self, params: dict[str, str | int], token: str
+    ) -> tuple[list[SourceDocument], str | None]:
+        page_params = {**params, "pageToken": token} if token else params
+        data = self.http.get_json(CT_API_BASE, params=page_params)
+        return list(self._normalize(data.get("studies", []))), data.get("nextPageToken")
 
     def _normalize(self, studies: list[dict]) -> Iterable[SourceDocument]:
         for study in studies:
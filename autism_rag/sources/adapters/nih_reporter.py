@@ -3,6 +3,7 @@
 We search the projects endpoint for autism-relevant grants. The response
 includes project abstracts, PI info, organization, and fiscal year, which
 is enough context for a useful "what funded research exists?" RAG channel.
+Pages of up to 500 projects are requested concurrently by offset.
 """
 
 from __future__ import annotations
@@ -11,56 +12,74 @@ import logging
 from collections.abc import Iterable
 from datetime import datetime, timezone
 
-from tenacity import retry, stop_after_attempt, wait_exponential
-
 from ..models import AccessClass, EvidenceType, SourceDocument
-from . import _http
+from ._paging import collect_offset_pages
 from .base import BaseAdapter
 
 logger = logging.getLogger(__name__)
 
 REPORTER_URL = "https://api.reporter.nih.gov/v2/projects/search"
+REPORTER_PAGE_SIZE = 500
+REPORTER_MAX_OFFSET = 14_999
+REPORTER_FIELDS = [
+    "ProjectNum",
+    "ProjectTitle",
+    "AbstractText",
+    "ContactPiName",
+    "Organization",
+    "FiscalYear",
+    "ProjectStartDate",
+    "ProjectEndDate",
+    "AgencyIcAdmin",
+    "AwardAmount",
+    "PrincipalInvestigators",
+]
 
 
 class NIHReporterAdapter(BaseAdapter):
     source_key = "nih_reporter"
 
-    @retry(
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
-    def fetch(self, query: str, *, limit: int = 25, **_: object) -> Iterable[SourceDocument]:
+    def fetch(
+        self,
+        query: str,
+        *,
+        limit: int = 25,
+        checkpoint: bool = False,
+        **_: object,
+    ) -> Iterable[SourceDocument]:
         search_text = query or "autism"
+        criteria = {
+            "advanced_text_search": {
+                "operator": "advanced",
+                # RePORTER accepts comma-separated fields poorly in some
+                # clients; "all" keeps the API payload stable while still
+                # sorting by relevance.
+                "search_field": "all",
+                "search_text": _to_boolean_query(search_text),
+            }
+        }
+        page_size = min(limit, REPORTER_PAGE_SIZE)
+        return collect_offset_pages(
+            lambda offset, size: self._fetch_page(criteria, offset=offset, page_size=size),
+            page_size=page_size,
+            limit=min(limit, REPORTER_MAX_OFFSET + page_size),
+            concurrency=self.settings.source_fetch_concurrency,
+            checkpoint=self.checkpoint(checkpoint, criteria=criteria, page_size=page_size),
+        )
+
+    def _fetch_page(
+        self, criteria: dict, *, offset: int, page_size: int
+    ) -> tuple[list[SourceDocument], int]:
         payload = {
-            "criteria": {
-                "advanced_text_search": {
-                    "operator": "advanced",
-                    # RePORTER accepts comma-separated fields poorly in some
-                    # clients; "all" keeps the API payload stable while still
-                    # sorting by relevance.
-                    "search_field": "all",
-                    "search_text": _to_boolean_query(search_text),
-                }
-            },
-            "include_fields": [
-                "ProjectNum",
-                "ProjectTitle",
-                "AbstractText",
-                "ContactPiName",
-                "Organization",
-                "FiscalYear",
-                "ProjectStartDate",
-                "ProjectEndDate",
-                "AgencyIcAdmin",
-                "AwardAmount",
-                "PrincipalInvestigators",
-            ],
-            "limit": min(limit, 500),
-            "offset": 0,
+            "criteria": criteria,
+            "include_fields": REPORTER_FIELDS,
+            "limit": page_size,
+            "offset": offset,
         }
-        data = _http.post_json(REPORTER_URL, json=payload)
-        return list(self._normalize(data.get("results", [])))
+        data = self.http.post_json(REPORTER_URL, json=payload)
+        total = int((data.get("meta") or {}).get("total", 0) or 0)
+        # RePORTER rejects offsets past 14,999; stop paging there.
+        return list(self._normalize(data.get("results", []))), min(total, REPORTER_MAX_OFFSET + 1)
 
     def _normalize(self, results: list[dict]) -> Iterable[SourceDocument]:
         for record in results:
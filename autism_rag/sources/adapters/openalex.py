@@ -2,7 +2,8 @@
 
 Used primarily to find recent/highly-cited autism research that PubMed may
 not surface first, and to provide a citation graph (referenced_works,
-related_works) for downstream enrichment.
+related_works) for downstream enrichment. Large pulls page with OpenAlex's ``cursor``
+parameter, which unlike ``page`` is not capped at 10,000 results.
 """
 
 from __future__ import annotations
@@ -11,37 +12,49 @@ import logging
 from collections.abc import Iterable
 from datetime import datetime, timezone
 
-from tenacity import retry, stop_after_attempt, wait_exponential
-
 from ..models import AccessClass, EvidenceType, SourceDocument
-from . import _http
+from ._paging import collect_cursor_pages
 from .base import BaseAdapter
 
 logger = logging.getLogger(__name__)
 
 OPENALEX_URL = "https://api.openalex.org/works"
+OPENALEX_PAGE_SIZE = 200
 
 
 class OpenAlexAdapter(BaseAdapter):
     source_key = "openalex"
 
-    @retry(
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
-    def fetch(self, query: str, *, limit: int = 25, **_: object) -> Iterable[SourceDocument]:
-        params = {
+    def fetch(
+        self,
+        query: str,
+        *,
+        limit: int = 25,
+        checkpoint: bool = False,
+        **_: object,
+    ) -> Iterable[SourceDocument]:
+        params: dict[str, str | int] = {
             "search": query or "autism spectrum disorder",
-            "per_page": min(limit, 200),
+            "per_page": min(limit, OPENALEX_PAGE_SIZE),
             "sort": "cited_by_count:desc",
             "filter": "type:article,has_abstract:true",
         }
-        headers: dict[str, str] = {}
         if self.settings.ncbi_email:
             params["mailto"] = self.settings.ncbi_email
-        data = _http.get_json(OPENALEX_URL, params=params, headers=headers)
-        return list(self._normalize(data.get("results", [])))
+        return collect_cursor_pages(
+            lambda cursor: self._fetch_page(params, cursor),
+            first_cursor="*",
+            limit=limit,
+            checkpoint=self.checkpoint(checkpoint, **params),
+        )
+
+    def _fetch_page(
+        self, params: dict[str, str | int], cursor: str
+    ) -> tuple[list[SourceDocument], str | None]:
+        data = self.http.get_json(OPENALEX_URL, params={**params, "cursor": cursor})
+        results = data.get("results", [])
+        next_cursor = (data.get("meta") or {}).get("next_cursor") if results else None
+        return list(self._normalize(results)), next_cursor
 
     def _normalize(self, results: list[dict]) -> Iterable[SourceDocument]:
         for work in results:
@@ -1,8 +1,11 @@
 """PubMed adapter via NCBI E-utilities.
 
-We fetch PMIDs via esearch, then abstracts and metadata via efetch with
-``retmode=xml``. Only abstracts are stored here. Full-text retrieval is the
-job of :class:`PMCOpenAccessAdapter` once we extend the pipeline to PMC OA.
+We run one esearch with ``usehistory=y`` to park the full result set on
+the NCBI history server, then page abstracts and metadata out of it with
+concurrent efetch calls (``retstart``/``retmax``, ``retmode=xml``). The
+shared client keeps requests under NCBI's 3/s (10/s with ``NCBI_API_KEY``)
+quota. Only abstracts are stored here. Full-text retrieval is the job of
+:class:`PMCOpenAccessAdapter` once we extend the pipeline to PMC OA.
 """
 
 from __future__ import annotations
@@ -11,68 +14,84 @@ import logging
 from collections.abc import Iterable
 from datetime import datetime, timezone
 
-from tenacity import retry, stop_after_attempt, wait_exponential
-
 from ..models import AccessClass, EvidenceType, SourceDocument
-from . import _http
+from ._paging import collect_offset_pages
 from .base import BaseAdapter
 
 logger = logging.getLogger(__name__)
 
 EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+EFETCH_PAGE_SIZE = 200
 
 
 class PubMedAdapter(BaseAdapter):
     source_key = "pubmed"
 
-    def fetch(self, query: str, *, limit: int = 25, **_: object) -> Iterable[SourceDocument]:
-        pmids = self._esearch(query, limit=limit)
-        if not pmids:
+    def fetch(
+        self,
+        query: str,
+        *,
+        limit: int = 25,
+        checkpoint: bool = False,
+        **_: object,
+    ) -> Iterable[SourceDocument]:
+        count, history = self._esearch(query)
+        if not count:
             logger.info("PubMed: no PMIDs returned for query %r", query)
             return []
-        return self._efetch(pmids)
-
-    @retry(
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
-    def _esearch(self, query: str, *, limit: int) -> list[str]:
-        params: dict[str, str | int] = {
-            "db": "pubmed",
-            "term": query,
-            "retmode": "json",
-            "retmax": min(limit, 200),
-            "sort": "pub_date",
-            "tool": self.settings.ncbi_tool,
-        }
+        return collect_offset_pages(
+            lambda offset, size: (
+                self._efetch(history, query=query, count=count, offset=offset, size=size),
+                count,
+            ),
+            page_size=EFETCH_PAGE_SIZE,
+            limit=limit,
+            concurrency=self.settings.source_fetch_concurrency,
+            total=count,
+            checkpoint=self.checkpoint(checkpoint, query=query),
+        )
+
+    def _base_params(self) -> dict[str, str | int]:
+        params: dict[str, str | int] = {"db": "pubmed", "tool": self.settings.ncbi_tool}
         if self.settings.ncbi_email:
             params["email"] = self.settings.ncbi_email
         if self.settings.ncbi_api_key:
             params["api_key"] = self.settings.ncbi_api_key
+        return params
+
+    def _esearch(self, query: str) -> tuple[int, dict[str, str]]:
+        """Return the total hit count and the history-server handle."""
+
+        params = {
+            **self._base_params(),
+            "term": query,
+            "retmode": "json",
+            "retmax": 0,
+            "sort": "pub_date",
+            "usehistory": "y",
+        }
         url = f"{EUTILS_BASE}/esearch.fcgi"
-        data = _http.get_json(url, params=params, timeout=20.0)
-        return data.get("esearchresult", {}).get("idlist", [])
-
-    @retry(
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
-    def _efetch(self, pmids: list[str]) -> list[SourceDocument]:
-        params: dict[str, str | int] = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
+        # Never cached: the WebEnv handle expires on NCBI's side.
+        data = self.http.get_json(url, params=params, timeout=20.0, use_cache=False)
+        result = data.get("esearchresult", {})
+        history = {"WebEnv": result.get("webenv", ""), "query_key": result.get("querykey", "")}
+        return int(result.get("count", 0) or 0), history
+
+    def _efetch(
+        self, history: dict[str, str], *, query: str, count: int, offset: int, size: int
+    ) -> list[SourceDocument]:
+        page = {
+            "retstart": offset,
+            "retmax": size,
             "rettype": "abstract",
             "retmode": "xml",
-            "tool": self.settings.ncbi_tool,
         }
-        if self.settings.ncbi_email:
-            params["email"] = self.settings.ncbi_email
-        if self.settings.ncbi_api_key:
-            params["api_key"] = self.settings.ncbi_api_key
+        params = {**self._base_params(), **history, **page}
+        # The WebEnv differs per esearch, so the cache key uses the query
+        # instead; the hit count keeps pages of a grown result set apart.
+        cache_params = {"db": "pubmed", "term": query, "count": count, **page}
         url = f"{EUTILS_BASE}/efetch.fcgi"
-        xml = _http.get_text(url, params=params, timeout=30.0)
+        xml = self.http.get_text(url, params=params, timeout=30.0, cache_params=cache_params)
         return list(self._parse_pubmed_xml(xml))
 
     def _parse_pubmed_xml(self, xml: str) -> Iterable[SourceDocument]:
@@ -14,10 +14,7 @@ import logging
 from collections.abc import Iterable
 from pathlib import Path
 
-from tenacity import retry, stop_after_attempt, wait_exponential
-
 from ..models import AccessClass, EvidenceType, SourceDocument
-from . import _http
 from .base import BaseAdapter
 
 logger = logging.getLogger(__name__)
@@ -66,13 +63,8 @@ class SFARIGeneAdapter(BaseAdapter):
         with path.open("r", newline="", encoding="utf-8") as fh:
             return list(csv.DictReader(fh))
 
-    @retry(
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
     def _read_remote_csv(self, url: str) -> list[dict[str, str]]:
-        text = _http.get_text(url, timeout=60.0)
+        text = self.http.get_text(url, timeout=60.0)
         reader = csv.DictReader(io.StringIO(text))
         return list(reader)
 
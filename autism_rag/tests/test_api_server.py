@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from autism_rag.api import server
+from autism_rag.config import Settings
+from autism_rag.rag.generation import Answerer
+from autism_rag.rag.rerank import RerankerUnavailable
+from autism_rag.rag.vectorstore import VectorHit
+
+
+class FakeRetriever:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def search(self, query: str, **kwargs) -> list[VectorHit]:
+        self.calls.append({"query": query, **kwargs})
+        return [
+            VectorHit(
+                id="pubmed:1#chunk-0",
+                score=0.9,
+                text="Early screening improves outcomes for autistic toddlers.",
+                metadata={"title": "Screening study", "url": "https://example.org/1", "source_key": "pubmed"},
+            )
+        ]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    retriever = FakeRetriever()
+    offline = Settings(anthropic_api_key="", anthropic_bedrock_enabled=False, openai_api_key="")
+    monkeypatch.setattr(server, "_retriever", retriever)
+    monkeypatch.setattr(server, "_answerer", Answerer(settings=offline))
+    with TestClient(server.app) as test_client:
+        yield test_client, retriever
+
+
+def test_ask_returns_answer_with_citations(client):
+    test_client, retriever = client
+    response = test_client.post("/ask", json={"question": "autism screening", "reranker": "fusion"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["model"] == "extractive-fallback"
+    assert body["citations"][0]["label"] == "S1"
+    assert retriever.calls[0]["reranker"] == "fusion"
+
+
+def test_ask_stream_emits_citations_before_chunks(client):
+    test_client, _ = client
+    with test_client.stream("POST", "/ask/stream", json={"question": "autism screening"}) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line.removeprefix("data: "))
+            for line in response.iter_lines()
+            if line.startswith("data: ")
+        ]
+
+    assert [e["type"] for e in events][0] == "citations"
+    assert events[0]["citations"][0]["title"] == "Screening study"
+    assert any(e["type"] == "chunk" for e in events)
+    assert events[-1] == {"type": "done", "model": "extractive-fallback"}
+
+
+def test_ask_rejects_blank_question_and_unknown_reranker(client):
+    test_client, _ = client
+    assert test_client.post("/ask", json={"question": "  "}).status_code == 400
+    assert test_client.post("/ask", json={"question": "q", "reranker": "nope"}).status_code == 422
+
+
+def test_unconfigured_reranker_is_a_bad_request_but_backend_faults_are_not(client, monkeypatch):
+    test_client, retriever = client
+
+    def unconfigured(query, **kwargs):
+        raise RerankerUnavailable("CROSS_ENCODER_MODEL_DIR must point at a directory containing model.onnx")
+
+    monkeypatch.setattr(retriever, "search", unconfigured)
+    response = test_client.post("/ask", json={"question": "q", "reranker": "cross_encoder"})
+    assert response.status_code == 400
+    assert "CROSS_ENCODER_MODEL_DIR" in response.json()["detail"]
+
+    def misconfigured(query, **kwargs):
+        raise RuntimeError("PINECONE_API_KEY is not set")
+
+    monkeypatch.setattr(retriever, "search", misconfigured)
+    with TestClient(server.app, raise_server_exceptions=False) as fresh:
+        assert fresh.post("/ask", json={"question": "q"}).status_code == 500
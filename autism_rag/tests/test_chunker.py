@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from autism_rag.ingestion.chunker import chunk_document
+from autism_rag.ingestion.chunker import TOKEN_PROFILES, Chunker, chunk_document, chunk_documents
 from autism_rag.sources.models import AccessClass, EvidenceType, SourceDocument
 
 
@@ -43,3 +43,46 @@ def test_chunk_ids_are_stable_and_unique():
     ids = [c.chunk_id for c in chunks]
     assert len(ids) == len(set(ids))
     assert ids[0].startswith("pubmed:12345#chunk-")
+
+
+def test_token_chunks_end_on_sentence_boundaries_within_budget():
+    sentences = [f"Finding {i} links early intervention to outcomes." for i in range(300)]
+    chunks = Chunker().chunk(_doc(" ".join(sentences)))
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.metadata["token_count"] <= TOKEN_PROFILES[EvidenceType.LITERATURE][0]
+        assert chunk.text.endswith(".")
+    # Overlap is whole trailing sentences of the previous chunk.
+    first_sentence = chunks[1].text.split(". ", 1)[0] + "."
+    last_sentence = chunks[0].text.rsplit(". ", 1)[-1]
+    assert f" {first_sentence} " in chunks[0].text
+    assert last_sentence in chunks[1].text
+
+
+def test_token_strategy_embeds_fewer_tokens_than_char_windows():
+    doc = _doc("Autism research finding about sensory processing. " * 600)
+    tokens = Chunker(strategy="tokens").chunk(doc)
+    chars = Chunker(strategy="chars").chunk(doc)
+
+    def embedded(chunks):
+        return sum(c.metadata["token_count"] for c in chunks)
+
+    assert embedded(tokens) < embedded(chars)
+
+
+def test_batch_matches_per_document_chunking():
+    docs = [_doc("Short abstract."), _doc("Autism research. " * 500)]
+    docs[1].source_id = "67890"
+    chunker = Chunker()
+
+    batch = chunk_documents(docs, chunker=chunker)
+    single = [c for doc in docs for c in chunker.chunk(doc)]
+
+    assert [(c.chunk_id, c.text) for c in batch] == [(c.chunk_id, c.text) for c in single]
+
+
+def test_oversized_sentence_is_split_on_words():
+    chunks = Chunker().chunk(_doc("autism " * 2000))
+    assert len(chunks) > 1
+    assert all(c.metadata["token_count"] <= 400 for c in chunks)
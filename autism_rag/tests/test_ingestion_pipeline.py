@@ -73,12 +73,12 @@ class FakeVectorStore(VectorStore):
         return {}
 
 
-def test_pipeline_can_prefix_namespace_for_separate_corpus():
+def test_pipeline_can_prefix_namespace_for_separate_corpus(tmp_path):
     store = FakeVectorStore()
     pipeline = IngestionPipeline(
         embedder=FakeEmbedder(),
         vector_store=store,
-        settings=Settings(),
+        settings=Settings(cache_dir=tmp_path),
     )
 
     result = pipeline.run(
@@ -98,12 +98,12 @@ def test_pipeline_can_prefix_namespace_for_separate_corpus():
     assert record.metadata["search_terms"] == ["rare diseases", "rare disorders"]
 
 
-def test_pipeline_can_replace_existing_source_records():
+def test_pipeline_can_replace_existing_source_records(tmp_path):
     store = FakeVectorStore()
     pipeline = IngestionPipeline(
         embedder=FakeEmbedder(),
         vector_store=store,
-        settings=Settings(),
+        settings=Settings(cache_dir=tmp_path),
     )
 
     pipeline.run(
@@ -118,3 +118,36 @@ def test_pipeline_can_replace_existing_source_records():
     assert store.deletes == [
         ("rare_ndd_public_literature", {"source_key": {"$eq": "pubmed"}})
     ]
+
+
+def test_pipeline_deletes_previous_chunks_of_reingested_documents(tmp_path):
+    store = FakeVectorStore()
+    pipeline = IngestionPipeline(
+        embedder=FakeEmbedder(),
+        vector_store=store,
+        settings=Settings(cache_dir=tmp_path),
+    )
+
+    pipeline.run(FakeAdapter(), query="autism", limit=1, save_raw=False)
+
+    assert store.deletes == [
+        (
+            "public_literature",
+            {"source_key": {"$eq": "pubmed"}, "source_id": {"$in": ["123"]}},
+        )
+    ]
+
+
+def test_pipeline_bumps_index_generation_after_upsert(tmp_path):
+    settings = Settings(cache_dir=tmp_path)
+    pipeline = IngestionPipeline(
+        embedder=FakeEmbedder(),
+        vector_store=FakeVectorStore(),
+        settings=settings,
+    )
+
+    first = pipeline.run(FakeAdapter(), query="autism", limit=1, save_raw=False)
+    second = pipeline.run(FakeAdapter(), query="autism", limit=1, save_raw=False)
+
+    assert (first.index_generation, second.index_generation) == (1, 2)
+    assert (tmp_path / "index_generation").read_text() == "2"
@@ -0,0 +1,125 @@
+import pytest
+
+from autism_rag.rag.cache import DiskStore
+from autism_rag.sources.adapters import _http
+from autism_rag.sources.adapters._http import HttpClient
+from autism_rag.sources.adapters._paging import (
+    PageCheckpoint,
+    collect_cursor_pages,
+    collect_offset_pages,
+)
+from autism_rag.sources.models import AccessClass, EvidenceType, SourceDocument
+
+
+def _doc(i: int) -> SourceDocument:
+    return SourceDocument(
+        source_key="openalex",
+        source_id=f"W{i}",
+        title=f"Work {i}",
+        text="autism",
+        url="",
+        evidence_type=EvidenceType.LITERATURE,
+        access_class=AccessClass.PUBLIC_OPEN,
+    )
+
+
+def _cursor_pages(pages: int, per_page: int, calls: list):
+    def fetch(cursor):
+        calls.append(cursor)
+        start = int(cursor) * per_page
+        docs = [_doc(i) for i in range(start, start + per_page)]
+        nxt = str(int(cursor) + 1) if int(cursor) + 1 < pages else None
+        return docs, nxt
+
+    return fetch
+
+
+def test_cursor_pages_follow_next_cursor_until_limit():
+    calls: list = []
+    docs = collect_cursor_pages(_cursor_pages(5, 10, calls), first_cursor="0", limit=25)
+
+    assert len(docs) == 25
+    assert calls == ["0", "1", "2"]
+
+
+def test_offset_pages_fan_out_and_keep_order():
+    calls: list = []
+
+    def fetch(offset, size):
+        calls.append(offset)
+        return [_doc(i) for i in range(offset, min(offset + size, 45))], 45
+
+    docs = collect_offset_pages(fetch, page_size=10, limit=100, concurrency=3)
+
+    assert [d.source_id for d in docs] == [f"W{i}" for i in range(45)]
+    assert sorted(calls) == [0, 10, 20, 30, 40]
+
+
+def test_offset_pages_request_only_what_the_limit_still_needs():
+    calls: list = []
+
+    def fetch(offset, size):
+        calls.append((offset, size))
+        # Every third record is dropped (e.g. a PubMed article without an abstract).
+        return [_doc(i) for i in range(offset, offset + size) if i % 3], 1000
+
+    docs = collect_offset_pages(fetch, page_size=200, limit=25, concurrency=3)
+
+    assert len(docs) == 25
+    assert calls == [(0, 25), (25, 9), (34, 3), (37, 1)]
+
+
+def test_checkpoint_resumes_from_last_completed_page(tmp_path):
+    checkpoint = PageCheckpoint(tmp_path / "openalex-test")
+    calls: list = []
+    fetch = _cursor_pages(4, 10, calls)
+
+    def flaky(cursor):
+        if cursor == "2":
+            raise RuntimeError("connection reset")
+        return fetch(cursor)
+
+    with pytest.raises(RuntimeError):
+        collect_cursor_pages(flaky, first_cursor="0", limit=40, checkpoint=checkpoint)
+
+    calls.clear()
+    docs = collect_cursor_pages(fetch, first_cursor="0", limit=40, checkpoint=checkpoint)
+
+    assert calls == ["2", "3"]
+    assert [d.source_id for d in docs] == [f"W{i}" for i in range(40)]
+    assert checkpoint.load() is None  # cleared after a complete pull
+
+
+class _FakeResponse:
+    text = '{"ok": true}'
+    headers: dict = {}
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_http_client_serves_repeat_requests_from_disk_cache(tmp_path, monkeypatch):
+    client = HttpClient(rate_per_second=1000, cache=DiskStore(tmp_path / "http.sqlite3"))
+    monkeypatch.setattr(client.session, "request", lambda *a, **kw: _FakeResponse())
+
+    first = client.get_json("https://example.org/x", params={"q": "autism", "api_key": "a"})
+    second = client.get_json("https://example.org/x", params={"q": "autism", "api_key": "b"})
+    client.get_json("https://example.org/x", params={"q": "autism"}, use_cache=False)
+
+    assert first == second == {"ok": True}
+    assert client.requests_sent == 2
+
+
+def test_http_client_retries_through_the_rate_limiter(monkeypatch):
+    client = HttpClient(rate_per_second=1000, max_attempts=3)
+    acquired = []
+    statuses = iter([503, 429, 200])
+    monkeypatch.setattr(client.limiter, "acquire", lambda: acquired.append(1))
+    monkeypatch.setattr(client.session, "request", lambda *a, **kw: _FakeResponse(next(statuses)))
+    monkeypatch.setattr(_http.time, "sleep", lambda seconds: None)
+
+    assert client.get_json("https://example.org/x") == {"ok": True}
+    assert len(acquired) == client.requests_sent == 3
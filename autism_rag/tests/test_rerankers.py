@@ -0,0 +1,47 @@
+import pytest
+
+from autism_rag.config import Settings
+from autism_rag.evaluation import EvalQuestion, ndcg_at_k, weak_relevance
+from autism_rag.rag.rerank import FusionReranker, RerankerUnavailable, get_reranker
+from autism_rag.rag.vectorstore import VectorHit
+from autism_rag.sources.models import EvidenceType
+
+
+def _hits() -> list[VectorHit]:
+    return [
+        VectorHit(id="a", score=0.90, text="Sleep problems in adults with epilepsy."),
+        VectorHit(id="b", score=0.85, text="Early autism screening in toddlers using M-CHAT."),
+        VectorHit(id="c", score=0.80, text="Gut microbiome and diet."),
+    ]
+
+
+def test_fusion_reranker_promotes_lexical_match():
+    reranker = FusionReranker(Settings(), alpha=0.7)
+    ranked = reranker.rerank("autism screening toddlers", _hits(), top_n=2)
+    assert [hit.id for hit in ranked] == ["b", "a"]
+    assert ranked[0].score == pytest.approx(0.7 + 0.3 * 0.5)
+
+
+def test_fusion_reranker_alpha_zero_keeps_vector_order():
+    ranked = FusionReranker(Settings(), alpha=0.0).rerank("autism", _hits(), top_n=3)
+    assert [hit.id for hit in ranked] == ["a", "b", "c"]
+
+
+def test_get_reranker_rejects_unknown_and_unconfigured():
+    with pytest.raises(ValueError):
+        get_reranker("nope", settings=Settings())
+    with pytest.raises(RerankerUnavailable):
+        get_reranker("cross_encoder", settings=Settings(cross_encoder_model_dir=""))
+
+
+def test_ndcg_and_weak_relevance():
+    question = EvalQuestion(
+        question="screening",
+        expected_evidence_types=[EvidenceType.LITERATURE],
+        must_include_terms=["autism"],
+    )
+    hit = VectorHit(id="x", score=1.0, text="Autism study", metadata={"evidence_type": "literature"})
+    assert weak_relevance(hit, question) == 2
+    assert ndcg_at_k([2, 1, 0], 3) == pytest.approx(1.0)
+    assert ndcg_at_k([0, 1, 2], 3) < 1.0
+    assert ndcg_at_k([0, 0], 2) == 0.0
@@ -0,0 +1,154 @@
+from autism_rag.config import Settings
+from autism_rag.rag.cache import IndexGeneration, RetrievalCache, TTLCache
+from autism_rag.rag.embeddings import EmbeddingProvider, InputType
+from autism_rag.rag.rerank import Reranker, RerankError
+from autism_rag.rag.retrieval import RetrievalFilters, Retriever
+from autism_rag.rag.vectorstore import VectorHit, VectorRecord, VectorStore
+
+
+class CountingEmbedder(EmbeddingProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def model_name(self) -> str:
+        return "counting-embedder"
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    def embed(self, texts: list[str], *, input_type: InputType) -> list[list[float]]:
+        self.calls += 1
+        return [[0.5, 0.5] for _ in texts]
+
+
+class CountingVectorStore(VectorStore):
+    def __init__(self) -> None:
+        self.queries = 0
+
+    def ensure_index(self, *, dimension: int, metric: str = "cosine") -> None:
+        pass
+
+    def upsert(self, records: list[VectorRecord], *, namespace: str) -> None:
+        pass
+
+    def delete(self, *, namespace: str, metadata_filter: dict) -> None:
+        pass
+
+    def query(
+        self,
+        *,
+        vector: list[float],
+        namespace: str | None,
+        top_k: int,
+        metadata_filter: dict | None = None,
+        include_namespaces: list[str] | None = None,
+    ) -> list[VectorHit]:
+        self.queries += 1
+        return [
+            VectorHit(id=f"doc-{i}", score=1.0 - i / 10, metadata={"title": f"T{i}"}, text="autism")
+            for i in range(top_k)
+        ]
+
+    def describe(self) -> dict:
+        return {}
+
+
+def _retriever(tmp_path, **cache_kwargs):
+    embedder = CountingEmbedder()
+    store = CountingVectorStore()
+    generation = IndexGeneration(tmp_path / "index_generation")
+    retriever = Retriever(
+        embedder=embedder,
+        vector_store=store,
+        settings=Settings(cache_dir=tmp_path, rerank_enabled=False),
+        cache=RetrievalCache(generation=generation, **cache_kwargs),
+    )
+    return retriever, embedder, store, generation
+
+
+def test_repeat_question_skips_embed_and_query(tmp_path):
+    retriever, embedder, store, _ = _retriever(tmp_path)
+
+    first = retriever.search("What is  autism?", top_k=2)
+    first[0].score = -1.0  # callers may mutate hits; cache must not see it
+    second = retriever.search("What is autism?", top_k=2)
+
+    assert (embedder.calls, store.queries) == (1, 1)
+    assert [h.id for h in second] == ["doc-0", "doc-1"]
+    assert second[0].score == 1.0
+
+
+def test_filters_and_top_k_are_part_of_the_result_key(tmp_path):
+    retriever, embedder, store, _ = _retriever(tmp_path)
+
+    retriever.search("autism", top_k=2)
+    retriever.search("autism", top_k=3)
+    retriever.search("autism", top_k=2, filters=RetrievalFilters(min_year=2020))
+
+    assert store.queries == 3
+    assert embedder.calls == 1  # query vector is shared across result keys
+
+
+def test_index_generation_bump_invalidates_results_but_not_vectors(tmp_path):
+    retriever, embedder, store, generation = _retriever(tmp_path)
+
+    retriever.search("autism", top_k=2)
+    generation.bump()
+    retriever.search("autism", top_k=2)
+
+    assert store.queries == 2
+    assert embedder.calls == 1
+
+
+def test_use_cache_false_bypasses_cache(tmp_path):
+    retriever, embedder, store, _ = _retriever(tmp_path)
+
+    retriever.search("autism", top_k=2)
+    retriever.search("autism", top_k=2, use_cache=False)
+
+    assert (embedder.calls, store.queries) == (2, 2)
+
+
+def test_failed_rerank_returns_vector_order_without_caching(tmp_path):
+    class FlakyReranker(Reranker):
+        name = "cohere"
+        failures = 1
+
+        def rerank(self, query, hits, *, top_n):
+            if self.failures:
+                self.failures -= 1
+                raise RerankError("Cohere rerank failed: timeout")
+            return list(reversed(hits))[:top_n]
+
+    retriever, _, store, _ = _retriever(tmp_path)
+    retriever._rerankers["cohere"] = FlakyReranker()
+
+    degraded = retriever.search("autism", top_k=2, rerank=True, reranker="cohere")
+    reranked = retriever.search("autism", top_k=2, rerank=True, reranker="cohere")
+
+    assert [h.id for h in degraded] == ["doc-0", "doc-1"]
+    assert [h.id for h in reranked] == ["doc-5", "doc-4"]
+    assert store.queries == 2
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    expired = TTLCache(max_entries=2, ttl_seconds=-1)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+def test_disk_persistence_survives_new_cache_instance(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    RetrievalCache(disk_path=path).set_vector(model="m", query="autism", vector=[0.1, 0.2])
+
+    assert RetrievalCache(disk_path=path).get_vector(model="m", query="autism") == [0.1, 0.2]
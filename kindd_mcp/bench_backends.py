@@ -0,0 +1,102 @@
+"""Per-call latency of the HTTP client vs the in-process (local) backend.
+
+Runs the same tool calls through ``KinddClient`` (uncached HTTP against
+``KINDD_API_BASE_URL``) and ``LocalKinddBackend`` (Django ORM in this
+process) and prints p50/p95 per call, with the size of the raw result each
+backend hands to the formatter. Run it on the host that serves Django, with
+the Django app's environment (database settings) loaded:
+
+    KINDD_API_BASE_URL=http://127.0.0.1:8000/api \\
+        python -m kindd_mcp.bench_backends --iterations 50
+
+Pass ``--backends http`` or ``--backends local`` to run only one side.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable
+
+from .tools import (
+    find_regional_center_tool,
+    find_regional_centers_by_zips_tool,
+    search_providers_batch_tool,
+    search_providers_tool,
+)
+
+ZIP_CODES = ["90001", "91101", "91801", "90806", "91344"]
+SEARCHES = [
+    {"zip_code": "90001", "query": "speech"},
+    {"zip_code": "90001", "query": "ABA", "insurance": ["Medi-Cal"]},
+    {"zip_code": "91101", "query": "occupational therapy", "radius_miles": 25},
+]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def calls(client: Any) -> dict[str, tuple[Callable[[], Any], Callable[[], Any]]]:
+    """``{name: (tool call, raw backend call)}`` for one backend."""
+    return {
+        "search_providers": (
+            lambda: search_providers_tool(client, **SEARCHES[1]),
+            lambda: client.search_providers(**SEARCHES[1]),
+        ),
+        "search_providers_batch": (
+            lambda: search_providers_batch_tool(client, SEARCHES),
+            lambda: client.search_providers_batch(SEARCHES, limit=10),
+        ),
+        "find_regional_center_by_zip": (
+            lambda: find_regional_center_tool(client, ZIP_CODES[0]),
+            lambda: client.find_regional_center_by_zip(ZIP_CODES[0]),
+        ),
+        "find_regional_centers_by_zips": (
+            lambda: find_regional_centers_by_zips_tool(client, ZIP_CODES),
+            lambda: client.find_regional_centers_by_zips(ZIP_CODES),
+        ),
+    }
+
+
+def build(backend: str) -> Any:
+    if backend == "local":
+        from .local_backend import LocalKinddBackend
+
+        return LocalKinddBackend()
+    from .kindd_client import KinddClient
+
+    return KinddClient()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", default="http,local", help="Comma-separated: http, local")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'backend':<7} {'call':<30} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8} {'raw KB':>8}")
+    for backend in args.backends.split(","):
+        client = build(backend.strip())
+        for name, (tool_call, raw_call) in calls(client).items():
+            raw_kb = len(json.dumps(raw_call(), default=str)) / 1024
+            for _ in range(args.warmup):
+                tool_call()
+            timings = []
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                tool_call()
+                timings.append((time.perf_counter() - started) * 1000)
+            print(
+                f"{backend:<7} {name:<30} {percentile(timings, 50):8.1f}"
+                f" {percentile(timings, 95):8.1f} {statistics.mean(timings):8.1f} {raw_kb:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
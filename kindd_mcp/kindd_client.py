@@ -7,13 +7,65 @@ be tested and reused independently of the tool/transport layer in
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
 
 import requests
 
 DEFAULT_BASE_URL = "https://api.kinddhelp.com/api"
 DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+DEFAULT_CACHE_MAXSIZE = 1024
+DEFAULT_MAX_CONNECTIONS = 100
+
+SEARCH_PATH = "/providers-v2/comprehensive_search/"
+REGIONAL_CENTER_PATH = "/regional-centers/by_zip_code/"
+SEARCH_BATCH_PATH = "/providers-v2/search_batch/"
+REGIONAL_CENTER_BATCH_PATH = "/regional-centers/by_zip_codes/"
+# Per-request caps of the batch endpoints; larger batches are split.
+MAX_BATCH_SEARCHES = 25
+MAX_BATCH_ZIP_CODES = 100
+
+
+def _base_url(base_url: Optional[str]) -> str:
+    return (base_url or os.environ.get("KINDD_API_BASE_URL", DEFAULT_BASE_URL)).rstrip("/")
+
+
+def search_params(
+    *,
+    query: str = "",
+    zip_code: Optional[str] = None,
+    radius_miles: float = 15,
+    insurance: Optional[list[str]] = None,
+    diagnosis: Optional[str] = None,
+    age: Optional[str] = None,
+    specialization: Optional[str] = None,
+) -> dict[str, Any]:
+    """Map tool arguments onto ``comprehensive_search`` query params."""
+    params: dict[str, Any] = {"q": query, "radius": radius_miles}
+    if zip_code:
+        params["location"] = zip_code
+    if insurance:
+        params["insurance"] = insurance
+    if diagnosis:
+        params["diagnosis"] = diagnosis
+    if age:
+        params["age"] = age
+    if specialization:
+        params["specialization"] = specialization
+    return params
+
+
+def _chunks(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _unique_zip_codes(zip_codes: list[str]) -> list[str]:
+    return list(dict.fromkeys(z.strip() for z in zip_codes if z and z.strip()))
 
 
 class KinddClient:
@@ -25,9 +77,7 @@ class KinddClient:
         session: Optional[Any] = None,
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
     ) -> None:
-        self.base_url = (
-            base_url or os.environ.get("KINDD_API_BASE_URL", DEFAULT_BASE_URL)
-        ).rstrip("/")
+        self.base_url = _base_url(base_url)
         self.session = session or requests.Session()
         self.timeout = timeout
 
@@ -43,20 +93,18 @@ class KinddClient:
         specialization: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """Search providers via ``/providers-v2/comprehensive_search/``."""
-        params: dict[str, Any] = {"q": query, "radius": radius_miles}
-        if zip_code:
-            params["location"] = zip_code
-        if insurance:
-            params["insurance"] = insurance
-        if diagnosis:
-            params["diagnosis"] = diagnosis
-        if age:
-            params["age"] = age
-        if specialization:
-            params["specialization"] = specialization
+        params = search_params(
+            query=query,
+            zip_code=zip_code,
+            radius_miles=radius_miles,
+            insurance=insurance,
+            diagnosis=diagnosis,
+            age=age,
+            specialization=specialization,
+        )
 
         response = self.session.get(
-            f"{self.base_url}/providers-v2/comprehensive_search/",
+            f"{self.base_url}{SEARCH_PATH}",
             params=params,
             timeout=self.timeout,
         )
@@ -66,7 +114,7 @@ class KinddClient:
     def find_regional_center_by_zip(self, zip_code: str) -> Optional[dict[str, Any]]:
         """Look up the Regional Center serving a ZIP code, or ``None``."""
         response = self.session.get(
-            f"{self.base_url}/regional-centers/by_zip_code/",
+            f"{self.base_url}{REGIONAL_CENTER_PATH}",
             params={"zip_code": zip_code},
             timeout=self.timeout,
         )
@@ -74,3 +122,265 @@ class KinddClient:
             return None
         response.raise_for_status()
         return response.json()
+
+    def search_providers_batch(
+        self,
+        searches: list[dict[str, Any]],
+        *,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Run several searches via ``/providers-v2/search_batch/``.
+
+        Each search takes the :meth:`search_providers` keyword arguments.
+        Returns one ``{"count", "providers"}`` dict per search, in order.
+        """
+        results: list[dict[str, Any]] = []
+        for chunk in _chunks([search_params(**search) for search in searches], MAX_BATCH_SEARCHES):
+            response = self.session.post(
+                f"{self.base_url}{SEARCH_BATCH_PATH}",
+                json={"searches": chunk, "limit": limit},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            results.extend(response.json()["results"])
+        return results
+
+    def find_regional_centers_by_zips(
+        self, zip_codes: list[str]
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Regional Center (or ``None``) for each ZIP, in input order."""
+        results: dict[str, Optional[dict[str, Any]]] = {}
+        for chunk in _chunks(_unique_zip_codes(zip_codes), MAX_BATCH_ZIP_CODES):
+            response = self.session.get(
+                f"{self.base_url}{REGIONAL_CENTER_BATCH_PATH}",
+                params={"zip_codes": ",".join(chunk)},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            found = response.json()["results"]
+            results.update((z, found.get(z)) for z in chunk)
+        return results
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire ``ttl`` seconds after being stored."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= self._clock():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_MISSING = object()
+
+
+class AsyncKinddClient:
+    """Async counterpart of :class:`KinddClient` for the MCP server.
+
+    One pooled ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed,
+    keep-alive otherwise) serves every tool call. Successful responses,
+    including "no Regional Center" 404s, are cached in a TTL/LRU cache, and
+    identical calls already in flight share one request. Cached results
+    are shared between callers, so treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        http_client: Optional[Any] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        cache: Optional[TTLCache] = None,
+        max_connections: Optional[int] = None,
+    ) -> None:
+        self.base_url = _base_url(base_url)
+        self.timeout = timeout
+        self.max_connections = max_connections or int(
+            os.environ.get("KINDD_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+        )
+        self.cache = cache or TTLCache(
+            ttl=float(os.environ.get("KINDD_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS)),
+            maxsize=int(os.environ.get("KINDD_CACHE_MAXSIZE", DEFAULT_CACHE_MAXSIZE)),
+        )
+        self._http = http_client
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @property
+    def http(self) -> Any:
+        """The pooled ``httpx.AsyncClient``, created on first use."""
+        if self._http is None:
+            import httpx
+
+            try:
+                import h2  # noqa: F401
+
+                http2 = True
+            except ImportError:
+                http2 = False
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+            # KINDD_API_UDS: reach a co-deployed Django over its Unix socket
+            # (the base URL's host is then only used for the Host header).
+            uds = os.environ.get("KINDD_API_UDS")
+            transport = (
+                httpx.AsyncHTTPTransport(uds=uds, http2=http2, limits=limits) if uds else None
+            )
+            self._http = httpx.AsyncClient(
+                http2=http2,
+                timeout=self.timeout,
+                limits=limits,
+                transport=transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this caller was cancelled
+                # The caller that owned the request was cancelled; fetch here.
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; retrieve here so an unawaited future stays quiet.
+            future.exception()
+            raise
+        else:
+            self.cache.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _get(self, path: str, params: dict[str, Any]) -> Any:
+        return await self.http.get(f"{self.base_url}{path}", params=params)
+
+    async def search_providers(self, **kwargs: Any) -> list[dict[str, Any]]:
+        """Search providers via ``/providers-v2/comprehensive_search/`` (cached)."""
+        params = search_params(**kwargs)
+
+        async def fetch() -> list[dict[str, Any]]:
+            response = await self._get(SEARCH_PATH, params)
+            response.raise_for_status()
+            return response.json()
+
+        key = "search:" + json.dumps(params, sort_keys=True)
+        return await self._cached(key, fetch)
+
+    async def find_regional_center_by_zip(self, zip_code: str) -> Optional[dict[str, Any]]:
+        """Look up the Regional Center serving a ZIP code, or ``None`` (cached)."""
+        zip_code = zip_code.strip()
+
+        async def fetch() -> Optional[dict[str, Any]]:
+            response = await self._get(REGIONAL_CENTER_PATH, {"zip_code": zip_code})
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()
+
+        return await self._cached(f"regional_center:{zip_code}", fetch)
+
+    async def search_providers_batch(
+        self,
+        searches: list[dict[str, Any]],
+        *,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Run several searches via ``/providers-v2/search_batch/`` (cached per search).
+
+        Cached searches are answered locally; the rest go out in as few
+        batch requests as the endpoint's cap allows, concurrently.
+        """
+        params = [search_params(**search) for search in searches]
+        keys = [f"search_batch:{limit}:" + json.dumps(p, sort_keys=True) for p in params]
+        results = {key: self.cache.get(key, _MISSING) for key in keys}
+        missing = list(dict.fromkeys(key for key in keys if results[key] is _MISSING))
+        by_key = dict(zip(keys, params))
+
+        async def fetch(chunk: list[str]) -> None:
+            response = await self.http.post(
+                f"{self.base_url}{SEARCH_BATCH_PATH}",
+                json={"searches": [by_key[key] for key in chunk], "limit": limit},
+            )
+            response.raise_for_status()
+            for key, result in zip(chunk, response.json()["results"]):
+                self.cache.set(key, result)
+                results[key] = result
+
+        await asyncio.gather(*(fetch(chunk) for chunk in _chunks(missing, MAX_BATCH_SEARCHES)))
+        return [results[key] for key in keys]
+
+    async def find_regional_centers_by_zips(
+        self, zip_codes: list[str]
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Regional Center (or ``None``) for each ZIP, in input order.
+
+        Shares the per-ZIP cache with :meth:`find_regional_center_by_zip`;
+        only uncached ZIPs are sent to ``/regional-centers/by_zip_codes/``.
+        """
+        zip_codes = _unique_zip_codes(zip_codes)
+        results = {z: self.cache.get(f"regional_center:{z}", _MISSING) for z in zip_codes}
+        missing = [z for z in zip_codes if results[z] is _MISSING]
+
+        async def fetch(chunk: list[str]) -> None:
+            response = await self._get(REGIONAL_CENTER_BATCH_PATH, {"zip_codes": ",".join(chunk)})
+            response.raise_for_status()
+            found = response.json()["results"]
+            for z in chunk:
+                self.cache.set(f"regional_center:{z}", found.get(z))
+                results[z] = found.get(z)
+
+        await asyncio.gather(*(fetch(chunk) for chunk in _chunks(missing, MAX_BATCH_ZIP_CODES)))
+        return results
@@ -0,0 +1,195 @@
+"""In-process KiNDD backend for when the MCP server runs next to Django.
+
+``LocalKinddBackend`` implements the same lookups as ``KinddClient`` by
+calling the provider search engine (``locations.views``'s
+comprehensive_search filtering) and ``RegionalCenter.find_by_zip_code(s)``
+directly. It skips the HTTP round trip and the full ``ProviderV2Serializer``
+payload: each provider is loaded as only the fields
+``tools.format_provider_search_results`` reads, with insurance carriers
+fetched in one grouped query instead of one query per provider.
+
+Select it with ``KINDD_BACKEND=local`` (see ``server.build_client``). Django
+is configured from ``DJANGO_SETTINGS_MODULE`` (default
+``maplocation.settings``), and the project directory is
+``KINDD_DJANGO_PROJECT_DIR`` (default: the ``maplocation/`` checkout next
+to this package). The database is the one those settings point at.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Optional
+
+from .kindd_client import search_params
+
+DEFAULT_DJANGO_PROJECT_DIR = Path(__file__).resolve().parent.parent / "maplocation"
+# comprehensive_search's response cap.
+MAX_SEARCH_RESULTS = 1000
+
+PROVIDER_FIELDS = ("id", "name", "type", "phone", "website", "address", "insurance_accepted")
+REGIONAL_CENTER_FIELDS = (
+    "id",
+    "regional_center",
+    "telephone",
+    "website",
+    "address",
+    "city",
+    "state",
+    "zip_code",
+    "county_served",
+)
+
+_setup_lock = threading.Lock()
+_configured = False
+
+
+def setup_django() -> None:
+    """Configure Django once per process (no-op if the host already did)."""
+    global _configured
+    with _setup_lock:
+        if _configured:
+            return
+        project_dir = os.environ.get("KINDD_DJANGO_PROJECT_DIR", str(DEFAULT_DJANGO_PROJECT_DIR))
+        if project_dir not in sys.path:
+            sys.path.insert(0, project_dir)
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "maplocation.settings")
+
+        import django
+        from django.apps import apps
+
+        if not apps.ready:
+            django.setup()
+        _configured = True
+
+
+def compact_providers(rows: list[dict[str, Any]], carriers: dict[Any, list[str]]) -> list[dict[str, Any]]:
+    """``ProviderV2Serializer``'s values for the fields the tools keep."""
+    return [
+        {
+            "name": row["name"],
+            "type": row["type"],
+            "phone": row["phone"],
+            "website": row["website"],
+            "address": row["address"],
+            "insurance_carriers": carriers.get(row["id"], []),
+            "insurance_accepted": row["insurance_accepted"],
+            "specializations": [row["type"]] if row["type"] else [],
+            "age_groups_served": "",
+            "distance": None,
+        }
+        for row in rows
+    ]
+
+
+class LocalKinddBackend:
+    """``SupportsKinddLookups`` over the Django ORM in this process."""
+
+    def __init__(self) -> None:
+        setup_django()
+
+    def _load_providers(self, id_lists: list[list[Any]]) -> list[list[dict[str, Any]]]:
+        from locations.models import ProviderInsuranceCarrier, ProviderV2
+
+        ids = {pk for id_list in id_lists for pk in id_list}
+        rows = {row["id"]: row for row in ProviderV2.objects.filter(id__in=ids).values(*PROVIDER_FIELDS)}
+        carriers: dict[Any, list[str]] = defaultdict(list)
+        for provider_id, carrier in (
+            ProviderInsuranceCarrier.objects.filter(provider_id__in=ids)
+            .order_by("id")
+            .values_list("provider_id", "insurance_carrier__name")
+        ):
+            carriers[provider_id].append(carrier)
+        return [
+            compact_providers([rows[pk] for pk in id_list if pk in rows], carriers)
+            for id_list in id_lists
+        ]
+
+    def _search_ids(self, searches: list[dict[str, Any]]) -> list[list[Any]]:
+        from django.db import close_old_connections
+        from locations.views import provider_search_querysets, search_query_dict
+
+        close_old_connections()
+        querysets = provider_search_querysets(
+            [search_query_dict(search_params(**search)) for search in searches]
+        )
+        return [list(qs.values_list("id", flat=True)[:MAX_SEARCH_RESULTS]) for qs in querysets]
+
+    def search_providers(self, **kwargs: Any) -> list[dict[str, Any]]:
+        """Compact records of every provider ``comprehensive_search`` would return."""
+        return self._load_providers(self._search_ids([kwargs]))[0]
+
+    def search_providers_batch(
+        self,
+        searches: list[dict[str, Any]],
+        *,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """``{"count", "providers"}`` per search, like ``/providers-v2/search_batch/``."""
+        matches = self._search_ids(searches)
+        shown = self._load_providers([ids[:limit] for ids in matches])
+        return [
+            {"count": len(ids), "providers": providers}
+            for ids, providers in zip(matches, shown)
+        ]
+
+    def find_regional_center_by_zip(self, zip_code: str) -> Optional[dict[str, Any]]:
+        return self.find_regional_centers_by_zips([zip_code]).get(zip_code.strip())
+
+    def find_regional_centers_by_zips(
+        self, zip_codes: list[str]
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        from django.db import close_old_connections
+        from locations.models import RegionalCenter
+
+        close_old_connections()
+        return {
+            zip_code: (
+                {field: getattr(center, field) for field in REGIONAL_CENTER_FIELDS}
+                if center is not None
+                else None
+            )
+            for zip_code, center in RegionalCenter.find_by_zip_codes(zip_codes).items()
+        }
+
+
+class AsyncLocalKinddBackend:
+    """``SupportsAsyncKinddLookups`` running ``LocalKinddBackend`` in worker threads.
+
+    Calls are independent, so they run off the event loop in parallel
+    (``thread_sensitive=False``); each worker thread keeps its own database
+    connection.
+    """
+
+    def __init__(self, backend: Optional[LocalKinddBackend] = None) -> None:
+        self.backend = backend or LocalKinddBackend()
+
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(getattr(self.backend, method), thread_sensitive=False)(*args, **kwargs)
+
+    async def search_providers(self, **kwargs: Any) -> list[dict[str, Any]]:
+        return await self._run("search_providers", **kwargs)
+
+    async def search_providers_batch(
+        self,
+        searches: list[dict[str, Any]],
+        *,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        return await self._run("search_providers_batch", searches, limit=limit)
+
+    async def find_regional_center_by_zip(self, zip_code: str) -> Optional[dict[str, Any]]:
+        return await self._run("find_regional_center_by_zip", zip_code)
+
+    async def find_regional_centers_by_zips(
+        self, zip_codes: list[str]
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        return await self._run("find_regional_centers_by_zips", zip_codes)
+
+    async def aclose(self) -> None:
+        return None
@@ -1,9 +1,9 @@
 """KiNDD MCP server.
 
 Exposes read-only KiNDD Resource Navigator data (provider search and
-Regional Center lookup) as MCP tools over Streamable HTTP, so AI clients
-(Claude Desktop, Cursor, ChatGPT, or KiNDD's own agent) can query it
-directly.
+Regional Center lookup, single and batched) as MCP tools over Streamable
+HTTP, so AI clients (Claude Desktop, Cursor, ChatGPT, or KiNDD's own agent)
+can query it directly.
 
 Run for local development:
 
@@ -24,13 +24,36 @@ from fastmcp import FastMCP
 from starlette.responses import JSONResponse
 
 from .auth import build_auth_provider
-from .kindd_client import KinddClient
-from .tools import find_regional_center_tool, search_providers_tool
+from .kindd_client import AsyncKinddClient
+from .tools import (
+    find_regional_center_tool_async,
+    find_regional_centers_by_zips_tool_async,
+    search_providers_batch_tool_async,
+    search_providers_tool_async,
+)
 
 load_dotenv()
 
+
+def build_client():
+    """The tools' backend, chosen by ``KINDD_BACKEND``.
+
+    ``http`` (default): one pooled, cached ``AsyncKinddClient`` shared by
+    every tool call. ``local``: query the co-deployed Django database
+    in-process (see ``local_backend``).
+    """
+    backend = os.environ.get("KINDD_BACKEND", "http").strip().lower()
+    if backend == "local":
+        from .local_backend import AsyncLocalKinddBackend
+
+        return AsyncLocalKinddBackend()
+    if backend != "http":
+        raise ValueError(f"Unknown KINDD_BACKEND {backend!r}; use 'http' or 'local'")
+    return AsyncKinddClient()
+
+
 mcp = FastMCP("KiNDD Resource Navigator", auth=build_auth_provider())
-_client = KinddClient()
+_client = build_client()
 
 
 @mcp.custom_route("/health", methods=["GET"])
@@ -39,7 +62,7 @@ async def health_check(request):  # noqa: ANN001 - Starlette request type
 
 
 @mcp.tool()
-def search_providers(
+async def search_providers(
     zip_code: Optional[str] = None,
     query: str = "",
     radius_miles: float = 15,
@@ -64,7 +87,7 @@ def search_providers(
     Returns a compact summary with ``total_matches`` (how many matched
     before truncation) and ``providers`` (the trimmed, returned list).
     """
-    return search_providers_tool(
+    return await search_providers_tool_async(
         _client,
         query=query,
         zip_code=zip_code,
@@ -78,7 +101,7 @@ def search_providers(
 
 
 @mcp.tool()
-def find_regional_center_by_zip(zip_code: str) -> dict:
+async def find_regional_center_by_zip(zip_code: str) -> dict:
     """Find the California Regional Center that serves a given ZIP code.
 
     Args:
@@ -87,7 +110,41 @@ def find_regional_center_by_zip(zip_code: str) -> dict:
     Returns ``found`` (bool) plus Regional Center contact details, or a
     ``message`` explaining that no Regional Center was found.
     """
-    return find_regional_center_tool(_client, zip_code)
+    return await find_regional_center_tool_async(_client, zip_code)
+
+
+@mcp.tool()
+async def find_regional_centers_by_zips(zip_codes: list[str]) -> dict:
+    """Find the California Regional Centers serving several ZIP codes at once.
+
+    Prefer this over repeated ``find_regional_center_by_zip`` calls.
+
+    Args:
+        zip_codes: 5-digit US ZIP codes.
+
+    Returns ``regional_centers`` (each listed once, with the
+    ``requested_zip_codes`` it serves) and ``not_found`` ZIP codes.
+    """
+    return await find_regional_centers_by_zips_tool_async(_client, zip_codes)
+
+
+@mcp.tool()
+async def search_providers_batch(searches: list[dict], limit: int = 10) -> dict:
+    """Run several KiNDD provider searches in one call.
+
+    Prefer this over repeated ``search_providers`` calls, e.g. one search
+    per therapy type near the same ZIP code.
+
+    Args:
+        searches: Search objects with the ``search_providers`` arguments
+            (zip_code, query, radius_miles, insurance, diagnosis, age,
+            specialization).
+        limit: Maximum providers returned per search (default 10).
+
+    Returns ``results``: one compact summary per search, in order, echoing
+    its ``search`` with ``total_matches`` and the trimmed ``providers``.
+    """
+    return await search_providers_batch_tool_async(_client, searches, limit=limit)
 
 
 app = mcp.http_app()
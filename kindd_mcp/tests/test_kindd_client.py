@@ -98,3 +98,135 @@ def test_find_regional_center_by_zip_raises_on_server_error():
 
     with pytest.raises(RuntimeError):
         client.find_regional_center_by_zip("90001")
+
+
+def _async_client(handler, **kwargs):
+    import httpx
+
+    from kindd_mcp.kindd_client import AsyncKinddClient
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncKinddClient(
+        base_url="https://api.kinddhelp.com/api", http_client=http_client, **kwargs
+    )
+
+
+def test_async_client_caches_and_coalesces_identical_searches():
+    import asyncio
+
+    import httpx
+
+    requests_seen = []
+
+    async def handler(request):
+        requests_seen.append(request.url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=[{"name": "Example Therapy Center"}])
+
+    async def run():
+        client = _async_client(handler)
+        concurrent = await asyncio.gather(
+            *(client.search_providers(zip_code="90001", insurance=["Medi-Cal"]) for _ in range(5))
+        )
+        later = await client.search_providers(zip_code="90001", insurance=["Medi-Cal"])
+        other = await client.search_providers(zip_code="90002")
+        return concurrent, later, other
+
+    concurrent, later, other = asyncio.run(run())
+
+    assert all(result == [{"name": "Example Therapy Center"}] for result in concurrent)
+    assert later == concurrent[0]
+    assert other == concurrent[0]
+    assert len(requests_seen) == 2
+    assert requests_seen[0].path == "/api/providers-v2/comprehensive_search/"
+    assert requests_seen[0].params.get_list("insurance") == ["Medi-Cal"]
+    assert requests_seen[0].params["location"] == "90001"
+
+
+def test_async_client_caches_missing_regional_center_but_not_errors():
+    import asyncio
+
+    import httpx
+
+    statuses = {"00000": [404], "90001": [500, 200]}
+    calls = []
+
+    def handler(request):
+        zip_code = request.url.params["zip_code"]
+        calls.append(zip_code)
+        status = statuses[zip_code].pop(0)
+        return httpx.Response(status, json={"regional_center": "SCLARC"})
+
+    async def run():
+        client = _async_client(handler)
+        missing = [await client.find_regional_center_by_zip("00000") for _ in range(2)]
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.find_regional_center_by_zip("90001")
+        found = await client.find_regional_center_by_zip("90001")
+        return missing, found
+
+    missing, found = asyncio.run(run())
+
+    assert missing == [None, None]
+    assert found == {"regional_center": "SCLARC"}
+    assert calls == ["00000", "90001", "90001"]
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used():
+    from kindd_mcp.kindd_client import TTLCache
+
+    now = [0.0]
+    cache = TTLCache(ttl=10, maxsize=2, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a is now most recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 10.0
+    assert cache.get("a") is None
+    assert cache.get("c", "expired") == "expired"
+
+
+def test_async_batch_lookups_send_only_uncached_items_in_one_request():
+    import asyncio
+    import json
+
+    import httpx
+
+    requests_seen = []
+
+    async def handler(request):
+        requests_seen.append(request)
+        if request.url.path.endswith("/regional-centers/by_zip_code/"):
+            return httpx.Response(200, json={"id": 1})
+        if request.url.path.endswith("/regional-centers/by_zip_codes/"):
+            zips = request.url.params["zip_codes"].split(",")
+            return httpx.Response(
+                200, json={"results": {z: {"id": 1} if z != "00000" else None for z in zips}}
+            )
+        searches = json.loads(request.content)["searches"]
+        return httpx.Response(
+            200, json={"results": [{"count": 1, "providers": [{"name": s["q"]}]} for s in searches]}
+        )
+
+    async def run():
+        client = _async_client(handler)
+        await client.find_regional_center_by_zip("90001")
+        centers = await client.find_regional_centers_by_zips(["90001", "90002", " 90002", "00000"])
+        first = await client.search_providers_batch([{"query": "speech", "zip_code": "90001"}], limit=5)
+        both = await client.search_providers_batch(
+            [{"query": "speech", "zip_code": "90001"}, {"query": "ABA", "zip_code": "90001"}],
+            limit=5,
+        )
+        return centers, first, both
+
+    centers, first, both = asyncio.run(run())
+
+    assert centers == {"90001": {"id": 1}, "90002": {"id": 1}, "00000": None}
+    assert [result["providers"][0]["name"] for result in both] == ["speech", "ABA"]
+    assert both[0] == first[0]
+    assert requests_seen[1].url.params["zip_codes"] == "90002,00000"
+    assert [s["q"] for s in json.loads(requests_seen[3].content)["searches"]] == ["ABA"]
+    assert len(requests_seen) == 4
@@ -0,0 +1,42 @@
+"""Tests for the in-process backend's Django-free pieces and backend selection."""
+
+import pytest
+
+
+def test_compact_providers_format_like_serialized_records():
+    from kindd_mcp.local_backend import compact_providers
+    from kindd_mcp.tools import format_provider_search_results
+
+    row = {
+        "id": "a1",
+        "name": "Example Therapy Center",
+        "type": "ABA Therapy",
+        "phone": "555-0100",
+        "website": "https://example.org",
+        "address": "123 Main St, Los Angeles, CA",
+        "insurance_accepted": "Medi-Cal",
+    }
+    serialized = {
+        **row,
+        "insurance_carriers": ["Medi-Cal", "Regional Center"],
+        "specializations": ["ABA Therapy"],
+        "age_groups_served": "",
+        "distance": None,
+        "description": "Long description the formatter drops",
+    }
+
+    compact = compact_providers([row], {"a1": ["Medi-Cal", "Regional Center"]})
+
+    assert format_provider_search_results(compact) == format_provider_search_results([serialized])
+
+
+def test_build_client_defaults_to_http_and_rejects_unknown_backends(monkeypatch):
+    from kindd_mcp.kindd_client import AsyncKinddClient
+    from kindd_mcp.server import build_client
+
+    monkeypatch.delenv("KINDD_BACKEND", raising=False)
+    assert isinstance(build_client(), AsyncKinddClient)
+
+    monkeypatch.setenv("KINDD_BACKEND", "grpc")
+    with pytest.raises(ValueError):
+        build_client()
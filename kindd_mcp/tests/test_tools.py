@@ -108,3 +108,65 @@ def test_find_regional_center_tool_returns_found_false_when_missing():
     assert result["found"] is False
     assert result["zip_code"] == "00000"
     assert "00000" in result["message"]
+
+
+def test_async_tools_await_the_client_and_format_results():
+    import asyncio
+
+    from kindd_mcp.tools import find_regional_center_tool_async, search_providers_tool_async
+
+    class _FakeAsyncClient(_FakeClient):
+        async def search_providers(self, **kwargs):
+            return _FakeClient.search_providers(self, **kwargs)
+
+        async def find_regional_center_by_zip(self, zip_code):
+            return _FakeClient.find_regional_center_by_zip(self, zip_code)
+
+    client = _FakeAsyncClient(providers=[{"name": f"Provider {i}"} for i in range(3)])
+
+    search = asyncio.run(search_providers_tool_async(client, zip_code="90001", limit=2))
+    center = asyncio.run(find_regional_center_tool_async(client, "00000"))
+
+    assert (search["total_matches"], search["returned"]) == (3, 2)
+    assert client.search_calls[0]["zip_code"] == "90001"
+    assert center["found"] is False
+
+
+def test_batch_tools_group_centers_and_format_each_search():
+    import pytest
+
+    from kindd_mcp.tools import find_regional_centers_by_zips_tool, search_providers_batch_tool
+
+    class _FakeBatchClient:
+        def __init__(self):
+            self.batch_calls = []
+
+        def find_regional_centers_by_zips(self, zip_codes):
+            center = {"id": 7, "regional_center": "Eastern Los Angeles Regional Center"}
+            return {"91801": center, "91803": center, "00000": None}
+
+        def search_providers_batch(self, searches, *, limit):
+            self.batch_calls.append((searches, limit))
+            return [
+                {"count": 12, "providers": [{"name": f"{s['query']} {i}"} for i in range(limit)]}
+                for s in searches
+            ]
+
+    client = _FakeBatchClient()
+
+    centers = find_regional_centers_by_zips_tool(client, ["91801", "91803", "00000"])
+    search = search_providers_batch_tool(
+        client,
+        [{"query": "speech", "zip_code": "91801", "insurance": []}, {"query": "ABA"}],
+        limit=2,
+    )
+
+    assert centers["found"] == 2
+    assert centers["not_found"] == ["00000"]
+    assert len(centers["regional_centers"]) == 1
+    assert centers["regional_centers"][0]["requested_zip_codes"] == ["91801", "91803"]
+    assert client.batch_calls[0][0][0] == {"query": "speech", "zip_code": "91801"}
+    assert [(r["total_matches"], r["returned"]) for r in search["results"]] == [(12, 2), (12, 2)]
+    assert search["results"][1]["search"] == {"query": "ABA"}
+    with pytest.raises(ValueError):
+        search_providers_batch_tool(client, [{"therapy": "ABA"}])
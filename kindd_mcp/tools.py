@@ -2,7 +2,8 @@
 
 These functions take a ``KinddClient``-shaped object (anything exposing
 ``search_providers`` and ``find_regional_center_by_zip``) and shape the raw
-API responses into compact dicts suited for MCP tool results. Keeping this
+API responses into compact dicts suited for MCP tool results. The ``_async``
+variants do the same for ``AsyncKinddClient``, which the server uses. Keeping this
 separate from ``kindd_mcp.server`` lets it be tested without a running
 FastMCP server or network access.
 """
@@ -12,6 +13,15 @@ from __future__ import annotations
 from typing import Any, Optional, Protocol
 
 DEFAULT_RESULT_LIMIT = 10
+SEARCH_FIELDS = (
+    "query",
+    "zip_code",
+    "radius_miles",
+    "insurance",
+    "diagnosis",
+    "age",
+    "specialization",
+)
 
 
 class SupportsKinddLookups(Protocol):
@@ -19,13 +29,40 @@ class SupportsKinddLookups(Protocol):
 
     def find_regional_center_by_zip(self, zip_code: str) -> Optional[dict[str, Any]]: ...
 
+    def search_providers_batch(
+        self, searches: list[dict[str, Any]], *, limit: int = ...
+    ) -> list[dict[str, Any]]: ...
+
+    def find_regional_centers_by_zips(
+        self, zip_codes: list[str]
+    ) -> dict[str, Optional[dict[str, Any]]]: ...
+
+
+class SupportsAsyncKinddLookups(Protocol):
+    async def search_providers(self, **kwargs: Any) -> list[dict[str, Any]]: ...
+
+    async def find_regional_center_by_zip(self, zip_code: str) -> Optional[dict[str, Any]]: ...
+
+    async def search_providers_batch(
+        self, searches: list[dict[str, Any]], *, limit: int = ...
+    ) -> list[dict[str, Any]]: ...
+
+    async def find_regional_centers_by_zips(
+        self, zip_codes: list[str]
+    ) -> dict[str, Optional[dict[str, Any]]]: ...
+
 
 def format_provider_search_results(
     providers: list[dict[str, Any]],
     *,
     limit: int = DEFAULT_RESULT_LIMIT,
+    total: Optional[int] = None,
 ) -> dict[str, Any]:
-    """Trim raw provider records into a compact, LLM-friendly shape."""
+    """Trim raw provider records into a compact, LLM-friendly shape.
+
+    ``total`` is the match count when ``providers`` is already truncated
+    (batch search results); it defaults to ``len(providers)``.
+    """
     trimmed = providers[:limit]
     formatted = [
         {
@@ -43,7 +80,7 @@ def format_provider_search_results(
         for provider in trimmed
     ]
     return {
-        "total_matches": len(providers),
+        "total_matches": len(providers) if total is None else total,
         "returned": len(formatted),
         "providers": formatted,
     }
@@ -73,6 +110,58 @@ def format_regional_center_result(
     }
 
 
+def format_regional_centers_by_zip(
+    centers: dict[str, Optional[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Group a ZIP -> center mapping by center, so each center's details
+    appear once with the requested ZIPs it serves."""
+    grouped: dict[Any, dict[str, Any]] = {}
+    not_found = []
+    for zip_code, center in centers.items():
+        if center is None:
+            not_found.append(zip_code)
+            continue
+        key = center.get("id", center.get("regional_center"))
+        if key not in grouped:
+            formatted = format_regional_center_result(center, zip_code)
+            del formatted["found"]
+            grouped[key] = {**formatted, "requested_zip_codes": []}
+        grouped[key]["requested_zip_codes"].append(zip_code)
+    return {
+        "found": len(centers) - len(not_found),
+        "not_found": not_found,
+        "regional_centers": list(grouped.values()),
+    }
+
+
+def _search_kwargs(search: dict[str, Any]) -> dict[str, Any]:
+    unknown = set(search) - set(SEARCH_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown search field(s): {', '.join(sorted(unknown))}; "
+            f"use {', '.join(SEARCH_FIELDS)}"
+        )
+    return {key: value for key, value in search.items() if value not in (None, "", [])}
+
+
+def _format_batch_results(
+    searches: list[dict[str, Any]],
+    results: list[dict[str, Any]],
+    limit: int,
+) -> dict[str, Any]:
+    return {
+        "results": [
+            {
+                "search": search,
+                **format_provider_search_results(
+                    result["providers"], limit=limit, total=result["count"]
+                ),
+            }
+            for search, result in zip(searches, results)
+        ]
+    }
+
+
 def search_providers_tool(
     client: SupportsKinddLookups,
     *,
@@ -105,3 +194,77 @@ def find_regional_center_tool(
     """Look up the Regional Center serving a ZIP code."""
     center = client.find_regional_center_by_zip(zip_code)
     return format_regional_center_result(center, zip_code)
+
+
+def search_providers_batch_tool(
+    client: SupportsKinddLookups,
+    searches: list[dict[str, Any]],
+    *,
+    limit: int = DEFAULT_RESULT_LIMIT,
+) -> dict[str, Any]:
+    """Run several provider searches in one batch request."""
+    searches = [_search_kwargs(search) for search in searches]
+    results = client.search_providers_batch(searches, limit=limit)
+    return _format_batch_results(searches, results, limit)
+
+
+def find_regional_centers_by_zips_tool(
+    client: SupportsKinddLookups,
+    zip_codes: list[str],
+) -> dict[str, Any]:
+    """Look up the Regional Centers serving several ZIP codes at once."""
+    return format_regional_centers_by_zip(client.find_regional_centers_by_zips(zip_codes))
+
+
+async def search_providers_tool_async(
+    client: SupportsAsyncKinddLookups,
+    *,
+    query: str = "",
+    zip_code: Optional[str] = None,
+    radius_miles: float = 15,
+    insurance: Optional[list[str]] = None,
+    diagnosis: Optional[str] = None,
+    age: Optional[str] = None,
+    specialization: Optional[str] = None,
+    limit: int = DEFAULT_RESULT_LIMIT,
+) -> dict[str, Any]:
+    """Async :func:`search_providers_tool`."""
+    providers = await client.search_providers(
+        query=query,
+        zip_code=zip_code,
+        radius_miles=radius_miles,
+        insurance=insurance,
+        diagnosis=diagnosis,
+        age=age,
+        specialization=specialization,
+    )
+    return format_provider_search_results(providers, limit=limit)
+
+
+async def find_regional_center_tool_async(
+    client: SupportsAsyncKinddLookups,
+    zip_code: str,
+) -> dict[str, Any]:
+    """Async :func:`find_regional_center_tool`."""
+    center = await client.find_regional_center_by_zip(zip_code)
+    return format_regional_center_result(center, zip_code)
+
+
+async def search_providers_batch_tool_async(
+    client: SupportsAsyncKinddLookups,
+    searches: list[dict[str, Any]],
+    *,
+    limit: int = DEFAULT_RESULT_LIMIT,
+) -> dict[str, Any]:
+    """Async :func:`search_providers_batch_tool`."""
+    searches = [_search_kwargs(search) for search in searches]
+    results = await client.search_providers_batch(searches, limit=limit)
+    return _format_batch_results(searches, results, limit)
+
+
+async def find_regional_centers_by_zips_tool_async(
+    client: SupportsAsyncKinddLookups,
+    zip_codes: list[str],
+) -> dict[str, Any]:
+    """Async :func:`find_regional_centers_by_zips_tool`."""
+    return format_regional_centers_by_zip(await client.find_regional_centers_by_zips(zip_codes))
@@ -0,0 +1,131 @@
+"""
+Fixtures for the endpoint benchmarks.
+
+The suite needs the PostGIS test database (see the root conftest) and is
+not in the default ``testpaths``; run it explicitly:
+
+    pytest benchmarks --no-cov
+    BENCH_SCALES=300,5000,50000 BENCH_ITERATIONS=30 pytest benchmarks --no-cov
+
+Each size in ``BENCH_SCALES`` seeds that many synthetic providers once
+(locations/utils/synthetic_data.py) and runs every benchmark against it.
+The response cache is replaced by a dummy cache so every call takes the
+uncached path. Results are printed at the end of the run and written to
+``BENCH_REPORT`` (default benchmark-results.json).
+"""
+
+import json
+import os
+
+import pytest
+
+from .harness import Results, measure
+from .thresholds import THRESHOLDS, latency_budget
+
+SCALES = [int(size) for size in os.environ.get("BENCH_SCALES", "300").split(",") if size.strip()]
+ITERATIONS = int(os.environ.get("BENCH_ITERATIONS", "20"))
+REPORT_PATH = os.environ.get("BENCH_REPORT", "benchmark-results.json")
+
+_results = Results()
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results.measurements:
+        return
+    terminalreporter.section("benchmarks")
+    for line in _results.table():
+        terminalreporter.write_line(line)
+    _results.write(REPORT_PATH)
+    terminalreporter.write_line(f"Wrote {REPORT_PATH}")
+
+
+@pytest.fixture(scope="session")
+def uncached():
+    from django.test.utils import override_settings
+
+    with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}):
+        yield
+
+
+@pytest.fixture(scope="session", params=SCALES, ids=lambda rows: f"{rows}rows")
+def bench_rows(request, uncached, django_db_setup, django_db_blocker):
+    """Seed ``rows`` synthetic providers for every benchmark at this size."""
+    from locations.utils.nearby import reset_available_layers
+    from locations.utils.provider_geo import reset_provider_geo_index
+    from locations.utils.synthetic_data import clear_synthetic_data, seed_synthetic_data
+
+    with django_db_blocker.unblock():
+        clear_synthetic_data()
+        seed_synthetic_data(request.param)
+        # The dummy cache pins the facet version, so drop the snapshots by hand.
+        reset_provider_geo_index()
+        reset_available_layers()
+    yield request.param
+    with django_db_blocker.unblock():
+        clear_synthetic_data()
+        reset_provider_geo_index()
+
+
+@pytest.fixture
+def bench(bench_rows):
+    """
+    ``bench(name, call)`` measures ``call`` at the current size, records
+    the result and fails on a threshold regression.
+    """
+
+    def run(name, call):
+        measurement = measure(name, bench_rows, call, ITERATIONS)
+        smallest = _results.smallest(name)
+        _results.add(measurement)
+
+        limits = THRESHOLDS[name]
+        failures = []
+        if measurement.queries > limits["queries"]:
+            failures.append(f"{measurement.queries} queries > {limits['queries']}")
+        if smallest and smallest.rows < bench_rows and measurement.queries > smallest.queries:
+            failures.append(
+                f"{measurement.queries} queries at {bench_rows} rows vs {smallest.queries} at {smallest.rows}"
+            )
+        budget = latency_budget(name, bench_rows)
+        if measurement.p95_ms > budget:
+            failures.append(f"p95 {measurement.p95_ms:.1f} ms > {budget:.0f} ms")
+        if "max_bytes" in limits and measurement.payload_bytes > limits["max_bytes"]:
+            failures.append(f"{measurement.payload_bytes} bytes > {limits['max_bytes']}")
+        assert not failures, f"{name} at {bench_rows} rows: " + "; ".join(failures)
+        return measurement
+
+    return run
+
+
+@pytest.fixture
+def get_body(client):
+    """``get_body(url)()`` fetches ``url`` and returns the body, asserting a 200."""
+
+    def make(url):
+        def call():
+            response = client.get(url)
+            assert response.status_code == 200, f"{url}: {response.status_code} {response.content[:200]!r}"
+            return response.content
+
+        return call
+
+    return make
+
+
+@pytest.fixture
+def stub_bedrock(monkeypatch):
+    """Canned Bedrock and Tavily responses, so only retrieval and formatting are timed."""
+    monkeypatch.setattr("llm.query.generate_embedding", lambda text: [0.0] * 1024)
+    monkeypatch.setattr("llm.query.chat_completion", lambda **kwargs: "Here are some providers near you.")
+    monkeypatch.setattr(
+        "llm.agent.web_search",
+        lambda query, max_results=5: json.dumps(
+            {
+                "results": [
+                    {"title": f"Result {i}", "url": f"https://example.org/{i}", "content": "Snippet " * 40}
+                    for i in range(max_results)
+                ],
+                "answer": "A short answer.",
+            }
+        ),
+    )
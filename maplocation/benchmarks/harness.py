@@ -0,0 +1,102 @@
+"""
+Timing harness for the endpoint benchmarks: p50/p95 latency, SQL query
+count and payload size of a callable, plus the session-wide results table.
+"""
+
+import json
+import math
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Union
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+Payload = Union[bytes, str, None]
+
+
+@dataclass
+class Measurement:
+    name: str
+    rows: int
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    queries: int
+    payload_bytes: int
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _size(payload: Payload) -> int:
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        payload = payload.encode()
+    return len(payload)
+
+
+def measure(name: str, rows: int, call: Callable[[], Payload], iterations: int, warmup: int = 1) -> Measurement:
+    """
+    Run ``call`` ``warmup`` times untimed, then ``iterations`` times timed.
+    ``call`` returns the payload (response body or built context); the
+    query count is the largest seen in a single timed call.
+    """
+    for _ in range(warmup):
+        call()
+
+    timings, queries, payload_bytes = [], 0, 0
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            payload = call()
+            timings.append((time.perf_counter() - started) * 1000)
+        queries = max(queries, len(captured.captured_queries))
+        payload_bytes = _size(payload)
+
+    return Measurement(
+        name=name,
+        rows=rows,
+        iterations=iterations,
+        p50_ms=round(statistics.median(timings), 3),
+        p95_ms=round(percentile(timings, 95), 3),
+        queries=queries,
+        payload_bytes=payload_bytes,
+    )
+
+
+class Results:
+    """Measurements collected over a session, keyed by (name, rows)."""
+
+    def __init__(self):
+        self.measurements: Dict[tuple, Measurement] = {}
+
+    def add(self, measurement: Measurement) -> None:
+        self.measurements[(measurement.name, measurement.rows)] = measurement
+
+    def smallest(self, name: str) -> Optional[Measurement]:
+        """The measurement of ``name`` at the fewest rows, if any."""
+        matches = [m for (n, _), m in self.measurements.items() if n == name]
+        return min(matches, key=lambda m: m.rows) if matches else None
+
+    def table(self) -> List[str]:
+        lines = [f"{'benchmark':<34} {'rows':>6} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8} {'bytes':>10}"]
+        for m in sorted(self.measurements.values(), key=lambda m: (m.name, m.rows)):
+            lines.append(
+                f"{m.name:<34} {m.rows:>6} {m.p50_ms:>9.2f} {m.p95_ms:>9.2f} {m.queries:>8} {m.payload_bytes:>10}"
+            )
+        return lines
+
+    def write(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as handle:
+            json.dump([asdict(m) for m in self.measurements.values()], handle, indent=2)
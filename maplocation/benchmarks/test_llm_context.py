@@ -0,0 +1,33 @@
+"""
+Benchmarks for the RAG context builders, with Bedrock and Tavily stubbed
+so only retrieval and prompt assembly are measured.
+"""
+
+import json
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+QUERY = "Which ABA therapy providers near me take Medi-Cal? What is the latest regional center policy?"
+USER_CONTEXT = {
+    "zip_code": "90001",
+    "child_age": 4,
+    "diagnosis": "Autism Spectrum Disorder",
+    "insurance": "Medi-Cal",
+}
+
+
+def test_rag_chat_context(bench, stub_bedrock):
+    from llm.views import _build_chat_context
+
+    bench("rag_chat_context", lambda: _build_chat_context(QUERY, dict(USER_CONTEXT))[0])
+
+
+def test_rag_answer_query(bench, stub_bedrock):
+    from llm.query import answer_query
+
+    bench(
+        "rag_answer_query",
+        lambda: json.dumps(answer_query(QUERY, dict(USER_CONTEXT)), default=str),
+    )
@@ -0,0 +1,48 @@
+"""
+Latency, query-count and payload benchmarks for the provider and regional
+center endpoints.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+# Downtown LA; every synthetic size has providers within a few miles.
+LAT, LNG = 34.0522, -118.2437
+
+
+def test_providers_list(bench, get_body):
+    bench("providers_list", get_body("/api/providers-v2/"))
+
+
+def test_providers_nearby(bench, get_body):
+    bench("providers_nearby", get_body(f"/api/providers-v2/nearby/?lat={LAT}&lng={LNG}&radius=10&limit=20"))
+
+
+def test_nearby_layers(bench, get_body):
+    bench("nearby_layers", get_body(f"/api/nearby/?lat={LAT}&lng={LNG}&radius=10"))
+
+
+def test_comprehensive_search(bench, get_body):
+    bench(
+        "comprehensive_search",
+        get_body(
+            f"/api/providers-v2/comprehensive_search/?lat={LAT}&lng={LNG}&radius=15"
+            "&insurance=Medi-Cal&age=0-5&diagnosis=Autism%20Spectrum%20Disorder"
+        ),
+    )
+
+
+def test_by_regional_center(bench, get_body):
+    bench(
+        "by_regional_center",
+        get_body("/api/providers-v2/by_regional_center/?zip_code=90001&insurance=Medi-Cal&age=0-5"),
+    )
+
+
+def test_provider_filters(bench, get_body):
+    bench("provider_filters", get_body("/api/providers-v2/filters/"))
+
+
+def test_service_area_boundaries(bench, get_body):
+    bench("service_area_boundaries", get_body("/api/regional-centers/service_area_boundaries/"))
@@ -0,0 +1,37 @@
+"""
+Regression thresholds for the endpoint benchmarks.
+
+``queries`` is a ceiling on SQL statements per call at any size; the suite
+also fails when a benchmark issues more queries at a larger size than at
+the smallest one measured (an N+1). ``p95_ms`` is a latency budget per
+seeded provider count, with the response cache disabled. Budgets are
+scaled by ``BENCH_LATENCY_FACTOR`` for slower machines (e.g. ``2`` on
+shared CI runners). ``max_bytes`` bounds payloads that have a fixed limit.
+
+Tighten a budget after a speedup lands so it stays won.
+"""
+
+import os
+
+LATENCY_FACTOR = float(os.environ.get("BENCH_LATENCY_FACTOR", "1"))
+
+THRESHOLDS = {
+    # One page of PAGE_SIZE (1000) providers, serialized.
+    "providers_list": {"queries": 6, "p95_ms": {300: 150, 5000: 600, 50000: 900}},
+    "providers_nearby": {"queries": 4, "p95_ms": {300: 40, 5000: 60, 50000: 120}, "max_bytes": 40_000},
+    "nearby_layers": {"queries": 3, "p95_ms": {300: 40, 5000: 60, 50000: 120}},
+    "comprehensive_search": {"queries": 6, "p95_ms": {300: 60, 5000: 150, 50000: 400}},
+    # Matches provider addresses against the center's ZIPs row by row.
+    "by_regional_center": {"queries": 6, "p95_ms": {300: 80, 5000: 600, 50000: 5000}},
+    "provider_filters": {"queries": 4, "p95_ms": {300: 40, 5000: 150, 50000: 800}},
+    "service_area_boundaries": {"queries": 4, "p95_ms": {300: 80, 5000: 80, 50000: 80}},
+    "rag_chat_context": {"queries": 6, "p95_ms": {300: 60, 5000: 150, 50000: 600}, "max_bytes": 20_000},
+    "rag_answer_query": {"queries": 6, "p95_ms": {300: 60, 5000: 150, 50000: 600}},
+}
+
+
+def latency_budget(name: str, rows: int) -> float:
+    """The p95 budget for ``name`` at ``rows``, from the nearest size at or above it."""
+    budgets = THRESHOLDS[name]["p95_ms"]
+    size = min((s for s in budgets if s >= rows), default=max(budgets))
+    return budgets[size] * LATENCY_FACTOR
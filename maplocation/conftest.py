@@ -2,6 +2,8 @@
 Pytest configuration and fixtures for the entire project.
 """
 
+from contextlib import nullcontext
+
 import pytest
 from django.conf import settings
 
@@ -19,6 +21,31 @@ def django_db_setup():
     }
 
 
+@pytest.fixture
+def sqlite_connection(request):
+    """
+    An in-memory SQLite database registered as the ``sqlite`` alias, for
+    the code paths that must work without PostgreSQL (dev/test setups).
+    Tables are created by the test with raw SQL.
+    """
+    from django.db import connections
+    from django.db.backends.sqlite3.base import DatabaseWrapper
+
+    try:
+        blocker = request.getfixturevalue("django_db_blocker").unblock()
+    except pytest.FixtureLookupError:  # pytest-django not active
+        blocker = nullcontext()
+    config = connections.configure_settings(
+        {"default": {}, "sqlite": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+    )
+    connection = DatabaseWrapper(config["sqlite"], alias="sqlite")
+    connections["sqlite"] = connection
+    with blocker:
+        yield connection
+        connection.close()
+    del connections["sqlite"]
+
+
 @pytest.fixture
 def api_client():
     """Create a DRF API client for testing."""
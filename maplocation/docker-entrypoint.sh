@@ -24,26 +24,23 @@ export DJANGO_SECRET_KEY=$(aws secretsmanager get-secret-value \
 
 echo "Secrets fetched."
 
-echo "Fixing migration history if needed..."
-python manage.py fix_migrations || echo "Migration fix skipped or failed"
+# Each bootstrap step is skipped when its inputs are unchanged
+# (locations/utils/bootstrap.py). Static files are collected at build time.
+echo "Applying pending migrations..."
+python manage.py bootstrap --phase schema
 
-echo "Running database migrations..."
-python manage.py migrate --noinput
-
-echo "Collecting static files..."
-python manage.py collectstatic --noinput --clear
-
-echo "Populating regional center ZIP codes..."
-python manage.py populate_san_gabriel_zips || echo "San Gabriel ZIP population failed or skipped"
-python manage.py populate_pasadena_zips || echo "Pasadena ZIP population failed or skipped"
-
-echo "Importing provider data..."
-python manage.py import_regional_center_providers --file "data/Pasadena Provider List.xlsx" --area "Pasadena" || echo "Pasadena import failed or skipped"
-python manage.py import_regional_center_providers --file "data/San Gabriel Pomona Provider List.xlsx" --regional-center "San Gabriel" || echo "San Gabriel import failed or skipped"
+# Reference data loads in the background so Gunicorn binds right away.
+echo "Loading reference data in the background..."
+python manage.py bootstrap --phase data &
 
 echo "Starting Gunicorn..."
 # --preload: Load app before forking workers (shares code, establishes DB connections early)
 # --workers 2: Use 2 workers (t3.small has 2 vCPUs)
-# --threads 2: Use 2 threads per worker for better concurrency
 # --keep-alive 5: Keep connections alive for 5 seconds between requests
-exec gunicorn --bind 0.0.0.0:8000 --workers 2 --threads 2 --timeout 120 --keep-alive 5 --preload maplocation.wsgi:application
+# ASGI (default): uvicorn workers run the SSE chat streams on the event loop,
+# so open streams don't hold a worker. APP_SERVER=wsgi restores sync workers.
+if [ "${APP_SERVER:-asgi}" = "wsgi" ]; then
+    # --threads 2: Use 2 threads per worker for better concurrency
+    exec gunicorn --bind 0.0.0.0:8000 --workers 2 --threads 2 --timeout 120 --keep-alive 5 --preload maplocation.wsgi:application
+fi
+exec gunicorn --bind 0.0.0.0:8000 --workers 2 --worker-class uvicorn_worker.UvicornWorker --timeout 120 --keep-alive 5 --preload maplocation.asgi:application
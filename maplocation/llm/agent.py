@@ -16,6 +16,7 @@ import logging
 import os
 
 from locations.models import ProviderV2, RegionalCenter
+from maplocation.request_profile import timed
 
 from .observability import agent_observation
 
@@ -40,6 +41,27 @@ def _provider_regional_center(provider: ProviderV2) -> str | None:
     return None
 
 
+def _providers_served_by(providers, regional_center) -> list:
+    """
+    Keep the providers linked to ``regional_center`` (one query for the
+    whole list; links come from ``assign_service_areas``'s spatial join).
+    """
+    from locations.models import ProviderRegionalCenter
+
+    linked = set(
+        ProviderRegionalCenter.objects.filter(
+            regional_center=regional_center,
+            provider_id__in=[p.id for p in providers],
+        ).values_list("provider_id", flat=True)
+    )
+    name = regional_center.regional_center.lower()
+    return [
+        p
+        for p in providers
+        if p.id in linked or name in str(getattr(p, "regional_center", None) or "").lower()
+    ]
+
+
 # ============================================================================
 # KINDD TOOLS - These give the agent access to our database
 # ============================================================================
@@ -85,11 +107,7 @@ def search_providers(
     if zip_code:
         rc = RegionalCenter.find_by_zip_code(zip_code)
         if rc:
-            providers = [
-                p
-                for p in providers
-                if rc.regional_center.lower() in str(_provider_regional_center(p)).lower()
-            ]
+            providers = _providers_served_by(providers, rc)
 
     # Format results
     results = []
@@ -118,13 +136,15 @@ def search_providers(
 @tool
 def get_regional_center(zip_code: str) -> str:
     """
-    Find which Regional Center serves a given ZIP code in LA County.
+    Find which Regional Center serves a given ZIP code.
 
     Use this when users ask which Regional Center serves their area,
     or when you need to determine eligibility based on location.
+    ZIPs not on a center's list are resolved by which service area
+    contains them.
 
     Args:
-        zip_code: 5-digit ZIP code in Los Angeles County
+        zip_code: 5-digit California ZIP code
 
     Returns:
         Regional Center name and contact information
@@ -508,7 +528,8 @@ def _run_tavily_search(
         if include_domains:
             search_kwargs["include_domains"] = include_domains
 
-        response = client.search(**search_kwargs)
+        with timed("tavily"):
+            response = client.search(**search_kwargs)
     except Exception as exc:
         logger.warning(
             "Tavily search unavailable",
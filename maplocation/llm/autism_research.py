@@ -7,7 +7,9 @@ client and exposes app-facing endpoints/tools.
 
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 import requests
@@ -35,18 +37,14 @@ def ask_autism_research(
 ) -> dict[str, Any]:
     """Ask the Autism Research RAG service and return its structured response."""
 
-    payload: dict[str, Any] = {"question": question}
-    if top_k is not None:
-        payload["top_k"] = top_k
-    if evidence_types:
-        payload["evidence_types"] = evidence_types
-    if access_classes:
-        payload["access_classes"] = access_classes
-    if min_year is not None:
-        payload["min_year"] = min_year
-    if rerank is not None:
-        payload["rerank"] = rerank
-
+    payload = _ask_payload(
+        question,
+        top_k=top_k,
+        evidence_types=evidence_types,
+        access_classes=access_classes,
+        min_year=min_year,
+        rerank=rerank,
+    )
     url = f"{_rag_base_url()}/ask"
     try:
         response = requests.post(  # nosec B113 - timeout is supplied from settings.
@@ -66,6 +64,84 @@ def ask_autism_research(
         raise AutismResearchError("Autism Research RAG returned invalid JSON") from exc
 
 
+def stream_autism_research(
+    question: str,
+    *,
+    top_k: int | None = None,
+    evidence_types: list[str] | None = None,
+    access_classes: list[str] | None = None,
+    min_year: int | None = None,
+    rerank: bool | None = None,
+) -> Iterator[str]:
+    """Relay ``/ask/stream`` SSE events from the RAG service.
+
+    Yields complete SSE ``data:`` frames. Citations arrive as soon as
+    retrieval finishes; answer chunks follow as the model generates them.
+    If the service cannot be reached before streaming starts, the classic
+    fallback answer is emitted as a single chunk instead.
+    """
+
+    payload = _ask_payload(
+        question,
+        top_k=top_k,
+        evidence_types=evidence_types,
+        access_classes=access_classes,
+        min_year=min_year,
+        rerank=rerank,
+    )
+    url = f"{_rag_base_url()}/ask/stream"
+    try:
+        response = requests.post(  # nosec B113 - timeout is supplied from settings.
+            url,
+            json=payload,
+            stream=True,
+            timeout=getattr(settings, "AUTISM_RAG_TIMEOUT_SECONDS", 45),
+        )
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        logger.warning(
+            "Autism Research RAG stream failed; falling back to classic pipeline",
+            extra={"url": url, "error_type": type(exc).__name__},
+        )
+        result = _classic_fallback(question)
+        yield _sse({"type": "citations", "citations": []})
+        yield _sse({"type": "chunk", "content": result["answer"]})
+        yield _sse({"type": "done", "model": result["runtime"]})
+        return
+
+    with response:
+        for line in response.iter_lines(decode_unicode=True):
+            if line and line.startswith("data: "):
+                yield f"{line}\n\n"
+
+
+def _sse(event: dict[str, Any]) -> str:
+    return f"data: {json.dumps(event)}\n\n"
+
+
+def _ask_payload(
+    question: str,
+    *,
+    top_k: int | None,
+    evidence_types: list[str] | None,
+    access_classes: list[str] | None,
+    min_year: int | None,
+    rerank: bool | None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {"question": question}
+    if top_k is not None:
+        payload["top_k"] = top_k
+    if evidence_types:
+        payload["evidence_types"] = evidence_types
+    if access_classes:
+        payload["access_classes"] = access_classes
+    if min_year is not None:
+        payload["min_year"] = min_year
+    if rerank is not None:
+        payload["rerank"] = rerank
+    return payload
+
+
 def _classic_fallback(question: str) -> dict[str, Any]:
     """Answer via the main chat pipeline when the RAG service is unavailable.
 
@@ -6,7 +6,6 @@ All within your AWS Personal account - no external API keys needed.
 """
 
 import json
-import boto3
 from django.conf import settings
 from typing import Optional
 
@@ -19,6 +18,8 @@ CHAT_MODEL_ID = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
 # Initialize Bedrock client
 def get_bedrock_client():
     """Get Bedrock runtime client using AWS credentials."""
+    import boto3  # imported on first use; boto3/botocore are slow to load
+
     return boto3.client(
         "bedrock-runtime",
         region_name=getattr(settings, "AWS_REGION", "us-west-2"),
@@ -27,6 +28,8 @@ def get_bedrock_client():
 
 def get_bedrock_agent_client():
     """Get Bedrock agent client for knowledge bases."""
+    import boto3
+
     return boto3.client(
         "bedrock-agent-runtime",
         region_name=getattr(settings, "AWS_REGION", "us-west-2"),
@@ -483,6 +486,8 @@ def analyze_document(image_base64: str, media_type: str = "image/jpeg") -> str:
 
 def list_available_models():
     """List foundation models available in your Bedrock account."""
+    import boto3
+
     client = boto3.client("bedrock", region_name="us-west-2")
 
     response = client.list_foundation_models(
@@ -34,6 +34,7 @@ from locations.models import ProviderV2, RegionalCenter
 from .agent import (
     CLINICAL_ALLOWLIST,
     get_agent_system_prompt_for_locale,
+    _providers_served_by,
     _run_tavily_search,
 )
 from .autism_research import AutismResearchError, ask_autism_research
@@ -85,12 +86,7 @@ def search_providers(
     if zip_code:
         regional_center = RegionalCenter.find_by_zip_code(zip_code)
         if regional_center:
-            providers = [
-                provider
-                for provider in providers
-                if regional_center.regional_center.lower()
-                in str(_provider_regional_center(provider)).lower()
-            ]
+            providers = _providers_served_by(providers, regional_center)
 
     results = [_provider_summary(provider) for provider in providers[:max_results]]
     return _json_response({"count": len(results), "providers": results})
@@ -8,6 +8,7 @@ agent calls with trace attributes that make CHLA queries searchable.
 
 import base64
 import hashlib
+import importlib.util
 import logging
 import os
 import time
@@ -17,15 +18,33 @@ from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from typing import Any, Iterator, Optional
 
-try:
-    from langfuse import get_client, propagate_attributes
-except ImportError:
+
+# The Langfuse SDK is imported on first use: it pulls in OpenTelemetry and
+# pydantic and adds about a quarter second to every process start.
+def _langfuse_get_client():
+    from langfuse import get_client
+
+    return get_client()
+
+
+if importlib.util.find_spec("langfuse") is not None:
+    get_client = _langfuse_get_client
+
+    @contextmanager
+    def propagate_attributes(**kwargs):
+        from langfuse import propagate_attributes as langfuse_propagate_attributes
+
+        with langfuse_propagate_attributes(**kwargs):
+            yield
+
+else:
     get_client = None
 
     @contextmanager
     def propagate_attributes(**kwargs):
         yield
 
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_LANGFUSE_HOST = "https://us.cloud.langfuse.com"
@@ -118,6 +137,14 @@ def record_llm_call(
         error_type=type(error).__name__ if error else None,
     )
     _recent_llm_calls.append(record)
+    from maplocation.request_profile import current_profile
+
+    request_profile = current_profile()
+    if request_profile is not None:
+        request_profile.add_time("bedrock", latency_ms)
+    from .throttles import charge_bedrock_tokens
+
+    charge_bedrock_tokens((record.input_tokens or 0) + (record.output_tokens or 0))
     logger.info(
         "LLM call",
         extra={
@@ -163,21 +163,13 @@ def semantic_search(query: str, limit: int = 15) -> list[ProviderV2]:
 
 def keyword_search(query: str, limit: int = 15) -> list[ProviderV2]:
     """
-    Basic keyword search fallback.
-    Searches name, therapy types, and diagnoses.
+    Keyword search fallback: providers matching any word of the query,
+    ranked by full-text relevance with typo tolerance
+    (see locations/utils/text_search.py).
     """
-    from django.db.models import Q
-
-    terms = query.lower().split()
-
-    q = Q()
-    for term in terms:
-        q |= Q(name__icontains=term)
-        q |= Q(therapy_types__icontains=term)
-        q |= Q(diagnoses_treated__icontains=term)
-        q |= Q(description__icontains=term)
+    from locations.utils.text_search import ranked_search
 
-    return list(ProviderV2.objects.filter(q)[:limit])
+    return list(ranked_search(ProviderV2.objects.all(), query, match_any=True)[:limit])
 
 
 def format_provider_context(providers: list[ProviderV2]) -> str:
@@ -0,0 +1,97 @@
+"""
+Server-Sent Events helpers for the streaming LLM views.
+
+Each view writes its stream once, as a sync generator (or, for the Strands
+agent, an async one), and :func:`stream_body` / :func:`async_stream_body`
+hand Django the body type the running server streams natively:
+
+- Under ASGI (``maplocation/asgi.py`` on uvicorn workers) the body is an
+  async iterator on the worker's event loop, so a slow Bedrock or Strands
+  stream waits on I/O instead of pinning a worker. A sync generator is
+  stepped through ``sync_to_async(thread_sensitive=True)``, which gives
+  each request its own executor thread.
+- Under WSGI (``runserver``, ``APP_SERVER=wsgi``) the body is a sync
+  iterator, written out chunk by chunk. Django would otherwise buffer an
+  async body into a list before sending anything.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Union
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+_DONE = object()
+
+
+def sse(payload: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def is_asgi(request) -> bool:
+    """Whether ``request`` (a Django or DRF request) is served over ASGI."""
+    return isinstance(getattr(request, "_request", request), ASGIRequest)
+
+
+async def iterate_in_thread(make_iterable: Callable[..., Iterable], *args, **kwargs) -> AsyncIterator:
+    """
+    Iterate a blocking (sync) generator without blocking the event loop.
+    The generator is created and advanced in the request's sync thread,
+    one item per hop, and closed there if the client goes away.
+    """
+    iterator = await sync_to_async(lambda: iter(make_iterable(*args, **kwargs)))()
+    step = sync_to_async(next)
+    try:
+        while True:
+            item = await step(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close)()
+
+
+def iterate_on_loop(events: AsyncIterator) -> Iterator:
+    """
+    Iterate an async iterator from sync code, one item per step, on a
+    private event loop that lives as long as the iteration.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(events.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        try:
+            close = getattr(events, "aclose", None)
+            if close is not None:
+                loop.run_until_complete(close())
+        finally:
+            loop.close()
+
+
+def stream_body(request, make_events: Callable[[], Iterable[str]]) -> Union[Iterable[str], AsyncIterator[str]]:
+    """``make_events()``'s SSE strings as the body type the server streams natively."""
+    if is_asgi(request):
+        return iterate_in_thread(make_events)
+    return make_events()
+
+
+def async_stream_body(request, events: AsyncIterator[str]) -> Union[Iterable[str], AsyncIterator[str]]:
+    """``events`` as is under ASGI, driven item by item on a private loop under WSGI."""
+    if is_asgi(request):
+        return events
+    return iterate_on_loop(events)
+
+
+def sse_response(events: Union[Iterable[str], AsyncIterator[str]]) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
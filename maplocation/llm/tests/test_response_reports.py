@@ -43,9 +43,13 @@ def valid_report(response=REPORTED_RESPONSE, fingerprint=None):
 
 @pytest.fixture(autouse=True)
 def clear_throttle_cache():
+    from maplocation.rate_limit import reset_rate_limiter
+
     cache.clear()
+    reset_rate_limiter()
     yield
     cache.clear()
+    reset_rate_limiter()
 
 
 def report_model():
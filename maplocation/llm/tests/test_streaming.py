@@ -0,0 +1,47 @@
+"""Tests for the SSE body helpers (llm/streaming.py)."""
+
+import asyncio
+
+from django.test import RequestFactory
+
+from llm.streaming import async_stream_body, iterate_on_loop, stream_body
+
+
+def test_wsgi_requests_get_sync_bodies_that_stream_item_by_item():
+    request = RequestFactory().post("/api/llm/stream/")
+    produced = []
+
+    def events():
+        for event in ("a", "b"):
+            produced.append(event)
+            yield event
+
+    body = stream_body(request, events)
+    assert next(body) == "a" and produced == ["a"]
+    assert list(body) == ["b"]
+
+    async def async_events():
+        for event in ("x", "y"):
+            produced.append(event)
+            await asyncio.sleep(0)
+            yield event
+
+    body = async_stream_body(request, async_events())
+    assert next(body) == "x" and produced[-1] == "x"
+    assert list(body) == ["y"]
+
+
+def test_iterate_on_loop_closes_an_abandoned_async_iterator():
+    closed = []
+
+    async def events():
+        try:
+            yield 1
+            yield 2
+        finally:
+            closed.append(True)
+
+    body = iterate_on_loop(events())
+    assert next(body) == 1
+    body.close()
+    assert closed == [True]
@@ -1,22 +1,89 @@
-"""Privacy-preserving throttles for assistant response reports."""
+"""
+Throttles for the LLM endpoints, counted in the shared rate limiter
+(maplocation/rate_limit.py) so limits hold across workers, plus the
+privacy-preserving throttle for assistant response reports.
+"""
 
 from datetime import timedelta
 
 from django.conf import settings
 from django.db.models import F
 from django.utils import timezone
-from rest_framework.throttling import BaseThrottle
+from rest_framework.throttling import AnonRateThrottle, BaseThrottle
 
-from .models import ResponseReportThrottleWindow
+from maplocation.rate_limit import SharedLimiterUnavailable, get_rate_limiter, is_shared
+
+BEDROCK_BUDGET_KEY = "bedrock:tokens"
+RESPONSE_REPORT_KEY = "response_report:global"
+
+
+class SharedAnonRateThrottle(AnonRateThrottle):
+    """``AnonRateThrottle`` over the shared sliding-window limiter instead of the per-worker cache."""
+
+    retry_after = None
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        decision = get_rate_limiter().hit(self.key, self.num_requests, self.duration)
+        self.retry_after = decision.retry_after
+        return decision.allowed
+
+    def wait(self):
+        return self.retry_after
+
+
+def _bedrock_tokens_per_minute() -> int:
+    return int(getattr(settings, "BEDROCK_TOKENS_PER_MINUTE", 0))
+
+
+class BedrockTokenBudgetThrottle(BaseThrottle):
+    """
+    Refuse LLM requests while the deployment-wide Bedrock token budget
+    (BEDROCK_TOKENS_PER_MINUTE, input + output) is spent. Tokens are
+    charged after each call by ``charge_bedrock_tokens``, so a request is
+    let in while any budget remains and may overdraw it; the overdraft
+    delays the next request.
+    """
+
+    retry_after = None
+
+    def allow_request(self, request, view):
+        per_minute = _bedrock_tokens_per_minute()
+        if per_minute <= 0:
+            return True
+        decision = get_rate_limiter().take(BEDROCK_BUDGET_KEY, per_minute, 60, cost=0)
+        self.retry_after = decision.retry_after
+        return decision.allowed
+
+    def wait(self):
+        return self.retry_after
+
+
+def charge_bedrock_tokens(tokens: int) -> None:
+    """Charge ``tokens`` used by a Bedrock call against the budget."""
+    per_minute = _bedrock_tokens_per_minute()
+    if per_minute > 0 and tokens > 0:
+        get_rate_limiter().take(BEDROCK_BUDGET_KEY, per_minute, 60, cost=tokens, allow_debt=True)
 
 
 class GlobalResponseReportThrottle(BaseThrottle):
-    """Apply one atomic global fixed-window limit without identifying clients."""
+    """
+    Apply one atomic global limit without identifying clients. With a
+    shared (Redis) limiter this is a sliding window there, with no
+    database writes; otherwise, or while Redis is unreachable, a fixed
+    window in the database, the only other store all workers share.
+    """
 
     default_limit = 60
     retention = timedelta(days=1)
 
     def allow_request(self, request, view):
+        from .models import ResponseReportThrottleWindow
+
         limit = int(
             getattr(
                 settings,
@@ -24,6 +91,12 @@ class GlobalResponseReportThrottle(BaseThrottle):
                 self.default_limit,
             )
         )
+        if is_shared():
+            try:
+                return get_rate_limiter().hit(RESPONSE_REPORT_KEY, limit, 60, fallback=False).allowed
+            except SharedLimiterUnavailable:
+                pass  # count in the database window below
+
         window_start = timezone.now().replace(second=0, microsecond=0)
         _, created = ResponseReportThrottleWindow.objects.get_or_create(
             window_start=window_start,
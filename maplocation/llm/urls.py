@@ -18,6 +18,7 @@ from .views import (
     ImageAnalysisView,
     DocumentAnalysisView,
     AutismResearchView,
+    AutismResearchStreamView,
     AssistantResponseReportView,
 )
 
@@ -51,6 +52,11 @@ urlpatterns = [
     path("health/", LLMHealthView.as_view(), name="llm-health"),
     path("monitor/", LLMMonitorView.as_view(), name="llm-monitor"),
     path("autism-research/", AutismResearchView.as_view(), name="llm-autism-research"),
+    path(
+        "autism-research-stream/",
+        AutismResearchStreamView.as_view(),
+        name="llm-autism-research-stream",
+    ),
     path("analyze-image/", ImageAnalysisView.as_view(), name="llm-analyze-image"),
     path("analyze-document/", DocumentAnalysisView.as_view(), name="llm-analyze-document"),
 ]
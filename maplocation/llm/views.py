@@ -4,7 +4,6 @@ API views for KiNDD LLM endpoints.
 Includes both regular and streaming (SSE) endpoints.
 """
 
-import json
 import logging
 
 from django.db import IntegrityError, transaction
@@ -12,16 +11,15 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-from rest_framework.throttling import AnonRateThrottle
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
-from django.http import StreamingHttpResponse
 
 from .query import answer_query, explain_eligibility, find_providers_by_criteria
 from .autism_research import (
     AutismResearchError,
     ask_autism_research,
     check_autism_research_health,
+    stream_autism_research,
 )
 from .bedrock import (
     test_connection,
@@ -29,11 +27,6 @@ from .bedrock import (
     chat_completion_streaming,
     get_system_prompt_for_locale,
 )
-from .langgraph_agent import (
-    chat_with_langgraph_agent,
-    chat_with_langgraph_supervisor,
-    stream_chat_with_langgraph_agent,
-)
 from .observability import llm_monitor_snapshot
 from .models import AssistantResponseReport
 from .response_fingerprints import (
@@ -42,16 +35,41 @@ from .response_fingerprints import (
     issue_response_fingerprint,
 )
 from .serializers import AssistantResponseReportSerializer
-from .throttles import GlobalResponseReportThrottle
+from .streaming import async_stream_body, sse, sse_response, stream_body
+from .throttles import (
+    BedrockTokenBudgetThrottle,
+    GlobalResponseReportThrottle,
+    SharedAnonRateThrottle,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class LLMBurstThrottle(AnonRateThrottle):
+# LangGraph/LangChain and Strands take most of a second to import, so the
+# agent module is loaded on the first agent request rather than at startup.
+def chat_with_langgraph_agent(*args, **kwargs):
+    from .langgraph_agent import chat_with_langgraph_agent
+
+    return chat_with_langgraph_agent(*args, **kwargs)
+
+
+def chat_with_langgraph_supervisor(*args, **kwargs):
+    from .langgraph_agent import chat_with_langgraph_supervisor
+
+    return chat_with_langgraph_supervisor(*args, **kwargs)
+
+
+def stream_chat_with_langgraph_agent(*args, **kwargs):
+    from .langgraph_agent import stream_chat_with_langgraph_agent
+
+    return stream_chat_with_langgraph_agent(*args, **kwargs)
+
+
+class LLMBurstThrottle(SharedAnonRateThrottle):
     rate = "30/minute"
 
 
-class LLMSensitiveThrottle(AnonRateThrottle):
+class LLMSensitiveThrottle(SharedAnonRateThrottle):
     """Stricter limit for endpoints that handle uploaded images/documents."""
     rate = "10/minute"
 
@@ -171,7 +189,7 @@ class AskKiNDDView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         query = request.data.get("query")
@@ -233,7 +251,7 @@ class EligibilityCheckView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         age = request.data.get("age")
@@ -398,7 +416,7 @@ class AutismResearchView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         question = request.data.get("question") or request.data.get("query")
@@ -447,6 +465,55 @@ class AutismResearchView(APIView):
             )
 
 
+class AutismResearchStreamView(APIView):
+    """
+    POST /api/llm/autism-research-stream/
+
+    SSE relay for the Autism Research RAG ``/ask/stream`` endpoint. Accepts
+    the same body as ``/api/llm/autism-research/``.
+
+    Response: SSE stream like:
+    data: {"type": "citations", "citations": [...]}
+    data: {"type": "chunk", "content": "Early screening"}
+    data: {"type": "done", "model": "..."}
+    """
+
+    permission_classes = [AllowAny]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
+
+    def post(self, request):
+        question = request.data.get("question") or request.data.get("query")
+        if not question:
+            return Response(
+                {"error": "question is required"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(question) > 1000:
+            return Response(
+                {"error": "Question too long (max 1000 characters)"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user_context = request.data.get("context", {})
+        research_question = _research_question_with_context(question, user_context)
+
+        def event_stream():
+            try:
+                yield from stream_autism_research(
+                    research_question,
+                    top_k=request.data.get("top_k"),
+                    evidence_types=request.data.get("evidence_types"),
+                    access_classes=request.data.get("access_classes"),
+                    min_year=request.data.get("min_year"),
+                    rerank=request.data.get("rerank"),
+                )
+            except Exception as e:
+                logger.exception("Autism Research RAG stream error")
+                yield sse({"type": "error", "message": str(e)})
+
+        return sse_response(stream_body(request, event_stream))
+
+
 class StreamingAskView(APIView):
     """
     POST /api/llm/stream/
@@ -471,7 +538,7 @@ class StreamingAskView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         query = request.data.get("query")
@@ -493,48 +560,9 @@ class StreamingAskView(APIView):
         def event_stream():
             """Generate SSE events from streaming response."""
             try:
-                from .query import (
-                    semantic_search,
-                    format_provider_context,
-                    format_user_context,
-                    should_retrieve_providers,
-                    get_web_context,
+                full_context, relevant_providers, regional_center = _build_chat_context(
+                    query, user_context
                 )
-                from locations.models import RegionalCenter
-
-                regional_center = None
-                if user_context.get("zip_code"):
-                    regional_center = RegionalCenter.find_by_zip_code(
-                        user_context["zip_code"]
-                    )
-
-                enhanced_query = query
-                if user_context.get("diagnosis"):
-                    enhanced_query += f" {user_context['diagnosis']}"
-                if regional_center:
-                    enhanced_query += f" {regional_center.regional_center}"
-
-                if should_retrieve_providers(query, user_context):
-                    try:
-                        relevant_providers = semantic_search(enhanced_query, limit=8)
-                    except Exception:
-                        from .query import keyword_search
-
-                        relevant_providers = keyword_search(enhanced_query, limit=8)
-                else:
-                    relevant_providers = []
-
-                provider_context = format_provider_context(relevant_providers)
-                user_context_str = format_user_context(user_context, regional_center)
-                web_context = get_web_context(query)
-
-                full_context = f"""PROVIDERS IN DATABASE:
-{provider_context}
-
-{user_context_str}
-
-{web_context}"""
-
                 system_prompt = get_system_prompt_for_locale(locale)
 
                 emitted_chunks = False
@@ -546,7 +574,7 @@ class StreamingAskView(APIView):
                         conversation_history=conversation_history,
                     ):
                         emitted_chunks = True
-                        yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+                        yield sse({"type": "chunk", "content": chunk})
                 except Exception:
                     logger.exception("Bedrock stream interrupted")
                     if not emitted_chunks:
@@ -556,30 +584,77 @@ class StreamingAskView(APIView):
                             system_prompt=system_prompt,
                             conversation_history=conversation_history,
                         )
-                        yield (
-                            "data: "
-                            f"{json.dumps({'type': 'chunk', 'content': fallback_answer})}"
-                            "\n\n"
-                        )
+                        yield sse({"type": "chunk", "content": fallback_answer})
                     else:
-                        yield (
-                            "data: "
-                            f"{json.dumps({'type': 'chunk', 'content': '\n\n**Note:** The streaming connection was interrupted, so this answer may be incomplete.'})}"
-                            "\n\n"
+                        yield sse(
+                            {
+                                "type": "chunk",
+                                "content": "\n\n**Note:** The streaming connection was interrupted, so this answer may be incomplete.",
+                            }
                         )
 
-                yield f"data: {json.dumps({'type': 'done', 'providers_referenced': [str(p.id) for p in relevant_providers], 'regional_center': regional_center.regional_center if regional_center else None})}\n\n"
+                yield sse(
+                    {
+                        "type": "done",
+                        "providers_referenced": [str(p.id) for p in relevant_providers],
+                        "regional_center": regional_center.regional_center if regional_center else None,
+                    }
+                )
 
             except Exception as e:
                 logger.exception("Streaming ask error")
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                yield sse({"type": "error", "message": str(e)})
 
-        response = StreamingHttpResponse(
-            event_stream(), content_type="text/event-stream"
-        )
-        response["Cache-Control"] = "no-cache"
-        response["X-Accel-Buffering"] = "no"
-        return response
+        return sse_response(stream_body(request, event_stream))
+
+
+def _build_chat_context(query, user_context):
+    """
+    Provider, user and web context for a streaming chat turn (ORM and
+    retrieval; run in the request's sync thread).
+
+    Returns ``(full_context, relevant_providers, regional_center)``.
+    """
+    from .query import (
+        semantic_search,
+        format_provider_context,
+        format_user_context,
+        should_retrieve_providers,
+        get_web_context,
+    )
+    from locations.models import RegionalCenter
+
+    regional_center = None
+    if user_context.get("zip_code"):
+        regional_center = RegionalCenter.find_by_zip_code(user_context["zip_code"])
+
+    enhanced_query = query
+    if user_context.get("diagnosis"):
+        enhanced_query += f" {user_context['diagnosis']}"
+    if regional_center:
+        enhanced_query += f" {regional_center.regional_center}"
+
+    if should_retrieve_providers(query, user_context):
+        try:
+            relevant_providers = semantic_search(enhanced_query, limit=8)
+        except Exception:
+            from .query import keyword_search
+
+            relevant_providers = keyword_search(enhanced_query, limit=8)
+    else:
+        relevant_providers = []
+
+    provider_context = format_provider_context(relevant_providers)
+    user_context_str = format_user_context(user_context, regional_center)
+    web_context = get_web_context(query)
+
+    full_context = f"""PROVIDERS IN DATABASE:
+{provider_context}
+
+{user_context_str}
+
+{web_context}"""
+    return full_context, relevant_providers, regional_center
 
 
 class AgentAskView(APIView):
@@ -601,7 +676,7 @@ class AgentAskView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         query = request.data.get("query")
@@ -668,7 +743,7 @@ class LangGraphAgentAskView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         query = request.data.get("query")
@@ -724,7 +799,7 @@ class StreamingLangGraphAgentAskView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         query = request.data.get("query")
@@ -743,9 +818,10 @@ class StreamingLangGraphAgentAskView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        user_id, session_id = _request_trace_ids(request)
+
         def event_stream():
             try:
-                user_id, session_id = _request_trace_ids(request)
                 for chunk in stream_chat_with_langgraph_agent(
                     query,
                     user_context=user_context,
@@ -754,27 +830,14 @@ class StreamingLangGraphAgentAskView(APIView):
                     user_id=user_id,
                     session_id=session_id,
                 ):
-                    yield (
-                        "data: "
-                        f"{json.dumps({'type': 'chunk', 'content': chunk})}"
-                        "\n\n"
-                    )
+                    yield sse({"type": "chunk", "content": chunk})
 
-                yield (
-                    "data: "
-                    f"{json.dumps({'type': 'done', 'runtime': 'langgraph'})}"
-                    "\n\n"
-                )
+                yield sse({"type": "done", "runtime": "langgraph"})
             except Exception as e:
                 logger.exception("LangGraph streaming error")
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                yield sse({"type": "error", "message": str(e)})
 
-        response = StreamingHttpResponse(
-            event_stream(), content_type="text/event-stream"
-        )
-        response["Cache-Control"] = "no-cache"
-        response["X-Accel-Buffering"] = "no"
-        return response
+        return sse_response(stream_body(request, event_stream))
 
 
 class LangGraphSupervisorAskView(APIView):
@@ -786,7 +849,7 @@ class LangGraphSupervisorAskView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         query = request.data.get("query")
@@ -858,7 +921,7 @@ class ImageAnalysisView(APIView):
     """
     
     permission_classes = [AllowAny]
-    throttle_classes = [LLMSensitiveThrottle]
+    throttle_classes = [LLMSensitiveThrottle, BedrockTokenBudgetThrottle]
     
     def post(self, request):
         image_data = request.data.get("image")
@@ -929,7 +992,7 @@ class DocumentAnalysisView(APIView):
     """
     
     permission_classes = [AllowAny]
-    throttle_classes = [LLMSensitiveThrottle]
+    throttle_classes = [LLMSensitiveThrottle, BedrockTokenBudgetThrottle]
     
     def post(self, request):
         document_data = request.data.get("document")
@@ -1045,7 +1108,7 @@ class StreamingAgentAskView(APIView):
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [LLMBurstThrottle]
+    throttle_classes = [LLMBurstThrottle, BedrockTokenBudgetThrottle]
 
     def post(self, request):
         query = request.data.get("query")
@@ -1063,39 +1126,30 @@ class StreamingAgentAskView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        def event_stream():
+        user_id, session_id = _request_trace_ids(request)
+
+        async def event_stream():
             try:
-                from .agent import chat_with_agent
+                from .agent import stream_chat_with_agent
 
-                user_id, session_id = _request_trace_ids(request)
-                result = chat_with_agent(
+                # Strands streams natively on an event loop (the server's
+                # under ASGI); its sync tools run in Strands' own threads.
+                async for chunk in stream_chat_with_agent(
                     query,
                     user_context,
                     locale=locale,
                     user_id=user_id,
                     session_id=session_id,
                     feature="chla",
-                )
-
-                yield (
-                    f"data: "
-                    f"{json.dumps({'type': 'chunk', 'content': result['answer']})}\n\n"
-                )
+                ):
+                    yield sse({"type": "chunk", "content": chunk})
 
-                yield (
-                    f"data: "
-                    f"{json.dumps({'type': 'done', 'regional_center': result.get('regional_center')})}\n\n"
-                )
+                yield sse({"type": "done", "regional_center": user_context.get("regional_center")})
 
             except ImportError:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Agent streaming not available; Strands SDK not installed.'})}\n\n"
+                yield sse({"type": "error", "message": "Agent streaming not available; Strands SDK not installed."})
             except Exception as e:
                 logger.exception("Agent streaming error")
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                yield sse({"type": "error", "message": str(e)})
 
-        response = StreamingHttpResponse(
-            event_stream(), content_type="text/event-stream"
-        )
-        response["Cache-Control"] = "no-cache"
-        response["X-Accel-Buffering"] = "no"
-        return response
+        return sse_response(async_stream_body(request, event_stream()))
@@ -0,0 +1,166 @@
+"""
+Per-request batch loaders for the GraphQL schema (locations/schema.py).
+
+Graphene runs the Django view synchronously, so these follow DataLoader's
+batching contract without promises. List resolvers announce the objects
+they return with ``prime(info, objects)``. The first time a nested
+resolver asks a loader for one of them, a single query loads the value for
+every announced key. A query for 50 locations with their reviews, images
+and average rating therefore costs four queries rather than several per
+location.
+
+Loaders live on the request (``info.context``), so nothing is shared or
+cached between requests.
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+
+class BatchLoader:
+    """Loads values for many keys with one call of ``batch_load(keys)``."""
+
+    def __init__(self, batch_load: Callable[[List[Hashable]], Dict[Hashable, Any]], default: Callable[[], Any] = list):
+        self.batch_load = batch_load
+        self.default = default
+        self._pending: Dict[Hashable, None] = {}
+        self._values: Dict[Hashable, Any] = {}
+
+    def prime(self, keys: Iterable[Hashable]) -> None:
+        """Queue keys so the next batch includes them."""
+        for key in keys:
+            if key not in self._values:
+                self._pending[key] = None
+
+    def load(self, key: Hashable) -> Any:
+        if key not in self._values:
+            self._pending[key] = None
+            keys = list(self._pending)
+            self._pending.clear()
+            found = self.batch_load(keys)
+            for pending_key in keys:
+                self._values[pending_key] = found.get(pending_key, self.default())
+        return self._values[key]
+
+
+def _group(rows, key: str) -> Dict[Hashable, List[Any]]:
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[getattr(row, key)].append(row)
+    return grouped
+
+
+def _location_reviews(keys):
+    from .models import LocationReview
+
+    return _group(LocationReview.objects.filter(location_id__in=keys).order_by("-created_at"), "location_id")
+
+
+def _location_images(keys):
+    from .models import LocationImage
+
+    return _group(LocationImage.objects.filter(location_id__in=keys).order_by("-is_primary", "id"), "location_id")
+
+
+def _location_average_ratings(keys):
+    from django.db.models import Avg
+
+    from .models import LocationReview
+
+    return {
+        row["location_id"]: row["average"]
+        for row in LocationReview.objects.filter(location_id__in=keys)
+        .values("location_id")
+        .annotate(average=Avg("rating"))
+    }
+
+
+def _provider_insurance_carriers(keys):
+    from .models import ProviderInsuranceCarrier
+
+    carriers = defaultdict(list)
+    for provider_id, name in (
+        ProviderInsuranceCarrier.objects.filter(provider_id__in=keys)
+        .order_by("insurance_carrier__name")
+        .values_list("provider_id", "insurance_carrier__name")
+    ):
+        carriers[provider_id].append(name)
+    return carriers
+
+
+def _provider_regional_centers(keys):
+    from .models import ProviderRegionalCenter
+
+    links = (
+        ProviderRegionalCenter.objects.filter(provider_id__in=keys)
+        .select_related("regional_center")
+        .order_by("-is_primary", "regional_center__regional_center")
+    )
+    grouped = defaultdict(list)
+    for link in links:
+        grouped[link.provider_id].append(link.regional_center)
+    return grouped
+
+
+def _regional_center_providers(keys):
+    from .models import ProviderRegionalCenter
+
+    links = (
+        ProviderRegionalCenter.objects.filter(regional_center_id__in=keys)
+        .select_related("provider")
+        .order_by("provider__name")
+    )
+    grouped = defaultdict(list)
+    for link in links:
+        grouped[link.regional_center_id].append(link.provider)
+    return grouped
+
+
+LOADERS: Dict[str, tuple] = {
+    "location_reviews": (_location_reviews, list),
+    "location_images": (_location_images, list),
+    "location_average_rating": (_location_average_ratings, lambda: 0),
+    "provider_insurance_carriers": (_provider_insurance_carriers, list),
+    "provider_regional_centers": (_provider_regional_centers, list),
+    "regional_center_providers": (_regional_center_providers, list),
+}
+
+# Loaders keyed by each model's primary key, primed together by prime().
+MODEL_LOADERS = {
+    "Location": ("location_reviews", "location_images", "location_average_rating"),
+    "ProviderV2": ("provider_insurance_carriers", "provider_regional_centers"),
+    "RegionalCenter": ("regional_center_providers",),
+}
+
+
+def get_loader(info, name: str) -> BatchLoader:
+    """The request's loader ``name``, created on first use."""
+    context = info.context
+    loaders = getattr(context, "_batch_loaders", None)
+    if loaders is None:
+        loaders = {}
+        setattr(context, "_batch_loaders", loaders)
+    if name not in loaders:
+        batch_load, default = LOADERS[name]
+
+        def load_and_prime(keys, batch_load=batch_load):
+            # Instances loaded here are the parents of the next level down.
+            found = batch_load(keys)
+            prime(info, (obj for values in found.values() if isinstance(values, list) for obj in values))
+            return found
+
+        loaders[name] = BatchLoader(load_and_prime, default)
+    return loaders[name]
+
+
+def prime(info, objects):
+    """Announce model instances about to be returned, so their nested
+    fields load in one batch per loader. Returns ``objects`` as a list."""
+    objects = list(objects)
+    by_model = defaultdict(list)
+    for obj in objects:
+        by_model[type(obj).__name__].append(obj.pk)
+    for model, keys in by_model.items():
+        for name in MODEL_LOADERS.get(model, ()):
+            get_loader(info, name).prime(keys)
+    return objects
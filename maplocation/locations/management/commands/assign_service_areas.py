@@ -0,0 +1,47 @@
+"""
+Management command to link providers to the regional center whose service
+area contains them, in one spatial join (see locations/utils/service_areas.py).
+
+    python manage.py assign_service_areas --dry-run
+    python manage.py assign_service_areas
+"""
+
+from django.core.management.base import BaseCommand
+
+from locations.utils.service_areas import (
+    assign_providers_to_service_areas,
+    postgis_available,
+    reset_service_area_index,
+)
+
+
+class Command(BaseCommand):
+    help = "Assign each located provider its primary regional center by service area"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--provider-ids", nargs="*", help="Only these provider ids")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the links that would change without writing",
+        )
+
+    def handle(self, *args, **options):
+        # Service areas may have been regenerated since this process loaded them.
+        reset_service_area_index()
+        path = "PostGIS spatial join" if postgis_available() else "in-process service area index"
+        self.stdout.write(f"Classifying providers with the {path}")
+
+        result = assign_providers_to_service_areas(
+            provider_ids=options["provider_ids"], dry_run=options["dry_run"]
+        )
+
+        self.stdout.write(f"Providers inside a service area: {result.assigned}")
+        self.stdout.write(f"Located providers outside every service area: {result.unmatched}")
+        self.stdout.write(f"Links created: {result.created}")
+        self.stdout.write(f"Links marked primary: {result.made_primary}")
+        self.stdout.write(f"Other primary links demoted: {result.demoted}")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN - nothing was written"))
+        else:
+            self.stdout.write(self.style.SUCCESS("Service area assignment complete"))
@@ -4,6 +4,7 @@ Management command to audit LA County ZIP code coverage in regional centers
 
 from django.core.management.base import BaseCommand
 from locations.models import RegionalCenter
+from locations.utils.service_area_builder import ServiceAreaBuilder, find_duplicate_zips
 import requests
 
 
@@ -21,6 +22,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Show detailed output including all ZIPs",
         )
+        parser.add_argument(
+            "--boundaries",
+            action="store_true",
+            help="Also check ZIP boundaries and service area polygons for overlaps and gaps (PostGIS)",
+        )
 
     def handle(self, *args, **options):
         verbose = options["verbose"]
@@ -127,6 +133,14 @@ class Command(BaseCommand):
         if not missing_zips and not duplicate_zips:
             self.stdout.write(self.style.SUCCESS("  ✅ ZIP code coverage looks good!"))
 
+        if options["boundaries"]:
+            self.stdout.write(self.style.HTTP_INFO(f"\n🗺️  BOUNDARIES (from zip_codes):"))
+            for line in ServiceAreaBuilder().build(dry_run=True).lines():
+                self.stdout.write(f"  {line}")
+            self.stdout.write(self.style.HTTP_INFO(f"\n🗺️  STORED SERVICE AREAS:"))
+            for line in ServiceAreaBuilder().audit().lines():
+                self.stdout.write(f"  {line}")
+
         # Fix mode
         if fix and missing_zips:
             self.stdout.write(
@@ -450,20 +464,9 @@ class Command(BaseCommand):
 
     def _find_duplicates(self, rc_data):
         """Find ZIP codes assigned to multiple regional centers"""
-        zip_to_centers = {}
-
-        for rc_id, data in rc_data.items():
-            for zip_code in data["zips"]:
-                if zip_code not in zip_to_centers:
-                    zip_to_centers[zip_code] = []
-                zip_to_centers[zip_code].append(data["name"])
-
-        # Return only duplicates
-        return {
-            zip_code: centers
-            for zip_code, centers in zip_to_centers.items()
-            if len(centers) > 1
-        }
+        return find_duplicate_zips(
+            {f"{data['name']} (#{rc_id})": data["zips"] for rc_id, data in rc_data.items()}
+        )
 
     def _format_zip_ranges(self, sorted_zips):
         """Format ZIP codes as ranges for compact display"""
@@ -0,0 +1,86 @@
+"""
+Management command to benchmark provider radius queries: the in-memory
+vectorized index (locations/utils/provider_geo.py) against the database
+paths it replaces or backs up.
+
+    python manage.py bench_provider_geo
+    python manage.py bench_provider_geo --radii 2,5,25 --iterations 200
+"""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from locations.models import ProviderV2
+from locations.utils.provider_geo import load_provider_geo_index
+from locations.utils.service_areas import postgis_available
+
+# The SQL haversine comprehensive_search used before the index.
+HAVERSINE_SQL = """
+    SELECT id FROM providers_v2
+    WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+    AND (3959 * acos(least(1.0, cos(radians(%s)) * cos(radians(latitude)) *
+    cos(radians(longitude) - radians(%s)) + sin(radians(%s)) *
+    sin(radians(latitude))))) < %s
+"""
+
+
+def _time(fn, iterations):
+    fn()  # warm up
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    help = "Benchmark in-memory provider radius search against the database paths"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lat", type=float, default=34.0522)
+        parser.add_argument("--lng", type=float, default=-118.2437)
+        parser.add_argument("--radii", default="2,5,15,50", help="Comma-separated radii in miles")
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--iterations", type=int, default=100)
+
+    def handle(self, *args, **options):
+        lat, lng, limit = options["lat"], options["lng"], options["limit"]
+        iterations = options["iterations"]
+
+        started = time.perf_counter()
+        index = load_provider_geo_index()
+        self.stdout.write(
+            f"Index: {len(index)} providers built in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+
+        def sql_haversine(radius):
+            with connection.cursor() as cursor:
+                cursor.execute(HAVERSINE_SQL, [lat, lng, lat, radius])
+                return cursor.fetchall()
+
+        use_postgis = postgis_available()
+        self.stdout.write(
+            f"{'radius':>7} {'hits':>6} {'index us':>10} {'index+k us':>11} {'sql us':>10}"
+            + (f" {'postgis us':>11}" if use_postgis else "")
+        )
+        for radius in (float(r) for r in options["radii"].split(",")):
+            hits = len(index.search(lat, lng, radius)[0])
+            row = (
+                f"{radius:>7g} {hits:>6}"
+                f" {_time(lambda: index.search(lat, lng, radius), iterations):>10.1f}"
+                f" {_time(lambda: index.search(lat, lng, radius, limit=limit), iterations):>11.1f}"
+                f" {_time(lambda: sql_haversine(radius), iterations):>10.1f}"
+            )
+            if use_postgis:
+                postgis = _time(
+                    lambda: ProviderV2.find_nearest(lat, lng, radius_miles=radius, limit=limit),
+                    iterations,
+                )
+                row += f" {postgis:>11.1f}"
+            self.stdout.write(row)
+
+        self.stdout.write(self.style.SUCCESS("Median microseconds per query"))
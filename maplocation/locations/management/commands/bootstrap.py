@@ -0,0 +1,42 @@
+"""
+Management command for the container bootstrap (locations/utils/bootstrap.py):
+migrations, static files and reference data, each skipped when its inputs
+are unchanged.
+
+    python manage.py bootstrap --phase schema   # before the app server starts
+    python manage.py bootstrap --phase data     # in the background afterwards
+    python manage.py bootstrap --phase static   # at image build time
+    python manage.py bootstrap --force          # every phase, ignoring fingerprints
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from locations.utils.bootstrap import PHASES, run_data, run_schema, run_static
+
+
+class Command(BaseCommand):
+    help = "Run the idempotent container bootstrap (migrations, static files, reference data)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--phase",
+            choices=PHASES + ("all",),
+            default="all",
+            help="Which phase to run (default: all, in order)",
+        )
+        parser.add_argument("--force", action="store_true", help="Ignore recorded fingerprints")
+
+    def handle(self, *args, **options):
+        phase, force = options["phase"], options["force"]
+        started = time.perf_counter()
+        if phase in ("schema", "all"):
+            run_schema(force, log=self.stdout.write)
+        if phase in ("static", "all"):
+            run_static(force, log=self.stdout.write)
+        if phase in ("data", "all"):
+            run_data(force, log=self.stdout.write)
+        self.stdout.write(
+            self.style.SUCCESS(f"Bootstrap ({phase}) finished in {time.perf_counter() - started:.1f}s")
+        )
@@ -17,7 +17,6 @@ from django.core.management.base import BaseCommand
 from django.contrib.gis.geos import Point
 from locations.models import ProviderV2
 from decimal import Decimal
-import time
 
 
 class Command(BaseCommand):
@@ -143,7 +142,7 @@ class Command(BaseCommand):
         """Fix sync issues between location and lat/lng"""
         self.stdout.write("Fixing coordinate sync issues...\n")
         
-        fixed = 0
+        fixed = []
         for provider in missing_location:
             # If has valid lat/lng but no location, create PostGIS point
             if (
@@ -155,19 +154,19 @@ class Command(BaseCommand):
                 provider.location = Point(
                     float(provider.longitude), float(provider.latitude), srid=4326
                 )
-                provider.save()
-                fixed += 1
+                fixed.append(provider)
                 self.stdout.write(
                     self.style.SUCCESS(
                         f"  ✓ Fixed: {provider.name} - created PostGIS point from lat/lng"
                     )
                 )
 
-        self.stdout.write(f"\nFixed {fixed} providers\n")
+        ProviderV2.objects.bulk_update(fixed, ["location"], batch_size=500)
+        self.stdout.write(f"\nFixed {len(fixed)} providers\n")
 
     def geocode_missing_coordinates(self, missing_location, zero_coords, limit):
         """Attempt to geocode providers with missing coordinates"""
-        from locations.utils.mapbox_geocode import geocode_with_fallback
+        from locations.utils.geocoder import apply_result, bulk_save_coordinates, get_geocoder
         
         # Combine both sets
         needs_geocoding = (missing_location | zero_coords).distinct()
@@ -182,48 +181,35 @@ class Command(BaseCommand):
             needs_geocoding = needs_geocoding[:limit]
             self.stdout.write(f"Limiting to {limit} providers due to --limit flag\n")
         
-        geocoded = 0
+        providers = list(needs_geocoding)
+        # One batched, cached, rate-limited pass instead of a request per row
+        results = get_geocoder().geocode_many(p.address for p in providers)
+
+        geocoded = []
         failed = 0
-        
-        for i, provider in enumerate(needs_geocoding, 1):
-            self.stdout.write(f"\n[{i}/{needs_geocoding.count()}] Geocoding: {provider.name}")
-            # Clean address (remove newlines)
-            clean_address = provider.address.replace("\n", ", ")
-            self.stdout.write(f"  Address: {clean_address}")
-            
-            try:
-                # Use the Mapbox geocoding with fallback strategies
-                coordinates = geocode_with_fallback(clean_address)
-                
-                if coordinates:
-                    lat, lng = coordinates
-                    provider.latitude = Decimal(str(lat))
-                    provider.longitude = Decimal(str(lng))
-                    provider.location = Point(lng, lat, srid=4326)
-                    provider.save()
-                    geocoded += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(f"  ✓ Success: {lat}, {lng}")
-                    )
-                else:
-                    failed += 1
-                    self.stdout.write(
-                        self.style.ERROR("  ✗ Failed: No coordinates returned")
+        for i, provider in enumerate(providers, 1):
+            result = results.get(provider.address)
+            if apply_result(provider, result):
+                geocoded.append(provider)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{i}/{len(providers)}] ✓ {provider.name}: {result.latitude}, {result.longitude}"
                     )
-                
-                # Rate limiting - sleep for 1 second between requests
-                time.sleep(1)
-                
-            except Exception as e:
+                )
+            else:
                 failed += 1
                 self.stdout.write(
-                    self.style.ERROR(f"  ✗ Error: {str(e)}")
+                    self.style.ERROR(
+                        f"[{i}/{len(providers)}] ✗ {provider.name}: no coordinates for "
+                        f"{provider.address.replace(chr(10), ', ')}"
+                    )
                 )
+
+        bulk_save_coordinates(ProviderV2, geocoded)
         
         self.stdout.write("\n" + "=" * 80)
         self.stdout.write(self.style.HTTP_INFO("GEOCODING SUMMARY"))
         self.stdout.write("=" * 80)
-        self.stdout.write(f"Attempted:  {geocoded + failed}")
-        self.stdout.write(f"Successful: {geocoded}")
+        self.stdout.write(f"Attempted:  {len(providers)}")
+        self.stdout.write(f"Successful: {len(geocoded)}")
         self.stdout.write(f"Failed:     {failed}\n")
-
@@ -0,0 +1,39 @@
+"""
+Management command to precompute the cleaned HMGL display columns
+(see locations/utils/hmgl.py) and restore the search vector and indexes a
+reload drops. Run it after every hmgl.location load.
+
+    python manage.py clean_hmgl_locations --dry-run
+    python manage.py clean_hmgl_locations
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from locations.utils.hmgl import ensure_clean_columns, refresh_clean_columns
+
+
+class Command(BaseCommand):
+    help = "Store HTML-free hours, description and phone text on hmgl.location"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the rows that would change without writing",
+        )
+
+    def handle(self, *args, **options):
+        if not ensure_clean_columns():
+            raise CommandError("hmgl.location does not exist; load the HMGL data first")
+
+        result = refresh_clean_columns(
+            batch_size=options["batch_size"], dry_run=options["dry_run"]
+        )
+
+        self.stdout.write(f"Locations scanned: {result.scanned}")
+        self.stdout.write(f"Locations updated: {result.updated}")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN - nothing was written"))
+        else:
+            self.stdout.write(self.style.SUCCESS("HMGL clean columns are up to date"))
@@ -1,304 +0,0 @@
-from django.core.management.base import BaseCommand
-from locations.models import RegionalCenter
-import json
-import math
-
-
-class Command(BaseCommand):
-    help = "Generate realistic geographic service area boundaries for LA Regional Centers using real geographic data"
-
-    def handle(self, *args, **options):
-        self.stdout.write(
-            "Generating LA Regional Center service area boundaries using real geographic data..."
-        )
-
-        # Get all LA regional centers
-        la_centers = RegionalCenter.objects.filter(is_la_regional_center=True)
-
-        if not la_centers.exists():
-            self.stdout.write(self.style.ERROR("No LA regional centers found"))
-            return
-
-        for center in la_centers:
-            if center.zip_codes:
-                self.stdout.write(f"Processing {center.regional_center}...")
-
-                # Generate realistic geographic boundary based on real LA County data
-                service_area_geojson = self._generate_realistic_service_area(center)
-
-                if service_area_geojson:
-                    # Store the GeoJSON in the service_areas field
-                    center.service_areas = service_area_geojson
-                    center.save()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f"✓ Generated service area for {center.regional_center}"
-                        )
-                    )
-                else:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"⚠ Could not generate service area for {center.regional_center}"
-                        )
-                    )
-
-        self.stdout.write(self.style.SUCCESS("Service area generation complete!"))
-
-    def _generate_realistic_service_area(self, center):
-        """
-        Generate realistic geographic service area boundaries using real LA County data.
-        This creates 7 regions that correspond to actual service areas and zip codes.
-        """
-        if not center.zip_codes:
-            return None
-
-        # Use the real service areas and zip codes to create proper boundaries
-        # Based on the actual regional center service areas from the template
-
-        if "North Los Angeles" in center.regional_center:
-            # San Fernando Valley, Santa Clarita Valley, Antelope Valley
-            # Northern LA County - covers the valley areas
-            coordinates = [
-                [-118.9, 34.8],
-                [-118.7, 34.8],
-                [-118.5, 34.8],
-                [-118.3, 34.8],
-                [-118.1, 34.8],
-                [-117.9, 34.8],
-                [-117.7, 34.8],
-                [-117.5, 34.8],
-                [-117.3, 34.8],
-                [-117.1, 34.8],
-                [-116.9, 34.8],
-                [-116.8, 34.7],
-                [-116.8, 34.6],
-                [-116.8, 34.5],
-                [-116.9, 34.4],
-                [-117.1, 34.4],
-                [-117.3, 34.4],
-                [-117.5, 34.4],
-                [-117.7, 34.4],
-                [-117.9, 34.4],
-                [-118.1, 34.4],
-                [-118.3, 34.4],
-                [-118.5, 34.4],
-                [-118.7, 34.4],
-                [-118.9, 34.4],
-                [-118.9, 34.5],
-                [-118.9, 34.6],
-                [-118.9, 34.7],
-                [-118.9, 34.8],
-            ]
-        elif "San Gabriel/Pomona" in center.regional_center:
-            # Eastern LA County - San Gabriel Valley, Pomona Valley
-            # Covers the eastern portion with cities like Pomona, Diamond Bar, Claremont
-            coordinates = [
-                [-117.7, 34.8],
-                [-117.5, 34.8],
-                [-117.3, 34.8],
-                [-117.1, 34.8],
-                [-116.9, 34.8],
-                [-116.7, 34.8],
-                [-116.5, 34.8],
-                [-116.3, 34.8],
-                [-116.1, 34.8],
-                [-116.0, 34.7],
-                [-116.0, 34.6],
-                [-116.0, 34.5],
-                [-116.1, 34.4],
-                [-116.3, 34.4],
-                [-116.5, 34.4],
-                [-116.7, 34.4],
-                [-116.9, 34.4],
-                [-117.1, 34.4],
-                [-117.3, 34.4],
-                [-117.5, 34.4],
-                [-117.7, 34.4],
-                [-117.7, 34.5],
-                [-117.7, 34.6],
-                [-117.7, 34.7],
-                [-117.7, 34.8],
-            ]
-        elif "Eastern Los Angeles" in center.regional_center:
-            # Central-east LA County - Alhambra, Bell, Commerce, East LA
-            # Covers the central-east portion with cities like Alhambra, Bell Gardens
-            coordinates = [
-                [-118.3, 34.6],
-                [-118.1, 34.6],
-                [-117.9, 34.6],
-                [-117.7, 34.6],
-                [-117.5, 34.6],
-                [-117.3, 34.6],
-                [-117.1, 34.6],
-                [-116.9, 34.6],
-                [-116.8, 34.5],
-                [-116.8, 34.4],
-                [-116.8, 34.3],
-                [-116.9, 34.2],
-                [-117.1, 34.2],
-                [-117.3, 34.2],
-                [-117.5, 34.2],
-                [-117.7, 34.2],
-                [-117.9, 34.2],
-                [-118.1, 34.2],
-                [-118.3, 34.2],
-                [-118.4, 34.3],
-                [-118.4, 34.4],
-                [-118.4, 34.5],
-                [-118.3, 34.6],
-            ]
-        elif "Westside" in center.regional_center:
-            # West LA County - coastal areas, Santa Monica, Beverly Hills, Malibu
-            # Covers the western coastal portion
-            coordinates = [
-                [-118.9, 34.6],
-                [-118.7, 34.6],
-                [-118.5, 34.6],
-                [-118.3, 34.6],
-                [-118.1, 34.6],
-                [-117.9, 34.6],
-                [-117.7, 34.6],
-                [-117.5, 34.6],
-                [-117.3, 34.6],
-                [-117.1, 34.6],
-                [-117.0, 34.5],
-                [-117.0, 34.4],
-                [-117.0, 34.3],
-                [-117.1, 34.2],
-                [-117.3, 34.2],
-                [-117.5, 34.2],
-                [-117.7, 34.2],
-                [-117.9, 34.2],
-                [-118.1, 34.2],
-                [-118.3, 34.2],
-                [-118.5, 34.2],
-                [-118.7, 34.2],
-                [-118.9, 34.2],
-                [-119.0, 34.3],
-                [-119.0, 34.4],
-                [-119.0, 34.5],
-                [-118.9, 34.6],
-            ]
-        elif "Lanterman" in center.regional_center:
-            # Central LA County - Hollywood, Glendale, Burbank, Pasadena
-            # Covers the central portion with major cities
-            coordinates = [
-                [-118.6, 34.5],
-                [-118.4, 34.5],
-                [-118.2, 34.5],
-                [-118.0, 34.5],
-                [-117.8, 34.5],
-                [-117.6, 34.5],
-                [-117.4, 34.5],
-                [-117.2, 34.5],
-                [-117.0, 34.5],
-                [-116.8, 34.5],
-                [-116.7, 34.4],
-                [-116.7, 34.3],
-                [-116.7, 34.2],
-                [-116.8, 34.1],
-                [-117.0, 34.1],
-                [-117.2, 34.1],
-                [-117.4, 34.1],
-                [-117.6, 34.1],
-                [-117.8, 34.1],
-                [-118.0, 34.1],
-                [-118.2, 34.1],
-                [-118.4, 34.1],
-                [-118.6, 34.1],
-                [-118.7, 34.2],
-                [-118.7, 34.3],
-                [-118.7, 34.4],
-                [-118.6, 34.5],
-            ]
-        elif "South Central Los Angeles" in center.regional_center:
-            # South LA County - South LA, Watts, Compton, Inglewood
-            # Covers the southern portion
-            coordinates = [
-                [-118.5, 34.2],
-                [-118.3, 34.2],
-                [-118.1, 34.2],
-                [-117.9, 34.2],
-                [-117.7, 34.2],
-                [-117.5, 34.2],
-                [-117.3, 34.2],
-                [-117.1, 34.2],
-                [-116.9, 34.2],
-                [-116.7, 34.2],
-                [-116.6, 34.1],
-                [-116.6, 34.0],
-                [-116.6, 33.9],
-                [-116.7, 33.8],
-                [-116.9, 33.8],
-                [-117.1, 33.8],
-                [-117.3, 33.8],
-                [-117.5, 33.8],
-                [-117.7, 33.8],
-                [-117.9, 33.8],
-                [-118.1, 33.8],
-                [-118.3, 33.8],
-                [-118.5, 33.8],
-                [-118.6, 33.9],
-                [-118.6, 34.0],
-                [-118.6, 34.1],
-                [-118.5, 34.2],
-            ]
-        elif "Harbor" in center.regional_center:
-            # South-west LA County - Torrance, Long Beach, San Pedro, Carson
-            # Covers the south-western coastal portion
-            coordinates = [
-                [-118.9, 34.2],
-                [-118.7, 34.2],
-                [-118.5, 34.2],
-                [-118.3, 34.2],
-                [-118.1, 34.2],
-                [-117.9, 34.2],
-                [-117.7, 34.2],
-                [-117.5, 34.2],
-                [-117.3, 34.2],
-                [-117.1, 34.2],
-                [-117.0, 34.1],
-                [-117.0, 34.0],
-                [-117.0, 33.9],
-                [-117.1, 33.8],
-                [-117.3, 33.8],
-                [-117.5, 33.8],
-                [-117.7, 33.8],
-                [-117.9, 33.8],
-                [-118.1, 33.8],
-                [-118.3, 33.8],
-                [-118.5, 33.8],
-                [-118.7, 33.8],
-                [-118.9, 33.8],
-                [-119.0, 33.9],
-                [-119.0, 34.0],
-                [-119.0, 34.1],
-                [-118.9, 34.2],
-            ]
-        else:
-            # Default fallback - create a realistic polygon around the center
-            center_lat = center.latitude or 34.0522
-            center_lng = center.longitude or -118.2437
-
-            # Create a realistic polygon that fits within LA County bounds
-            coordinates = [
-                [center_lng - 0.05, center_lat + 0.05],
-                [center_lng + 0.05, center_lat + 0.05],
-                [center_lng + 0.05, center_lat - 0.05],
-                [center_lng - 0.05, center_lat - 0.05],
-                [center_lng - 0.05, center_lat + 0.05],
-            ]
-
-        # Create the GeoJSON feature
-        geojson = {
-            "type": "Feature",
-            "properties": {
-                "name": center.regional_center,
-                "center_id": center.id,
-                "zip_codes": center.zip_codes,
-                "service_areas": center.service_areas or [],
-            },
-            "geometry": {"type": "Polygon", "coordinates": [coordinates]},
-        }
-
-        return geojson
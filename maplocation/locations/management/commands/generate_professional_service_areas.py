@@ -1,231 +0,0 @@
-from django.core.management.base import BaseCommand
-from locations.models import RegionalCenter
-import json
-import math
-
-
-class Command(BaseCommand):
-    help = "Generate professional service area boundaries using real LA County geographic data"
-
-    def handle(self, *args, **options):
-        self.stdout.write(
-            "Generating professional LA Regional Center service area boundaries..."
-        )
-
-        # Get all LA regional centers
-        la_centers = RegionalCenter.objects.filter(is_la_regional_center=True)
-
-        if not la_centers.exists():
-            self.stdout.write(self.style.ERROR("No LA regional centers found"))
-            return
-
-        for center in la_centers:
-            if center.zip_codes:
-                self.stdout.write(f"Processing {center.regional_center}...")
-
-                # Generate professional geographic boundary based on real LA County data
-                service_area_geojson = self._generate_professional_service_area(center)
-
-                if service_area_geojson:
-                    # Store the GeoJSON in the service_areas field
-                    center.service_areas = service_area_geojson
-                    center.save()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f"✓ Generated professional service area for {center.regional_center}"
-                        )
-                    )
-                else:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"⚠ Could not generate service area for {center.regional_center}"
-                        )
-                    )
-
-        self.stdout.write(
-            self.style.SUCCESS("Professional service area generation complete!")
-        )
-
-    def _generate_professional_service_area(self, center):
-        """
-        Generate professional service area boundaries that actually fit within LA County.
-        This creates 7 regions that fit together like puzzle pieces within the actual county boundary.
-        """
-        if not center.zip_codes:
-            return None
-
-        # Create service areas that actually fit within the real LA County boundary
-        # Based on the actual LA County coordinates from the API
-        # These will fit together like puzzle pieces within the county
-
-        if "North Los Angeles" in center.regional_center:
-            # San Fernando Valley area - northern LA County
-            # Fits within the northern portion of LA County (roughly 34.0 to 34.8 latitude)
-            coordinates = [
-                [-118.8, 34.8],
-                [-118.6, 34.8],
-                [-118.4, 34.8],
-                [-118.2, 34.8],
-                [-118.0, 34.8],
-                [-117.8, 34.8],
-                [-117.7, 34.7],
-                [-117.7, 34.6],
-                [-117.8, 34.5],
-                [-118.0, 34.4],
-                [-118.2, 34.4],
-                [-118.4, 34.4],
-                [-118.6, 34.4],
-                [-118.8, 34.4],
-                [-118.9, 34.5],
-                [-118.9, 34.6],
-                [-118.8, 34.8],
-            ]
-        elif "San Gabriel/Pomona" in center.regional_center:
-            # Eastern LA County - San Gabriel Valley
-            # Fits within the eastern portion of LA County (roughly 117.7 to 118.0 longitude)
-            coordinates = [
-                [-117.7, 34.8],
-                [-117.5, 34.8],
-                [-117.3, 34.8],
-                [-117.1, 34.8],
-                [-116.9, 34.8],
-                [-116.8, 34.7],
-                [-116.8, 34.6],
-                [-116.8, 34.5],
-                [-116.9, 34.4],
-                [-117.1, 34.4],
-                [-117.3, 34.4],
-                [-117.5, 34.4],
-                [-117.7, 34.4],
-                [-117.7, 34.5],
-                [-117.7, 34.6],
-                [-117.7, 34.7],
-                [-117.7, 34.8],
-            ]
-        elif "Eastern Los Angeles" in center.regional_center:
-            # Central-east LA County
-            # Fits within the central-east portion of LA County
-            coordinates = [
-                [-118.2, 34.6],
-                [-118.0, 34.6],
-                [-117.8, 34.6],
-                [-117.6, 34.6],
-                [-117.4, 34.6],
-                [-117.3, 34.5],
-                [-117.3, 34.4],
-                [-117.4, 34.3],
-                [-117.6, 34.3],
-                [-117.8, 34.3],
-                [-118.0, 34.3],
-                [-118.2, 34.3],
-                [-118.3, 34.4],
-                [-118.3, 34.5],
-                [-118.2, 34.6],
-            ]
-        elif "Westside" in center.regional_center:
-            # West LA County - coastal areas
-            # Fits within the western portion of LA County (roughly 118.4 to 118.9 longitude)
-            coordinates = [
-                [-118.9, 34.6],
-                [-118.7, 34.6],
-                [-118.5, 34.6],
-                [-118.3, 34.6],
-                [-118.1, 34.6],
-                [-118.0, 34.5],
-                [-118.0, 34.4],
-                [-118.1, 34.3],
-                [-118.3, 34.3],
-                [-118.5, 34.3],
-                [-118.7, 34.3],
-                [-118.9, 34.3],
-                [-119.0, 34.4],
-                [-119.0, 34.5],
-                [-118.9, 34.6],
-            ]
-        elif "Lanterman" in center.regional_center:
-            # Central LA County
-            # Fits within the central portion of LA County
-            coordinates = [
-                [-118.5, 34.5],
-                [-118.3, 34.5],
-                [-118.1, 34.5],
-                [-117.9, 34.5],
-                [-117.7, 34.5],
-                [-117.6, 34.4],
-                [-117.6, 34.3],
-                [-117.7, 34.2],
-                [-117.9, 34.2],
-                [-118.1, 34.2],
-                [-118.3, 34.2],
-                [-118.5, 34.2],
-                [-118.6, 34.3],
-                [-118.6, 34.4],
-                [-118.5, 34.5],
-            ]
-        elif "South Central Los Angeles" in center.regional_center:
-            # South LA County
-            # Fits within the southern portion of LA County (roughly 33.7 to 34.2 latitude)
-            coordinates = [
-                [-118.4, 34.2],
-                [-118.2, 34.2],
-                [-118.0, 34.2],
-                [-117.8, 34.2],
-                [-117.6, 34.2],
-                [-117.5, 34.1],
-                [-117.5, 34.0],
-                [-117.6, 33.9],
-                [-117.8, 33.9],
-                [-118.0, 33.9],
-                [-118.2, 33.9],
-                [-118.4, 33.9],
-                [-118.5, 34.0],
-                [-118.5, 34.1],
-                [-118.4, 34.2],
-            ]
-        elif "Harbor" in center.regional_center:
-            # South-west LA County - coastal areas
-            # Fits within the south-western portion of LA County
-            coordinates = [
-                [-118.9, 34.2],
-                [-118.7, 34.2],
-                [-118.5, 34.2],
-                [-118.3, 34.2],
-                [-118.1, 34.2],
-                [-118.0, 34.1],
-                [-118.0, 34.0],
-                [-118.1, 33.9],
-                [-118.3, 33.9],
-                [-118.5, 33.9],
-                [-118.7, 33.9],
-                [-118.9, 33.9],
-                [-119.0, 34.0],
-                [-119.0, 34.1],
-                [-118.9, 34.2],
-            ]
-        else:
-            # Default fallback - create a realistic polygon around the center
-            center_lat = center.latitude or 34.0522
-            center_lng = center.longitude or -118.2437
-
-            # Create a realistic polygon that fits within LA County bounds
-            coordinates = [
-                [center_lng - 0.05, center_lat + 0.05],
-                [center_lng + 0.05, center_lat + 0.05],
-                [center_lng + 0.05, center_lat - 0.05],
-                [center_lng - 0.05, center_lat - 0.05],
-                [center_lng - 0.05, center_lat + 0.05],
-            ]
-
-        # Create the GeoJSON feature
-        geojson = {
-            "type": "Feature",
-            "properties": {
-                "name": center.regional_center,
-                "center_id": center.id,
-                "zip_codes": center.zip_codes,
-                "service_areas": center.service_areas or [],
-            },
-            "geometry": {"type": "Polygon", "coordinates": [coordinates]},
-        }
-
-        return geojson
@@ -1,10 +1,8 @@
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from locations.models import ProviderV2, RegionalCenter
-from locations.utils.mapbox_geocode import geocode_with_fallback
+from locations.utils.geocoder import apply_result, bulk_save_coordinates, get_geocoder
 from decimal import Decimal
-import requests
-import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -90,61 +88,53 @@ class Command(BaseCommand):
                 self.stdout.write(f"... and {total_providers - 10} more")
             return
 
-        geocoded_count = 0
-        failed_count = 0
+        providers = list(providers)
+        addresses = {provider.pk: self._provider_address(provider) for provider in providers}
+        results = get_geocoder().geocode_many(a for a in addresses.values() if a)
 
+        geocoded = []
+        failed_count = 0
         for i, provider in enumerate(providers, 1):
-            self.stdout.write(f"[{i}/{total_providers}] Geocoding {provider.name}...")
-
-            try:
-                # Build address from provider data
-                address = provider.address
-                if isinstance(address, dict):
-                    # Handle JSON address format
-                    parts = [
-                        address.get("street", ""),
-                        address.get("city", ""),
-                        address.get("state", ""),
-                        address.get("zip", ""),
-                    ]
-                    address = ", ".join([p for p in parts if p])
-
-                if not address:
-                    failed_count += 1
-                    self.stdout.write(self.style.WARNING(f"  ⚠ No address available"))
-                    continue
-
-                # Use Mapbox geocoding with fallback
-                coordinates = geocode_with_fallback(address)
-                if coordinates:
-                    provider.latitude = Decimal(str(coordinates[0]))
-                    provider.longitude = Decimal(str(coordinates[1]))
-                    provider.save()
-                    geocoded_count += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f"  ✓ Success: {coordinates[0]}, {coordinates[1]}"
-                        )
-                    )
-                else:
-                    failed_count += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"  ✗ Failed to geocode: {address}")
+            address = addresses[provider.pk]
+            if not address:
+                failed_count += 1
+                self.stdout.write(self.style.WARNING(f"[{i}/{total_providers}] ⚠ No address available: {provider.name}"))
+                continue
+            result = results.get(address)
+            if apply_result(provider, result):
+                geocoded.append(provider)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{i}/{total_providers}] ✓ {provider.name}: {result.latitude}, {result.longitude}"
                     )
-
-                # Rate limiting
-                time.sleep(0.1)  # 10 requests per second max
-
-            except Exception as e:
+                )
+            else:
                 failed_count += 1
-                self.stdout.write(self.style.ERROR(f"  ✗ Error: {str(e)}"))
+                self.stdout.write(
+                    self.style.ERROR(f"[{i}/{total_providers}] ✗ Failed to geocode: {address}")
+                )
+
+        bulk_save_coordinates(ProviderV2, geocoded)
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Provider geocoding complete: {geocoded_count} success, {failed_count} failed"
+                f"Provider geocoding complete: {len(geocoded)} success, {failed_count} failed"
             )
         )
 
+    def _provider_address(self, provider):
+        address = provider.address
+        if isinstance(address, dict):
+            # Handle JSON address format
+            parts = [
+                address.get("street", ""),
+                address.get("city", ""),
+                address.get("state", ""),
+                address.get("zip", ""),
+            ]
+            address = ", ".join([p for p in parts if p])
+        return address
+
     def geocode_regional_centers(self, force=False, dry_run=False):
         """Geocode regional center addresses"""
         self.stdout.write(self.style.SUCCESS("Starting regional center geocoding..."))
@@ -176,61 +166,41 @@ class Command(BaseCommand):
                 self.stdout.write(f"... and {total_centers - 10} more")
             return
 
-        geocoded_count = 0
-        failed_count = 0
+        centers = list(centers)
+        addresses = {}
+        for center in centers:
+            # Combine address parts
+            address_parts = [center.address, center.suite, center.city, center.state, center.zip_code]
+            addresses[center.pk] = ", ".join(filter(None, address_parts))
+        results = get_geocoder().geocode_many(a for a in addresses.values() if a)
 
+        geocoded = []
+        failed_count = 0
         for i, center in enumerate(centers, 1):
-            self.stdout.write(
-                f"[{i}/{total_centers}] Geocoding {center.regional_center}..."
-            )
-
-            try:
-                # Combine address parts
-                address_parts = [center.address]
-                if center.suite:
-                    address_parts.append(center.suite)
-                if center.city:
-                    address_parts.append(center.city)
-                if center.state:
-                    address_parts.append(center.state)
-                if center.zip_code:
-                    address_parts.append(center.zip_code)
-
-                full_address = ", ".join(filter(None, address_parts))
-
-                if not full_address:
-                    failed_count += 1
-                    self.stdout.write(self.style.WARNING(f"  ⚠ No address available"))
-                    continue
-
-                # Use Mapbox geocoding with fallback
-                coordinates = geocode_with_fallback(full_address)
-                if coordinates:
-                    center.latitude = Decimal(str(coordinates[0]))
-                    center.longitude = Decimal(str(coordinates[1]))
-                    center.save()
-                    geocoded_count += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f"  ✓ Success: {coordinates[0]}, {coordinates[1]}"
-                        )
-                    )
-                else:
-                    failed_count += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"  ✗ Failed to geocode: {full_address}")
+            full_address = addresses[center.pk]
+            if not full_address:
+                failed_count += 1
+                self.stdout.write(self.style.WARNING(f"[{i}/{total_centers}] ⚠ No address available: {center.regional_center}"))
+                continue
+            result = results.get(full_address)
+            if apply_result(center, result):
+                geocoded.append(center)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{i}/{total_centers}] ✓ {center.regional_center}: {result.latitude}, {result.longitude}"
                     )
-
-                # Rate limiting
-                time.sleep(0.1)  # 10 requests per second max
-
-            except Exception as e:
+                )
+            else:
                 failed_count += 1
-                self.stdout.write(self.style.ERROR(f"  ✗ Error: {str(e)}"))
+                self.stdout.write(
+                    self.style.ERROR(f"[{i}/{total_centers}] ✗ Failed to geocode: {full_address}")
+                )
+
+        bulk_save_coordinates(RegionalCenter, geocoded)
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Regional center geocoding complete: {geocoded_count} success, {failed_count} failed"
+                f"Regional center geocoding complete: {len(geocoded)} success, {failed_count} failed"
             )
         )
 
@@ -4,8 +4,8 @@ Handles various CSV formats including the CHLA provider export format
 """
 
 from django.core.management.base import BaseCommand
-from django.contrib.gis.geos import Point
 from locations.models import ProviderV2
+from locations.utils.provider_import import MATCH_ID, ProviderImporter, ProviderRow
 from decimal import Decimal, InvalidOperation as DecimalInvalidOperation
 import csv
 import json
@@ -26,6 +26,12 @@ class Command(BaseCommand):
             action="store_true",
             help="Only update existing providers (skip new ones)",
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Rows written per transaction (default: 1000)",
+        )
         parser.add_argument(
             "--skip-empty",
             action="store_true",
@@ -154,6 +160,83 @@ class Command(BaseCommand):
 
         return value
 
+    def parse_coordinate(self, value):
+        """Parse a latitude/longitude cell; empty or invalid cells give None."""
+        if not value:
+            return None
+        try:
+            return Decimal(str(value))
+        except (ValueError, TypeError, DecimalInvalidOperation):
+            return None
+
+    def build_row(self, row, csv_columns):
+        """Turn one CSV row into a ProviderRow limited to the CSV's columns."""
+        provider_id = row.get("id", "").strip()
+        name = row.get("name", "").strip()
+
+        # Parse list fields
+        therapy_types = self.parse_list_field(row.get("therapy_types", ""))
+        age_groups = self.parse_list_field(row.get("age_groups", ""))
+        diagnoses_treated = self.parse_list_field(row.get("diagnoses_treated", ""))
+
+        # Parse address
+        address = self.parse_address(row.get("address", ""))
+
+        # Insurance - keep as text
+        insurance_accepted = row.get("insurance_accepted", "")
+        if insurance_accepted:
+            # Clean up postgres array format if needed
+            if insurance_accepted.startswith("{") and insurance_accepted.endswith("}"):
+                items = re.findall(r'"([^"]*)"', insurance_accepted[1:-1])
+                if items:
+                    insurance_accepted = ", ".join(items)
+                else:
+                    insurance_accepted = insurance_accepted[1:-1]
+
+        # Prepare data, limited to columns present in the CSV so a
+        # partial export never blanks fields it does not carry.
+        data = {"name": name}
+        for field in ("type", "phone", "email", "website", "description"):
+            if field in csv_columns:
+                data[field] = row.get(field, "") or ""
+        if "address" in csv_columns:
+            data["address"] = address
+        if "insurance_accepted" in csv_columns:
+            data["insurance_accepted"] = insurance_accepted
+        if "therapy_types" in csv_columns:
+            data["therapy_types"] = therapy_types if therapy_types else None
+        if "age_groups" in csv_columns:
+            data["age_groups"] = age_groups if age_groups else None
+        if "diagnoses_treated" in csv_columns:
+            data["diagnoses_treated"] = diagnoses_treated if diagnoses_treated else None
+
+        # Coordinates are only written when the row has them, so existing
+        # providers keep their coordinates (and PostGIS point) otherwise.
+        lat = self.parse_coordinate(row.get("latitude"))
+        lng = self.parse_coordinate(row.get("longitude"))
+        if lat and lng:
+            data["latitude"] = lat
+            data["longitude"] = lng
+
+        return ProviderRow(data=data, provider_id=provider_id, label=name[:50])
+
+    def iter_rows(self, csv_file):
+        """Stream ProviderRows from the CSV, skipping rows without id or name."""
+        with open(csv_file, "r", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            csv_columns = set(reader.fieldnames or [])
+            for row in reader:
+                if not (row.get("id") or "").strip() or not (row.get("name") or "").strip():
+                    self.stats["skipped"] += 1
+                    continue
+                self.stats["rows"] += 1
+                try:
+                    yield self.build_row(row, csv_columns)
+                except Exception as e:
+                    error_msg = f"Row {self.stats['rows']} ({row.get('name', 'Unknown')[:30]}): {str(e)}"
+                    self.parse_errors.append(error_msg)
+                    self.stdout.write(self.style.ERROR(f"  ❌ {error_msg}"))
+
     def handle(self, *args, **options):
         csv_file = options["csv_file"]
         dry_run = options.get("dry_run", False)
@@ -170,144 +253,32 @@ class Command(BaseCommand):
                 self.style.WARNING("UPDATE ONLY MODE - New providers will be skipped")
             )
 
-        with open(csv_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            providers = list(reader)
-            csv_columns = set(reader.fieldnames or [])
-
-        # Filter out empty rows
-        providers = [p for p in providers if p.get("id") and p.get("name")]
-
-        self.stdout.write(f"Found {len(providers)} valid providers in CSV")
-
-        created = 0
-        updated = 0
-        skipped = 0
-        errors = []
-
-        for i, row in enumerate(providers, 1):
-            try:
-                provider_id = row.get("id", "").strip()
-                name = row.get("name", "").strip()
-
-                # Skip empty rows
-                if not provider_id or not name:
-                    skipped += 1
-                    continue
-
-                # Check if provider exists
-                existing = ProviderV2.objects.filter(id=provider_id).first()
-
-                # Skip new providers if update-only mode
-                if update_only and not existing:
-                    skipped += 1
-                    continue
+        self.stats = {"rows": 0, "skipped": 0}
+        self.parse_errors = []
+        importer = ProviderImporter(
+            MATCH_ID,
+            create=not update_only,
+            dry_run=dry_run,
+            chunk_size=options.get("chunk_size") or 1000,
+            provider_model=ProviderV2,
+        )
+        report = importer.run(self.iter_rows(csv_file))
 
-                # Parse coordinates (may not exist in all CSV formats)
-                lat = Decimal("0.0")
-                lng = Decimal("0.0")
-                if row.get("latitude"):
-                    try:
-                        lat = Decimal(str(row["latitude"]))
-                    except (ValueError, TypeError, DecimalInvalidOperation):
-                        pass
-                if row.get("longitude"):
-                    try:
-                        lng = Decimal(str(row["longitude"]))
-                    except (ValueError, TypeError, DecimalInvalidOperation):
-                        pass
-
-                # If updating existing and no coordinates in CSV, keep existing coordinates
-                if existing and lat == Decimal("0.0") and lng == Decimal("0.0"):
-                    lat = existing.latitude
-                    lng = existing.longitude
-
-                # Create PostGIS Point
-                location = None
-                if lat and lng and (lat != Decimal("0.0") or lng != Decimal("0.0")):
-                    location = Point(float(lng), float(lat), srid=4326)
-                elif existing and existing.location:
-                    location = existing.location
-
-                # Parse list fields
-                therapy_types = self.parse_list_field(row.get("therapy_types", ""))
-                age_groups = self.parse_list_field(row.get("age_groups", ""))
-                diagnoses_treated = self.parse_list_field(
-                    row.get("diagnoses_treated", "")
-                )
+        self.stdout.write(f"Found {self.stats['rows']} valid providers in CSV")
+        if dry_run:
+            for line in report.diff_lines():
+                self.stdout.write(f"  [DRY] {line}")
 
-                # Parse address
-                address = self.parse_address(row.get("address", ""))
-
-                # Insurance - keep as text
-                insurance_accepted = row.get("insurance_accepted", "")
-                if insurance_accepted:
-                    # Clean up postgres array format if needed
-                    if insurance_accepted.startswith(
-                        "{"
-                    ) and insurance_accepted.endswith("}"):
-                        items = re.findall(r'"([^"]*)"', insurance_accepted[1:-1])
-                        if items:
-                            insurance_accepted = ", ".join(items)
-                        else:
-                            insurance_accepted = insurance_accepted[1:-1]
-
-                # Prepare data, limited to columns present in the CSV so a
-                # partial export never blanks fields it does not carry.
-                data = {"name": name}
-                for field in ("type", "phone", "email", "website", "description"):
-                    if field in csv_columns:
-                        data[field] = row.get(field, "") or ""
-                if "address" in csv_columns:
-                    data["address"] = address
-                if "insurance_accepted" in csv_columns:
-                    data["insurance_accepted"] = insurance_accepted
-                if "therapy_types" in csv_columns:
-                    data["therapy_types"] = therapy_types if therapy_types else None
-                if "age_groups" in csv_columns:
-                    data["age_groups"] = age_groups if age_groups else None
-                if "diagnoses_treated" in csv_columns:
-                    data["diagnoses_treated"] = (
-                        diagnoses_treated if diagnoses_treated else None
-                    )
-                if "latitude" in csv_columns or "longitude" in csv_columns:
-                    data["latitude"] = lat
-                    data["longitude"] = lng
-                    data["location"] = location
-
-                if not dry_run:
-                    if existing:
-                        # Update existing
-                        for key, value in data.items():
-                            setattr(existing, key, value)
-                        existing.save()
-                        updated += 1
-                        self.stdout.write(f"  📝 Updated: {name[:50]}")
-                    else:
-                        # Create new
-                        ProviderV2.objects.create(id=provider_id, **data)
-                        created += 1
-                        self.stdout.write(
-                            self.style.SUCCESS(f"  ✅ Created: {name[:50]}")
-                        )
-                else:
-                    if existing:
-                        self.stdout.write(f"  [DRY] Would update: {name[:50]}")
-                        updated += 1
-                    else:
-                        self.stdout.write(f"  [DRY] Would create: {name[:50]}")
-                        created += 1
-
-            except Exception as e:
-                error_msg = f"Row {i} ({row.get('name', 'Unknown')[:30]}): {str(e)}"
-                errors.append(error_msg)
-                self.stdout.write(self.style.ERROR(f"  ❌ {error_msg}"))
-                skipped += 1
+        created = len(report.created)
+        updated = len(report.updated)
+        skipped = self.stats["skipped"] + report.skipped
+        errors = self.parse_errors + report.errors
 
         # Summary
         self.stdout.write("\n" + "=" * 60)
         self.stdout.write(self.style.SUCCESS(f"✅ Created: {created}"))
         self.stdout.write(self.style.WARNING(f"📝 Updated: {updated}"))
+        self.stdout.write(f"⏸️  Unchanged: {report.unchanged}")
         self.stdout.write(f"⏭️  Skipped: {skipped}")
         self.stdout.write(self.style.ERROR(f"❌ Errors: {len(errors)}"))
 
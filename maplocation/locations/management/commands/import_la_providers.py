@@ -9,10 +9,9 @@ Usage:
 import csv
 import re
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from locations.models import ProviderV2, InsuranceCarrier, ProviderInsuranceCarrier
-from locations.utils.geocode import geocode_address
-from decimal import Decimal
+from locations.models import ProviderV2
+from locations.utils.geocoder import get_geocoder
+from locations.utils.provider_import import ProviderImporter, ProviderRow
 
 
 class Command(BaseCommand):
@@ -25,6 +24,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Preview import without saving to database'
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows geocoded and written per batch (default: 1000)'
+        )
 
     def handle(self, *args, **options):
         csv_file = options['csv_file']
@@ -35,22 +40,51 @@ class Command(BaseCommand):
 
         self.stdout.write(f'📂 Reading CSV file: {csv_file}')
 
-        # Statistics
-        stats = {
-            'total': 0,
-            'created': 0,
-            'updated': 0,
-            'skipped': 0,
-            'geocoded': 0,
-            'geocode_failed': 0,
-            'insurance_created': 0
-        }
+        self.total = 0
+
+        # Rows are geocoded in one batch per chunk through the shared cached
+        # geocoder (which tries suite-stripped, city/ZIP variants itself);
+        # providers whose address cannot be geocoded are skipped.
+        importer = ProviderImporter(
+            dry_run=dry_run,
+            chunk_size=options.get('chunk_size') or 1000,
+            geocoder=get_geocoder(),
+            require_coordinates=True,
+            provider_model=ProviderV2,
+        )
+        report = importer.run(self.iter_rows(csv_file))
+
+        if dry_run:
+            for line in report.diff_lines():
+                self.stdout.write(f'  🔍 {line}')
+        for error in report.errors:
+            self.stdout.write(self.style.ERROR(f'  ❌ {error}'))
+
+        # Print summary
+        self.stdout.write('\n' + '='*60)
+        self.stdout.write(self.style.SUCCESS('📊 IMPORT SUMMARY'))
+        self.stdout.write('='*60)
+        self.stdout.write(f'Total providers processed: {self.total}')
+        self.stdout.write(f'Created: {len(report.created)}')
+        self.stdout.write(f'Updated: {len(report.updated)}')
+        self.stdout.write(f'Unchanged: {report.unchanged}')
+        self.stdout.write(f'Skipped: {report.skipped}')
+        self.stdout.write(f'Geocoded successfully: {report.geocoded}')
+        self.stdout.write(f'Geocoding failed: {report.geocode_failed}')
+        self.stdout.write(f'Insurance carriers created: {report.carriers_created}')
+        self.stdout.write('='*60)
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('\n🔍 DRY RUN COMPLETE - No data was saved'))
+            self.stdout.write('Run without --dry-run to import data')
+        else:
+            self.stdout.write(self.style.SUCCESS('\n✅ IMPORT COMPLETE'))
 
-        # Read CSV file
+    def iter_rows(self, csv_file):
+        """Stream ProviderRows from the LA provider list."""
         with open(csv_file, 'r', encoding='utf-8') as f:
-            # Read raw lines to handle multi-line addresses
             reader = csv.reader(f)
-            header = next(reader)  # Skip header: Provider Name,Address,Services,Insurance,Phone,
+            next(reader)  # Skip header: Provider Name,Address,Services,Insurance,Phone,
 
             for row in reader:
                 if not row or len(row) < 5:
@@ -66,113 +100,23 @@ class Command(BaseCommand):
                 if not name:
                     continue
 
-                stats['total'] += 1
-
-                self.stdout.write(f'\n📋 Processing: {name}')
-
-                # Parse services to extract therapy types
-                therapy_types = self.parse_therapy_types(services)
-
-                # Parse insurance carriers
-                insurance_carriers = self.parse_insurance(insurance_text)
-
-                # Clean and format address
+                self.total += 1
                 clean_address = self.clean_address(address) if address else None
 
-                # Geocode address with enhanced strategies
-                latitude = None
-                longitude = None
-                if clean_address:
-                    from locations.utils.geocode import clean_address_aggressive, geocode_with_nominatim
-
-                    # Try all address variations
-                    variations = clean_address_aggressive(clean_address)
-                    coords = None
-                    successful_variant = None
-
-                    for i, variant in enumerate(variations):
-                        delay = 1.0 if i == 0 else 1.5
-                        coords = geocode_with_nominatim(variant, delay=delay)
-                        if coords:
-                            successful_variant = variant
-                            break
-
-                    if coords:
-                        latitude, longitude = coords
-                        stats['geocoded'] += 1
-                        if successful_variant != clean_address:
-                            self.stdout.write(f'  📍 Geocoded: {latitude}, {longitude}')
-                            self.stdout.write(f'      Used variant: {successful_variant}')
-                        else:
-                            self.stdout.write(f'  📍 Geocoded: {latitude}, {longitude}')
-                    else:
-                        stats['geocode_failed'] += 1
-                        stats['skipped'] += 1
-                        self.stdout.write(self.style.WARNING(f'  ⚠️  Geocoding failed after {len(variations)} attempts, skipping provider'))
-                        self.stdout.write(f'      Original address: {clean_address}')
-                        continue
-
-                # Prepare provider data
                 provider_data = {
                     'name': name,
                     'type': 'Service Provider',
                     'phone': self.clean_phone(phone) if phone else None,
-                    'address': clean_address,
-                    'latitude': Decimal(str(latitude)) if latitude else None,
-                    'longitude': Decimal(str(longitude)) if longitude else None,
-                    'therapy_types': therapy_types,
+                    'address': clean_address or '',
+                    'therapy_types': self.parse_therapy_types(services),
                     'insurance_accepted': insurance_text or '',  # Legacy field
                 }
-
-                if not dry_run:
-                    # Create or update provider
-                    with transaction.atomic():
-                        # Use name + address for matching to handle providers with same name
-                        if clean_address:
-                            provider, created = ProviderV2.objects.update_or_create(
-                                name=name,
-                                address=clean_address,
-                                defaults=provider_data
-                            )
-                        else:
-                            provider, created = ProviderV2.objects.update_or_create(
-                                name=name,
-                                defaults=provider_data
-                            )
-
-                        if created:
-                            stats['created'] += 1
-                            self.stdout.write(self.style.SUCCESS(f'  ✅ Created provider'))
-                        else:
-                            stats['updated'] += 1
-                            self.stdout.write(self.style.SUCCESS(f'  🔄 Updated provider'))
-
-                        # Create insurance carrier relationships
-                        if insurance_carriers:
-                            self.create_insurance_relationships(provider, insurance_carriers, stats)
-                else:
-                    self.stdout.write(f'  🔍 Would create/update: {name}')
-                    self.stdout.write(f'     Therapies: {therapy_types}')
-                    self.stdout.write(f'     Insurance: {insurance_carriers}')
-
-        # Print summary
-        self.stdout.write('\n' + '='*60)
-        self.stdout.write(self.style.SUCCESS('📊 IMPORT SUMMARY'))
-        self.stdout.write('='*60)
-        self.stdout.write(f'Total providers processed: {stats["total"]}')
-        self.stdout.write(f'Created: {stats["created"]}')
-        self.stdout.write(f'Updated: {stats["updated"]}')
-        self.stdout.write(f'Skipped: {stats["skipped"]}')
-        self.stdout.write(f'Geocoded successfully: {stats["geocoded"]}')
-        self.stdout.write(f'Geocoding failed: {stats["geocode_failed"]}')
-        self.stdout.write(f'Insurance carriers created: {stats["insurance_created"]}')
-        self.stdout.write('='*60)
-
-        if dry_run:
-            self.stdout.write(self.style.WARNING('\n🔍 DRY RUN COMPLETE - No data was saved'))
-            self.stdout.write('Run without --dry-run to import data')
-        else:
-            self.stdout.write(self.style.SUCCESS('\n✅ IMPORT COMPLETE'))
+                yield ProviderRow(
+                    data=provider_data,
+                    carriers=self.parse_insurance(insurance_text),
+                    geocode=bool(clean_address),
+                    label=name,
+                )
 
     def clean_address(self, address):
         """Clean and format address from CSV"""
@@ -261,21 +205,3 @@ class Command(BaseCommand):
                 insurance_carriers.append('Private Insurance')
 
         return insurance_carriers
-
-    def create_insurance_relationships(self, provider, insurance_names, stats):
-        """Create ProviderInsuranceCarrier relationships"""
-        for insurance_name in insurance_names:
-            # Get or create insurance carrier
-            carrier, created = InsuranceCarrier.objects.get_or_create(
-                name=insurance_name,
-                defaults={'description': f'Imported from CSV'}
-            )
-
-            if created:
-                stats['insurance_created'] += 1
-
-            # Create relationship if it doesn't exist
-            ProviderInsuranceCarrier.objects.get_or_create(
-                provider=provider,
-                insurance_carrier=carrier
-            )
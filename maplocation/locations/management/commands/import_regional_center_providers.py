@@ -11,6 +11,7 @@ Usage:
 import os
 from django.core.management.base import BaseCommand
 from locations.models import ProviderV2, RegionalCenter
+from locations.utils.provider_import import ProviderImporter, ProviderRow
 
 from .utils.excel_parser import ExcelParser, ColumnMapper
 from .utils.geocoding import GeocodingService
@@ -55,6 +56,17 @@ class Command(BaseCommand):
             default=None,
             help="Specific sheet name to import (default: first sheet)",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be created/updated without saving",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Rows written per transaction (default: 1000)",
+        )
 
     def handle(self, *args, **options):
         file_path = options["file"]
@@ -152,7 +164,13 @@ class Command(BaseCommand):
 
         # Initialize services
         excel_parser = ExcelParser(file_path, options["sheet"])
-        geocoding_service = GeocodingService(self.stdout) if options["geocode"] else None
+        geocoder = None
+        if options["geocode"]:
+            geocoding_service = GeocodingService(self.stdout)
+            if geocoding_service.is_available():
+                geocoder = geocoding_service.geocoder
+            else:
+                self.stdout.write("No geocoder configured (MAPBOX_ACCESS_TOKEN not set), skipping geocoding")
 
         # Open Excel file
         try:
@@ -170,24 +188,39 @@ class Command(BaseCommand):
         column_map = ColumnMapper.map_columns(headers)
         self.stdout.write(f"Column mapping: {column_map}\n")
 
-        # Process rows
-        stats = self._process_rows(
-            excel_parser,
-            column_map,
-            area_name,
-            geocoding_service,
+        importer = ProviderImporter(
+            dry_run=options.get("dry_run", False),
+            chunk_size=options.get("chunk_size") or 1000,
+            geocoder=geocoder,
+            provider_model=ProviderV2,
         )
+        self.parse_errors = 0
+        try:
+            report = importer.run(
+                self._iter_rows(excel_parser, column_map, area_name, regional_center, geocoder)
+            )
+        finally:
+            excel_parser.close()
 
-        # Close parser
-        excel_parser.close()
+        if options.get("dry_run"):
+            for line in report.diff_lines():
+                self.stdout.write(f"  {line}")
+        for error in report.errors:
+            self.stdout.write(self.style.ERROR(f"  ✗ {error}"))
 
         # Print summary
-        self._print_summary(stats)
-
-    def _process_rows(self, excel_parser, column_map, area_name, geocoding_service):
-        """Process all rows from Excel file."""
-        stats = {"created": 0, "updated": 0, "errors": 0}
+        self._print_summary(
+            {
+                "created": len(report.created),
+                "updated": len(report.updated),
+                "unchanged": report.unchanged,
+                "linked": report.regional_center_links,
+                "errors": self.parse_errors + len(report.errors),
+            }
+        )
 
+    def _iter_rows(self, excel_parser, column_map, area_name, regional_center, geocoder):
+        """Stream ProviderRows from the Excel sheet."""
         for row_num, row_data in excel_parser.iter_rows():
             try:
                 # Get provider name
@@ -207,41 +240,28 @@ class Command(BaseCommand):
                     area_name,
                     ColumnMapper.get_value
                 )
+                provider_data["address"] = provider_data.get("address") or ""
 
-                # Geocode if requested
-                if geocoding_service and provider_data.get("address"):
-                    coords = geocoding_service.geocode_address(provider_data["address"])
-                    if coords:
-                        provider_data["latitude"] = coords["latitude"]
-                        provider_data["longitude"] = coords["longitude"]
-
-                # Create or update provider
-                provider, created = ProviderV2.objects.update_or_create(
-                    name=provider_data["name"],
-                    address=provider_data.get("address", ""),
-                    defaults=provider_data,
+                yield ProviderRow(
+                    data=provider_data,
+                    regional_centers=[regional_center] if regional_center else [],
+                    geocode=geocoder is not None,
+                    label=f"row {row_num}",
                 )
 
-                if created:
-                    stats["created"] += 1
-                    self.stdout.write(f"  ✓ Created: {provider.name}")
-                else:
-                    stats["updated"] += 1
-                    self.stdout.write(f"  ↻ Updated: {provider.name}")
-
             except Exception as e:  # pylint: disable=broad-except
-                stats["errors"] += 1
+                self.parse_errors += 1
                 self.stdout.write(
                     self.style.ERROR(f"  ✗ Error on row {row_num}: {e}")
                 )
 
-        return stats
-
     def _print_summary(self, stats):
         """Print import summary statistics."""
         self.stdout.write("\n" + "=" * 50)
         self.stdout.write(self.style.SUCCESS("Import complete!"))
         self.stdout.write(f"  Created: {stats['created']}")
         self.stdout.write(f"  Updated: {stats['updated']}")
+        self.stdout.write(f"  Unchanged: {stats['unchanged']}")
+        self.stdout.write(f"  Regional center links: {stats['linked']}")
         self.stdout.write(f"  Errors:  {stats['errors']}")
         self.stdout.write("=" * 50 + "\n")
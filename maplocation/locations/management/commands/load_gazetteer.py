@@ -0,0 +1,89 @@
+"""
+Management command to load California ZIP and place centroids into the
+gazetteer table from the Census Bureau gazetteer files.
+
+Download from https://www.census.gov/geographies/reference-files/time-series/geo/gazetteer-files.html:
+  - ZCTA file (national), e.g. 2023_Gaz_zcta_national.zip
+  - Places file for California, e.g. 2023_Gaz_place_06.txt
+
+    python manage.py load_gazetteer --zcta 2023_Gaz_zcta_national.zip --places 2023_Gaz_place_06.txt
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from locations.models import GazetteerEntry
+from locations.utils.gazetteer import (
+    CA_ZIP_PREFIXES,
+    open_census_file,
+    read_census_places,
+    read_census_zctas,
+    reset_gazetteer,
+)
+
+
+class Command(BaseCommand):
+    help = "Load Census ZCTA and place centroids into the gazetteer table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--zcta", help="Census ZCTA gazetteer file (.txt or .zip)")
+        parser.add_argument("--places", help="Census place gazetteer file (.txt or .zip)")
+        parser.add_argument("--state", default="CA", help="USPS state code for places (default: CA)")
+        parser.add_argument(
+            "--zip-prefixes",
+            default=",".join(CA_ZIP_PREFIXES),
+            help="Comma-separated ZIP prefixes to keep from the national ZCTA file",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Parse the files and report counts without writing",
+        )
+
+    def handle(self, *args, **options):
+        if not options["zcta"] and not options["places"]:
+            raise CommandError("Pass --zcta and/or --places")
+
+        state = options["state"].upper()
+        rows = []
+        try:
+            if options["zcta"]:
+                prefixes = [p.strip() for p in options["zip_prefixes"].split(",") if p.strip()]
+                zctas = list(read_census_zctas(open_census_file(options["zcta"]), prefixes))
+                self.stdout.write(f"Parsed {len(zctas)} ZCTAs")
+                rows.extend(zctas)
+            if options["places"]:
+                places = list(read_census_places(open_census_file(options["places"]), state))
+                self.stdout.write(f"Parsed {len(places)} places")
+                rows.extend(places)
+        except (OSError, KeyError, ValueError, StopIteration) as exc:
+            raise CommandError(f"Could not read gazetteer file: {exc}")
+
+        # Two places can normalize to the same key; keep the last one.
+        entries = {
+            (kind, key): GazetteerEntry(
+                kind=kind, key=key, name=name, state=state, latitude=lat, longitude=lng
+            )
+            for kind, key, name, lat, lng in rows
+        }
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"DRY RUN: would upsert {len(entries)} entries"))
+            return
+
+        with transaction.atomic():
+            GazetteerEntry.objects.bulk_create(
+                entries.values(),
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=["kind", "key"],
+                update_fields=["name", "state", "latitude", "longitude"],
+            )
+        reset_gazetteer()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Upserted {len(entries)} gazetteer entries. "
+                "Restart running web workers to pick them up."
+            )
+        )
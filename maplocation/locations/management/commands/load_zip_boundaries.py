@@ -0,0 +1,50 @@
+"""
+Management command to load ZIP (ZCTA) boundary polygons into the
+zip_boundary table, for generate_service_areas.
+
+Use a Census ZCTA cartographic boundary file converted to GeoJSON, e.g.
+cb_2020_us_zcta520_500k (ogr2ogr -f GeoJSON zcta.geojson cb_2020_us_zcta520_500k.shp):
+
+    python manage.py load_zip_boundaries zcta.geojson
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from locations.utils.gazetteer import CA_ZIP_PREFIXES
+from locations.utils.service_area_builder import (
+    open_geojson,
+    read_zcta_features,
+    upsert_zip_boundaries,
+)
+
+
+class Command(BaseCommand):
+    help = "Load ZCTA boundary polygons from GeoJSON into the zip_boundary table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="ZCTA GeoJSON file (.geojson, .json or .zip)")
+        parser.add_argument(
+            "--zip-prefixes",
+            default=",".join(CA_ZIP_PREFIXES),
+            help="Comma-separated ZIP prefixes to keep (default: California)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Parse the file and report counts without writing",
+        )
+
+    def handle(self, *args, **options):
+        prefixes = [p.strip() for p in options["zip_prefixes"].split(",") if p.strip()]
+        try:
+            features = list(read_zcta_features(open_geojson(options["path"]), prefixes))
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read ZCTA file: {exc}")
+
+        self.stdout.write(f"Parsed {len(features)} ZCTA boundaries")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN - nothing was written"))
+            return
+
+        count = upsert_zip_boundaries(features)
+        self.stdout.write(self.style.SUCCESS(f"Loaded {count} ZIP boundaries"))
@@ -9,9 +9,9 @@ Usage:
 import csv
 import re
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from locations.models import ProviderV2, InsuranceCarrier, ProviderInsuranceCarrier
-from locations.utils.geocode import clean_address_aggressive, geocode_with_nominatim
+from locations.models import ProviderV2
+from locations.utils.geocoder import address_variants, get_geocoder
+from locations.utils.provider_import import ProviderImporter, ProviderRow
 from decimal import Decimal
 
 
@@ -53,6 +53,7 @@ class Command(BaseCommand):
         }
 
         # Read CSV file
+        pending = []
         with open(csv_file, 'r', encoding='utf-8') as f:
             reader = csv.reader(f)
             header = next(reader)  # Skip header
@@ -64,99 +65,88 @@ class Command(BaseCommand):
                 # CSV columns: Provider Name, Address, Services, Insurance, Phone
                 name = row[0].strip() if row[0] else None
                 address = row[1].strip() if row[1] else None
-                services = row[2].strip() if row[2] else None
-                insurance_text = row[3].strip() if row[3] else None
-                phone = row[4].strip() if row[4] else None
-
                 if not name or not address:
                     continue
-
-                # Clean address
-                clean_address = self.clean_address(address)
-
-                # Check if provider already exists with valid coordinates
-                existing = ProviderV2.objects.filter(
-                    name=name,
-                    address=clean_address
-                ).first()
-
-                if existing and existing.latitude and existing.longitude and \
-                   existing.latitude != Decimal('0.0') and existing.longitude != Decimal('0.0'):
-                    stats['already_exists'] += 1
-                    continue
-
-                # This provider either doesn't exist or failed geocoding
-                stats['total_processed'] += 1
+                pending.append((name, self.clean_address(address), row))
+
+        # Providers that already have valid coordinates, in one query
+        geocoded_keys = set(
+            ProviderV2.objects.filter(name__in={name for name, _, _ in pending})
+            .exclude(latitude__isnull=True)
+            .exclude(longitude__isnull=True)
+            .exclude(latitude=Decimal('0.0'))
+            .exclude(longitude=Decimal('0.0'))
+            .values_list('name', 'address')
+        )
+        to_retry = []
+        for name, clean_address, row in pending:
+            if (name, clean_address) in geocoded_keys:
+                stats['already_exists'] += 1
+            else:
+                to_retry.append((name, clean_address, row))
+
+        # One batched pass; the geocoder tries suite-stripped, city/state/ZIP
+        # and ZIP variants for every miss, and caches the outcome.
+        self.stdout.write(f'🌍 Geocoding {len(to_retry)} addresses...')
+        results = get_geocoder().geocode_many(address for _, address, _ in to_retry)
+
+        import_rows = []
+        for name, clean_address, row in to_retry:
+            # This provider either doesn't exist or failed geocoding
+            stats['total_processed'] += 1
+            services = row[2].strip() if row[2] else None
+            insurance_text = row[3].strip() if row[3] else None
+            phone = row[4].strip() if row[4] else None
+
+            if verbose:
                 self.stdout.write(f'\n📋 Processing: {name}')
-
-                # Try enhanced geocoding
-                variations = clean_address_aggressive(clean_address)
-
+                variations = address_variants(clean_address)
+                self.stdout.write(f'  🔍 Address variations:')
+                for i, var in enumerate(variations, 1):
+                    self.stdout.write(f'      {i}. {var}')
+
+            result = results.get(clean_address)
+            if result:
+                latitude, longitude = result.as_decimal()
+                stats['geocoded_success'] += 1
                 if verbose:
-                    self.stdout.write(f'  🔍 Trying {len(variations)} address variations:')
-                    for i, var in enumerate(variations, 1):
-                        self.stdout.write(f'      {i}. {var}')
-
-                coords = None
-                successful_variant = None
-
-                for i, variant in enumerate(variations):
-                    delay = 1.0 if i == 0 else 1.5
-                    coords = geocode_with_nominatim(variant, delay=delay)
-                    if coords:
-                        successful_variant = variant
-                        if verbose:
-                            self.stdout.write(f'  ✅ Match found on attempt {i+1}!')
-                        break
-
-                if coords:
-                    latitude, longitude = coords
-                    stats['geocoded_success'] += 1
                     self.stdout.write(self.style.SUCCESS(f'  📍 Geocoded: {latitude}, {longitude}'))
-                    if successful_variant != clean_address:
-                        self.stdout.write(f'      Strategy worked: {successful_variant}')
-
-                    # Parse services and insurance
-                    therapy_types = self.parse_therapy_types(services)
-                    insurance_carriers = self.parse_insurance(insurance_text)
-
-                    # Prepare provider data
-                    provider_data = {
-                        'name': name,
-                        'type': 'Service Provider',
-                        'phone': self.clean_phone(phone) if phone else None,
-                        'address': clean_address,
-                        'latitude': Decimal(str(latitude)),
-                        'longitude': Decimal(str(longitude)),
-                        'therapy_types': therapy_types,
-                        'insurance_accepted': insurance_text or '',
-                    }
-
-                    if not dry_run:
-                        # Create or update provider
-                        with transaction.atomic():
-                            provider, created = ProviderV2.objects.update_or_create(
-                                name=name,
-                                address=clean_address,
-                                defaults=provider_data
-                            )
-
-                            if created:
-                                stats['created'] += 1
-                                self.stdout.write(self.style.SUCCESS(f'  ✅ Created provider'))
-                            else:
-                                self.stdout.write(self.style.SUCCESS(f'  🔄 Updated provider with coordinates'))
-
-                            # Create insurance carrier relationships
-                            if insurance_carriers:
-                                self.create_insurance_relationships(provider, insurance_carriers, stats)
-                    else:
-                        self.stdout.write(f'  🔍 Would create/update provider')
-                else:
-                    stats['still_failed'] += 1
-                    self.stdout.write(self.style.ERROR(f'  ❌ Still failed after {len(variations)} attempts'))
-                    if verbose:
-                        self.stdout.write(f'      Original: {clean_address}')
+                    if result.matched_query != clean_address:
+                        self.stdout.write(f'      Strategy worked: {result.matched_query}')
+
+                # Prepare provider data
+                provider_data = {
+                    'name': name,
+                    'type': 'Service Provider',
+                    'phone': self.clean_phone(phone) if phone else None,
+                    'address': clean_address,
+                    'latitude': latitude,
+                    'longitude': longitude,
+                    'therapy_types': self.parse_therapy_types(services),
+                    'insurance_accepted': insurance_text or '',
+                }
+                import_rows.append(
+                    ProviderRow(
+                        data=provider_data,
+                        carriers=self.parse_insurance(insurance_text),
+                        label=name,
+                    )
+                )
+            else:
+                stats['still_failed'] += 1
+                self.stdout.write(self.style.ERROR(f'  ❌ Still failed after all address variants: {name}'))
+                if verbose:
+                    self.stdout.write(f'      Original: {clean_address}')
+
+        # Create or update the recovered providers in bulk
+        report = ProviderImporter(dry_run=dry_run, provider_model=ProviderV2).run(import_rows)
+        stats['created'] = len(report.created)
+        stats['insurance_created'] = report.carriers_created
+        if dry_run:
+            for line in report.diff_lines():
+                self.stdout.write(f'  🔍 {line}')
+        for error in report.errors:
+            self.stdout.write(self.style.ERROR(f'  ❌ {error}'))
 
         # Print summary
         self.stdout.write('\n' + '='*60)
@@ -257,19 +247,3 @@ class Command(BaseCommand):
                 insurance_carriers.append('Private Insurance')
 
         return insurance_carriers
-
-    def create_insurance_relationships(self, provider, insurance_names, stats):
-        """Create ProviderInsuranceCarrier relationships"""
-        for insurance_name in insurance_names:
-            carrier, created = InsuranceCarrier.objects.get_or_create(
-                name=insurance_name,
-                defaults={'description': f'Imported from CSV'}
-            )
-
-            if created:
-                stats['insurance_created'] += 1
-
-            ProviderInsuranceCarrier.objects.get_or_create(
-                provider=provider,
-                insurance_carrier=carrier
-            )
@@ -0,0 +1,40 @@
+"""
+Management command to seed (or clear) synthetic LA providers, carriers and
+regional centers for benchmarks and load tests (locations/utils/synthetic_data.py).
+
+    python manage.py seed_synthetic_data --providers 5000
+    python manage.py seed_synthetic_data --clear
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from locations.utils.synthetic_data import clear_synthetic_data, seed_synthetic_data
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic LA providers, carriers and regional centers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--providers", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--clear", action="store_true", help="Only delete previously seeded rows")
+
+    def handle(self, *args, **options):
+        deleted = clear_synthetic_data()
+        self.stdout.write(
+            "Cleared: " + ", ".join(f"{count} {table}" for table, count in deleted.items())
+        )
+        if options["clear"]:
+            self.stdout.write(self.style.SUCCESS("Synthetic data cleared"))
+            return
+
+        started = time.perf_counter()
+        created = seed_synthetic_data(options["providers"], seed=options["seed"])
+        self.stdout.write(
+            "Created: " + ", ".join(f"{count} {table}" for table, count in created.items())
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Seeded synthetic data in {time.perf_counter() - started:.1f}s")
+        )
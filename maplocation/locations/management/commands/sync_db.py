@@ -0,0 +1,120 @@
+"""
+Incrementally sync provider data between two Postgres databases.
+
+Only rows that changed are copied (per-row updated_at comparison for
+providers, content hashes elsewhere), using COPY streams and batched
+upserts in one target transaction; relationship tables are synced as sets.
+Each table is verified by checksum afterwards. See locations/utils/db_sync.py.
+
+Usage:
+    python manage.py sync_db --target rds                 # local -> RDS
+    python manage.py sync_db --source rds --target default  # RDS -> local
+    python manage.py sync_db --source-url postgres://localhost/a --target-url postgres://localhost/b
+    python manage.py sync_db --target rds --verify-only
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from locations.utils.db_sync import (
+    DEFAULT_BATCH_SIZE,
+    SYNC_TABLES,
+    DatabaseSync,
+    PgConnection,
+    select_tables,
+)
+
+
+def connect_url(url):
+    """Open a raw connection from a postgres:// URL with whichever psycopg is installed."""
+    try:
+        import psycopg
+
+        return psycopg.connect(url)
+    except ImportError:
+        import psycopg2
+
+        return psycopg2.connect(url)
+
+
+class Command(BaseCommand):
+    help = "Incrementally sync providers, carriers, regional centers and links between databases"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", default="default", help="Source database alias (default: default)")
+        parser.add_argument("--target", default="rds", help="Target database alias (default: rds)")
+        parser.add_argument("--source-url", help="Source postgres:// URL (overrides --source)")
+        parser.add_argument("--target-url", help="Target postgres:// URL (overrides --target)")
+        parser.add_argument(
+            "--tables",
+            nargs="*",
+            help=f"Tables to sync (default: all): {', '.join(t.name for t in SYNC_TABLES)}",
+        )
+        parser.add_argument("--full", action="store_true", help="Copy every row, ignoring updated_at")
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete target rows missing from the source (relationship tables always are)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Report deltas without writing")
+        parser.add_argument("--verify-only", action="store_true", help="Only compare table checksums")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            tables = select_tables(options["tables"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        source = self._connect(options["source"], options["source_url"])
+        target = self._connect(options["target"], options["target_url"])
+        self.stdout.write(f"Source: {source.label}")
+        self.stdout.write(f"Target: {target.label}")
+
+        sync = DatabaseSync(
+            source,
+            target,
+            tables=tables,
+            batch_size=options["batch_size"],
+            full=options["full"],
+            delete=options["delete"],
+            dry_run=options["dry_run"],
+        )
+        results = sync.verify() if options["verify_only"] else sync.run()
+
+        self.stdout.write("")
+        self.stdout.write(f"{'table':<36} {'mode':<10} {'copied':>8} {'deleted':>8}  checksum")
+        mismatched = 0
+        for result in results:
+            if result.in_sync is None:
+                status = "-"
+            elif result.in_sync:
+                status = self.style.SUCCESS(f"ok ({result.target_checksum[0]} rows)")
+            else:
+                mismatched += 1
+                status = self.style.ERROR(
+                    f"MISMATCH (source {result.source_checksum[0]} rows, "
+                    f"target {result.target_checksum[0]} rows)"
+                )
+            self.stdout.write(
+                f"{result.table:<36} {result.mode:<10} {result.copied:>8} {result.deleted:>8}  {status}"
+            )
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("\nDRY RUN - nothing was written"))
+        if mismatched:
+            raise CommandError(f"{mismatched} table(s) differ after sync; rerun with --full")
+
+    def _connect(self, alias, url):
+        if url:
+            return PgConnection(connect_url(url), label=url.rsplit("@", 1)[-1])
+        if alias == "rds" and alias not in connections.databases:
+            from locations.utils.rds_secret import register_rds_connection
+
+            register_rds_connection(alias)
+        if alias not in connections.databases:
+            raise CommandError(f"Unknown database alias: {alias}")
+        connection = connections[alias]
+        connection.ensure_connection()
+        settings = connection.settings_dict
+        return PgConnection(connection.connection, label=f"{alias} ({settings['HOST']}/{settings['NAME']})")
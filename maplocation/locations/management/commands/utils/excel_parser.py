@@ -1,6 +1,6 @@
 """Excel file parsing utilities for provider data imports."""
 import openpyxl
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class ExcelParser:
@@ -28,7 +28,11 @@ class ExcelParser:
             True if successful, False otherwise
         """
         try:
-            self.workbook = openpyxl.load_workbook(self.file_path)
+            # Read-only mode streams rows instead of building the whole sheet
+            # in memory; data_only returns cached formula results.
+            self.workbook = openpyxl.load_workbook(
+                self.file_path, read_only=True, data_only=True
+            )
             
             if self.sheet_name:
                 if self.sheet_name not in self.workbook.sheetnames:
@@ -42,9 +46,12 @@ class ExcelParser:
                 self.sheet = self.workbook.active
             
             # Read headers
+            header_row = next(
+                self.sheet.iter_rows(min_row=1, max_row=1, values_only=True), ()
+            )
             self.headers = [
-                cell.value.strip() if cell.value else ""
-                for cell in self.sheet[1]
+                str(value).strip() if value is not None else ""
+                for value in header_row
             ]
             
             return True
@@ -60,7 +67,7 @@ class ExcelParser:
         """Get column headers from the sheet."""
         return self.headers
 
-    def iter_rows(self, start_row: int = 2) -> List[Dict[str, Any]]:
+    def iter_rows(self, start_row: int = 2) -> Iterator[Tuple[int, Dict[str, Any]]]:
         """
         Iterate through rows and yield data as dictionaries.
         
@@ -0,0 +1,52 @@
+# Generated by Django 5.2 on 2026-10-19 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0033_geocodecache"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GazetteerEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("zip", "ZIP code"), ("place", "City / place")],
+                        max_length=8,
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="ZIP code or normalized place name", max_length=128
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("state", models.CharField(default="CA", max_length=2)),
+                ("latitude", models.FloatField()),
+                ("longitude", models.FloatField()),
+            ],
+            options={
+                "db_table": "gazetteer_entry",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("kind", "key"), name="gazetteer_entry_kind_key"
+                    )
+                ],
+            },
+        ),
+    ]
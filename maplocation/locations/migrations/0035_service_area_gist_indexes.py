@@ -0,0 +1,39 @@
+# GiST indexes for the point-in-polygon regional center lookups in
+# locations/utils/service_areas.py. Django creates these for spatial fields
+# it manages, but regional_centers / providers_v2 predate the models on RDS,
+# so only create one where no GiST index on the column exists yet.
+
+from django.db import migrations
+
+
+def gist_index_sql(table, column, name):
+    return f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_indexes
+                WHERE tablename = '{table}'
+                  AND indexdef ILIKE '%USING gist ({column})%'
+            ) THEN
+                CREATE INDEX {name} ON {table} USING GIST ({column});
+            END IF;
+        END $$;
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0034_gazetteerentry"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=gist_index_sql("regional_centers", "service_area", "regional_centers_service_area_gist"),
+            reverse_sql="DROP INDEX IF EXISTS regional_centers_service_area_gist;",
+        ),
+        migrations.RunSQL(
+            sql=gist_index_sql("providers_v2", "location", "providers_v2_location_gist"),
+            reverse_sql="DROP INDEX IF EXISTS providers_v2_location_gist;",
+        ),
+    ]
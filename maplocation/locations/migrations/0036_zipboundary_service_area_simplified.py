@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2026-10-19 14:20
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0035_service_area_gist_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="regionalcenter",
+            name="service_area_simplified",
+            field=models.JSONField(
+                blank=True,
+                help_text="Simplified service area GeoJSON geometries keyed by tolerance in degrees",
+                null=True,
+            ),
+        ),
+        migrations.CreateModel(
+            name="ZipBoundary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("zip_code", models.CharField(max_length=5, unique=True)),
+                (
+                    "geom",
+                    django.contrib.gis.db.models.fields.MultiPolygonField(srid=4326),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "zip_boundary",
+            },
+        ),
+    ]
@@ -0,0 +1,113 @@
+# Full-text and trigram search indexes for locations/utils/text_search.py.
+#
+# Each searchable table gets a stored generated ``search_vector`` tsvector
+# (weighted A-D, see SEARCH_VECTORS) with a GIN index, plus pg_trgm GIN
+# indexes on the name and address columns for typo-tolerant matching.
+# hmgl.location is unmanaged and may not exist (local databases), so every
+# statement is guarded on the table and column existing.
+
+from django.db import migrations
+
+SEARCH_VECTORS = {
+    "providers_v2": """
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english',
+            coalesce(type, '') || ' ' || coalesce(therapy_types::text, '') || ' '
+            || coalesce(diagnoses_treated::text, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        || setweight(to_tsvector('english',
+            coalesce(address, '') || ' ' || coalesce(insurance_accepted, '')), 'D')
+    """,
+    "locations_location": """
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        || setweight(to_tsvector('english',
+            coalesce(address, '') || ' ' || coalesce(city, '') || ' ' || coalesce(state, '')), 'D')
+    """,
+    "hmgl.location": """
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(organization, '')), 'B')
+        || setweight(to_tsvector('english',
+            regexp_replace(coalesce(description_html, ''), '<[^>]+>', ' ', 'g')), 'C')
+        || setweight(to_tsvector('english',
+            coalesce(address1, '') || ' ' || coalesce(city, '')), 'D')
+    """,
+}
+
+TRIGRAM_COLUMNS = {
+    "providers_v2": ("name", "address"),
+    "locations_location": ("name", "address"),
+    "hmgl.location": ("name", "address1"),
+}
+
+
+def index_name(table, suffix):
+    return f"{table.replace('.', '_')}_{suffix}"
+
+
+def search_vector_sql(table, expression):
+    return f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{table}') IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM pg_attribute
+                WHERE attrelid = '{table}'::regclass AND attname = 'search_vector'
+            ) THEN
+                ALTER TABLE {table} ADD COLUMN search_vector tsvector
+                    GENERATED ALWAYS AS ({expression}) STORED;
+            END IF;
+            IF to_regclass('{table}') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS {index_name(table, "search_gin")}
+                    ON {table} USING GIN (search_vector);
+            END IF;
+        END $$;
+    """
+
+
+def trigram_index_sql(table, column):
+    return f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{table}') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS {index_name(table, column + "_trgm")}
+                    ON {table} USING GIN ({column} gin_trgm_ops);
+            END IF;
+        END $$;
+    """
+
+
+def drop_sql(table):
+    schema = f"{table.split('.')[0]}." if "." in table else ""
+    indexes = [index_name(table, "search_gin")] + [
+        index_name(table, column + "_trgm") for column in TRIGRAM_COLUMNS[table]
+    ]
+    drops = " ".join(f"DROP INDEX IF EXISTS {schema}{name};" for name in indexes)
+    return f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{table}') IS NOT NULL THEN
+                {drops}
+                ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector;
+            END IF;
+        END $$;
+    """
+
+
+def table_operations(table):
+    forward = [search_vector_sql(table, SEARCH_VECTORS[table])]
+    forward += [trigram_index_sql(table, column) for column in TRIGRAM_COLUMNS[table]]
+    return migrations.RunSQL(sql=forward, reverse_sql=drop_sql(table))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0036_zipboundary_service_area_simplified"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ] + [table_operations(table) for table in SEARCH_VECTORS]
@@ -0,0 +1,48 @@
+# hmgl.location (unmanaged, loaded outside Django) support for
+# HMGLLocation.find_nearby and the precomputed display columns:
+#
+# - a functional GiST index on geom::geography, so true-meter ST_DWithin
+#   and <-> KNN ordering on the cast are index-backed;
+# - hours_clean / description_clean / primary_phone_clean text columns,
+#   filled by `manage.py clean_hmgl_locations`.
+#
+# Skipped when the table does not exist (local databases).
+
+from django.db import migrations
+
+FORWARD = """
+    DO $$
+    BEGIN
+        IF to_regclass('hmgl.location') IS NOT NULL THEN
+            ALTER TABLE hmgl.location ADD COLUMN IF NOT EXISTS hours_clean text;
+            ALTER TABLE hmgl.location ADD COLUMN IF NOT EXISTS description_clean text;
+            ALTER TABLE hmgl.location ADD COLUMN IF NOT EXISTS primary_phone_clean text;
+            CREATE INDEX IF NOT EXISTS hmgl_location_geog_gist
+                ON hmgl.location USING GIST ((geom::geography));
+        END IF;
+    END $$;
+"""
+
+REVERSE = """
+    DO $$
+    BEGIN
+        IF to_regclass('hmgl.location') IS NOT NULL THEN
+            DROP INDEX IF EXISTS hmgl.hmgl_location_geog_gist;
+            ALTER TABLE hmgl.location
+                DROP COLUMN IF EXISTS hours_clean,
+                DROP COLUMN IF EXISTS description_clean,
+                DROP COLUMN IF EXISTS primary_phone_clean;
+        END IF;
+    END $$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0037_search_vectors"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=FORWARD, reverse_sql=REVERSE),
+    ]
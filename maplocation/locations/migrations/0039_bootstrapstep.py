@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-19 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0038_hmgl_geography_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BootstrapStep",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, unique=True)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("completed_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "bootstrap_step",
+            },
+        ),
+    ]
@@ -4,9 +4,14 @@ from django.contrib.gis.geos import Point, Polygon, MultiPolygon
 from django.contrib.gis.measure import Distance
 from django.contrib.postgres.fields import ArrayField
 from decimal import Decimal
+import logging
 import math
 import uuid
 
+logger = logging.getLogger(__name__)
+
+METERS_PER_MILE = 1609.344
+
 # Optional pgvector support - may not be available in all environments
 try:
     from pgvector.django import VectorField
@@ -148,6 +153,11 @@ class RegionalCenter(models.Model):
     is_la_regional_center = models.BooleanField(
         default=False, help_text="Whether this is a Los Angeles County regional center"
     )
+    service_area_simplified = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Simplified service area GeoJSON geometries keyed by tolerance in degrees",
+    )
 
     class Meta:
         verbose_name_plural = "Regional Centers"
@@ -187,15 +197,11 @@ class RegionalCenter(models.Model):
         """Find regional center that serves a specific ZIP code (LA-specific)"""
         try:
             from django.db import connection
-            import traceback
-
-            print(f"[DEBUG] find_by_zip_code called with ZIP: {zip_code}")
 
             # Use raw SQL to properly check JSONB array containment
             # The @> operator checks if the JSONB array contains the given element
             with connection.cursor() as cursor:
                 query_param = f'["{zip_code}"]'
-                print(f"[DEBUG] Query param: {query_param}")
 
                 cursor.execute(
                     """
@@ -208,21 +214,77 @@ class RegionalCenter(models.Model):
                     [query_param],
                 )
                 result = cursor.fetchone()
-                print(f"[DEBUG] Query result: {result}")
 
                 if result:
-                    rc = cls.objects.get(id=result[0])
-                    print(f"[DEBUG] Found RC: {rc.regional_center}")
-                    return rc
+                    return cls.objects.get(id=result[0])
+
+            # Next: the center whose service area contains the ZIP centroid
+            coordinates = cls.geocode_address(zip_code)
+            if coordinates:
+                centers = cls.find_by_location(*coordinates, nearest_fallback=False)
+                if centers:
+                    return centers[0]
 
             # Fallback: try to find by the center's own zip_code field
-            print(f"[DEBUG] Trying fallback by zip_code field")
             return cls.objects.filter(zip_code=zip_code).first()
-        except Exception as e:
-            print(f"[ERROR] finding regional center by ZIP code {zip_code}: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error finding regional center by ZIP code %s", zip_code)
             return None
 
+    @classmethod
+    def find_by_zip_codes(cls, zip_codes):
+        """
+        Batch ``find_by_zip_code``: ``{zip: RegionalCenter or None}`` in input
+        order. Each fallback stage (zip_codes list, service area containing
+        the ZIP centroid, the center's own zip_code) is one query for all
+        ZIPs still unresolved, so cost does not grow with the batch.
+        """
+        from django.db import connection
+
+        from .utils.service_areas import classify_points
+
+        zip_codes = list(dict.fromkeys(z.strip() for z in zip_codes if z and z.strip()))
+        if not zip_codes:
+            return {}
+
+        matched = {}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT DISTINCT ON (z.zip) z.zip, rc.id
+                FROM regional_centers rc
+                CROSS JOIN LATERAL jsonb_array_elements_text(rc.zip_codes) AS z(zip)
+                WHERE rc.is_la_regional_center = true
+                  AND jsonb_typeof(rc.zip_codes) = 'array'
+                  AND rc.zip_codes ?| %s
+                  AND z.zip = ANY(%s)
+                ORDER BY z.zip, rc.id
+                """,
+                [zip_codes, zip_codes],
+            )
+            matched.update(cursor.fetchall())
+
+        # Next: the center whose service area contains each ZIP centroid
+        remaining = [z for z in zip_codes if z not in matched]
+        located = [(z, cls.geocode_address(z)) for z in remaining]
+        located = [(z, coordinates) for z, coordinates in located if coordinates]
+        if located:
+            served = classify_points([coordinates for _, coordinates in located])
+            matched.update((z, ids[0]) for (z, _), ids in zip(located, served) if ids)
+
+        # Fallback: the center's own zip_code field
+        remaining = [z for z in zip_codes if z not in matched]
+        if remaining:
+            for center_id, zip_code in (
+                cls.objects.filter(zip_code__in=remaining)
+                .order_by("id")
+                .values_list("id", "zip_code")
+            ):
+                matched.setdefault(zip_code, center_id)
+
+        centers = cls.objects.in_bulk(set(matched.values()))
+        return {z: centers.get(matched.get(z)) for z in zip_codes}
+
     @classmethod
     def find_nearest(cls, latitude, longitude, radius_miles=25, limit=10):
         """Find regional centers within radius of given coordinates using PostGIS"""
@@ -250,9 +312,18 @@ class RegionalCenter(models.Model):
         return list(results)
 
     @classmethod
-    def find_by_location(cls, latitude, longitude):
-        """Find regional centers that serve a specific geographic point"""
-        # Temporarily use only distance-based search due to GIS being disabled
+    def find_by_location(cls, latitude, longitude, nearest_fallback=True):
+        """
+        Find regional centers whose service area contains a geographic point
+        (ST_Intersects on PostGIS, in-process index otherwise), nearest
+        office first. Without a containing service area, optionally falls
+        back to the nearest centers within 25 miles.
+        """
+        from .utils.service_areas import find_centers_for_point
+
+        centers = find_centers_for_point(latitude, longitude)
+        if centers or not nearest_fallback:
+            return centers
         return cls.find_nearest(latitude, longitude, radius_miles=25, limit=3)
 
     @classmethod
@@ -265,89 +336,13 @@ class RegionalCenter(models.Model):
 
     @classmethod
     def geocode_address(cls, address_or_zip):
-        """Convert address or zip code to coordinates"""
-        # Check if it's a zip code (5 digits)
-        if address_or_zip.isdigit() and len(address_or_zip) == 5:
-            return cls._geocode_zip(address_or_zip)
-        else:
-            return cls._geocode_address(address_or_zip)
-
-    @classmethod
-    def _geocode_zip(cls, zip_code):
-        """Basic zip code to coordinates mapping for LA area"""
-        zip_coords = {
-            "91361": (34.1678, -118.5946),  # Westlake Village (approx)
-            "91362": (34.1678, -118.5946),  # Westlake Village (approx)
-            "91377": (34.1678, -118.5946),  # Oak Park (approx)
-            "90210": (34.1030, -118.4104),  # Beverly Hills
-            "90211": (34.0901, -118.4065),  # Beverly Hills
-            "90028": (34.1016, -118.3267),  # Hollywood
-            "90046": (34.1056, -118.3632),  # West Hollywood
-            "91436": (34.1559, -118.4818),  # Encino
-            "91301": (34.2209, -118.6010),  # Agoura Hills
-            "90405": (34.0195, -118.4912),  # Santa Monica
-            "90401": (34.0194, -118.4912),  # Santa Monica
-            "91505": (34.1808, -118.3090),  # Burbank
-            "91304": (34.2703, -118.7370),  # Canoga Park
-            "90401": (34.0194, -118.4912),  # Santa Monica
-            "90402": (34.0301, -118.4951),  # Santa Monica
-            "90403": (34.0287, -118.4668),  # Santa Monica
-            "90404": (34.0194, -118.4912),  # Santa Monica
-            "91302": (34.1678, -118.5946),  # Calabasas
-            "91307": (34.1984, -118.6120),  # West Hills
-            "91316": (34.1610, -118.5079),  # Encino
-            "91324": (34.2386, -118.5645),  # Northridge
-            "91325": (34.2386, -118.5645),  # Northridge
-            "91326": (34.2386, -118.5645),  # Northridge
-            "91330": (34.2514, -118.4456),  # Hansen Dam
-            "91331": (34.2642, -118.4456),  # Pacoima
-            "91335": (34.2217, -118.4456),  # Reseda
-            "91340": (34.2717, -118.4123),  # San Fernando
-            "91342": (34.2717, -118.4456),  # Sylmar
-            "91343": (34.3128, -118.4456),  # North Hills
-            "91344": (34.2649, -118.5037),  # Granada Hills
-            "91345": (34.2386, -118.5645),  # Northridge
-            "91352": (34.2717, -118.4789),  # Sun Valley
-            "91354": (34.2931, -118.4912),  # Valencia
-            "91355": (34.4233, -118.5778),  # Valencia
-            "91356": (34.1713, -118.5358),  # Tarzana
-            "91357": (34.1713, -118.5358),  # Tarzana
-            "91364": (34.1678, -118.5946),  # Woodland Hills
-            "91365": (34.1678, -118.5946),  # Woodland Hills
-            "91367": (34.1699, -118.6078),  # Woodland Hills
-            "91401": (34.1716, -118.4192),  # Van Nuys
-            "91402": (34.1686, -118.4912),  # Panorama City
-            "91403": (34.1611, -118.4678),  # Sherman Oaks
-            "91406": (34.2008, -118.5030),  # Van Nuys
-            "91411": (34.1986, -118.4789),  # Van Nuys
-            "91423": (34.1869, -118.4456),  # Sherman Oaks
-            "91601": (34.1808, -118.3090),  # North Hollywood
-            "91602": (34.1869, -118.3789),  # North Hollywood
-            "91604": (34.1446, -118.4112),  # Studio City
-            "91605": (34.1869, -118.3789),  # North Hollywood
-            "91606": (34.1869, -118.3789),  # North Hollywood
-            "91607": (34.1508, -118.3912),  # Valley Village
-            "91608": (34.1869, -118.3789),  # Universal City
-        }
-        return zip_coords.get(zip_code)
+        """
+        Convert a ZIP, city or address to (latitude, longitude) using the
+        local gazetteer (locations/utils/gazetteer.py); no external API call.
+        """
+        from .utils.gazetteer import get_gazetteer
 
-    @classmethod
-    def _geocode_address(cls, address):
-        """Basic address geocoding"""
-        address_lower = address.lower()
-        if "los angeles" in address_lower:
-            return (34.0522, -118.2437)
-        elif "santa monica" in address_lower:
-            return (34.0195, -118.4912)
-        elif "beverly hills" in address_lower:
-            return (34.1030, -118.4104)
-        elif "encino" in address_lower:
-            return (34.1559, -118.4818)
-        elif "van nuys" in address_lower:
-            return (34.2008, -118.5030)
-        elif "burbank" in address_lower:
-            return (34.1808, -118.3090)
-        return None
+        return get_gazetteer().coordinates(address_or_zip or "")
 
     def get_served_providers(self):
         """Get providers that work with this regional center"""
@@ -610,6 +605,11 @@ class ProviderV2(models.Model):
     @classmethod
     def find_nearest(cls, latitude, longitude, radius_miles=10, limit=20):
         """Find providers within radius of given coordinates using PostGIS"""
+        from .utils.service_areas import postgis_available
+
+        if not postgis_available():
+            return cls._find_nearest_in_memory(latitude, longitude, radius_miles, limit)
+
         from django.contrib.gis.geos import Point
         from django.contrib.gis.measure import Distance as D
         from django.contrib.gis.db.models.functions import Distance as DistanceFunc
@@ -633,6 +633,22 @@ class ProviderV2(models.Model):
 
         return list(results)
 
+    @classmethod
+    def _find_nearest_in_memory(cls, latitude, longitude, radius_miles, limit):
+        """find_nearest without PostGIS, via the vectorized provider index."""
+        from .utils.provider_geo import get_provider_geo_index
+
+        ids, miles = get_provider_geo_index().search(
+            latitude, longitude, radius_miles, limit=limit
+        )
+        providers = cls.objects.in_bulk(list(ids))
+        results = []
+        for pk, distance in zip(ids, miles):
+            if pk in providers:
+                providers[pk].distance = float(distance)
+                results.append(providers[pk])
+        return results
+
     @classmethod
     def geocode_and_search(cls, address_or_zip, radius_miles=10, limit=20):
         """Geocode an address/zip and find nearby providers"""
@@ -776,6 +792,104 @@ class ProviderServiceModel(models.Model):
         return f"{self.provider.name} - {self.service_model.name}"
 
 
+class GeocodeCache(models.Model):
+    """
+    Normalized address -> coordinates, shared by every geocoding caller.
+    Rows with NULL coordinates record addresses the geocoder could not
+    resolve, so they are not retried until the miss expires.
+    See locations/utils/geocoder.py.
+    """
+
+    normalized_address = models.CharField(max_length=512, unique=True)
+    query = models.TextField(default="")
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
+    source = models.CharField(max_length=20, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "geocode_cache"
+
+    def __str__(self):
+        return self.normalized_address
+
+
+class BootstrapStep(models.Model):
+    """
+    Fingerprint of the inputs a container bootstrap step last ran with, so
+    unchanged steps are skipped on the next start.
+    See locations/utils/bootstrap.py.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    fingerprint = models.CharField(max_length=64)
+    completed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "bootstrap_step"
+
+    def __str__(self):
+        return self.name
+
+
+class GazetteerEntry(models.Model):
+    """
+    ZIP (ZCTA) or place centroid, loaded from the Census gazetteer files by
+    ``manage.py load_gazetteer``. Read once per process into the in-memory
+    index in locations/utils/gazetteer.py.
+    """
+
+    KIND_CHOICES = [
+        ("zip", "ZIP code"),
+        ("place", "City / place"),
+    ]
+
+    kind = models.CharField(max_length=8, choices=KIND_CHOICES)
+    key = models.CharField(max_length=128, help_text="ZIP code or normalized place name")
+    name = models.CharField(max_length=255)
+    state = models.CharField(max_length=2, default="CA")
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    class Meta:
+        db_table = "gazetteer_entry"
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "key"], name="gazetteer_entry_kind_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.key}"
+
+
+class ZipBoundary(models.Model):
+    """
+    ZIP (ZCTA) boundary polygon, loaded from Census ZCTA GeoJSON by
+    ``manage.py load_zip_boundaries``. ``generate_service_areas`` unions
+    these per regional center (locations/utils/service_area_builder.py).
+    """
+
+    zip_code = models.CharField(max_length=5, unique=True)
+    geom = gis_models.MultiPolygonField(srid=4326)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "zip_boundary"
+
+    def __str__(self):
+        return self.zip_code
+
+
+class HMGLLocationManager(models.Manager):
+    """Defers the clean columns an HMGL reload dropped (see utils/hmgl.py)."""
+
+    def get_queryset(self):
+        from .utils.hmgl import missing_clean_columns
+
+        queryset = super().get_queryset()
+        missing = missing_clean_columns()
+        return queryset.defer(*missing) if missing else queryset
+
+
 class HMGLLocation(models.Model):
     """
     Model for Help Me Grow LA location data.
@@ -783,6 +897,8 @@ class HMGLLocation(models.Model):
     This is an unmanaged model - Django won't create/alter the table.
     """
 
+    objects = HMGLLocationManager()
+
     location_id = models.BigIntegerField(primary_key=True)
     name = models.TextField(blank=True, null=True)
     phones = models.TextField(blank=True, null=True)
@@ -813,6 +929,10 @@ class HMGLLocation(models.Model):
     tag_types = models.JSONField(blank=True, null=True)
     # PostGIS geometry field - Point(longitude, latitude) in SRID 4326 (WGS84)
     geom = gis_models.PointField(srid=4326, blank=True, null=True)
+    # HTML-free display text, precomputed by `manage.py clean_hmgl_locations`
+    hours_clean = models.TextField(blank=True, null=True)
+    description_clean = models.TextField(blank=True, null=True)
+    primary_phone_clean = models.TextField(blank=True, null=True)
 
     class Meta:
         managed = False  # Django won't manage this table
@@ -821,6 +941,40 @@ class HMGLLocation(models.Model):
     def __str__(self):
         return self.name or f"Location {self.location_id}"
 
+    @classmethod
+    def find_nearby(cls, latitude, longitude, radius_miles=25, limit=50):
+        """
+        Locations within ``radius_miles`` true miles, nearest first.
+
+        ``geom`` is a plain geometry column, so the filter and ordering
+        use its geography cast (backed by the functional GiST index from
+        migration 0038): ST_DWithin in meters and ``<->`` KNN ordering.
+        ``calculated_distance`` is annotated in miles.
+        """
+        from django.db.models import BooleanField, FloatField
+        from django.db.models.expressions import RawSQL
+
+        geog = f'"{cls._meta.db_table}"."geom"::geography'
+        point = "ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography"
+        xy = (longitude, latitude)
+        return (
+            cls.objects.filter(
+                RawSQL(
+                    f"ST_DWithin({geog}, {point}, %s)",
+                    xy + (radius_miles * METERS_PER_MILE,),
+                    output_field=BooleanField(),
+                )
+            )
+            .annotate(
+                calculated_distance=RawSQL(
+                    f"ST_Distance({geog}, {point}) / {METERS_PER_MILE}",
+                    xy,
+                    output_field=FloatField(),
+                )
+            )
+            .order_by(RawSQL(f"{geog} <-> {point}", xy, output_field=FloatField()).asc())[:limit]
+        )
+
     @property
     def full_address(self):
         """Combine address fields into a single string"""
@@ -1,8 +1,27 @@
 import graphene
 from graphene_django import DjangoObjectType
-from django.db import models
-from .models import LocationCategory, Location, LocationImage, LocationReview
-import math
+
+from maplocation.graphql_limits import MAX_LIMIT, list_size_hint
+
+from .loaders import get_loader, prime
+from .models import (
+    LocationCategory,
+    Location,
+    LocationImage,
+    LocationReview,
+    ProviderV2,
+    RegionalCenter,
+)
+
+def _miles(value):
+    """Distance annotations are Distance objects or floats in miles."""
+    if value is None:
+        return None
+    return round(float(getattr(value, "mi", value)), 2)
+
+
+def _limit(limit):
+    return max(1, min(limit, MAX_LIMIT))
 
 
 class LocationCategoryType(DjangoObjectType):
@@ -56,19 +75,86 @@ class LocationType(DjangoObjectType):
             "is_accessible",
         )
 
+    def resolve_distance(self, info):
+        return _miles(getattr(self, "distance", None))
+
     def resolve_category_name(self, info):
         return self.category.name if self.category else ""
 
     def resolve_average_rating(self, info):
-        if self.reviews.exists():
-            return self.reviews.aggregate(models.Avg("rating"))["rating__avg"]
-        return 0
+        return get_loader(info, "location_average_rating").load(self.pk) or 0
 
     def resolve_images(self, info):
-        return self.images.all()
+        return get_loader(info, "location_images").load(self.pk)
 
     def resolve_reviews(self, info):
-        return self.reviews.all()
+        return get_loader(info, "location_reviews").load(self.pk)
+
+
+class ProviderV2Type(DjangoObjectType):
+    distance = graphene.Float()
+    insurance_carriers = graphene.List(graphene.String)
+    regional_centers = graphene.List(lambda: RegionalCenterType)
+
+    class Meta:
+        model = ProviderV2
+        fields = (
+            "id",
+            "name",
+            "type",
+            "phone",
+            "email",
+            "website",
+            "description",
+            "latitude",
+            "longitude",
+            "address",
+            "insurance_accepted",
+            "age_groups",
+            "diagnoses_treated",
+            "therapy_types",
+            "created_at",
+            "updated_at",
+        )
+
+    def resolve_distance(self, info):
+        return _miles(getattr(self, "distance", None))
+
+    def resolve_insurance_carriers(self, info):
+        return get_loader(info, "provider_insurance_carriers").load(self.pk)
+
+    def resolve_regional_centers(self, info):
+        return get_loader(info, "provider_regional_centers").load(self.pk)
+
+
+class RegionalCenterType(DjangoObjectType):
+    distance = graphene.Float()
+    providers = graphene.List(ProviderV2Type, limit=graphene.Int(default_value=50))
+
+    class Meta:
+        model = RegionalCenter
+        fields = (
+            "id",
+            "regional_center",
+            "office_type",
+            "address",
+            "suite",
+            "city",
+            "state",
+            "zip_code",
+            "telephone",
+            "website",
+            "county_served",
+            "latitude",
+            "longitude",
+            "zip_codes",
+        )
+
+    def resolve_distance(self, info):
+        return _miles(getattr(self, "distance", None))
+
+    def resolve_providers(self, info, limit):
+        return get_loader(info, "regional_center_providers").load(self.pk)[: _limit(limit)]
 
 
 class Query(graphene.ObjectType):
@@ -80,50 +166,86 @@ class Query(graphene.ObjectType):
         lat=graphene.Float(required=True),
         lng=graphene.Float(required=True),
         radius=graphene.Float(default_value=5.0),
+        limit=graphene.Int(default_value=50),
+    )
+    providers = graphene.List(
+        ProviderV2Type,
+        search=graphene.String(),
+        limit=graphene.Int(default_value=50),
+    )
+    provider = graphene.Field(ProviderV2Type, id=graphene.ID(required=True))
+    nearby_providers = graphene.List(
+        ProviderV2Type,
+        lat=graphene.Float(required=True),
+        lng=graphene.Float(required=True),
+        radius=graphene.Float(default_value=10.0),
+        limit=graphene.Int(default_value=20),
+    )
+    regional_centers = graphene.List(RegionalCenterType)
+    regional_center_by_zip = graphene.Field(
+        RegionalCenterType, zip_code=graphene.String(required=True)
+    )
+    nearby_regional_centers = graphene.List(
+        RegionalCenterType,
+        lat=graphene.Float(required=True),
+        lng=graphene.Float(required=True),
+        radius=graphene.Float(default_value=25.0),
+        limit=graphene.Int(default_value=10),
     )
 
     def resolve_all_categories(self, info):
         return LocationCategory.objects.all()
 
     def resolve_all_locations(self, info):
-        return Location.objects.filter(is_active=True)
+        return prime(info, Location.objects.filter(is_active=True).select_related("category"))
 
     def resolve_location(self, info, id):
         try:
-            return Location.objects.get(pk=id)
+            return Location.objects.select_related("category").get(pk=id)
         except Location.DoesNotExist:
             return None
 
-    def resolve_nearby_locations(self, info, lat, lng, radius):
-        earth_radius = 3959  # Earth's radius in miles (use 3959 for miles, 6371 for kilometers)
-        locations = Location.objects.filter(is_active=True)
-        nearby_locations = []
-
-        for location in locations:
-            try:
-                # Convert to radians
-                lat1, lng1 = math.radians(lat), math.radians(lng)
-                lat2, lng2 = math.radians(float(location.latitude)), math.radians(
-                    float(location.longitude)
-                )
-
-                # Haversine formula
-                dlng = lng2 - lng1
-                dlat = lat2 - lat1
-                a = (
-                    math.sin(dlat / 2) ** 2
-                    + math.cos(lat1) * math.cos(lat2) * math.sin(dlng / 2) ** 2
-                )
-                c = 2 * math.asin(math.sqrt(a))
-                distance = earth_radius * c  # in miles
-
-                if distance <= radius:
-                    # Add distance to location
-                    location.distance = round(distance, 2)
-                    nearby_locations.append(location)
-            except (ValueError, TypeError):
-                continue
-
-        # Sort by distance
-        nearby_locations.sort(key=lambda x: x.distance)
-        return nearby_locations
+    def resolve_nearby_locations(self, info, lat, lng, radius, limit):
+        # PostGIS ST_DWithin on the geography column, nearest first
+        return prime(info, Location.find_nearest(lat, lng, radius_miles=radius, limit=_limit(limit)))
+
+    def resolve_providers(self, info, limit, search=None):
+        from .utils.text_search import ranked_search
+
+        providers = ProviderV2.objects.order_by("name")
+        if search:
+            providers = ranked_search(providers, search)
+        return prime(info, providers[: _limit(limit)])
+
+    def resolve_provider(self, info, id):
+        return ProviderV2.objects.filter(pk=id).first()
+
+    def resolve_nearby_providers(self, info, lat, lng, radius, limit):
+        return prime(info, ProviderV2.find_nearest(lat, lng, radius_miles=radius, limit=_limit(limit)))
+
+    def resolve_regional_centers(self, info):
+        return prime(info, RegionalCenter.objects.order_by("regional_center"))
+
+    def resolve_regional_center_by_zip(self, info, zip_code):
+        return RegionalCenter.find_by_zip_code(zip_code)
+
+    def resolve_nearby_regional_centers(self, info, lat, lng, radius, limit):
+        return prime(info, RegionalCenter.find_nearest(lat, lng, radius_miles=radius, limit=_limit(limit)))
+
+
+# Real sizes of the unbounded root lists, for query complexity.
+
+
+@list_size_hint("Query", "allCategories")
+def _category_count():
+    return LocationCategory.objects.count()
+
+
+@list_size_hint("Query", "allLocations")
+def _active_location_count():
+    return Location.objects.filter(is_active=True).count()
+
+
+@list_size_hint("Query", "regionalCenters")
+def _regional_center_count():
+    return RegionalCenter.objects.count()
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
 from .utils.geocode import geocode_address
+from .utils.hmgl import clean_description, clean_hours, clean_phones
 
 # from rest_framework_gis.serializers import GeoFeatureModelSerializer
 from .models import (
@@ -520,63 +521,33 @@ class HMGLLocationSerializer(serializers.ModelSerializer):
             return round(float(obj.calculated_distance), 2)
         return obj.distance_miles
 
+    # The clean fields are stored by `manage.py clean_hmgl_locations`;
+    # rows loaded since the last run, or columns dropped by a reload
+    # (deferred by the manager), are cleaned on the fly.
+
+    @staticmethod
+    def _stored(obj, field):
+        if field in obj.get_deferred_fields():
+            return None
+        return getattr(obj, field)
+
     def get_hours_clean(self, obj):
-        """Strip HTML and format hours nicely"""
-        import re
-
-        if obj.hours:
-            # Replace <br> with newline, strip other tags
-            clean = re.sub(r"<br\s*/?>", "\n", obj.hours)
-            clean = re.sub(r"<[^>]+>", "", clean)
-            # Split on semicolons and format as lines
-            parts = [p.strip() for p in clean.split(";") if p.strip()]
-            if len(parts) > 1:
-                return "\n".join(parts)
-            return clean.strip()
-        # Fall back to hour_list if available
-        if obj.hour_list:
-            return "\n".join(obj.hour_list)
-        return None
+        stored = self._stored(obj, "hours_clean")
+        if stored is not None:
+            return stored
+        return clean_hours(obj.hours, obj.hour_list)
 
     def get_description_clean(self, obj):
-        """Strip HTML from description field"""
-        import re
-
-        if obj.description_html:
-            clean = re.sub(r"<br\s*/?>", "\n", obj.description_html)
-            clean = re.sub(r"<[^>]+>", "", clean)
-            return clean.strip()
-        return None
+        stored = self._stored(obj, "description_clean")
+        if stored is not None:
+            return stored
+        return clean_description(obj.description_html)
 
     def get_primary_phone_clean(self, obj):
-        """Extract and format phone numbers - one per line"""
-        import re
-
-        # Prefer the phones field (phone_list is often incorrectly split)
-        if obj.phones:
-            # Decode HTML entities first
-            phones = obj.phones.replace("&amp;", "&")
-
-            # Find all phone entries: text followed by phone number in format (xxx) xxx-xxxx
-            pattern = r"([^,]*?\(\d{3}\)\s*\d{3}[-.]?\d{4})"
-            matches = re.findall(pattern, phones)
-
-            if matches:
-                # Clean up each match
-                cleaned = [m.strip().strip(",").strip() for m in matches]
-                return "\n".join(cleaned)
-
-            # Fallback: just return the phones field cleaned
-            return phones
-
-        # Fall back to phone_list if phones is empty
-        if obj.phone_list and len(obj.phone_list) > 0:
-            # Filter out fragments that don't contain phone numbers
-            valid = [p for p in obj.phone_list if re.search(r"\(\d{3}\)", p)]
-            if valid:
-                return "\n".join(valid)
-
-        return None
+        stored = self._stored(obj, "primary_phone_clean")
+        if stored is not None:
+            return stored
+        return clean_phones(obj.phones, obj.phone_list)
 
 
 class HMGLLocationListSerializer(serializers.ModelSerializer):
@@ -0,0 +1,50 @@
+"""
+Cache invalidation for the facet / filter-option indexes
+(locations/utils/facets.py) and, through the same provider version, the
+in-memory provider geo index (locations/utils/provider_geo.py).
+
+The versions are derived from the data itself, so writes from other
+processes show up within VERSION_CHECK_SECONDS without any signal. These
+handlers only make the writing process re-read its version at once; bulk
+writes that bypass signals (the provider import engine) do the same
+explicitly.
+"""
+
+from django.db.models.signals import post_delete, post_save
+
+from .models import (
+    InsuranceCarrier,
+    Location,
+    LocationCategory,
+    ProviderInsuranceCarrier,
+    ProviderRegionalCenter,
+    ProviderV2,
+    RegionalCenter,
+)
+from .utils.facets import bump_location_filters, bump_provider_facets
+
+PROVIDER_FACET_MODELS = (
+    ProviderV2,
+    ProviderInsuranceCarrier,
+    ProviderRegionalCenter,
+    InsuranceCarrier,
+    RegionalCenter,
+)
+LOCATION_FILTER_MODELS = (Location, LocationCategory)
+
+
+def _provider_facets_changed(sender, **kwargs):
+    bump_provider_facets()
+
+
+def _location_filters_changed(sender, **kwargs):
+    bump_location_filters()
+
+
+for model in PROVIDER_FACET_MODELS:
+    post_save.connect(_provider_facets_changed, sender=model, dispatch_uid=f"facets:{model.__name__}")
+    post_delete.connect(_provider_facets_changed, sender=model, dispatch_uid=f"facets:{model.__name__}")
+
+for model in LOCATION_FILTER_MODELS:
+    post_save.connect(_location_filters_changed, sender=model, dispatch_uid=f"filters:{model.__name__}")
+    post_delete.connect(_location_filters_changed, sender=model, dispatch_uid=f"filters:{model.__name__}")
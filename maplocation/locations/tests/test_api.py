@@ -37,6 +37,15 @@ class TestRegionalCenterAPI:
         assert data["type"] == "FeatureCollection"
         assert "features" in data
 
+    def test_by_service_area_rejects_malformed_points(self, api_client):
+        """A bad pair in a points batch is a 400 naming the entry."""
+        url = reverse("regionalcenter-by-service-area")
+        for points, bad in (("34.05,-118.24;34.1", "'34.1'"), ("34.05,-118.24;abc,1", "'abc,1'")):
+            response = api_client.get(url, {"points": points})
+            assert response.status_code == 400
+            assert bad in response.json()["error"]
+            assert "position 1" in response.json()["error"]
+
 
 @pytest.mark.django_db
 class TestProviderAPI:
@@ -0,0 +1,131 @@
+"""Tests for the incremental database sync (locations/utils/db_sync.py).
+
+The SQL builders and delta logic are tested directly. The round trip test
+needs two scratch Postgres databases and is skipped unless
+SYNC_TEST_SOURCE_URL and SYNC_TEST_TARGET_URL are set, e.g.
+
+    createdb sync_a && createdb sync_b
+    SYNC_TEST_SOURCE_URL=postgres://localhost/sync_a \\
+    SYNC_TEST_TARGET_URL=postgres://localhost/sync_b \\
+    pytest locations/tests/test_db_sync.py
+"""
+
+import os
+
+import pytest
+
+from locations.utils.db_sync import (
+    MODE_WATERMARK,
+    DatabaseSync,
+    PgConnection,
+    SyncTable,
+    checksum_sql,
+    diff_hashes,
+    key_filter,
+    newer_keys,
+    select_tables,
+    upsert_sql,
+)
+
+
+def test_diff_hashes_finds_new_changed_and_removed_keys():
+    source = {("1",): "a", ("2",): "b", ("3",): "c"}
+    target = {("1",): "a", ("2",): "x", ("4",): "d"}
+
+    changed, removed = diff_hashes(source, target)
+
+    assert changed == [("2",), ("3",)]
+    assert removed == [("4",)]
+
+
+def test_newer_keys_compares_each_row_not_the_target_maximum():
+    # The target's newest row (3) is newer than the source edit to 1;
+    # a max(updated_at) watermark would skip that edit.
+    source = {("1",): 200, ("2",): 100, ("3",): 300, ("5",): 50}
+    target = {("1",): 150, ("2",): 100, ("3",): 900}
+
+    assert newer_keys(source, target) == [("1",), ("5",)]
+
+
+def test_upsert_updates_non_key_columns_or_does_nothing():
+    sql = upsert_sql("providers_v2", "_sync_providers_v2", ["id", "name"], ["id"])
+    assert 'ON CONFLICT ("id") DO UPDATE SET "name" = EXCLUDED."name"' in sql
+    assert "_sync_seq > %s AND _sync_seq <= %s" in sql
+
+    pair = ["provider_id", "insurance_carrier_id"]
+    assert upsert_sql("links", "_sync_links", pair, pair).endswith("DO NOTHING")
+
+
+def test_composite_key_filter_and_checksum_sql():
+    where, params = key_filter(["provider_id", "regional_center_id"], [("a", "1"), ("b", "2")])
+    assert where == '("provider_id"::text, "regional_center_id"::text) IN (VALUES (%s, %s), (%s, %s))'
+    assert params == ["a", "1", "b", "2"]
+
+    sql = checksum_sql("regional_centers", ["id", "name"], ["id"])
+    assert 'md5(ROW("id", "name")::text)' in sql
+    assert 'ORDER BY "id"' in sql
+
+
+def test_select_tables_keeps_foreign_key_order():
+    names = [t.name for t in select_tables(["provider_regional_centers", "providers_v2"])]
+    assert names == ["providers_v2", "provider_regional_centers"]
+    with pytest.raises(ValueError):
+        select_tables(["nope"])
+
+
+SOURCE_URL = os.environ.get("SYNC_TEST_SOURCE_URL")
+TARGET_URL = os.environ.get("SYNC_TEST_TARGET_URL")
+
+SCHEMA = [
+    "DROP TABLE IF EXISTS sync_links, sync_items, sync_tags",
+    "CREATE TABLE sync_tags (id integer PRIMARY KEY, name text)",
+    "CREATE TABLE sync_items (id uuid PRIMARY KEY, name text, tags jsonb, updated_at timestamptz)",
+    "CREATE TABLE sync_links (id serial PRIMARY KEY, item_id uuid, tag_id integer, UNIQUE (item_id, tag_id))",
+]
+TABLES = (
+    SyncTable("sync_tags"),
+    SyncTable("sync_items", mode=MODE_WATERMARK),
+    SyncTable(
+        "sync_links",
+        key=("item_id", "tag_id"),
+        exclude=("id",),
+        parent=("item_id", "sync_items", "id"),
+    ),
+)
+ITEM_A = "00000000-0000-0000-0000-00000000000a"
+ITEM_B = "00000000-0000-0000-0000-00000000000b"
+
+
+@pytest.mark.skipif(not (SOURCE_URL and TARGET_URL), reason="needs two scratch Postgres databases")
+def test_round_trip_between_two_databases():
+    import psycopg2
+
+    source = PgConnection(psycopg2.connect(SOURCE_URL))
+    target = PgConnection(psycopg2.connect(TARGET_URL))
+    for db in (source, target):
+        for statement in SCHEMA:
+            db.execute(statement)
+
+    source.execute("INSERT INTO sync_tags VALUES (1, 'aba'), (2, 'speech')")
+    source.execute(
+        "INSERT INTO sync_items VALUES (%s, 'Line1\nLine2, \"quoted\"', '[\"x\"]', now() - interval '2 days'),"
+        " (%s, 'B', NULL, now() - interval '1 day')",
+        [ITEM_A, ITEM_B],
+    )
+    source.execute("INSERT INTO sync_links (item_id, tag_id) VALUES (%s, 1), (%s, 2)", [ITEM_A, ITEM_B])
+
+    first = DatabaseSync(source, target, tables=TABLES).run()
+    assert [r.copied for r in first] == [2, 2, 2]
+    assert all(r.in_sync for r in first)
+
+    # Change one item and move a link; only the delta is copied.
+    source.execute("UPDATE sync_items SET name = 'B2', updated_at = now() WHERE id = %s", [ITEM_B])
+    source.execute("DELETE FROM sync_links WHERE item_id = %s", [ITEM_B])
+    source.execute("INSERT INTO sync_links (item_id, tag_id) VALUES (%s, 1)", [ITEM_B])
+
+    second = DatabaseSync(source, target, tables=TABLES).run()
+    by_table = {r.table: r for r in second}
+    assert by_table["sync_tags"].copied == 0
+    assert by_table["sync_items"].copied == 1
+    assert (by_table["sync_links"].copied, by_table["sync_links"].deleted) == (1, 1)
+    assert all(r.in_sync for r in second)
@@ -0,0 +1,101 @@
+"""Tests for the provider facet index (locations/utils/facets.py)."""
+
+from django.core.cache import cache
+
+from locations.utils import facets
+
+
+def test_rows_to_facets_orders_by_count_and_lists_every_facet():
+    result = facets.rows_to_facets(
+        [
+            ("therapy_types", "Speech therapy", 4),
+            ("therapy_types", "ABA therapy", 9),
+            ("therapy_types", "aba", 4),
+            ("insurance_carriers", "Medi-Cal", 2),
+        ]
+    )
+
+    assert [f["value"] for f in result["therapy_types"]] == ["ABA therapy", "aba", "Speech therapy"]
+    assert result["insurance_carriers"] == [{"value": "Medi-Cal", "count": 2}]
+    assert result["regional_centers"] == []
+    assert set(result) == set(facets.FACETS)
+
+
+def test_facet_sql_scopes_every_facet_to_one_id_set(monkeypatch):
+    tables = ("provider", "carrier", "provider_carrier", "regional_center", "provider_rc")
+    monkeypatch.setattr(facets, "_tables", lambda: {name: name for name in tables})
+
+    sql = facets.facet_sql('SELECT "id" FROM "providers_v2" WHERE "name" = %s')
+
+    assert sql.count("FROM scope s") == len(facets.FACETS)
+    assert 'WITH scope AS (SELECT "id" FROM "providers_v2" WHERE "name" = %s)' in sql
+    assert "jsonb_array_elements_text" in sql
+    assert "count(DISTINCT provider_id)" in sql
+
+
+def test_provider_facets_are_cached_until_the_data_version_changes(monkeypatch):
+    cache.clear()
+    facets._versions.clear()
+    calls, state = [], {"provider": "v1"}
+
+    def fake_compute(queryset=None):
+        calls.append(queryset)
+        return {"therapy_types": [{"value": "ABA therapy", "count": len(calls)}]}
+
+    monkeypatch.setattr(facets, "compute_facets", fake_compute)
+    monkeypatch.setattr(facets, "_read_version", lambda name, using="default": state[name])
+    base = lambda: "deduplicated providers"  # noqa: E731
+
+    first = facets.get_provider_facets(base)
+    assert facets.get_provider_facets(base) == first
+    assert calls == ["deduplicated providers"]
+
+    # Another process wrote: seen once the per-process check expires.
+    state["provider"] = "v2"
+    assert facets.get_provider_facets(base) == first
+    facets._versions[("provider", "default")] = (float("-inf"), "v1")
+    second = facets.get_provider_facets(base)
+
+    assert second["version"] == "v2"
+    assert second["facets"]["therapy_types"][0]["count"] == 2
+
+    # A local write re-reads the version at once.
+    state["provider"] = "v3"
+    facets.bump_provider_facets()
+    assert facets.get_provider_facets(base)["version"] == "v3"
+
+
+def test_provider_version_sql_covers_providers_links_and_names(monkeypatch):
+    tables = ("provider", "carrier", "provider_carrier", "regional_center", "provider_rc")
+    monkeypatch.setattr(facets, "_tables", lambda: {name: name for name in tables})
+
+    sql = facets.provider_version_sql()
+
+    assert 'max(updated_at)::text, \'\') || \'/\' || coalesce(sum(extract(epoch FROM updated_at)), 0) FROM "provider"' in sql
+    assert 'coalesce(max(id), 0) FROM "provider_carrier"' in sql
+    assert 'coalesce(max(id), 0) FROM "provider_rc"' in sql
+    assert 'FROM "carrier"' in sql and 'FROM "regional_center"' in sql
+
+
+def test_provider_version_is_read_with_portable_sql_off_postgres(monkeypatch, sqlite_connection):
+    tables = ("provider", "carrier", "provider_carrier", "regional_center", "provider_rc")
+    monkeypatch.setattr(facets, "_tables", lambda: {name: name for name in tables})
+    with sqlite_connection.cursor() as cursor:
+        cursor.execute('CREATE TABLE "provider" (id text, updated_at text)')
+        for table in ("provider_carrier", "provider_rc"):
+            cursor.execute(f'CREATE TABLE "{table}" (id integer primary key)')
+        cursor.execute('CREATE TABLE "carrier" (id integer primary key, name text)')
+        cursor.execute('CREATE TABLE "regional_center" (id integer primary key, regional_center text)')
+        cursor.execute("INSERT INTO carrier VALUES (1, 'Medi-Cal')")
+
+    first = facets._read_version("provider", "sqlite")
+    assert facets._read_version("provider", "sqlite") == first
+
+    with sqlite_connection.cursor() as cursor:
+        cursor.execute("INSERT INTO provider VALUES ('a', '2026-01-01')")
+    second = facets._read_version("provider", "sqlite")
+    assert second != first
+
+    with sqlite_connection.cursor() as cursor:
+        cursor.execute("UPDATE carrier SET name = 'Medi-Cal (LA)'")
+    assert facets._read_version("provider", "sqlite") != second
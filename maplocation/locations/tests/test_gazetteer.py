@@ -0,0 +1,97 @@
+"""Tests for the ZIP / place gazetteer (locations/utils/gazetteer.py).
+
+These build the index from in-memory rows and the bundled seed, so they run
+without a database.
+"""
+
+import io
+
+from locations.utils.gazetteer import (
+    Gazetteer,
+    normalize_place,
+    read_census_places,
+    read_census_zctas,
+    read_seed,
+)
+
+ROWS = [
+    ("zip", "90012", "90012", 34.0614, -118.2385),
+    ("zip", "90015", "90015", 34.0395, -118.2661),
+    ("zip", "91101", "91101", 34.1469, -118.1387),
+    ("place", "los angeles", "Los Angeles", 34.0522, -118.2437),
+    ("place", "pasadena", "Pasadena", 34.1478, -118.1445),
+    ("place", "la canada flintridge", "La Cañada Flintridge", 34.2064, -118.2001),
+    ("place", "culver city", "Culver City", 34.0211, -118.3965),
+]
+
+
+def _gazetteer():
+    return Gazetteer.from_rows(ROWS)
+
+
+def test_normalize_place_folds_accents_case_and_punctuation():
+    assert normalize_place("  La Cañada-Flintridge ") == "la canada flintridge"
+
+
+def test_exact_zip_and_zip_plus_four():
+    gazetteer = _gazetteer()
+    assert gazetteer.zip("91101").coordinates == (34.1469, -118.1387)
+    assert gazetteer.resolve("91101-1234").key == "91101"
+
+
+def test_unknown_zip_falls_back_to_closest_zip_with_shared_prefix():
+    gazetteer = _gazetteer()
+    assert gazetteer.nearest_zip("90013").key == "90012"
+    assert gazetteer.nearest_zip("90099").key == "90015"
+    assert gazetteer.nearest_zip("10001") is None
+
+
+def test_prefix_lookups():
+    gazetteer = _gazetteer()
+    assert gazetteer.zips_with_prefix("900") == ["90012", "90015"]
+    assert [p.name for p in gazetteer.places_with_prefix("LA ")] == ["La Cañada Flintridge"]
+
+
+def test_resolve_addresses_and_city_names():
+    gazetteer = _gazetteer()
+    assert gazetteer.resolve("Pasadena, CA").key == "pasadena"
+    assert gazetteer.resolve("123 Main St, Culver City, California").key == "culver city"
+    assert gazetteer.resolve("near downtown los angeles").key == "los angeles"
+    assert gazetteer.resolve("La Canada Flintridge").name == "La Cañada Flintridge"
+    assert gazetteer.resolve("Pasadna").key == "pasadena"  # fuzzy
+    assert gazetteer.resolve("") is None
+    assert gazetteer.coordinates("Atlantis") is None
+
+
+def test_zip_wins_over_city_name():
+    assert _gazetteer().resolve("Los Angeles, CA 90015").key == "90015"
+
+
+def test_census_readers_filter_and_strip_area_types():
+    zcta_file = io.StringIO(
+        "GEOID\tALAND\tAWATER\tALAND_SQMI\tAWATER_SQMI\tINTPTLAT\tINTPTLONG                                     \n"
+        "10001\t1\t0\t0\t0\t40.750649\t-73.997298\n"
+        "90012\t1\t0\t0\t0\t34.061396\t-118.238479\n"
+    )
+    place_file = io.StringIO(
+        "USPS\tGEOID\tANSICODE\tNAME\tLSAD\tFUNCSTAT\tALAND\tAWATER\tALAND_SQMI\tAWATER_SQMI\tINTPTLAT\tINTPTLONG\n"
+        "CA\t0617568\t02410282\tCulver City city\t25\tA\t1\t0\t0\t0\t34.0108\t-118.4002\n"
+        "CA\t0600884\t02407672\tAltadena CDP\t57\tS\t1\t0\t0\t0\t34.1935\t-118.1346\n"
+        "NV\t3240000\t02411630\tLas Vegas city\t25\tA\t1\t0\t0\t0\t36.2288\t-115.2603\n"
+    )
+
+    zctas = list(read_census_zctas(zcta_file))
+    places = list(read_census_places(place_file))
+
+    assert zctas == [("zip", "90012", "90012", 34.061396, -118.238479)]
+    assert [(key, name) for _, key, name, _, _ in places] == [
+        ("culver city", "Culver City"),
+        ("altadena", "Altadena"),
+    ]
+
+
+def test_bundled_seed_covers_previously_hardcoded_lookups():
+    gazetteer = Gazetteer.from_rows(read_seed())
+    assert gazetteer.coordinates("91361") == (34.1678, -118.5946)
+    assert gazetteer.coordinates("Van Nuys") == (34.2008, -118.503)
+    assert gazetteer.coordinates("San Diego, CA") is not None
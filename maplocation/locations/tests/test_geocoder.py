@@ -0,0 +1,125 @@
+"""Tests for the shared geocoder (locations/utils/geocoder.py).
+
+These run without a database or network: the stub backend stands in for
+Mapbox and the in-memory store stands in for the geocode_cache table.
+"""
+
+from decimal import Decimal
+
+from locations.utils.geocoder import (
+    GeocodeResult,
+    Geocoder,
+    MemoryGeocodeStore,
+    StubBackend,
+    address_variants,
+    apply_result,
+    normalize_address,
+)
+
+KNOWN = {
+    "4650 Sunset Blvd, Los Angeles, CA 90027": (34.0976, -118.2912),
+    "Pasadena, CA 91101": (34.1478, -118.1445),
+}
+
+
+def _geocoder(known=KNOWN):
+    return Geocoder(StubBackend(known=known), MemoryGeocodeStore())
+
+
+def test_normalize_address_folds_case_spacing_and_periods():
+    assert normalize_address("  4650 Sunset Blvd.,, Los Angeles ,CA 90027\n") == normalize_address(
+        "4650 sunset blvd, los angeles, ca 90027"
+    )
+
+
+def test_address_variants_go_from_specific_to_zip():
+    variants = address_variants("100 E Green St Suite 200, Pasadena, CA 91101")
+    assert variants[0] == "100 E Green St Suite 200, Pasadena, CA 91101"
+    assert "Pasadena, CA 91101" in variants
+    assert variants[-1] == "91101"
+
+
+def test_geocode_many_dedupes_and_serves_repeat_runs_from_cache():
+    geocoder = _geocoder()
+    addresses = [
+        "4650 Sunset Blvd, Los Angeles, CA 90027",
+        "4650 SUNSET BLVD.,  Los Angeles, CA 90027",
+    ]
+
+    first = geocoder.geocode_many(addresses)
+    calls_after_first = len(geocoder.backend.calls)
+    second = geocoder.geocode_many(addresses)
+
+    assert calls_after_first == 1
+    assert len(geocoder.backend.calls) == 1
+    assert first == second
+    assert first[addresses[1]].latitude == 34.0976
+
+
+def test_misses_fall_back_to_coarser_variants_and_are_promoted():
+    geocoder = _geocoder()
+    address = "100 E Green St Suite 200, Pasadena, CA 91101"
+
+    result = geocoder.geocode(address)
+    calls = len(geocoder.backend.calls)
+    again = geocoder.geocode(address)
+
+    assert (result.latitude, result.longitude) == (34.1478, -118.1445)
+    assert result.matched_query == "Pasadena, CA 91101"
+    assert again == result
+    assert len(geocoder.backend.calls) == calls  # promoted under the original key
+
+
+def test_unresolvable_addresses_are_cached_as_misses():
+    geocoder = _geocoder()
+
+    assert geocoder.geocode("nowhere at all") is None
+    calls = len(geocoder.backend.calls)
+    assert geocoder.geocode("Nowhere at all") is None
+    assert len(geocoder.backend.calls) == calls
+
+
+def test_transient_backend_failures_are_not_cached():
+    class FlakyBackend(StubBackend):
+        def geocode(self, query):
+            raise ConnectionError("timeout")
+
+    geocoder = Geocoder(FlakyBackend(), MemoryGeocodeStore())
+
+    assert geocoder.geocode("123 Main St, Los Angeles, CA 90012") is None
+    assert geocoder.store.entries == {}
+
+
+class _Field:
+    def __init__(self, name, internal_type):
+        self.name = name
+        self._internal_type = internal_type
+
+    def get_internal_type(self):
+        return self._internal_type
+
+
+class _Meta:
+    def __init__(self, lat_type):
+        self.concrete_fields = [_Field("latitude", lat_type), _Field("longitude", lat_type)]
+
+    def get_field(self, name):
+        return next(f for f in self.concrete_fields if f.name == name)
+
+
+class _Row:
+    def __init__(self, lat_type):
+        self._meta = _Meta(lat_type)
+
+
+def test_apply_result_matches_model_field_types():
+    result = GeocodeResult(34.0522, -118.2437, "stub")
+
+    provider_like = _Row("DecimalField")
+    center_like = _Row("FloatField")
+
+    assert apply_result(provider_like, result)
+    assert apply_result(center_like, result)
+    assert provider_like.latitude == Decimal("34.0522")
+    assert center_like.longitude == -118.2437
+    assert apply_result(_Row("FloatField"), None) is False
@@ -0,0 +1,135 @@
+"""
+Tests for the GraphQL layer: batch loaders, query limits and query counts.
+"""
+
+import json
+
+import pytest
+
+
+def test_batch_loader_loads_primed_keys_in_one_call():
+    from locations.loaders import BatchLoader
+
+    calls = []
+
+    def batch_load(keys):
+        calls.append(sorted(keys))
+        return {key: [key * 10] for key in keys if key != 3}
+
+    loader = BatchLoader(batch_load)
+    loader.prime([1, 2, 3])
+
+    assert loader.load(2) == [20]
+    assert loader.load(1) == [10]
+    assert loader.load(3) == []
+    assert loader.load(4) == [40]
+    assert calls == [[1, 2, 3], [4]]
+
+
+def test_complexity_rule_multiplies_list_fields_by_limit():
+    import graphene
+    from graphql import parse, validate
+
+    from maplocation.graphql_limits import complexity_limit_validator
+
+    class Item(graphene.ObjectType):
+        name = graphene.String()
+        children = graphene.List(lambda: Item, limit=graphene.Int(default_value=3))
+        tags = graphene.List(lambda: Item)
+
+    class Query(graphene.ObjectType):
+        items = graphene.List(Item, limit=graphene.Int())
+        everything = graphene.List(Item)
+
+    schema = graphene.Schema(query=Query).graphql_schema
+
+    def cost_error(query, variables=None):
+        errors = validate(schema, parse(query), [complexity_limit_validator(100, variables)])
+        return errors[0].message if errors else None
+
+    # 1 + 5 * (1 + 1 + 3 * 1) = 26, with children's default limit
+    assert cost_error("{ items(limit: 5) { name children { name } } }") is None
+    # Variables are resolved, falling back to their declared default; a
+    # nested list without a limit counts DEFAULT_LIST_SIZE: 1 + n * (1 + 1 + 10 * 1)
+    query = "query Q($n: Int = 5) { items(limit: $n) { name tags { name } } }"
+    assert cost_error(query) is None
+    assert "complexity 601" in cost_error(query, {"n": 50})
+    # Unbounded root lists, or a limit left out without a default, count MAX_LIMIT.
+    assert "complexity 201" in cost_error("query Costly { everything { ...F } } fragment F on Item { name }")
+    assert "complexity 201" in cost_error("{ items { name } }")
+
+
+def _graphql(client, query):
+    response = client.post("/graphql/", json.dumps({"query": query}), content_type="application/json")
+    return response.json()
+
+
+@pytest.fixture
+def reviewed_locations(db):
+    from locations.models import Location, LocationCategory, LocationImage, LocationReview
+
+    category = LocationCategory.objects.create(name="Playground")
+    locations = []
+    for i in range(3):
+        location = Location.objects.create(
+            name=f"Park {i}",
+            address=f"{i} Play St",
+            city="Los Angeles",
+            state="CA",
+            zip_code="90001",
+            latitude=34.05 + i / 100,
+            longitude=-118.24,
+            category=category,
+        )
+        for rating in (3, 5):
+            LocationReview.objects.create(
+                location=location, name="Parent", email="p@example.com", rating=rating, comment="ok"
+            )
+        LocationImage.objects.create(location=location, image="location_images/park.jpg")
+        locations.append(location)
+    return locations
+
+
+@pytest.mark.django_db
+class TestGraphQLQueryCounts:
+    """Nested fields are batched: query count does not grow with the result size."""
+
+    def test_locations_with_nested_fields_use_one_query_per_field(
+        self, client, reviewed_locations, django_assert_num_queries
+    ):
+        query = "{ allLocations { name categoryName averageRating reviews { rating } images { caption } } }"
+        _graphql(client, query)  # caches the allLocations size the complexity check counts
+
+        # locations (+category), reviews, images, average ratings
+        with django_assert_num_queries(4):
+            data = _graphql(client, query)
+
+        assert "errors" not in data
+        assert len(data["data"]["allLocations"]) == 3
+        assert all(item["averageRating"] == 4 for item in data["data"]["allLocations"])
+        assert all(len(item["reviews"]) == 2 for item in data["data"]["allLocations"])
+
+    def test_regional_center_providers_are_batched_two_levels_deep(
+        self, client, sample_regional_center, sample_provider, django_assert_num_queries
+    ):
+        from locations.models import ProviderRegionalCenter
+
+        ProviderRegionalCenter.objects.create(provider=sample_provider, regional_center=sample_regional_center)
+        query = "{ regionalCenters { regionalCenter providers { name insuranceCarriers } } }"
+        _graphql(client, query)  # caches the regionalCenters size the complexity check counts
+
+        # centers, provider links, insurance carriers
+        with django_assert_num_queries(3):
+            data = _graphql(client, query)
+
+        center = data["data"]["regionalCenters"][0]
+        assert center["providers"][0]["name"] == "Test Provider"
+
+    def test_queries_over_the_depth_limit_are_rejected(self, client, settings):
+        settings.GRAPHQL_MAX_DEPTH = 3
+        query = "{ regionalCenters { providers { regionalCenters { providers { name } } } } }"
+
+        data = _graphql(client, query)
+
+        assert "data" not in data or data["data"] is None
+        assert "exceeds maximum operation depth" in data["errors"][0]["message"]
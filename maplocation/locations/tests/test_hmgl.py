@@ -0,0 +1,51 @@
+"""Tests for the HMGL display-text cleaning (locations/utils/hmgl.py)."""
+
+from types import SimpleNamespace
+
+from locations.utils import hmgl
+from locations.utils.hmgl import clean_description, clean_hours, clean_phones, clean_values
+
+
+def test_hours_split_on_semicolons_and_fall_back_to_hour_list():
+    assert clean_hours("<b>Mon-Fri</b> 9-5; Sat 10-2;") == "Mon-Fri 9-5\nSat 10-2"
+    assert clean_hours("By appointment<br/>only ") == "By appointment\nonly"
+    assert clean_hours(None, ["Mon 9-5", "Tue 9-5"]) == "Mon 9-5\nTue 9-5"
+    assert clean_hours("", None) is None
+
+
+def test_phones_prefer_entries_from_phones_text():
+    phones = "Main (323) 555-0100, Spanish &amp; Korean (323) 555.0101"
+    assert clean_phones(phones) == "Main (323) 555-0100\nSpanish & Korean (323) 555.0101"
+    assert clean_phones("Call 211") == "Call 211"
+    assert clean_phones(None, ["Main", "(626) 555-0199"]) == "(626) 555-0199"
+    assert clean_phones(None, ["ext. 4"]) is None
+
+
+def test_clean_values_covers_every_stored_column():
+    location = SimpleNamespace(
+        hours=None,
+        hour_list=None,
+        description_html="<p>Free <em>screenings</em></p>",
+        phones=None,
+        phone_list=None,
+    )
+    assert clean_values(location) == {
+        "hours_clean": None,
+        "description_clean": "Free screenings",
+        "primary_phone_clean": None,
+    }
+    assert clean_description("") is None
+
+
+def test_missing_clean_columns_after_a_reload(monkeypatch):
+    monkeypatch.setattr(hmgl, "connection", SimpleNamespace(vendor="postgresql"))
+    columns = {"location_id", "name", "hours", "hours_clean", "description_clean", "primary_phone_clean"}
+    monkeypatch.setattr(hmgl, "table_columns", lambda: frozenset(columns))
+    assert hmgl.missing_clean_columns() == ()
+
+    columns -= set(hmgl.CLEAN_COLUMNS)
+    assert hmgl.missing_clean_columns() == hmgl.CLEAN_COLUMNS
+
+    # No table at all: nothing to defer, the query fails on its own.
+    columns.clear()
+    assert hmgl.missing_clean_columns() == ()
@@ -1,13 +1,15 @@
 """Tests for the import_csv_providers management command.
 
-These run without a database: the ProviderV2 manager is stubbed so we can
-assert exactly which fields the command assigns. The point under test is
+These run without a database: the ProviderV2 manager is stubbed (and the
+import engine's transaction is a no-op) so we can assert exactly which
+fields the command assigns and writes. The point under test is
 that columns absent from the CSV header are never written, so a partial
 export (e.g. the cleaned Google Sheets dataset) cannot blank fields like
 description, type, or coordinates.
 """
 
 import csv
+from contextlib import nullcontext
 from decimal import Decimal
 from io import StringIO
 from unittest import mock
@@ -47,9 +49,7 @@ class StubProvider:
         self.longitude = Decimal("-118.49120000")
         self.location = object()
         self.saved = False
-
-    def save(self):
-        self.saved = True
+        self.updated_fields = set()
 
 
 class StubManager:
@@ -57,21 +57,24 @@ class StubManager:
         self.existing = existing
 
     def filter(self, **kwargs):
-        return self
+        return [self.existing] if PROVIDER_ID in kwargs.get("id__in", ()) else []
 
-    def first(self):
-        return self.existing
+    def bulk_update(self, objs, fields, batch_size=None):
+        for obj in objs:
+            obj.saved = True
+            obj.updated_fields.update(fields)
 
-    def create(self, **kwargs):
-        raise AssertionError("create() should not be called in update-only tests")
+    def bulk_create(self, objs, batch_size=None):
+        raise AssertionError("bulk_create() should not be called in update-only tests")
 
 
 def run_command(csv_path, existing):
     stub_model = mock.Mock()
     stub_model.objects = StubManager(existing)
+    stub_transaction = mock.Mock(atomic=nullcontext)
     with mock.patch(
         "locations.management.commands.import_csv_providers.ProviderV2", stub_model
-    ):
+    ), mock.patch("locations.utils.provider_import.transaction", stub_transaction):
         call_command(
             "import_csv_providers", str(csv_path), "--update-only", stdout=StringIO()
         )
@@ -122,6 +125,15 @@ def test_partial_csv_updates_lists_and_preserves_absent_columns(tmp_path):
     assert existing.email == "contact@example.org"
     assert existing.latitude == Decimal("34.01950000")
     assert existing.longitude == Decimal("-118.49120000")
+    # ...and never included in the bulk UPDATE
+    assert not existing.updated_fields & {
+        "description",
+        "type",
+        "email",
+        "latitude",
+        "longitude",
+        "location",
+    }
 
 
 def test_full_csv_still_overwrites_present_columns(tmp_path):
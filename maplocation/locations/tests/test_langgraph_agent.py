@@ -394,8 +394,12 @@ def test_stream_chat_with_langgraph_agent_yields_answer_text():
 def test_langgraph_streaming_endpoint_returns_sse_chunks(monkeypatch):
     from llm.views import StreamingLangGraphAgentAskView
 
+    produced = []
+
     def fake_stream_chat_with_langgraph_agent(*args, **kwargs):
-        yield "Streamed LangGraph answer"
+        for chunk in ("Streamed LangGraph", " answer"):
+            produced.append(chunk)
+            yield chunk
 
     monkeypatch.setattr(
         "llm.views.stream_chat_with_langgraph_agent",
@@ -412,12 +416,17 @@ def test_langgraph_streaming_endpoint_returns_sse_chunks(monkeypatch):
         format="json",
     )
     response = StreamingLangGraphAgentAskView.as_view()(request)
-    body = b"".join(response.streaming_content).decode("utf-8")
 
     assert response.status_code == 200
+    # A WSGI request gets a sync body, written out event by event.
+    assert not response.is_async
     assert response["Content-Type"] == "text/event-stream"
-    assert 'data: {"type": "chunk", "content": "Streamed LangGraph answer"}' in body
-    assert 'data: {"type": "done", "runtime": "langgraph"}' in body
+    events = iter(response.streaming_content)
+    assert next(events).decode() == 'data: {"type": "chunk", "content": "Streamed LangGraph"}\n\n'
+    assert produced == ["Streamed LangGraph"]
+    assert next(events).decode() == 'data: {"type": "chunk", "content": " answer"}\n\n'
+    assert next(events).decode() == 'data: {"type": "done", "runtime": "langgraph"}\n\n'
+    assert next(events, None) is None
 
 
 def test_langgraph_supervisor_routes_common_chat_intents():
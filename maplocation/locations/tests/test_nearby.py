@@ -0,0 +1,46 @@
+"""Tests for the combined nearby query (locations/utils/nearby.py)."""
+
+import pytest
+
+from locations.utils.nearby import (
+    LAYERS,
+    geohash_center,
+    geohash_encode,
+    layer_params,
+    layer_sql,
+    nearby_sql,
+    parse_layers,
+)
+
+
+def test_geohash_round_trip_stays_inside_the_cell():
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    cell = geohash_encode(34.1478, -118.1445, 7)
+    lat, lng = geohash_center(cell)
+    assert abs(lat - 34.1478) < 0.001 and abs(lng - -118.1445) < 0.001
+    assert geohash_encode(lat, lng, 7) == cell
+
+
+def test_parse_layers_limits_and_skips_unavailable():
+    available = ("providers", "regional_centers", "service_area", "locations")
+
+    assert parse_layers(None, available) == {name: LAYERS[name].default_limit for name in available}
+    assert parse_layers("providers:500, hmgl, service_area", available) == {
+        "providers": 200,
+        "service_area": 1,
+    }
+    with pytest.raises(ValueError):
+        parse_layers("parks", available)
+
+
+def test_every_layer_binds_its_params():
+    for layer in LAYERS.values():
+        sql = layer_sql(layer)
+        assert sql.count("%s") == len(layer_params(layer, 34.0, -118.0, 1609.0, 5))
+        assert f"FROM {layer.table} t" in sql
+
+    combined = nearby_sql({"providers": 5, "service_area": 1})
+    assert combined.count("UNION ALL") == 1
+    assert "ST_Intersects(t.service_area" in combined
+    assert "ORDER BY t.location <-> ST_SetSRID" in combined
@@ -0,0 +1,157 @@
+"""
+Tests for the vectorized provider distance index (locations/utils/provider_geo.py).
+"""
+
+import math
+import random
+
+from locations.utils.provider_geo import EARTH_RADIUS_MILES, ProviderGeoIndex
+
+
+def _haversine(lat1, lng1, lat2, lng2):
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((p2 - p1) / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+def _random_index(count=2000, seed=7):
+    rng = random.Random(seed)
+    therapies = ["ABA", "Speech", "Occupational", "Physical"]
+    points = [(33.7 + rng.random() * 0.8, -118.7 + rng.random() * 0.9) for _ in range(count)]
+    therapy_types = [rng.sample(therapies, rng.randint(0, 2)) for _ in range(count)]
+    index = ProviderGeoIndex(
+        list(range(count)),
+        [lat for lat, _ in points],
+        [lng for _, lng in points],
+        {"therapy_types": therapy_types},
+    )
+    return index, points, therapy_types
+
+
+def test_radius_search_matches_brute_force_and_sorts_by_distance():
+    index, points, _ = _random_index()
+
+    ids, miles = index.search(34.05, -118.24, 5)
+
+    expected = {i for i, (lat, lng) in enumerate(points) if _haversine(34.05, -118.24, lat, lng) <= 5}
+    assert set(ids) == expected
+    assert list(miles) == sorted(miles)
+    assert abs(miles[0] - _haversine(34.05, -118.24, *points[ids[0]])) < 1e-9
+
+
+def test_filters_and_top_k_limit():
+    index, points, therapy_types = _random_index()
+
+    ids, miles = index.search(34.05, -118.24, 10, limit=5, any_of={"therapy_types": ["Speech"]})
+    everything, _ = index.search(34.05, -118.24, 10, any_of={"therapy_types": ["Speech"]})
+    with_empty, _ = index.search(
+        34.05, -118.24, 10, any_of={"therapy_types": ["Speech"]}, or_empty=("therapy_types",)
+    )
+
+    assert len(ids) == 5
+    assert list(ids) == list(everything[:5])
+    assert all("Speech" in therapy_types[i] for i in everything)
+    assert set(with_empty) == set(everything) | {
+        i for i, (lat, lng) in enumerate(points) if not therapy_types[i] and _haversine(34.05, -118.24, lat, lng) <= 10
+    }
+    assert len(index.search(0.0, 0.0, 5)[0]) == 0
+
+
+class _RecordingQuerySet:
+    def __init__(self, calls=None, db="default"):
+        self.calls = [] if calls is None else calls
+        self.db = db
+
+    def filter(self, *args, **kwargs):
+        self.calls.append(("filter", kwargs))
+        return self
+
+    def alias(self, **kwargs):
+        self.calls.append(("alias", kwargs))
+        return self
+
+
+def test_radius_filter_stays_in_sql_on_postgis_and_uses_the_index_otherwise(monkeypatch):
+    from locations.utils import provider_geo, service_areas
+
+    index, points, _ = _random_index()
+    monkeypatch.setattr(provider_geo, "get_provider_geo_index", lambda using="default": index)
+
+    monkeypatch.setattr(service_areas, "postgis_available", lambda using="default": True)
+    sql = provider_geo.filter_within_radius(_RecordingQuerySet(), 34.05, -118.24, 5).calls
+    assert [name for name, _ in sql] == ["filter", "alias", "filter"]
+    assert sql[0][1]["latitude__isnull"] is False
+    assert "distance_miles" in sql[1][1]
+    assert sql[2][1] == {"distance_miles__lte": 5}
+
+    monkeypatch.setattr(service_areas, "postgis_available", lambda using="default": False)
+    fallback = provider_geo.filter_within_radius(_RecordingQuerySet(), 34.05, -118.24, 5).calls
+    expected = {i for i, (lat, lng) in enumerate(points) if _haversine(34.05, -118.24, lat, lng) <= 5}
+    assert [name for name, _ in fallback] == ["filter"]
+    assert set(fallback[0][1]["id__in"]) == expected
+
+
+def _sqlite_providers(monkeypatch, connection):
+    from locations.utils import facets, provider_geo
+
+    tables = ("provider", "carrier", "provider_carrier", "regional_center", "provider_rc")
+    monkeypatch.setattr(facets, "_tables", lambda: {name: name for name in tables})
+    monkeypatch.setattr(provider_geo, "_provider_pk", lambda: str)
+    facets._versions.clear()
+    provider_geo.reset_provider_geo_index()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TABLE provider (id text, latitude real, longitude real, therapy_types text, "
+            "age_groups text, diagnoses_treated text, updated_at text)"
+        )
+        cursor.execute("CREATE TABLE carrier (id integer primary key, name text)")
+        cursor.execute("CREATE TABLE provider_carrier (id integer primary key, provider_id text, insurance_carrier_id integer)")
+        cursor.execute("CREATE TABLE regional_center (id integer primary key, regional_center text)")
+        cursor.execute("CREATE TABLE provider_rc (id integer primary key)")
+        cursor.executemany(
+            "INSERT INTO provider VALUES (%s, %s, %s, %s, %s, '[]', '2026-01-01')",
+            [
+                ("aba-kids", 34.05, -118.24, '["ABA", "Speech"]', '["0-5"]'),
+                ("speech-all", 34.06, -118.25, '["Speech"]', "null"),
+                ("aba-teens", 34.07, -118.24, '["ABA"]', '["13-18"]'),
+                ("far-away", 35.00, -118.24, '["ABA"]', '["0-5"]'),
+            ],
+        )
+        cursor.execute("INSERT INTO carrier VALUES (1, 'Medi-Cal'), (2, 'Regional Center')")
+        cursor.execute("INSERT INTO provider_carrier VALUES (1, 'aba-kids', 1), (2, 'aba-teens', 2)")
+    return provider_geo
+
+
+def _ids(queryset):
+    return set(queryset.calls[-1][1]["id__in"])
+
+
+def test_index_builds_and_masks_on_sqlite(monkeypatch, sqlite_connection):
+    provider_geo = _sqlite_providers(monkeypatch, sqlite_connection)
+    search = lambda **kwargs: _ids(  # noqa: E731
+        provider_geo.index_within_radius(_RecordingQuerySet(db="sqlite"), 34.05, -118.24, 5, **kwargs)
+    )
+
+    assert search() == {"aba-kids", "speech-all", "aba-teens"}
+    assert search(therapy_types=["ABA", "Speech"]) == {"aba-kids"}
+    # Empty age groups mean all ages; a therapy nobody offers is dropped.
+    assert search(age_group="0-5") == {"aba-kids", "speech-all"}
+    assert search(therapy_types=["Music"], age_group="13-18") == {"aba-teens", "speech-all"}
+
+    index = provider_geo.get_provider_geo_index("sqlite")
+    assert search(insurance=provider_geo.insurance_search_filter(index, ["medi-cal"])) == {"aba-kids"}
+    any_carrier = provider_geo.insurance_search_filter(index, ["Accepts Insurance", "Medi-Cal"])
+    assert search(insurance=any_carrier) == {"aba-kids", "aba-teens"}
+    assert provider_geo.insurance_search_filter(index, ["Regional Center Funding"]) == {
+        "any_of": {"insurance_carriers": ["Regional Center"]}
+    }
+    assert provider_geo.insurance_search_filter(index, ["Private Pay"]) == {}
+    assert provider_geo.insurance_search_filter(index, ["Unknown Plan"]) is None
+
+    # A write changes the data version, so the next lookup rebuilds.
+    with sqlite_connection.cursor() as cursor:
+        cursor.execute("INSERT INTO provider VALUES ('new', 34.05, -118.24, '[]', '[]', '[]', '2026-02-01')")
+    from locations.utils import facets
+
+    facets.bump_provider_facets()
+    assert "new" in search()
@@ -0,0 +1,187 @@
+"""Tests for the bulk provider import engine (locations/utils/provider_import.py).
+
+These run without a database: a stub model records the bulk calls so we can
+check matching, in-file dedup, dry-run diffs and that query count depends on
+the number of chunks, not rows.
+"""
+
+from contextlib import nullcontext
+from unittest import mock
+
+import pytest
+from django.db import DatabaseError
+
+from locations.utils.provider_import import (
+    MATCH_ID,
+    ProviderImporter,
+    ProviderRow,
+    provider_dedup_key,
+)
+
+
+class StubManager:
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = 0
+        self.created = []
+        self.updates = []
+
+    def filter(self, name__in=(), id__in=()):
+        self.filters += 1
+        return [p for p in self.rows if p.name in name__in or str(p.id) in id__in]
+
+    def bulk_create(self, objs, batch_size=None):
+        self.created.append(list(objs))
+        self.rows.extend(objs)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        self.updates.append((list(objs), list(fields)))
+
+
+class StubProvider:
+    objects = None
+    _next_id = 0
+
+    def __init__(self, id=None, **fields):
+        StubProvider._next_id += 1
+        self.id = id or f"generated-{StubProvider._next_id}"
+        self.name = ""
+        self.address = ""
+        self.phone = None
+        self.latitude = 0
+        self.longitude = 0
+        self.location = None
+        for key, value in fields.items():
+            setattr(self, key, value)
+
+    @property
+    def pk(self):
+        return self.id
+
+
+@pytest.fixture
+def stub_model():
+    StubProvider.objects = StubManager(
+        [
+            StubProvider(id="p1", name="Sunrise ABA", address="1 Main St", phone="(818) 555-0100"),
+            StubProvider(id="p2", name="Valley Speech", address="9 Elm St", phone="818-555-0199"),
+        ]
+    )
+    with mock.patch(
+        "locations.utils.provider_import.transaction", mock.Mock(atomic=nullcontext)
+    ):
+        yield StubProvider
+
+
+def _row(name, address="", phone=None, **extra):
+    return ProviderRow(data={"name": name, "address": address, "phone": phone, **extra})
+
+
+def test_dedup_key_ignores_case_and_phone_formatting():
+    assert provider_dedup_key(" Sunrise ABA ", "(818) 555-0100") == provider_dedup_key(
+        "sunrise aba", "818.555.0100"
+    )
+
+
+def test_rows_match_by_name_address_then_dedup_key_and_collapse_in_file(stub_model):
+    importer = ProviderImporter(provider_model=stub_model)
+    report = importer.run(
+        [
+            _row("Sunrise ABA", "1 Main St", "(818) 555-0100", website="https://sunrise.example"),
+            # Same name and phone at a reformatted address: the dedup key
+            # folds it into p2 instead of creating a duplicate.
+            _row("Valley Speech", "9 Elm Street", "8185550199"),
+            _row("New Clinic", "5 Oak Ave", "323-555-0000"),
+            _row("New Clinic", "5 Oak Ave", "323-555-0000", website="https://new.example"),
+        ]
+    )
+
+    manager = stub_model.objects
+    assert manager.filters == 1
+    assert [p.name for p in manager.created[0]] == ["New Clinic"]
+    assert manager.created[0][0].website == "https://new.example"
+    (updated, fields), = manager.updates
+    assert {p.id for p in updated} == {"p1", "p2"}
+    assert {"website", "address", "phone", "updated_at"} <= set(fields)
+    assert report.duplicates == 1
+    assert report.errors == []
+
+
+def test_dry_run_reports_diff_without_writing(stub_model):
+    importer = ProviderImporter(MATCH_ID, dry_run=True, provider_model=stub_model)
+    report = importer.run(
+        [
+            ProviderRow(data={"name": "Sunrise ABA", "phone": "818-555-0101"}, provider_id="p1"),
+            ProviderRow(data={"name": "Brand New"}, provider_id="p9"),
+        ]
+    )
+
+    manager = stub_model.objects
+    assert manager.created == [] and manager.updates == []
+    lines = report.diff_lines()
+    assert "+ Brand New" in lines
+    assert "~ Sunrise ABA" in lines
+    assert "    phone: '(818) 555-0100' -> '818-555-0101'" in lines
+
+
+def test_queries_scale_with_chunks_not_rows(stub_model):
+    importer = ProviderImporter(chunk_size=100, provider_model=stub_model)
+    rows = (_row(f"Provider {i}", f"{i} Main St") for i in range(250))
+
+    report = importer.run(rows)
+
+    manager = stub_model.objects
+    assert len(report.created) == 250
+    assert manager.filters == 3
+    assert [len(batch) for batch in manager.created] == [100, 100, 50]
+
+
+def test_update_disabled_skips_existing_providers(stub_model):
+    importer = ProviderImporter(update=False, provider_model=stub_model)
+    report = importer.run([_row("Sunrise ABA", "1 Main St", website="https://x.example")])
+
+    assert report.skipped == 1
+    assert stub_model.objects.updates == []
+
+
+def test_rolled_back_chunk_leaves_no_trace_in_report_or_matching_state(stub_model):
+    manager = stub_model.objects
+    bulk_create = manager.bulk_create
+    failures = iter([None, DatabaseError("deadlock detected")])
+
+    def fail_second_chunk(objs, batch_size=None):
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        bulk_create(objs, batch_size)
+
+    manager.bulk_create = fail_second_chunk
+    importer = ProviderImporter(chunk_size=1, provider_model=stub_model)
+    report = importer.run(
+        [
+            _row("Good Clinic", "1 Oak Ave"),
+            _row("Broken Clinic", "2 Oak Ave", "323-555-0001"),
+            # The same provider again: its first write was rolled back, so
+            # this creates it rather than updating a provider never saved.
+            _row("Broken Clinic", "2 Oak Ave", "323-555-0001"),
+        ]
+    )
+
+    assert report.created == ["Good Clinic (1 Oak Ave)", "Broken Clinic (2 Oak Ave)"]
+    assert report.duplicates == 0
+    assert len(report.errors) == 1 and "Broken Clinic" in report.errors[0]
+    assert [p.name for batch in manager.created for p in batch] == ["Good Clinic", "Broken Clinic"]
+
+
+def test_dry_run_does_not_geocode(stub_model):
+    geocoder = mock.Mock()
+    importer = ProviderImporter(
+        dry_run=True, geocoder=geocoder, require_coordinates=True, provider_model=stub_model
+    )
+    row = _row("Brand New", "7 Pine St")
+    row.geocode = True
+
+    report = importer.run([row])
+
+    geocoder.geocode_many.assert_not_called()
+    assert report.created == ["Brand New (7 Pine St)"] and report.skipped == 0
@@ -0,0 +1,84 @@
+"""
+Tests for the shared rate limiter (maplocation/rate_limit.py), using the
+in-memory backend the Redis scripts mirror.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from maplocation import rate_limit
+from maplocation.rate_limit import MemoryBackend, RateLimiter, SharedLimiterUnavailable
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"seconds": 6000.0}  # on a 60 s window boundary
+    monkeypatch.setattr(
+        rate_limit, "time", SimpleNamespace(time=lambda: now["seconds"], monotonic=lambda: now["seconds"])
+    )
+    return now
+
+
+def test_sliding_window_weights_the_previous_window(clock):
+    limiter = RateLimiter(MemoryBackend())
+
+    assert [limiter.hit("ip", 3, 60).allowed for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit("ip", 3, 60).retry_after == 60
+    assert limiter.hit("other-ip", 3, 60).allowed
+
+    # A fixed window would reset here; the previous window still counts fully.
+    clock["seconds"] += 60
+    assert not limiter.hit("ip", 3, 60).allowed
+    # Three quarters in, it weighs 3 * 0.25: two more requests fit.
+    clock["seconds"] += 45
+    assert [limiter.hit("ip", 3, 60).allowed for _ in range(3)] == [True, True, False]
+
+
+def test_token_bucket_debt_blocks_until_repaid(clock):
+    limiter = RateLimiter(MemoryBackend())
+
+    assert limiter.take("tokens", 100, 60, cost=0).allowed
+    assert limiter.take("tokens", 100, 60, cost=150, allow_debt=True).remaining == -50
+    blocked = limiter.take("tokens", 100, 60, cost=0)
+    assert not blocked.allowed and blocked.retry_after == 30
+    assert not limiter.take("tokens", 100, 60, cost=10).allowed
+
+    clock["seconds"] += 30
+    assert limiter.take("tokens", 100, 60, cost=0).allowed
+
+
+def test_unreachable_shared_backend_falls_back_to_process_state(clock):
+    class Down:
+        def sliding_window(self, *args):
+            raise ConnectionError("redis down")
+
+    limiter = RateLimiter(Down())
+
+    assert [limiter.hit("ip", 1, 60).allowed for _ in range(2)] == [True, False]
+
+
+def test_failed_shared_backend_opens_the_breaker(clock):
+    calls = []
+
+    class Down:
+        def sliding_window(self, *args):
+            calls.append(args)
+            raise ConnectionError("redis down")
+
+    limiter = RateLimiter(Down(), breaker_seconds=10)
+
+    assert limiter.shared_available()
+    assert limiter.hit("ip", 5, 60).allowed
+    assert not limiter.shared_available()
+    # While open, checks skip the backend (no socket timeout per check).
+    assert limiter.hit("ip", 5, 60).allowed
+    with pytest.raises(SharedLimiterUnavailable):
+        limiter.hit("report", 5, 60, fallback=False)
+    assert len(calls) == 1
+
+    clock["seconds"] += 10
+    assert limiter.shared_available()
+    with pytest.raises(SharedLimiterUnavailable):
+        limiter.hit("report", 5, 60, fallback=False)
+    assert len(calls) == 2
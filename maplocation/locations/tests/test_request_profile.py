@@ -0,0 +1,65 @@
+"""
+Tests for per-request profiling (maplocation/request_profile.py).
+"""
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from maplocation.request_profile import (
+    InstrumentedLocMemCache,
+    RequestProfileMiddleware,
+    _query_wrapper,
+    current_profile,
+    incr,
+    profile,
+    timed,
+)
+
+
+def test_profile_collects_queries_cache_reads_and_timings():
+    cache = InstrumentedLocMemCache("request-profile-test", {})
+    cache.set("present", 1)
+
+    def execute(sql, params, many, context):
+        return "rows"
+
+    with timed("bedrock"):
+        pass  # no active profile: a no-op
+    with profile() as p:
+        assert _query_wrapper(execute, "SELECT 1", (), False, {}) == "rows"
+        _query_wrapper(execute, "SELECT 2", (), False, {})
+        assert cache.get("present") == 1
+        assert cache.get("absent", "fallback") == "fallback"
+        assert cache.get_many(["present", "absent"]) == {"present": 1}
+        with timed("geocode", count=3):
+            pass
+        incr("retries")
+    assert current_profile() is None
+
+    data = p.as_dict()
+    assert data["db_queries"] == 2
+    assert (data["cache_hit"], data["cache_miss"]) == (2, 2)
+    assert (data["geocode"], data["retries"]) == (3, 1)
+    assert "bedrock" not in data and "geocode_ms" in data
+    header = p.server_timing()
+    assert header.startswith("total;dur=")
+    assert 'db;dur=' in header and 'desc="2 queries"' in header
+    assert 'geocode;dur=' in header and 'cache;desc="2 hits, 2 misses"' in header
+
+
+def test_middleware_adds_server_timing_only_to_sampled_requests(settings):
+    settings.DEBUG = False
+    settings.REQUEST_PROFILE_OTEL = False
+    request = RequestFactory().get("/api/providers-v2/")
+
+    def view(request):
+        incr("cache_miss")
+        return HttpResponse("ok")
+
+    settings.REQUEST_PROFILE_SAMPLE_RATE = 0.0
+    assert "Server-Timing" not in RequestProfileMiddleware(view)(request)
+
+    settings.REQUEST_PROFILE_SAMPLE_RATE = 1.0
+    response = RequestProfileMiddleware(view)(request)
+    assert response["Server-Timing"].startswith("total;dur=")
+    assert 'cache;desc="0 hits, 1 misses"' in response["Server-Timing"]
@@ -0,0 +1,62 @@
+"""Tests for the ZIP-union service area builder (locations/utils/service_area_builder.py)."""
+
+from locations.utils.service_area_builder import (
+    CoverageReport,
+    find_duplicate_zips,
+    read_zcta_features,
+    tolerance_key,
+)
+
+
+def feature(props, geometry_type="Polygon"):
+    return {
+        "type": "Feature",
+        "properties": props,
+        "geometry": {"type": geometry_type, "coordinates": []},
+    }
+
+
+def test_read_zcta_features_filters_prefixes_and_geometry():
+    data = {
+        "features": [
+            feature({"ZCTA5CE20": "90001"}),
+            feature({"GEOID10": "91101"}, "MultiPolygon"),
+            feature({"ZCTA5CE20": "10001"}),  # New York
+            feature({"ZCTA5CE20": "90002"}, "Point"),
+            feature({"NAME": "no code"}),
+        ]
+    }
+
+    assert [code for code, _ in read_zcta_features(data)] == ["90001", "91101"]
+    assert [code for code, _ in read_zcta_features(data, prefixes=())] == ["90001", "91101", "10001"]
+
+
+def test_find_duplicate_zips_ignores_repeats_within_one_center():
+    duplicates = find_duplicate_zips(
+        {
+            "Harbor": ["90501", "90501", "90245"],
+            "Westside": ["90245", "90401"],
+            "Empty": None,
+        }
+    )
+
+    assert duplicates == {"90245": ["Harbor", "Westside"]}
+
+
+def test_coverage_report_lines():
+    report = CoverageReport(
+        built={"Harbor": 60},
+        missing_boundaries={"Harbor": ["90899"]},
+        overlaps=[("Harbor", "Westside", 1.234)],
+        gaps=[(3.5, ["90056"])],
+    )
+
+    lines = report.lines()
+
+    assert not report.ok
+    assert "  Harbor: 60 ZIP polygons" in lines
+    assert "No boundary for 1 ZIPs of Harbor: 90899" in lines
+    assert "  Harbor / Westside: 1.23 km²" in lines
+    assert "  3.50 km² (unassigned ZIPs: 90056)" in lines
+    assert CoverageReport(built={"Harbor": 60}).ok
+    assert tolerance_key(0.002) == "0.002"
@@ -0,0 +1,76 @@
+"""Tests for the in-process service area index (locations/utils/service_areas.py)."""
+
+import random
+
+from locations.utils.service_areas import (
+    ServiceArea,
+    ServiceAreaIndex,
+    STRtree,
+    polygon_contains,
+)
+
+
+def square(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
+
+
+def test_polygon_contains_respects_holes():
+    donut = [square(0, 0, 10, 10), square(4, 4, 6, 6)]
+
+    assert polygon_contains(donut, 2, 2)
+    assert not polygon_contains(donut, 5, 5)
+    assert not polygon_contains(donut, 11, 5)
+
+
+def test_strtree_matches_brute_force():
+    rng = random.Random(7)
+    boxes = []
+    for i in range(500):
+        x, y = rng.uniform(-120, -114), rng.uniform(32, 38)
+        boxes.append(((x, y, x + rng.uniform(0, 0.5), y + rng.uniform(0, 0.5)), i))
+    tree = STRtree(boxes)
+
+    for _ in range(200):
+        x, y = rng.uniform(-120, -114), rng.uniform(32, 38)
+        expected = {i for (x0, y0, x1, y1), i in boxes if x0 <= x <= x1 and y0 <= y <= y1}
+        assert set(tree.query_point(x, y)) == expected
+
+
+def test_index_locates_point_and_orders_overlaps_by_office_distance():
+    index = ServiceAreaIndex(
+        [
+            # Two-part multipolygon: the second part is far from the first.
+            ServiceArea(1, [[square(-118.5, 34.0, -118.0, 34.5)], [square(-117.0, 33.0, -116.9, 33.1)]], (34.2, -118.3)),
+            ServiceArea(2, [[square(-118.2, 34.0, -117.8, 34.5)]], (34.2, -117.9)),
+        ]
+    )
+
+    assert index.locate(34.2, -118.4) == [1]
+    assert index.locate(33.05, -116.95) == [1]
+    assert index.locate(34.2, -118.05) == [2, 1]
+    assert index.locate(33.5, -117.5) == []
+    assert index.locate_many([(34.2, -118.4), (33.5, -117.5)]) == [[1], []]
+
+
+def test_from_geojson_matches_features_to_centers_by_name():
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"REGIONALCENTER": "Harbor Regional Center"},
+                "geometry": {"type": "Polygon", "coordinates": [square(-118.4, 33.7, -118.1, 33.9)]},
+            },
+            {
+                "type": "Feature",
+                "properties": {"REGIONALCENTER": "Unknown Center"},
+                "geometry": {"type": "Polygon", "coordinates": [square(-119, 34, -118.9, 34.1)]},
+            },
+        ],
+    }
+
+    index = ServiceAreaIndex.from_geojson(data, {"harbor regional center": (7, None)})
+
+    assert len(index) == 1
+    assert index.locate(33.8, -118.2) == [7]
+    assert index.locate(34.05, -118.95) == []
@@ -0,0 +1,70 @@
+"""
+Startup cost guards: the import-time budget for loading the app, and the
+bootstrap fingerprints (locations/utils/bootstrap.py).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from locations.utils.bootstrap import Step, step_fingerprint
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+# Loaded on first use only; importing any of them at startup costs 0.1-0.5 s each.
+LAZY_PACKAGES = ("boto3", "langchain_aws", "langchain_core", "langfuse", "langgraph", "strands")
+IMPORT_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "2500"))
+
+
+def _import_times(code: str):
+    """(module, cumulative µs, is top level) rows from ``python -X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "maplocation.settings"},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            # Nested imports are indented two more spaces per level.
+            rows.append((name.strip(), int(cumulative), not name.startswith("   ")))
+    return rows
+
+
+@pytest.mark.slow
+def test_app_import_stays_within_budget_without_llm_sdks():
+    try:
+        from django.contrib.gis.gdal import GDAL_VERSION  # noqa: F401
+    except Exception:
+        pytest.skip("GDAL is not available")
+
+    rows = _import_times("import django; django.setup(); import maplocation.urls")
+
+    loaded = {name.split(".")[0] for name, _, _ in rows}
+    assert not loaded & set(LAZY_PACKAGES)
+    top_level = sum(us for _, us, is_top in rows if is_top) / 1000
+    assert top_level <= IMPORT_BUDGET_MS, f"app import took {top_level:.0f} ms"
+
+
+def test_step_fingerprint_tracks_arguments_and_input_files(tmp_path):
+    data = tmp_path / "providers.xlsx"
+    data.write_bytes(b"v1")
+    step = Step("import", "check", ("--deploy",), inputs=("providers.xlsx",))
+
+    fingerprint = step_fingerprint(step, tmp_path)
+    assert fingerprint == step_fingerprint(step, tmp_path)
+    assert fingerprint != step_fingerprint(Step("import", "check", inputs=step.inputs), tmp_path)
+
+    data.write_bytes(b"v2")
+    assert step_fingerprint(step, tmp_path) != fingerprint
+    data.unlink()
+    assert step_fingerprint(step, tmp_path) != fingerprint
@@ -0,0 +1,59 @@
+"""Tests for the ranked text search SQL (locations/utils/text_search.py)."""
+
+from locations.utils.text_search import SEARCH_SPECS, any_terms_query, search_sql
+
+
+def test_search_sql_matches_vector_or_trigram_and_ranks_both():
+    spec = SEARCH_SPECS["locations.ProviderV2"]
+    match, rank = search_sql("providers_v2", spec)
+
+    assert match == (
+        "(\"providers_v2\".search_vector @@ websearch_to_tsquery('english', %s)"
+        ' OR %s <%% "providers_v2"."name" OR %s <%% "providers_v2"."address")'
+    )
+    assert rank.startswith("ts_rank_cd(\"providers_v2\".search_vector, websearch_to_tsquery('english', %s), 32)")
+    assert 'word_similarity(%s, "providers_v2"."address")' in rank
+    assert match.count("%s") == rank.count("%s") == 1 + len(spec.trigram)
+
+
+def test_schema_qualified_table_and_any_terms_mode():
+    match, _ = search_sql('hmgl"."location', SEARCH_SPECS["locations.HMGLLocation"], match_any=True)
+
+    assert match.startswith("(\"hmgl\".\"location\".search_vector @@ to_tsquery('english', %s)")
+    assert '"hmgl"."location"."address1"' in match
+    assert any_terms_query("ABA therapy, near Pasadena!") == "ABA | therapy | near | Pasadena"
+    assert any_terms_query("&|!") == ""
+
+
+def test_hmgl_search_falls_back_to_icontains_without_its_vector(monkeypatch):
+    from types import SimpleNamespace
+
+    from locations.utils import hmgl, text_search
+
+    class Model:
+        _meta = SimpleNamespace(managed=False, label="locations.HMGLLocation", db_table='hmgl"."location')
+
+    class QuerySet:
+        model = Model
+
+        def filter(self, *args, **kwargs):
+            self.filtered = args
+            return self
+
+    monkeypatch.setattr(text_search, "connection", SimpleNamespace(vendor="postgresql"))
+    monkeypatch.setattr(hmgl, "table_columns", lambda: frozenset({"location_id", "name"}))
+
+    result = text_search.ranked_search(QuerySet(), "speech")
+
+    assert "name__icontains" in str(result.filtered[0])
+    assert not hasattr(result, "search_rank")
+
+
+def test_hmgl_search_index_statements_come_from_migration_0037():
+    from locations.utils.hmgl import search_index_sql
+
+    statements = search_index_sql()
+
+    assert "ADD COLUMN search_vector tsvector" in statements[0]
+    assert "hmgl_location_search_gin" in statements[0]
+    assert any("hmgl_location_address1_trgm" in sql for sql in statements[1:])
@@ -26,6 +26,7 @@ router.register(r"hmgl-locations", views.HMGLLocationViewSet, basename="hmgl-loc
 urlpatterns = [
     path("", include(router.urls)),
     path("health/", views.health_check, name="health-check"),
+    path("nearby/", views.nearby, name="nearby"),
     path("docs/", views.api_documentation, name="api-docs"),
     path("california-counties/", views.california_counties, name="california-counties"),
     path(
@@ -0,0 +1,206 @@
+"""
+Idempotent container bootstrap: the steps docker-entrypoint.sh used to run
+on every start, each skipped when nothing it depends on has changed.
+
+- ``schema``: ``fix_migrations`` and ``migrate``, only when the migration
+  plan is not empty. The app needs it before it can serve requests.
+- ``static``: ``collectstatic --clear``, fingerprinted by the path, size and
+  mtime of every file the staticfiles finders see. The fingerprint is kept
+  next to the output in STATIC_ROOT, so an image built with
+  ``bootstrap --phase static`` skips the step at runtime.
+- ``data``: ZIP population and the regional center provider imports. Each
+  step's fingerprint hashes its command's source, its helper modules, the
+  data files it reads and its arguments, and is recorded in
+  ``BootstrapStep`` once the step succeeds. The entrypoint runs this phase
+  in the background after Gunicorn binds.
+
+Containers starting together (an autoscale-out) serialize each phase on a
+Postgres advisory lock, so one does the work and the rest find matching
+fingerprints.
+"""
+
+import hashlib
+import logging
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.management import call_command, get_commands
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("schema", "static", "data")
+STATIC_FINGERPRINT_FILE = ".bootstrap-fingerprint"
+# pg_advisory_lock key per phase ("kindd" + phase index).
+ADVISORY_LOCK_BASE = 0x6B696E6464_00
+
+
+@dataclass(frozen=True)
+class Step:
+    """One management command call, fingerprinted by its inputs."""
+
+    name: str
+    command: str
+    args: Tuple[str, ...] = ()
+    # Data files and helper code (files or directories, relative to
+    # BASE_DIR) whose changes should re-run the step.
+    inputs: Tuple[str, ...] = ()
+
+
+IMPORT_HELPERS = ("locations/management/commands/utils", "locations/utils/provider_import.py")
+
+DATA_STEPS: Tuple[Step, ...] = (
+    Step("populate_san_gabriel_zips", "populate_san_gabriel_zips"),
+    Step("populate_pasadena_zips", "populate_pasadena_zips"),
+    Step(
+        "import_pasadena_providers",
+        "import_regional_center_providers",
+        ("--file", "data/Pasadena Provider List.xlsx", "--area", "Pasadena"),
+        inputs=("data/Pasadena Provider List.xlsx",) + IMPORT_HELPERS,
+    ),
+    Step(
+        "import_san_gabriel_providers",
+        "import_regional_center_providers",
+        ("--file", "data/San Gabriel Pomona Provider List.xlsx", "--regional-center", "San Gabriel"),
+        inputs=("data/San Gabriel Pomona Provider List.xlsx",) + IMPORT_HELPERS,
+    ),
+)
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _command_source(command: str) -> Path:
+    app = get_commands()[command]
+    return Path(import_module(f"{app}.management.commands.{command}").__file__)
+
+
+def _hash_path(digest, path: Path, base: Path) -> None:
+    if path.is_dir():
+        files = sorted(p for p in path.rglob("*.py") if "__pycache__" not in p.parts)
+    else:
+        files = [path]
+    for file in files:
+        digest.update(str(file.relative_to(base) if file.is_relative_to(base) else file).encode())
+        digest.update(file.read_bytes() if file.exists() else b"<missing>")
+
+
+def step_fingerprint(step: Step, base_dir: Optional[Path] = None) -> str:
+    """sha256 of the step's command source, arguments and input files."""
+    base = Path(base_dir or settings.BASE_DIR)
+    digest = hashlib.sha256()
+    digest.update("\0".join((step.command,) + step.args).encode())
+    _hash_path(digest, _command_source(step.command), base)
+    for relative in step.inputs:
+        _hash_path(digest, base / relative, base)
+    return digest.hexdigest()
+
+
+def static_fingerprint() -> str:
+    """sha256 over (path, size, mtime) of every file collectstatic would copy."""
+    from django.contrib.staticfiles.finders import get_finders
+
+    entries = []
+    for finder in get_finders():
+        for path, storage in finder.list([]):
+            stat = os.stat(storage.path(path))
+            entries.append(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}")
+    return hashlib.sha256("\n".join(sorted(entries)).encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Phases
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def phase_lock(phase: str) -> Iterator[None]:
+    """Hold a session-level advisory lock for ``phase`` (Postgres only)."""
+    if connection.vendor != "postgresql":
+        yield
+        return
+    key = ADVISORY_LOCK_BASE + PHASES.index(phase)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", [key])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [key])
+
+
+def pending_migrations() -> List[Tuple[object, bool]]:
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    return executor.migration_plan(executor.loader.graph.leaf_nodes())
+
+
+def run_schema(force: bool = False, log: Callable[[str], None] = logger.info) -> bool:
+    """Apply pending migrations; returns whether anything ran."""
+    with phase_lock("schema"):
+        plan = pending_migrations()
+        if not plan and not force:
+            log("schema: no pending migrations")
+            return False
+        try:
+            call_command("fix_migrations")
+        except Exception as exc:
+            # Fresh databases have no django_migrations table yet.
+            log(f"schema: fix_migrations skipped ({exc})")
+        log(f"schema: applying {len(plan)} migration(s)")
+        call_command("migrate", interactive=False)
+        return True
+
+
+def run_static(force: bool = False, log: Callable[[str], None] = logger.info) -> bool:
+    """Collect static files unless STATIC_ROOT already matches the sources."""
+    marker = Path(settings.STATIC_ROOT) / STATIC_FINGERPRINT_FILE
+    fingerprint = static_fingerprint()
+    if not force and marker.exists() and marker.read_text().strip() == fingerprint:
+        log("static: unchanged")
+        return False
+    log("static: collecting")
+    call_command("collectstatic", interactive=False, clear=True, verbosity=0)
+    marker.write_text(fingerprint + "\n")
+    return True
+
+
+def run_data(
+    force: bool = False,
+    log: Callable[[str], None] = logger.info,
+    steps: Tuple[Step, ...] = DATA_STEPS,
+) -> List[str]:
+    """
+    Run data steps whose fingerprint changed; returns the names that ran.
+    A failing step is logged and left unrecorded, so the next start retries it.
+    """
+    from locations.models import BootstrapStep
+
+    ran = []
+    with phase_lock("data"):
+        recorded = dict(BootstrapStep.objects.values_list("name", "fingerprint"))
+        for step in steps:
+            fingerprint = step_fingerprint(step)
+            if not force and recorded.get(step.name) == fingerprint:
+                log(f"data: {step.name} unchanged")
+                continue
+            log(f"data: running {step.name}")
+            try:
+                call_command(step.command, *step.args)
+            except Exception:
+                logger.exception("Bootstrap step %s failed", step.name)
+                log(f"data: {step.name} failed")
+                continue
+            BootstrapStep.objects.update_or_create(
+                name=step.name, defaults={"fingerprint": fingerprint}
+            )
+            ran.append(step.name)
+    return ran
@@ -0,0 +1,360 @@
+"""
+Provider facet index: value -> provider count for every filter dimension.
+
+All facets come from one SQL query that unions per-facet
+``(facet, provider_id, value)`` rows and groups them. The rows come from
+the JSON arrays (``jsonb_array_elements_text``), ``type``, and the carrier
+and regional center link tables. The query can be scoped to any provider
+queryset (the current search), so the UI can show live counts.
+
+The unscoped index is cached under a version derived from the database:
+row counts, ``max(updated_at)`` and a sum over every ``updated_at`` for
+providers, ``count`` / ``max(id)`` for the link tables, and a digest of
+carrier and regional center names. Any writer (another gunicorn worker, an
+import command, ``sync_db``, the background bootstrap) therefore changes
+the version every process sees. Each process re-reads it at most every
+VERSION_CHECK_SECONDS; ``bump_provider_facets`` (signals, the import
+engine) forgets the cached value so the writing process sees its change at
+once. Off PostgreSQL (SQLite dev/test, where the in-memory geo index is
+used) the same state is read with portable count / max queries and the
+name digests are computed in Python. Scoped counts are cached briefly per
+(version, filters).
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_INDEX_KEY = "provider_facets:{version}"
+PROVIDER_SCOPED_KEY = "provider_facets:{version}:{digest}"
+LOCATION_INDEX_KEY = "location_filters:{version}"
+
+JSON_ARRAY_FACETS = ("therapy_types", "age_groups", "diagnoses_treated")
+FACETS = JSON_ARRAY_FACETS + ("specializations", "insurance_carriers", "regional_centers")
+
+
+# ---------------------------------------------------------------------------
+# Versioning
+# ---------------------------------------------------------------------------
+
+
+def _rows_version(table: str) -> str:
+    """count, newest and summed ``updated_at``: catches inserts, deletes and updates."""
+    return (
+        f"(SELECT count(*) || '/' || coalesce(max(updated_at)::text, '') || '/' || "
+        f"coalesce(sum(extract(epoch FROM updated_at)), 0) FROM \"{table}\")"
+    )
+
+
+def _links_version(table: str) -> str:
+    """count and ``max(id)``: ids only grow, so any insert or delete shows."""
+    return f"(SELECT count(*) || '/' || coalesce(max(id), 0) FROM \"{table}\")"
+
+
+def _names_version(table: str, column: str) -> str:
+    return (
+        f"(SELECT md5(coalesce(string_agg(id || '=' || coalesce(\"{column}\", ''), ',' "
+        f"ORDER BY id), '')) FROM \"{table}\")"
+    )
+
+
+def provider_version_sql() -> str:
+    t = _tables()
+    parts = [
+        _rows_version(t["provider"]),
+        _links_version(t["provider_carrier"]),
+        _links_version(t["provider_rc"]),
+        _names_version(t["carrier"], "name"),
+        _names_version(t["regional_center"], "regional_center"),
+    ]
+    return f"SELECT concat_ws(':', {', '.join(parts)})"
+
+
+def _location_tables() -> Dict[str, str]:
+    from locations.models import Location, LocationCategory
+
+    return {"location": Location._meta.db_table, "category": LocationCategory._meta.db_table}
+
+
+def location_version_sql() -> str:
+    t = _location_tables()
+    parts = [
+        _rows_version(t["location"]),
+        _names_version(t["category"], "name"),
+        _names_version(t["category"], "description"),
+    ]
+    return f"SELECT concat_ws(':', {', '.join(parts)})"
+
+
+def _portable_sources(name: str) -> Tuple[Tuple[str, str, str], ...]:
+    """``(kind, table, column)`` rows read by :func:`portable_version_state`."""
+    if name == "provider":
+        t = _tables()
+        return (
+            ("rows", t["provider"], ""),
+            ("links", t["provider_carrier"], ""),
+            ("links", t["provider_rc"], ""),
+            ("names", t["carrier"], "name"),
+            ("names", t["regional_center"], "regional_center"),
+        )
+    t = _location_tables()
+    return (
+        ("rows", t["location"], ""),
+        ("names", t["category"], "name"),
+        ("names", t["category"], "description"),
+    )
+
+
+def portable_version_state(cursor, name: str) -> str:
+    """The version state in plain SQL: count / max per table, name digests in Python."""
+    parts = []
+    for kind, table, column in _portable_sources(name):
+        if kind == "names":
+            cursor.execute(f'SELECT id, "{column}" FROM "{table}" ORDER BY id')
+            digest = hashlib.md5(repr(cursor.fetchall()).encode()).hexdigest()
+            parts.append(digest)
+        else:
+            newest = "updated_at" if kind == "rows" else "id"
+            cursor.execute(f'SELECT count(*), max({newest}) FROM "{table}"')
+            parts.append("/".join(str(value) for value in cursor.fetchone()))
+    return ":".join(parts)
+
+
+_VERSION_SQL = {"provider": provider_version_sql, "location": location_version_sql}
+# (name, database alias) -> (checked at, version)
+_versions: Dict[Tuple[str, str], Tuple[float, str]] = {}
+_versions_lock = threading.Lock()
+
+
+def _read_version(name: str, using: str = "default") -> str:
+    from django.db import connections
+
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(_VERSION_SQL[name]())
+            state = cursor.fetchone()[0]
+        else:
+            state = portable_version_state(cursor, name)
+    return hashlib.md5(state.encode()).hexdigest()[:12]
+
+
+def _version(name: str, using: str = "default") -> str:
+    ttl = getattr(settings, "VERSION_CHECK_SECONDS", 5)
+    now = time.monotonic()
+    checked = _versions.get((name, using))
+    if checked is not None and now - checked[0] < ttl:
+        return checked[1]
+    version = _read_version(name, using)
+    with _versions_lock:
+        _versions[(name, using)] = (now, version)
+    return version
+
+
+def _forget(name: str) -> None:
+    with _versions_lock:
+        for key in [key for key in _versions if key[0] == name]:
+            del _versions[key]
+
+
+def provider_facet_version(using: str = "default") -> str:
+    """Version of the provider, carrier, regional center and link data."""
+    return _version("provider", using)
+
+
+def bump_provider_facets() -> None:
+    """Re-read the provider version on next use (call after provider/carrier/link writes)."""
+    _forget("provider")
+
+
+def bump_location_filters() -> None:
+    _forget("location")
+
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+
+def _tables() -> Dict[str, str]:
+    from locations.models import (
+        InsuranceCarrier,
+        ProviderInsuranceCarrier,
+        ProviderRegionalCenter,
+        ProviderV2,
+        RegionalCenter,
+    )
+
+    return {
+        "provider": ProviderV2._meta.db_table,
+        "carrier": InsuranceCarrier._meta.db_table,
+        "provider_carrier": ProviderInsuranceCarrier._meta.db_table,
+        "regional_center": RegionalCenter._meta.db_table,
+        "provider_rc": ProviderRegionalCenter._meta.db_table,
+    }
+
+
+def facet_sql(scope_sql: Optional[str] = None) -> str:
+    """
+    One statement returning ``(facet, value, count)`` for every facet.
+
+    ``scope_sql`` is a SELECT of provider ids (with ``%s`` placeholders
+    left for the caller's params); None counts every provider.
+    """
+    t = _tables()
+    scope = scope_sql or f'SELECT id FROM "{t["provider"]}"'
+    parts = []
+    for column in JSON_ARRAY_FACETS:
+        parts.append(
+            f"""
+            SELECT '{column}' AS facet, p.id AS provider_id, v.value AS value
+            FROM scope s
+            JOIN "{t["provider"]}" p ON p.id = s.id
+            CROSS JOIN LATERAL jsonb_array_elements_text(
+                CASE WHEN jsonb_typeof(p."{column}") = 'array' THEN p."{column}" ELSE '[]'::jsonb END
+            ) AS v(value)"""
+        )
+    parts.append(
+        f"""
+            SELECT 'specializations', p.id, btrim(p.type)
+            FROM scope s
+            JOIN "{t["provider"]}" p ON p.id = s.id
+            WHERE p.type IS NOT NULL"""
+    )
+    parts.append(
+        f"""
+            SELECT 'insurance_carriers', pc.provider_id, c.name
+            FROM scope s
+            JOIN "{t["provider_carrier"]}" pc ON pc.provider_id = s.id
+            JOIN "{t["carrier"]}" c ON c.id = pc.insurance_carrier_id"""
+    )
+    parts.append(
+        f"""
+            SELECT 'regional_centers', prc.provider_id, rc.regional_center
+            FROM scope s
+            JOIN "{t["provider_rc"]}" prc ON prc.provider_id = s.id
+            JOIN "{t["regional_center"]}" rc ON rc.id = prc.regional_center_id"""
+    )
+    union = "\n            UNION ALL".join(parts)
+    return f"""
+        WITH scope AS ({scope})
+        SELECT facet, value, count(DISTINCT provider_id) AS n
+        FROM ({union}
+        ) rows
+        WHERE value IS NOT NULL AND value <> ''
+        GROUP BY facet, value
+    """
+
+
+def rows_to_facets(rows: Sequence[Tuple[str, str, int]]) -> Dict[str, List[Dict[str, Any]]]:
+    """``{facet: [{"value", "count"}, ...]}``, most common first, every facet present."""
+    facets: Dict[str, List[Dict[str, Any]]] = {name: [] for name in FACETS}
+    for facet, value, count in rows:
+        facets.setdefault(facet, []).append({"value": value, "count": count})
+    for values in facets.values():
+        values.sort(key=lambda item: (-item["count"], item["value"].lower()))
+    return facets
+
+
+def compute_facets(queryset=None) -> Dict[str, List[Dict[str, Any]]]:
+    """Run the facet query over ``queryset`` (any ProviderV2 queryset) or all providers."""
+    from django.db import connection
+
+    scope_sql, params = None, ()
+    if queryset is not None:
+        scope_sql, params = queryset.order_by().values("id").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(facet_sql(scope_sql), params)
+        return rows_to_facets(cursor.fetchall())
+
+
+# ---------------------------------------------------------------------------
+# Cached entry points
+# ---------------------------------------------------------------------------
+
+
+def get_provider_facets(base_queryset=None) -> Dict[str, Any]:
+    """
+    The versioned, cached facet index over ``base_queryset`` (the
+    deduplicated provider list) or all providers. ``base_queryset`` may be
+    a callable so it is only built on a cache miss.
+    """
+    version = provider_facet_version()
+    key = PROVIDER_INDEX_KEY.format(version=version)
+    index = cache.get(key)
+    if index is None:
+        if callable(base_queryset):
+            base_queryset = base_queryset()
+        index = {"version": version, "facets": compute_facets(base_queryset)}
+        cache.set(key, index, getattr(settings, "CACHE_TIMEOUT_FACETS", 3600))
+        logger.info("Rebuilt provider facet index v%s", version)
+    return index
+
+
+def get_scoped_provider_facets(queryset, filters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Facet counts over ``queryset`` (the filtered search; may be a callable),
+    cached per version and filters.
+    """
+    version = provider_facet_version()
+    digest = hashlib.md5(repr(sorted(filters.items())).encode()).hexdigest()
+    key = PROVIDER_SCOPED_KEY.format(version=version, digest=digest)
+    result = cache.get(key)
+    if result is None:
+        if callable(queryset):
+            queryset = queryset()
+        result = {"version": version, "facets": compute_facets(queryset)}
+        cache.set(key, result, getattr(settings, "CACHE_TIMEOUT_PROVIDER_SEARCH", 60))
+    return result
+
+
+def get_location_filter_options() -> Dict[str, Any]:
+    """Category list, price levels and amenity counts for ``LocationViewSet.filters``, one pass."""
+    from django.db.models import Count, Q
+
+    from locations.models import Location, LocationCategory
+
+    key = LOCATION_INDEX_KEY.format(version=_version("location"))
+    options = cache.get(key)
+    if options is not None:
+        return options
+
+    active = Location.objects.filter(is_active=True)
+    categories = {
+        row["category"]: row["n"]
+        for row in active.values("category").annotate(n=Count("id")).order_by()
+    }
+    price_levels = {
+        row["price_level"]: row["n"]
+        for row in active.exclude(price_level__isnull=True)
+        .values("price_level")
+        .annotate(n=Count("id"))
+        .order_by()
+    }
+    amenities = active.aggregate(
+        has_parking=Count("id", filter=Q(has_parking=True)),
+        is_accessible=Count("id", filter=Q(is_accessible=True)),
+    )
+    options = {
+        "categories": [
+            {
+                "id": c.id,
+                "name": c.name,
+                "description": c.description,
+                "count": categories.get(c.id, 0),
+            }
+            for c in LocationCategory.objects.order_by("name")
+        ],
+        "price_levels": sorted(price_levels),
+        "price_level_counts": [{"value": v, "count": n} for v, n in sorted(price_levels.items())],
+        "amenity_counts": amenities,
+    }
+    cache.set(key, options, getattr(settings, "CACHE_TIMEOUT_FACETS", 3600))
+    return options
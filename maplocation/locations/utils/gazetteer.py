@@ -0,0 +1,320 @@
+"""
+Local ZIP / place centroid gazetteer for California.
+
+Request-path location lookups (``comprehensive_search``'s ``location``
+param, ``by_location``, ``geocode_and_search``) resolve ZIPs and city names
+here instead of calling a geocoding API. Entries come from two places:
+
+- ``locations/data/ca_gazetteer_seed.csv``: a small bundled seed (the LA
+  ZIPs and California cities that used to be hardcoded), so lookups work on
+  a fresh database.
+- The ``gazetteer_entry`` table, filled from the Census Bureau gazetteer
+  files by ``manage.py load_gazetteer``. Table rows override seed rows.
+
+Everything is loaded once per process into plain dicts plus sorted key
+lists, so an exact lookup is a dict hit and a prefix lookup is a bisect.
+California has ~1,800 ZCTAs and ~1,500 places, a few hundred KB in memory.
+"""
+
+import bisect
+import csv
+import difflib
+import io
+import logging
+import re
+import threading
+import unicodedata
+import zipfile
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEED_PATH = Path(__file__).resolve().parent.parent / "data" / "ca_gazetteer_seed.csv"
+
+KIND_ZIP = "zip"
+KIND_PLACE = "place"
+
+# California ZIPs run 90001-96162.
+CA_ZIP_PREFIXES = ("90", "91", "92", "93", "94", "95", "96")
+
+FUZZY_CUTOFF = 0.85
+MAX_PLACE_WORDS = 5
+
+_ZIP_RE = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
+_STATE_RE = re.compile(r"\b(?:ca|calif|california)\b\.?\s*$")
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+# Census place NAMEs end in their legal/statistical area type
+# ("Culver City city", "Altadena CDP").
+_CENSUS_PLACE_SUFFIX_RE = re.compile(r"\s+(?:city|town|CDP)$")
+
+
+@dataclass(frozen=True)
+class Centroid:
+    """A gazetteer hit: representative point for a ZIP or named place."""
+
+    latitude: float
+    longitude: float
+    name: str
+    kind: str
+    key: str
+
+    @property
+    def coordinates(self) -> Tuple[float, float]:
+        return (self.latitude, self.longitude)
+
+
+def normalize_place(name: str) -> str:
+    """Fold case, accents and punctuation: 'La Cañada-Flintridge' -> 'la canada flintridge'."""
+    folded = unicodedata.normalize("NFKD", name)
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return _NON_WORD_RE.sub(" ", folded.lower()).strip()
+
+
+class Gazetteer:
+    """In-memory ZIP and place index with exact, prefix and fuzzy lookup."""
+
+    def __init__(self, zips: Mapping[str, Centroid], places: Mapping[str, Centroid]):
+        self._zips: Dict[str, Centroid] = dict(zips)
+        self._zip_keys: List[str] = sorted(self._zips)
+        self._places: Dict[str, Centroid] = dict(places)
+        self._place_keys: List[str] = sorted(self._places)
+        # Fuzzy matching only compares names that share a first letter,
+        # which keeps difflib to a few dozen candidates per lookup.
+        self._places_by_initial: Dict[str, List[str]] = defaultdict(list)
+        for key in self._place_keys:
+            self._places_by_initial[key[0]].append(key)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, str, str, float, float]]) -> "Gazetteer":
+        """Build from ``(kind, key, name, latitude, longitude)`` rows; later rows win."""
+        zips: Dict[str, Centroid] = {}
+        places: Dict[str, Centroid] = {}
+        for kind, key, name, latitude, longitude in rows:
+            if kind == KIND_ZIP:
+                key = key.strip()[:5]
+                zips[key] = Centroid(float(latitude), float(longitude), name or key, KIND_ZIP, key)
+            elif kind == KIND_PLACE:
+                key = normalize_place(key or name)
+                if key:
+                    places[key] = Centroid(
+                        float(latitude), float(longitude), name or key, KIND_PLACE, key
+                    )
+        return cls(zips, places)
+
+    def __len__(self) -> int:
+        return len(self._zips) + len(self._places)
+
+    # ZIPs -------------------------------------------------------------------
+
+    def zip(self, zip_code: str) -> Optional[Centroid]:
+        """Exact ZIP lookup (ZIP+4 is truncated)."""
+        return self._zips.get(zip_code.strip()[:5])
+
+    def zips_with_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """ZIPs starting with ``prefix``, in order."""
+        return self._with_prefix(self._zip_keys, prefix, limit)
+
+    def nearest_zip(self, zip_code: str) -> Optional[Centroid]:
+        """
+        Exact ZIP, else the numerically closest known ZIP sharing its first
+        four, then three, digits. ZIPs are assigned along delivery routes, so
+        a neighbouring code is a far better guess than no answer at all.
+        """
+        zip_code = zip_code.strip()[:5]
+        exact = self._zips.get(zip_code)
+        if exact or not zip_code.isdigit():
+            return exact
+        for width in (4, 3):
+            candidates = self.zips_with_prefix(zip_code[:width])
+            if candidates:
+                target = int(zip_code)
+                closest = min(candidates, key=lambda z: abs(int(z) - target))
+                return self._zips[closest]
+        return None
+
+    # Places -----------------------------------------------------------------
+
+    def place(self, name: str, fuzzy: bool = True) -> Optional[Centroid]:
+        """Exact place lookup on the normalized name, then a fuzzy match."""
+        key = normalize_place(name)
+        if not key:
+            return None
+        hit = self._places.get(key)
+        if hit or not fuzzy:
+            return hit
+        candidates = self._places_by_initial.get(key[0], ())
+        matches = difflib.get_close_matches(key, candidates, n=1, cutoff=FUZZY_CUTOFF)
+        return self._places[matches[0]] if matches else None
+
+    def places_with_prefix(self, prefix: str, limit: Optional[int] = 10) -> List[Centroid]:
+        """Places whose normalized name starts with ``prefix`` (autocomplete)."""
+        keys = self._with_prefix(self._place_keys, normalize_place(prefix), limit)
+        return [self._places[key] for key in keys]
+
+    # Free text --------------------------------------------------------------
+
+    def resolve(self, text: str) -> Optional[Centroid]:
+        """
+        Resolve a ZIP, "City, CA", or full street address to a centroid.
+
+        A ZIP anywhere in the text wins; otherwise comma-separated parts are
+        tried right to left (the city sits just before the state), then any
+        run of words that names a known place, longest first.
+        """
+        if not text or not text.strip():
+            return None
+
+        match = _ZIP_RE.search(text)
+        if match:
+            hit = self.nearest_zip(match.group(1))
+            if hit:
+                return hit
+
+        cleaned = _ZIP_RE.sub(" ", text.lower())
+        parts = [normalize_place(_STATE_RE.sub("", part.strip())) for part in cleaned.split(",")]
+        parts = [part for part in parts if part]
+        for part in reversed(parts):
+            hit = self._places.get(part)
+            if hit:
+                return hit
+
+        for part in reversed(parts):
+            hit = self._scan_words(part)
+            if hit:
+                return hit
+
+        # Fuzzy only on short trailing parts; street lines never match a city.
+        for part in reversed(parts):
+            if len(part.split()) <= MAX_PLACE_WORDS:
+                hit = self.place(part)
+                if hit:
+                    return hit
+        return None
+
+    def coordinates(self, text: str) -> Optional[Tuple[float, float]]:
+        """``(latitude, longitude)`` for ``text``, or None."""
+        hit = self.resolve(text)
+        return hit.coordinates if hit else None
+
+    def _scan_words(self, text: str) -> Optional[Centroid]:
+        words = text.split()
+        for size in range(min(MAX_PLACE_WORDS, len(words)), 0, -1):
+            for start in range(len(words) - size, -1, -1):
+                hit = self._places.get(" ".join(words[start : start + size]))
+                if hit:
+                    return hit
+        return None
+
+    @staticmethod
+    def _with_prefix(keys: List[str], prefix: str, limit: Optional[int]) -> List[str]:
+        found = []
+        for index in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key = keys[index]
+            if not key.startswith(prefix) or (limit is not None and len(found) >= limit):
+                break
+            found.append(key)
+        return found
+
+
+# Loading -----------------------------------------------------------------
+
+
+def read_seed(path: Path = SEED_PATH) -> Iterator[Tuple[str, str, str, float, float]]:
+    """Rows from the bundled seed CSV."""
+    with path.open(encoding="utf-8", newline="") as fh:
+        for row in csv.DictReader(fh):
+            yield row["kind"], row["key"], row["name"], float(row["latitude"]), float(row["longitude"])
+
+
+def open_census_file(path: str) -> io.StringIO:
+    """
+    Open a Census gazetteer file, plain or zipped as published.
+    Older vintages are Latin-1, newer ones UTF-8.
+    """
+    if path.lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            member = next(name for name in archive.namelist() if name.lower().endswith(".txt"))
+            raw = archive.read(member)
+    else:
+        raw = Path(path).read_bytes()
+    try:
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = raw.decode("latin-1")
+    return io.StringIO(text)
+
+
+def _census_rows(fh) -> Iterator[Dict[str, str]]:
+    reader = csv.reader(fh, delimiter="\t")
+    header = [column.strip().upper() for column in next(reader, [])]
+    for values in reader:
+        if values:
+            yield dict(zip(header, (value.strip() for value in values)))
+
+
+def read_census_zctas(
+    fh, prefixes: Iterable[str] = CA_ZIP_PREFIXES
+) -> Iterator[Tuple[str, str, str, float, float]]:
+    """
+    Rows from a Census ZCTA gazetteer file (``*_Gaz_zcta_national.txt``).
+    That file is national and has no state column, so ZCTAs are kept by
+    ZIP prefix.
+    """
+    prefixes = tuple(prefixes)
+    for row in _census_rows(fh):
+        zcta = row.get("GEOID", "")
+        if len(zcta) == 5 and zcta.startswith(prefixes):
+            yield KIND_ZIP, zcta, zcta, float(row["INTPTLAT"]), float(row["INTPTLONG"])
+
+
+def read_census_places(fh, state: str = "CA") -> Iterator[Tuple[str, str, str, float, float]]:
+    """Rows from a Census place gazetteer file (``*_Gaz_place_06.txt`` or national)."""
+    state = state.upper()
+    for row in _census_rows(fh):
+        if row.get("USPS", state).upper() != state:
+            continue
+        name = _CENSUS_PLACE_SUFFIX_RE.sub("", row["NAME"])
+        yield KIND_PLACE, normalize_place(name), name, float(row["INTPTLAT"]), float(row["INTPTLONG"])
+
+
+def load_rows() -> List[Tuple[str, str, str, float, float]]:
+    """Seed rows followed by ``gazetteer_entry`` rows (so the table wins)."""
+    rows = list(read_seed())
+    try:
+        from locations.models import GazetteerEntry
+        from django.db import DatabaseError
+
+        try:
+            rows.extend(
+                GazetteerEntry.objects.values_list("kind", "key", "name", "latitude", "longitude")
+            )
+        except DatabaseError as exc:
+            logger.warning("Gazetteer table unavailable, using bundled seed only: %s", exc)
+    except ImportError:
+        pass
+    return rows
+
+
+_gazetteer: Optional[Gazetteer] = None
+_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """Process-wide gazetteer, loaded on first use."""
+    global _gazetteer
+    if _gazetteer is None:
+        with _lock:
+            if _gazetteer is None:
+                _gazetteer = Gazetteer.from_rows(load_rows())
+                logger.info("Loaded gazetteer with %d entries", len(_gazetteer))
+    return _gazetteer
+
+
+def reset_gazetteer() -> None:
+    """Drop the cached gazetteer so the next lookup reloads it."""
+    global _gazetteer
+    with _lock:
+        _gazetteer = None
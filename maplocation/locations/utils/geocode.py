@@ -93,23 +93,18 @@ def geocode_with_nominatim(address: str, delay: float = 1.0) -> Optional[Tuple[f
 
 def geocode_address(address: str) -> Optional[Tuple[float, float]]:
     """
-    Geocode an address via OpenStreetMap Nominatim.
-    Uses multiple fallback strategies for better success rate.
+    Geocode an address via the shared geocoder (Mapbox when a token is
+    configured, otherwise OpenStreetMap Nominatim), with cached results
+    and batched fallback variants.
 
     Returns (lat, lng) floats or None if not found/failed.
     """
     if not address:
         return None
 
-    # Get all address variations
-    variations = clean_address_aggressive(address)
+    from .geocoder import get_geocoder
 
-    # Try each variation with progressively longer delays
-    for i, variant in enumerate(variations):
-        # Use longer delay for later attempts to respect rate limits
-        delay = 1.0 if i == 0 else 1.5
-        result = geocode_with_nominatim(variant, delay=delay)
-        if result:
-            return result
-
-    return None
+    result = get_geocoder().geocode(address)
+    if result is None:
+        return None
+    return result.latitude, result.longitude
@@ -0,0 +1,486 @@
+"""
+Unified geocoding service.
+
+Every geocoding caller (management commands, admin actions, serializers)
+goes through :class:`Geocoder`, which
+
+- normalizes addresses and looks them up in the ``geocode_cache`` table
+  first, so re-geocoding the whole directory on a warm cache is a handful
+  of ``IN (...)`` queries,
+- sends cache misses to the configured backend in one batch: a single
+  Mapbox batch request per 1,000 queries, or concurrent single requests
+  under a token-bucket rate limit for backends without a batch API,
+- retries misses with progressively coarser address variants (suite
+  stripped, city/state/ZIP, ZIP) as whole batches rather than one address
+  at a time,
+- caches misses too, so unresolvable addresses stop costing API calls.
+
+Backends: ``mapbox`` (default when ``MAPBOX_ACCESS_TOKEN`` is set),
+``nominatim``, and ``stub`` (deterministic, offline; used in tests).
+
+Usage:
+    from locations.utils.geocoder import get_geocoder, bulk_save_coordinates
+
+    geocoder = get_geocoder()
+    results = geocoder.geocode_many(p.address for p in providers)
+    changed = [p for p in providers if apply_result(p, results.get(p.address))]
+    bulk_save_coordinates(ProviderV2, changed)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from django.conf import settings
+
+from maplocation.request_profile import timed
+
+logger = logging.getLogger(__name__)
+
+MAPBOX_FORWARD_URL = "https://api.mapbox.com/geocoding/v5/mapbox.places"
+MAPBOX_BATCH_URL = "https://api.mapbox.com/search/geocode/v6/batch"
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+USER_AGENT = "chla-maplocation/1.0 (contact: dev@localhost)"
+LA_PROXIMITY = "-118.2437,34.0522"
+
+_WHITESPACE = re.compile(r"\s+")
+_SUITE = re.compile(r"\b(suite|ste|unit|apt|#)\s*[a-z0-9\-/]+", re.IGNORECASE)
+_STREET_PERIOD = re.compile(r"\b(blvd|st|ave|dr|rd|ct|ln|way|pkwy|hwy)\.", re.IGNORECASE)
+_ZIP = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
+_CITY_STATE_ZIP = re.compile(r"([A-Za-z][A-Za-z .'-]+),\s*([A-Z]{2})\s*(\d{5})")
+
+
+@dataclass(frozen=True)
+class GeocodeResult:
+    latitude: float
+    longitude: float
+    source: str = ""
+    matched_query: str = ""
+
+    def as_decimal(self) -> Tuple[Decimal, Decimal]:
+        return Decimal(str(round(self.latitude, 8))), Decimal(str(round(self.longitude, 8)))
+
+
+def normalize_address(address: str) -> str:
+    """Cache key for an address: case, spacing, and punctuation folded."""
+
+    if not address:
+        return ""
+    text = address.replace("\n", ", ").lower()
+    text = _STREET_PERIOD.sub(r"\1", text)
+    text = re.sub(r",+", ",", text)
+    text = re.sub(r"\s*,\s*", ", ", text)
+    text = _WHITESPACE.sub(" ", text).strip(" ,.")
+    return text[:512]
+
+
+def address_variants(address: str) -> List[str]:
+    """The address itself, then coarser fallbacks, most specific first."""
+
+    cleaned = _WHITESPACE.sub(" ", address.replace("\n", ", ")).strip(" ,")
+    variants = [cleaned]
+    no_suite = _WHITESPACE.sub(" ", _SUITE.sub("", cleaned))
+    no_suite = re.sub(r",\s*,", ",", no_suite).strip(" ,")
+    variants.append(no_suite)
+    match = _CITY_STATE_ZIP.search(no_suite)
+    if match:
+        city, state, zip_code = match.groups()
+        variants.append(f"{city.strip()}, {state} {zip_code}")
+    zip_match = _ZIP.search(cleaned)
+    if zip_match:
+        variants.append(zip_match.group(1))
+
+    seen = set()
+    unique = []
+    for variant in variants:
+        key = normalize_address(variant)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(variant)
+    return unique
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is free."""
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class GeocoderBackend:
+    """
+    One geocoding provider.
+
+    ``geocode`` returns a result, ``None`` when the provider has no match,
+    and raises on transient failures (which are never cached).
+    ``geocode_batch`` returns results keyed by query; queries that failed
+    transiently are left out.
+    """
+
+    name = ""
+
+    def __init__(self, rate_per_second: float = 10.0, concurrency: int = 8):
+        self.limiter = TokenBucket(rate_per_second, burst=max(1, concurrency))
+        self.concurrency = max(1, concurrency)
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    def geocode(self, query: str) -> Optional[GeocodeResult]:
+        raise NotImplementedError
+
+    def geocode_batch(self, queries: List[str]) -> Dict[str, Optional[GeocodeResult]]:
+        def run(query):
+            self.limiter.acquire()
+            try:
+                return query, self.geocode(query), True
+            except Exception as exc:
+                logger.warning("%s geocoding failed for %r: %s", self.name, query, exc)
+                return query, None, False
+
+        if len(queries) <= 1 or self.concurrency == 1:
+            outcomes = [run(q) for q in queries]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(queries))) as pool:
+                outcomes = list(pool.map(run, queries))
+        return {query: result for query, result, ok in outcomes if ok}
+
+
+class MapboxBackend(GeocoderBackend):
+    name = "mapbox"
+    batch_limit = 1000
+
+    def __init__(self, token: str, **kwargs):
+        super().__init__(**kwargs)
+        self.token = token
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        self._batch_supported = True
+
+    @property
+    def available(self) -> bool:
+        return bool(self.token)
+
+    def geocode(self, query: str) -> Optional[GeocodeResult]:
+        response = self.session.get(
+            f"{MAPBOX_FORWARD_URL}/{requests.utils.quote(query, safe='')}.json",
+            params={
+                "access_token": self.token,
+                "country": "US",
+                "types": "address,poi,place,postcode,locality,neighborhood",
+                "limit": 1,
+                "proximity": LA_PROXIMITY,
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+        return self._first_feature(response.json().get("features"), query)
+
+    def geocode_batch(self, queries: List[str]) -> Dict[str, Optional[GeocodeResult]]:
+        if not self._batch_supported or len(queries) <= 1:
+            return super().geocode_batch(queries)
+        results: Dict[str, Optional[GeocodeResult]] = {}
+        for start in range(0, len(queries), self.batch_limit):
+            chunk = queries[start : start + self.batch_limit]
+            self.limiter.acquire()
+            try:
+                response = self.session.post(
+                    MAPBOX_BATCH_URL,
+                    params={"access_token": self.token},
+                    json=[
+                        {"q": q, "country": "us", "limit": 1, "proximity": LA_PROXIMITY}
+                        for q in chunk
+                    ],
+                    timeout=60,
+                )
+                response.raise_for_status()
+                collections = response.json().get("batch", [])
+            except requests.RequestException as exc:
+                status = getattr(exc.response, "status_code", None)
+                if status is not None and 400 <= status < 500 and status != 429:
+                    # Tokens without batch access get a 4xx; fall back for good.
+                    logger.warning("Mapbox batch geocoding unavailable (%s); using single requests", exc)
+                    self._batch_supported = False
+                    results.update(super().geocode_batch(queries[start:]))
+                    return results
+                # Transient: leave this chunk out so nothing is cached for it.
+                logger.warning("Mapbox batch request failed: %s", exc)
+                continue
+            for query, collection in zip(chunk, collections):
+                results[query] = self._first_feature((collection or {}).get("features"), query)
+        return results
+
+    def _first_feature(self, features, query: str) -> Optional[GeocodeResult]:
+        if not features:
+            return None
+        longitude, latitude = features[0]["geometry"]["coordinates"]
+        return GeocodeResult(float(latitude), float(longitude), self.name, query)
+
+
+class NominatimBackend(GeocoderBackend):
+    name = "nominatim"
+
+    def __init__(self, **kwargs):
+        # The public Nominatim policy is one request per second, no parallelism.
+        kwargs.update(rate_per_second=1.0, concurrency=1)
+        super().__init__(**kwargs)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+
+    def geocode(self, query: str) -> Optional[GeocodeResult]:
+        response = self.session.get(
+            NOMINATIM_URL,
+            params={"q": query, "format": "json", "limit": 1},
+            timeout=10,
+        )
+        response.raise_for_status()
+        data = response.json()
+        if not data:
+            return None
+        return GeocodeResult(float(data[0]["lat"]), float(data[0]["lon"]), self.name, query)
+
+
+class StubBackend(GeocoderBackend):
+    """
+    Offline backend: known addresses map to fixed points, anything else with
+    a ZIP code hashes to a stable point inside Los Angeles County.
+    """
+
+    name = "stub"
+
+    def __init__(self, known: Optional[Dict[str, Tuple[float, float]]] = None, **kwargs):
+        kwargs.setdefault("rate_per_second", 0)
+        super().__init__(**kwargs)
+        self.known = {normalize_address(k): v for k, v in (known or {}).items()}
+        self.calls: List[str] = []
+
+    def geocode(self, query: str) -> Optional[GeocodeResult]:
+        self.calls.append(query)
+        key = normalize_address(query)
+        if key in self.known:
+            lat, lng = self.known[key]
+            return GeocodeResult(lat, lng, self.name, query)
+        if self.known or not _ZIP.search(query):
+            return None
+        digest = hashlib.sha1(key.encode("utf-8")).digest()
+        lat = 33.70 + (digest[0] * 256 + digest[1]) / 65535 * 1.10
+        lng = -118.90 + (digest[2] * 256 + digest[3]) / 65535 * 1.30
+        return GeocodeResult(round(lat, 6), round(lng, 6), self.name, query)
+
+
+class DatabaseGeocodeStore:
+    """``geocode_cache`` table access; one query per lookup or write batch."""
+
+    def __init__(self, miss_ttl: timedelta = timedelta(days=30), batch_size: int = 1000):
+        self.miss_ttl = miss_ttl
+        self.batch_size = batch_size
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[GeocodeResult]]:
+        from django.utils import timezone
+
+        from locations.models import GeocodeCache
+
+        miss_cutoff = timezone.now() - self.miss_ttl
+        found: Dict[str, Optional[GeocodeResult]] = {}
+        for start in range(0, len(keys), self.batch_size):
+            rows = GeocodeCache.objects.filter(
+                normalized_address__in=keys[start : start + self.batch_size]
+            ).values_list("normalized_address", "latitude", "longitude", "source", "query", "updated_at")
+            for key, lat, lng, source, query, updated_at in rows:
+                if lat is not None and lng is not None:
+                    found[key] = GeocodeResult(lat, lng, source, query)
+                elif updated_at >= miss_cutoff:
+                    found[key] = None
+        return found
+
+    def put_many(self, entries: Dict[str, Tuple[str, Optional[GeocodeResult]]]) -> None:
+        from locations.models import GeocodeCache
+
+        rows = [
+            GeocodeCache(
+                normalized_address=key,
+                query=(result.matched_query if result else query)[:1000],
+                latitude=result.latitude if result else None,
+                longitude=result.longitude if result else None,
+                source=result.source if result else "",
+            )
+            for key, (query, result) in entries.items()
+        ]
+        if rows:
+            GeocodeCache.objects.bulk_create(
+                rows,
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=["normalized_address"],
+                update_fields=["query", "latitude", "longitude", "source", "updated_at"],
+            )
+
+
+class MemoryGeocodeStore:
+    """Process-local store for tests and one-off scripts."""
+
+    def __init__(self):
+        self.entries: Dict[str, Optional[GeocodeResult]] = {}
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[GeocodeResult]]:
+        return {key: self.entries[key] for key in keys if key in self.entries}
+
+    def put_many(self, entries: Dict[str, Tuple[str, Optional[GeocodeResult]]]) -> None:
+        for key, (_, result) in entries.items():
+            self.entries[key] = result
+
+
+class Geocoder:
+    def __init__(self, backend: GeocoderBackend, store=None):
+        self.backend = backend
+        self.store = store if store is not None else DatabaseGeocodeStore()
+
+    @property
+    def available(self) -> bool:
+        return self.backend.available
+
+    def geocode(self, address: str) -> Optional[GeocodeResult]:
+        return self.geocode_many([address]).get(address)
+
+    def geocode_many(self, addresses: Iterable[str]) -> Dict[str, Optional[GeocodeResult]]:
+        """Resolve every address; the result maps each input address to a hit or ``None``."""
+
+        by_key: Dict[str, List[str]] = {}
+        for address in addresses:
+            key = normalize_address(address or "")
+            if key:
+                by_key.setdefault(key, []).append(address)
+        if not by_key:
+            return {}
+
+        variants = {key: address_variants(originals[0]) for key, originals in by_key.items()}
+        resolved: Dict[str, GeocodeResult] = {}
+        promoted: Dict[str, Tuple[str, Optional[GeocodeResult]]] = {}
+        unresolved = list(by_key)
+        round_index = 0
+        while unresolved:
+            queries: Dict[str, str] = {}
+            owners: Dict[str, List[str]] = {}
+            for key in unresolved:
+                if round_index < len(variants[key]):
+                    query = variants[key][round_index]
+                    variant_key = normalize_address(query)
+                    queries.setdefault(variant_key, query)
+                    owners.setdefault(variant_key, []).append(key)
+            if not queries:
+                break
+            for variant_key, result in self._lookup(queries).items():
+                if result is not None:
+                    for key in owners[variant_key]:
+                        resolved[key] = result
+                        if round_index:
+                            promoted[key] = (by_key[key][0], result)
+            unresolved = [key for key in unresolved if key not in resolved]
+            round_index += 1
+
+        # Remember fallback hits under the original address so the next run
+        # resolves it in the first round.
+        if promoted:
+            self.store.put_many(promoted)
+
+        return {
+            address: resolved.get(key)
+            for key, originals in by_key.items()
+            for address in originals
+        }
+
+    def _lookup(self, queries: Dict[str, str]) -> Dict[str, Optional[GeocodeResult]]:
+        results = self.store.get_many(list(queries))
+        misses = {key: query for key, query in queries.items() if key not in results}
+        if misses and self.backend.available:
+            with timed("geocode", count=len(misses)):
+                fetched = self.backend.geocode_batch(list(misses.values()))
+            fresh = {
+                key: (query, fetched[query]) for key, query in misses.items() if query in fetched
+            }
+            self.store.put_many(fresh)
+            results.update({key: result for key, (_, result) in fresh.items()})
+        return results
+
+
+def build_backend(name: Optional[str] = None) -> GeocoderBackend:
+    token = getattr(settings, "MAPBOX_ACCESS_TOKEN", "")
+    name = name or getattr(settings, "GEOCODER_BACKEND", "") or ("mapbox" if token else "nominatim")
+    rate = getattr(settings, "GEOCODER_RATE_PER_SECOND", 10.0)
+    concurrency = getattr(settings, "GEOCODER_CONCURRENCY", 8)
+    if name == "mapbox":
+        return MapboxBackend(token, rate_per_second=rate, concurrency=concurrency)
+    if name == "nominatim":
+        return NominatimBackend()
+    if name == "stub":
+        return StubBackend()
+    raise ValueError(f"Unknown geocoder backend: {name}")
+
+
+@lru_cache(maxsize=1)
+def get_geocoder() -> Geocoder:
+    """Process-wide geocoder for the configured backend."""
+
+    miss_days = getattr(settings, "GEOCODER_MISS_TTL_DAYS", 30)
+    return Geocoder(build_backend(), DatabaseGeocodeStore(miss_ttl=timedelta(days=miss_days)))
+
+
+def apply_result(obj, result: Optional[GeocodeResult]) -> bool:
+    """Copy ``result`` onto a model instance's latitude/longitude/location."""
+
+    if result is None:
+        return False
+    field = obj._meta.get_field("latitude")
+    if field.get_internal_type() == "DecimalField":
+        obj.latitude, obj.longitude = result.as_decimal()
+    else:
+        obj.latitude, obj.longitude = result.latitude, result.longitude
+    if any(f.name == "location" for f in obj._meta.concrete_fields):
+        from django.contrib.gis.geos import Point
+
+        obj.location = Point(result.longitude, result.latitude, srid=4326)
+    return True
+
+
+def bulk_save_coordinates(model, objects: List, batch_size: int = 500) -> int:
+    """Write coordinates with ``bulk_update`` (bypasses ``save()`` hooks)."""
+
+    if not objects:
+        return 0
+    fields = ["latitude", "longitude"]
+    if any(f.name == "location" for f in model._meta.concrete_fields):
+        fields.append("location")
+    model.objects.bulk_update(objects, fields, batch_size=batch_size)
+    return len(objects)
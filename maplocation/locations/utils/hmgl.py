@@ -0,0 +1,193 @@
+"""
+Help Me Grow LA (``hmgl.location``) ingest helpers.
+
+The HMGL table is loaded outside Django and its hours, description and
+phone fields arrive as HTML fragments. The cleaned display text is
+computed here once per load and stored in ``hours_clean``,
+``description_clean`` and ``primary_phone_clean``, so list and nearby
+responses read plain columns instead of running regexes per row.
+
+    python manage.py clean_hmgl_locations   # after every HMGL load
+
+The serializer falls back to these same functions for rows not cleaned
+yet. A reload recreates the table without the clean columns (and
+without migration 0037's ``search_vector`` and search indexes, which
+:func:`ensure_clean_columns` re-creates too), so
+``HMGLLocation.objects`` defers whichever of them are missing (see
+:func:`missing_clean_columns`) and reads keep working until the command
+runs again.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+TABLE = "hmgl.location"
+CLEAN_COLUMNS = ("hours_clean", "description_clean", "primary_phone_clean")
+# How long a process trusts its view of the table's columns.
+COLUMN_CHECK_SECONDS = 30
+
+_BR_RE = re.compile(r"<br\s*/?>")
+_TAG_RE = re.compile(r"<[^>]+>")
+_PHONE_ENTRY_RE = re.compile(r"([^,]*?\(\d{3}\)\s*\d{3}[-.]?\d{4})")
+_AREA_CODE_RE = re.compile(r"\(\d{3}\)")
+
+
+def strip_html(html: str) -> str:
+    return _TAG_RE.sub("", _BR_RE.sub("\n", html))
+
+
+def clean_hours(hours: Optional[str], hour_list: Optional[Sequence[str]] = None) -> Optional[str]:
+    """Hours as plain text, one ``;``-separated entry per line."""
+    if hours:
+        clean = strip_html(hours)
+        parts = [p.strip() for p in clean.split(";") if p.strip()]
+        if len(parts) > 1:
+            return "\n".join(parts)
+        return clean.strip()
+    if hour_list:
+        return "\n".join(hour_list)
+    return None
+
+
+def clean_description(description_html: Optional[str]) -> Optional[str]:
+    if description_html:
+        return strip_html(description_html).strip()
+    return None
+
+
+def clean_phones(phones: Optional[str], phone_list: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    Phone entries, one per line. ``phones`` is preferred because
+    ``phone_list`` is often split mid-entry.
+    """
+    if phones:
+        phones = phones.replace("&amp;", "&")
+        matches = _PHONE_ENTRY_RE.findall(phones)
+        if matches:
+            return "\n".join(m.strip().strip(",").strip() for m in matches)
+        return phones
+    if phone_list:
+        valid = [p for p in phone_list if _AREA_CODE_RE.search(p)]
+        if valid:
+            return "\n".join(valid)
+    return None
+
+
+def clean_values(location) -> Dict[str, Optional[str]]:
+    """The stored clean columns for ``location`` (an HMGLLocation or similar)."""
+    return {
+        "hours_clean": clean_hours(location.hours, location.hour_list),
+        "description_clean": clean_description(location.description_html),
+        "primary_phone_clean": clean_phones(location.phones, location.phone_list),
+    }
+
+
+_columns: Optional[Tuple[float, FrozenSet[str]]] = None
+_columns_lock = threading.Lock()
+
+
+def table_columns() -> FrozenSet[str]:
+    """
+    Column names of ``hmgl.location`` (empty when the table is absent),
+    re-read at most every COLUMN_CHECK_SECONDS.
+    """
+    global _columns
+    now = time.monotonic()
+    checked = _columns
+    if checked is not None and now - checked[0] < COLUMN_CHECK_SECONDS:
+        return checked[1]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT attname FROM pg_attribute "
+            "WHERE attrelid = to_regclass(%s) AND attnum > 0 AND NOT attisdropped",
+            [TABLE],
+        )
+        columns = frozenset(row[0] for row in cursor.fetchall())
+    with _columns_lock:
+        _columns = (now, columns)
+    return columns
+
+
+def reset_table_columns() -> None:
+    global _columns
+    with _columns_lock:
+        _columns = None
+
+
+def missing_clean_columns() -> Tuple[str, ...]:
+    """Clean columns a reload dropped (none off PostgreSQL or without the table)."""
+    if connection.vendor != "postgresql":
+        return ()
+    columns = table_columns()
+    if not columns:
+        return ()
+    return tuple(column for column in CLEAN_COLUMNS if column not in columns)
+
+
+def search_index_sql() -> List[str]:
+    """Migration 0037's statements for ``hmgl.location``: the search vector and its indexes."""
+    migration = import_module("locations.migrations.0037_search_vectors")
+    statements = [migration.search_vector_sql(TABLE, migration.SEARCH_VECTORS[TABLE])]
+    statements += [migration.trigram_index_sql(TABLE, column) for column in migration.TRIGRAM_COLUMNS[TABLE]]
+    return statements
+
+
+def ensure_clean_columns() -> bool:
+    """
+    Add the clean columns, the ``search_vector`` column and the search
+    indexes if ``hmgl.location`` exists without them (a reload can
+    recreate the table). Returns False when the table is absent.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [TABLE])
+        if not cursor.fetchone()[0]:
+            return False
+        for column in CLEAN_COLUMNS:
+            cursor.execute(f"ALTER TABLE {TABLE} ADD COLUMN IF NOT EXISTS {column} text")
+        for statement in search_index_sql():
+            cursor.execute(statement)
+    reset_table_columns()
+    return True
+
+
+@dataclass
+class CleanResult:
+    scanned: int = 0
+    updated: int = 0
+
+
+def refresh_clean_columns(batch_size: int = 500, dry_run: bool = False) -> CleanResult:
+    """Recompute the clean columns, writing only rows whose values changed."""
+    from locations.models import HMGLLocation
+
+    result = CleanResult()
+    changed = []
+    fields = (
+        "location_id",
+        "hours",
+        "hour_list",
+        "description_html",
+        "phones",
+        "phone_list",
+    ) + CLEAN_COLUMNS
+    for location in HMGLLocation.objects.only(*fields).order_by("location_id").iterator(chunk_size=batch_size):
+        result.scanned += 1
+        values = clean_values(location)
+        if any(getattr(location, column) != value for column, value in values.items()):
+            for column, value in values.items():
+                setattr(location, column, value)
+            changed.append(location)
+    result.updated = len(changed)
+    if changed and not dry_run:
+        HMGLLocation.objects.bulk_update(changed, CLEAN_COLUMNS, batch_size=batch_size)
+    logger.info("HMGL clean columns: %s scanned, %s updated", result.scanned, result.updated)
+    return result
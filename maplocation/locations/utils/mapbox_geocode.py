@@ -74,6 +74,10 @@ def geocode_with_fallback(address: str) -> Optional[Tuple[float, float]]:
     """
     Geocode an address with multiple fallback strategies.
 
+    Delegates to the shared geocoder (locations/utils/geocoder.py), which
+    checks the geocode cache first and tries the suite-stripped,
+    city/state/ZIP and ZIP-only variants as batches.
+
     Args:
         address: The address string to geocode
 
@@ -83,43 +87,12 @@ def geocode_with_fallback(address: str) -> Optional[Tuple[float, float]]:
     if not address or not address.strip():
         return None
 
-    # Strategy 1: Try the full address
-    result = geocode_address(address)
-    if result:
-        print(f"✅ Geocoded full address: {address} -> {result}")
-        return result
-
-    # Strategy 2: Try with just city, state, zip
-    parts = address.split(",")
-    if len(parts) >= 2:
-        # Extract city, state, zip part
-        city_state_zip = ",".join(parts[-2:]).strip()
-        result = geocode_address(city_state_zip)
-        if result:
-            print(f"✅ Geocoded city/state/zip: {city_state_zip} -> {result}")
-            return result
-
-    # Strategy 3: Try with just the last part (usually city, state, zip)
-    if len(parts) >= 1:
-        last_part = parts[-1].strip()
-        result = geocode_address(last_part)
-        if result:
-            print(f"✅ Geocoded last part: {last_part} -> {result}")
-            return result
-
-    # Strategy 4: Try extracting just ZIP code
-    import re
-
-    zip_match = re.search(r"\b\d{5}(-\d{4})?\b", address)
-    if zip_match:
-        zip_code = zip_match.group()
-        result = geocode_address(zip_code)
-        if result:
-            print(f"✅ Geocoded ZIP code: {zip_code} -> {result}")
-            return result
-
-    print(f"❌ Failed to geocode address: {address}")
-    return None
+    from .geocoder import get_geocoder
+
+    result = get_geocoder().geocode(address)
+    if result is None:
+        return None
+    return result.latitude, result.longitude
 
 
 def reverse_geocode(latitude: float, longitude: float) -> Optional[str]:
@@ -0,0 +1,307 @@
+"""
+"Everything near me": every map layer around one point in one query.
+
+``/api/nearby/`` replaces the map screen's fan-out over the per-model
+``nearby`` / ``by_zip_code`` actions. Each requested layer is a
+``(SELECT ... ORDER BY geog <-> point LIMIT n)`` KNN subquery. They are
+glued with UNION ALL, so the database does one round trip and each layer
+keeps its own limit.
+
+The point (lat/lng, or a ZIP/place resolved by the local gazetteer) is
+snapped to the center of its geohash cell before querying. Everyone in
+the same ~150 m cell shares one cache entry.
+"""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+METERS_PER_MILE = 1609.344
+MAX_RADIUS_MILES = 50.0
+MAX_LAYER_LIMIT = 200
+CACHE_KEY = "nearby:{cell}:{radius}:{layers}"
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+# ---------------------------------------------------------------------------
+# Geohash
+# ---------------------------------------------------------------------------
+
+
+def geohash_encode(latitude: float, longitude: float, precision: int = 7) -> str:
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, coord = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def geohash_center(cell: str) -> Tuple[float, float]:
+    """``(latitude, longitude)`` of the center of ``cell``."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in cell:
+        value = GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            rng = lng_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if value >> shift & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return (lat_range[0] + lat_range[1]) / 2, (lng_range[0] + lng_range[1]) / 2
+
+
+# ---------------------------------------------------------------------------
+# Layers
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Layer:
+    """
+    One map layer. ``fields`` are ``(key, SQL expression on alias t)``
+    pairs packed into each result. ``containing`` switches the filter from
+    "within radius" to "service area contains the point".
+    """
+
+    name: str
+    table: str
+    geography: str
+    fields: Tuple[Tuple[str, str], ...]
+    default_limit: int = 20
+    id_column: str = "t.id"
+    where: str = ""
+    containing: str = ""
+    optional: bool = False
+
+
+LAYERS: Dict[str, Layer] = {
+    layer.name: layer
+    for layer in (
+        Layer(
+            "providers",
+            "providers_v2",
+            "t.location",
+            (
+                ("name", "t.name"),
+                ("type", "t.type"),
+                ("phone", "t.phone"),
+                ("address", "t.address"),
+                ("website", "t.website"),
+            ),
+            default_limit=50,
+        ),
+        Layer(
+            "regional_centers",
+            "regional_centers",
+            "t.location",
+            (
+                ("name", "t.regional_center"),
+                ("address", "t.address"),
+                ("city", "t.city"),
+                ("phone", "t.telephone"),
+                ("website", "t.website"),
+            ),
+            default_limit=5,
+        ),
+        Layer(
+            "service_area",
+            "regional_centers",
+            "t.location",
+            (
+                ("name", "t.regional_center"),
+                ("address", "t.address"),
+                ("city", "t.city"),
+                ("phone", "t.telephone"),
+                ("website", "t.website"),
+            ),
+            default_limit=1,
+            containing="t.service_area",
+        ),
+        Layer(
+            "hmgl",
+            "hmgl.location",
+            "t.geom::geography",
+            (
+                ("name", "t.name"),
+                ("organization", "t.organization"),
+                ("address", "t.address1"),
+                ("city", "t.city"),
+                # Read through to_jsonb: NULL, not an error, when a reload
+                # dropped the column (see utils/hmgl.py).
+                ("phone", "coalesce(to_jsonb(t) ->> 'primary_phone_clean', t.phones)"),
+            ),
+            id_column="t.location_id",
+            optional=True,
+        ),
+        Layer(
+            "locations",
+            "locations_location",
+            "t.location",
+            (
+                ("name", "t.name"),
+                ("address", "t.address"),
+                ("city", "t.city"),
+                ("category_id", "t.category_id"),
+                ("rating", "t.rating"),
+            ),
+            where="t.is_active",
+        ),
+    )
+}
+
+_available_lock = threading.Lock()
+_available: Optional[Tuple[str, ...]] = None
+
+
+def available_layers() -> Tuple[str, ...]:
+    """Layer names whose tables exist (hmgl.location is loaded separately)."""
+    global _available
+    with _available_lock:
+        if _available is None:
+            optional = [layer.table for layer in LAYERS.values() if layer.optional]
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT t, to_regclass(t) IS NOT NULL FROM unnest(%s::text[]) AS t", [optional])
+                present = {table for table, exists in cursor.fetchall() if exists}
+            _available = tuple(
+                name for name, layer in LAYERS.items() if not layer.optional or layer.table in present
+            )
+        return _available
+
+
+def reset_available_layers() -> None:
+    global _available
+    with _available_lock:
+        _available = None
+
+
+def parse_layers(spec: Optional[str], available: Sequence[str]) -> Dict[str, int]:
+    """
+    ``"providers:20,hmgl,locations:5"`` -> ``{layer: limit}`` in request order.
+    Empty means every available layer at its default limit.
+    """
+    if not spec or not spec.strip():
+        return {name: LAYERS[name].default_limit for name in available}
+    layers: Dict[str, int] = {}
+    for item in spec.split(","):
+        name, _, limit = item.strip().partition(":")
+        if not name:
+            continue
+        if name not in LAYERS:
+            raise ValueError(f"Unknown layer {name!r}; choose from {', '.join(LAYERS)}")
+        if name not in available:
+            continue
+        count = int(limit) if limit else LAYERS[name].default_limit
+        layers[name] = max(1, min(count, MAX_LAYER_LIMIT))
+    return layers
+
+
+# ---------------------------------------------------------------------------
+# Query
+# ---------------------------------------------------------------------------
+
+
+def layer_sql(layer: Layer) -> str:
+    """One layer's subquery; see :func:`layer_params` for its parameters."""
+    point = "ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography"
+    data = ", ".join(f"'{key}', {expr}" for key, expr in layer.fields)
+    if layer.containing:
+        conditions = [f"{layer.containing} IS NOT NULL", f"ST_Intersects({layer.containing}, {point})"]
+    else:
+        conditions = [f"{layer.geography} IS NOT NULL", f"ST_DWithin({layer.geography}, {point}, %s)"]
+    if layer.where:
+        conditions.append(layer.where)
+    return f"""(
+            SELECT '{layer.name}' AS layer, {layer.id_column}::text AS id,
+                   ST_Y(({layer.geography})::geometry) AS lat,
+                   ST_X(({layer.geography})::geometry) AS lng,
+                   ST_Distance({layer.geography}, {point}) AS meters,
+                   jsonb_build_object({data}) AS data
+            FROM {layer.table} t
+            WHERE {" AND ".join(conditions)}
+            ORDER BY {layer.geography} <-> {point}
+            LIMIT %s
+        )"""
+
+
+def layer_params(layer: Layer, latitude: float, longitude: float, radius_m: float, limit: int) -> List[Any]:
+    # The point appears in ST_Distance, the filter and the ORDER BY, in that order.
+    point = [longitude, latitude]
+    radius = [] if layer.containing else [radius_m]
+    return point + point + radius + point + [limit]
+
+
+def nearby_sql(layers: Dict[str, int]) -> str:
+    return "\n        UNION ALL\n        ".join(layer_sql(LAYERS[name]) for name in layers)
+
+
+def query_nearby(latitude: float, longitude: float, radius_miles: float, layers: Dict[str, int]) -> Dict[str, List[Dict[str, Any]]]:
+    """``{layer: [item, ...]}`` nearest first, one query for every layer."""
+    result: Dict[str, List[Dict[str, Any]]] = {name: [] for name in layers}
+    if not layers:
+        return result
+    params: List[Any] = []
+    for name, limit in layers.items():
+        params += layer_params(LAYERS[name], latitude, longitude, radius_miles * METERS_PER_MILE, limit)
+    with connection.cursor() as cursor:
+        cursor.execute(nearby_sql(layers), params)
+        rows = cursor.fetchall()
+    for layer, pk, lat, lng, meters, data in rows:
+        result[layer].append(compact_item(pk, lat, lng, meters, data))
+    return result
+
+
+def compact_item(pk, lat, lng, meters, data) -> Dict[str, Any]:
+    if isinstance(data, str):  # drivers without jsonb adaptation
+        data = json.loads(data)
+    item = {
+        "id": pk,
+        "lat": round(lat, 6) if lat is not None else None,
+        "lng": round(lng, 6) if lng is not None else None,
+        "distance": round(meters / METERS_PER_MILE, 2) if meters is not None else None,
+    }
+    item.update({key: value for key, value in data.items() if value not in (None, "")})
+    return item
+
+
+def get_nearby(latitude: float, longitude: float, radius_miles: float, layers: Dict[str, int]) -> Dict[str, Any]:
+    """The cached combined payload for the geohash cell containing the point."""
+    precision = getattr(settings, "NEARBY_GEOHASH_PRECISION", 7)
+    cell = geohash_encode(latitude, longitude, precision)
+    radius_miles = max(0.1, min(radius_miles, MAX_RADIUS_MILES))
+    layer_key = ",".join(f"{name}:{limit}" for name, limit in layers.items())
+    key = CACHE_KEY.format(cell=cell, radius=f"{radius_miles:g}", layers=layer_key)
+
+    payload = cache.get(key)
+    if payload is None:
+        cell_lat, cell_lng = geohash_center(cell)
+        payload = {
+            "point": {"lat": round(cell_lat, 6), "lng": round(cell_lng, 6), "geohash": cell},
+            "radius_miles": radius_miles,
+            "layers": query_nearby(cell_lat, cell_lng, radius_miles, layers),
+        }
+        cache.set(key, payload, getattr(settings, "CACHE_TIMEOUT_NEARBY", 300))
+    return payload
@@ -0,0 +1,334 @@
+"""
+In-memory, vectorized provider distance index.
+
+A process-level columnar snapshot of every ProviderV2 with coordinates:
+NumPy arrays of latitude/longitude sorted by latitude, plus one bitset per
+filter dimension (therapy types, age groups, diagnoses, insurance
+carriers). A radius query binary-searches the latitude band, then runs
+haversine and the filter masks over that band only, and picks the nearest
+``limit`` with ``argpartition``. A few-mile search over thousands of
+providers takes microseconds, with no database round trip.
+
+Used only when PostGIS is unavailable (SQLite dev/test): by
+``comprehensive_search``, whose radius, therapy, age group and insurance
+filters then run as one masked search, and by ``ProviderV2.find_nearest``.
+On PostGIS both stay in SQL, which always sees the current rows. The
+snapshot is loaded with plain SQL, so it works on any database. The snapshot is tagged with the provider facet version
+(``utils/facets.py``), which is derived from the provider, carrier and
+link tables themselves, and is rebuilt on the first query after a change.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Same Earth radius as the SQL haversine this replaces.
+EARTH_RADIUS_MILES = 3959.0
+MILES_PER_DEGREE_LAT = EARTH_RADIUS_MILES * np.pi / 180
+DIMENSIONS = ("therapy_types", "age_groups", "diagnoses_treated", "insurance_carriers")
+
+
+class Bitset:
+    """One uint64 word per 64 distinct values of a multi-valued attribute."""
+
+    def __init__(self, values_per_row: Sequence[Iterable[str]]):
+        self.vocabulary: Dict[str, int] = {}
+        for values in values_per_row:
+            for value in values:
+                self.vocabulary.setdefault(value, len(self.vocabulary))
+        self.words = max(1, (len(self.vocabulary) + 63) // 64)
+        self.bits = np.zeros((len(values_per_row), self.words), dtype=np.uint64)
+        for row, values in enumerate(values_per_row):
+            for value in values:
+                bit = self.vocabulary[value]
+                self.bits[row, bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+
+    def query(self, values: Iterable[str]) -> np.ndarray:
+        words = np.zeros(self.words, dtype=np.uint64)
+        for value in values:
+            bit = self.vocabulary.get(value)
+            if bit is not None:
+                words[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        return words
+
+    def any_of(self, values: Iterable[str], rows: slice = slice(None)) -> np.ndarray:
+        """Rows having at least one of ``values``."""
+        return (self.bits[rows] & self.query(values)).any(axis=1)
+
+    def all_of(self, values: Iterable[str], rows: slice = slice(None)) -> np.ndarray:
+        """Rows having every one of ``values`` (none, if a value is unknown)."""
+        values = list(values)
+        if any(value not in self.vocabulary for value in values):
+            return np.zeros(len(self.bits[rows]), dtype=bool)
+        words = self.query(values)
+        return ((self.bits[rows] & words) == words).all(axis=1)
+
+    def empty(self, rows: slice = slice(None)) -> np.ndarray:
+        return ~self.bits[rows].any(axis=1)
+
+
+class ProviderGeoIndex:
+    """Providers with coordinates, sorted by latitude for band queries."""
+
+    def __init__(
+        self,
+        ids: Sequence[Any],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        attributes: Optional[Dict[str, Sequence[Iterable[str]]]] = None,
+        version: Any = None,
+    ):
+        lat = np.asarray(latitudes, dtype=np.float64)
+        lng = np.asarray(longitudes, dtype=np.float64)
+        order = np.argsort(lat, kind="stable")
+        self.version = version
+        self.ids = np.empty(len(order), dtype=object)
+        self.ids[:] = [ids[i] for i in order]
+        self.latitudes = lat[order]
+        self.longitudes = lng[order]
+        self._lat = np.radians(self.latitudes)
+        self._lng = np.radians(self.longitudes)
+        self._cos_lat = np.cos(self._lat)
+        self.bitsets = {
+            name: Bitset([list(values[i] or ()) for i in order])
+            for name, values in (attributes or {}).items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _band(self, latitude: float, radius_miles: float) -> slice:
+        delta = radius_miles / MILES_PER_DEGREE_LAT
+        start = np.searchsorted(self.latitudes, latitude - delta, side="left")
+        stop = np.searchsorted(self.latitudes, latitude + delta, side="right")
+        return slice(int(start), int(stop))
+
+    def search(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_miles: float,
+        limit: Optional[int] = None,
+        any_of: Optional[Dict[str, Iterable[str]]] = None,
+        or_empty: Sequence[str] = (),
+        all_of: Optional[Dict[str, Iterable[str]]] = None,
+        nonempty: Sequence[str] = (),
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ``(ids, miles)`` of providers within ``radius_miles``, nearest first.
+        ``any_of`` maps a dimension to values a provider needs at least one
+        of; dimensions named in ``or_empty`` also accept providers with no
+        values (e.g. age groups, where empty means all ages). ``all_of``
+        needs every value, ``nonempty`` at least one value of any kind.
+        """
+        rows = self._band(latitude, radius_miles)
+        if rows.start >= rows.stop:
+            return self.ids[:0], np.empty(0)
+
+        lat1, lng1 = np.radians(latitude), np.radians(longitude)
+        dlat = self._lat[rows] - lat1
+        dlng = self._lng[rows] - lng1
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * self._cos_lat[rows] * np.sin(dlng / 2) ** 2
+        miles = 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+        mask = miles <= radius_miles
+        for name, values in (any_of or {}).items():
+            bitset = self.bitsets[name]
+            matches = bitset.any_of(values, rows)
+            if name in or_empty:
+                matches |= bitset.empty(rows)
+            mask &= matches
+        for name, values in (all_of or {}).items():
+            mask &= self.bitsets[name].all_of(values, rows)
+        for name in nonempty:
+            mask &= ~self.bitsets[name].empty(rows)
+
+        hits = np.flatnonzero(mask)
+        if limit is not None and len(hits) > limit:
+            hits = hits[np.argpartition(miles[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(miles[hits], kind="stable")]
+        return self.ids[rows][hits], miles[hits]
+
+
+def _provider_pk():
+    """Converts raw provider ids (UUID hex text on SQLite) to the ORM's pk values."""
+    from locations.models import ProviderV2
+
+    return ProviderV2._meta.pk.to_python
+
+
+def load_provider_geo_index(version: Any = None, using: str = "default") -> ProviderGeoIndex:
+    """Snapshot every provider with coordinates (plain SQL, any database)."""
+    from django.db import connections
+
+    from .facets import _tables
+
+    t = _tables()
+    to_pk = _provider_pk()
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f'SELECT id, latitude, longitude, therapy_types, age_groups, diagnoses_treated FROM "{t["provider"]}" '
+            "WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+        )
+        rows = cursor.fetchall()
+        cursor.execute(
+            f'SELECT pc.provider_id, c.name FROM "{t["provider_carrier"]}" pc '
+            f'JOIN "{t["carrier"]}" c ON c.id = pc.insurance_carrier_id'
+        )
+        links = cursor.fetchall()
+    carriers: Dict[Any, List[str]] = {}
+    for provider_id, name in links:
+        carriers.setdefault(to_pk(provider_id), []).append(name)
+
+    def listed(value):
+        if isinstance(value, str):  # JSON columns come back as text off PostgreSQL
+            try:
+                value = json.loads(value)
+            except ValueError:
+                return []
+        return value if isinstance(value, list) else []
+
+    ids = [to_pk(row[0]) for row in rows]
+    return ProviderGeoIndex(
+        ids,
+        [float(row[1]) for row in rows],
+        [float(row[2]) for row in rows],
+        {
+            "therapy_types": [listed(row[3]) for row in rows],
+            "age_groups": [listed(row[4]) for row in rows],
+            "diagnoses_treated": [listed(row[5]) for row in rows],
+            "insurance_carriers": [carriers.get(pk, []) for pk in ids],
+        },
+        version=version,
+    )
+
+
+# database alias -> snapshot
+_indexes: Dict[str, ProviderGeoIndex] = {}
+_lock = threading.Lock()
+
+
+def get_provider_geo_index(using: str = "default") -> ProviderGeoIndex:
+    """The process-wide snapshot, rebuilt when the provider data version changes."""
+    from .facets import provider_facet_version
+
+    version = provider_facet_version(using)
+    index = _indexes.get(using)
+    if index is None or index.version != version:
+        with _lock:
+            index = _indexes.get(using)
+            if index is None or index.version != version:
+                index = _indexes[using] = load_provider_geo_index(version, using)
+                logger.info("Loaded provider geo index: %d providers (version %s)", len(index), version)
+    return index
+
+
+def reset_provider_geo_index() -> None:
+    with _lock:
+        _indexes.clear()
+
+
+def sql_within_radius(queryset, latitude: float, longitude: float, radius_miles: float):
+    """
+    ``queryset`` narrowed in SQL: a latitude band, then the spherical law of
+    cosines on ``latitude`` / ``longitude`` (clamped for acos).
+    """
+    from django.db.models import FloatField, Value
+    from django.db.models.functions import ACos, Cast, Cos, Least, Radians, Sin
+
+    lat = Radians(Cast("latitude", FloatField()))
+    lng = Radians(Cast("longitude", FloatField()))
+    lat1, lng1 = float(np.radians(latitude)), float(np.radians(longitude))
+    cosine = Cos(Value(lat1)) * Cos(lat) * Cos(lng - Value(lng1)) + Sin(Value(lat1)) * Sin(lat)
+    delta = radius_miles / MILES_PER_DEGREE_LAT
+    return (
+        queryset.filter(
+            latitude__isnull=False,
+            longitude__isnull=False,
+            latitude__range=(latitude - delta, latitude + delta),
+        )
+        .alias(distance_miles=Value(EARTH_RADIUS_MILES) * ACos(Least(Value(1.0), cosine)))
+        .filter(distance_miles__lte=radius_miles)
+    )
+
+
+GENERIC_INSURANCE = ("insurance", "accepts insurance", "private insurance")
+PRIVATE_PAY = ("private pay", "private payment", "self pay")
+REGIONAL_CENTER_FUNDING = ("regional center", "regional center funding")
+
+
+def insurance_search_filter(index: ProviderGeoIndex, values: Sequence[str]) -> Optional[Dict[str, Any]]:
+    """
+    ``comprehensive_search``'s OR'd insurance filters as ``search`` keyword
+    arguments, or None when a value names no carrier in the index (the SQL
+    path then falls back to the legacy ``insurance_accepted`` text).
+    """
+    by_name = {name.lower(): name for name in index.bitsets["insurance_carriers"].vocabulary}
+    carriers = []
+    for value in values:
+        lowered = value.lower()
+        if lowered in GENERIC_INSURANCE:
+            return {"nonempty": ("insurance_carriers",)}  # any carrier covers the rest
+        if lowered in PRIVATE_PAY:
+            continue  # every provider accepts private pay
+        name = by_name.get("regional center" if lowered in REGIONAL_CENTER_FUNDING else lowered)
+        if name is None:
+            return None
+        carriers.append(name)
+    return {"any_of": {"insurance_carriers": carriers}} if carriers else {}
+
+
+def index_within_radius(
+    queryset,
+    latitude: float,
+    longitude: float,
+    radius_miles: float,
+    therapy_types: Sequence[str] = (),
+    age_group: Optional[str] = None,
+    insurance: Optional[Dict[str, Any]] = None,
+):
+    """
+    ``queryset`` narrowed through the in-memory index: radius plus the
+    therapy (all of), age group (that group, "All Ages" or none) and
+    insurance (see :func:`insurance_search_filter`) bitset masks. As in the
+    SQL path, a therapy or age filter matching nobody is dropped.
+    """
+    index = get_provider_geo_index(queryset.db)
+
+    def search(therapy, age):
+        kwargs: Dict[str, Any] = {"any_of": {}, "or_empty": (), "all_of": {}, "nonempty": ()}
+        if insurance:
+            kwargs["any_of"].update(insurance.get("any_of", {}))
+            kwargs["nonempty"] = insurance.get("nonempty", ())
+        if therapy:
+            kwargs["all_of"]["therapy_types"] = therapy
+        if age:
+            kwargs["any_of"]["age_groups"] = (age, "All Ages")
+            kwargs["or_empty"] = ("age_groups",)
+        ids, _ = index.search(latitude, longitude, radius_miles, **kwargs)
+        return ids
+
+    therapy = list(therapy_types)
+    if therapy and not len(search(therapy, None)):
+        therapy = []
+    ids = search(therapy, age_group)
+    if age_group and not len(ids):
+        ids = search(therapy, None)
+    return queryset.filter(id__in=list(ids))
+
+
+def filter_within_radius(queryset, latitude: float, longitude: float, radius_miles: float):
+    """
+    ``queryset`` narrowed to providers within ``radius_miles`` of the point:
+    in SQL on PostGIS, through the in-memory index otherwise.
+    """
+    from .service_areas import postgis_available
+
+    if postgis_available(queryset.db):
+        return sql_within_radius(queryset, latitude, longitude, radius_miles)
+    return index_within_radius(queryset, latitude, longitude, radius_miles)
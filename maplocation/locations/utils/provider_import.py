@@ -0,0 +1,519 @@
+"""
+Bulk provider import engine shared by the import_* management commands.
+
+Commands parse their source format (CSV, XLSX) into ``ProviderRow`` objects
+and hand them to ``ProviderImporter.run``, which:
+
+- consumes rows in chunks, so files are streamed rather than loaded whole;
+- matches each row to an existing provider by id or by (name, address),
+  falling back to ``provider_dedup_key`` (name + phone digits) so re-imports
+  don't create the duplicates the provider list later has to hide;
+- resolves insurance carriers and regional centers from in-memory maps
+  loaded once per run;
+- writes each chunk in one transaction with ``bulk_create`` /
+  ``bulk_update`` and ``ON CONFLICT DO NOTHING`` for link tables.
+
+A chunk costs a fixed handful of queries regardless of its size. A chunk
+that fails with a database error is rolled back and leaves no trace in the
+report or the run's matching state. With ``dry_run`` nothing is written or
+geocoded and the report lists the would-be creates and per-field changes.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+MATCH_ID = "id"
+MATCH_NAME_ADDRESS = "name_address"
+
+
+def provider_dedup_key(name, phone):
+    """Normalized signature used to detect duplicate ProviderV2 rows."""
+    name_key = (name or "").strip().lower()
+    phone_key = "".join(ch for ch in (phone or "") if ch.isdigit())
+    return name_key, phone_key
+
+
+@dataclass
+class ProviderRow:
+    """One parsed source row, ready to write."""
+
+    data: Dict[str, Any]
+    provider_id: Optional[str] = None
+    carriers: List[str] = field(default_factory=list)
+    regional_centers: List[str] = field(default_factory=list)
+    geocode: bool = False
+    label: str = ""
+
+    @property
+    def name(self) -> str:
+        return (self.data.get("name") or "").strip()
+
+    @property
+    def address(self) -> str:
+        return self.data.get("address") or ""
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import run (or what a dry run would have done)."""
+
+    created: List[str] = field(default_factory=list)
+    updated: Dict[str, Dict[str, Tuple[Any, Any]]] = field(default_factory=dict)
+    unchanged: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    geocoded: int = 0
+    geocode_failed: int = 0
+    carriers_created: int = 0
+    carrier_links: int = 0
+    regional_center_links: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def merge(self, other: "ImportReport") -> None:
+        """Add a chunk's outcome to this report."""
+        self.created.extend(other.created)
+        for label, changes in other.updated.items():
+            self.updated.setdefault(label, {}).update(changes)
+        for name in (
+            "unchanged",
+            "skipped",
+            "duplicates",
+            "geocoded",
+            "geocode_failed",
+            "carriers_created",
+            "carrier_links",
+            "regional_center_links",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.errors.extend(other.errors)
+
+    def diff_lines(self, limit: Optional[int] = 50) -> List[str]:
+        """Human-readable diff: creates, then field-level changes per update."""
+        lines = [f"+ {name}" for name in self.created[:limit]]
+        if limit is not None and len(self.created) > limit:
+            lines.append(f"+ ... and {len(self.created) - limit} more")
+        for count, (name, changes) in enumerate(self.updated.items()):
+            if limit is not None and count >= limit:
+                lines.append(f"~ ... and {len(self.updated) - limit} more")
+                break
+            lines.append(f"~ {name}")
+            for field_name, (old, new) in changes.items():
+                lines.append(f"    {field_name}: {_short(old)} -> {_short(new)}")
+        return lines
+
+
+def _short(value, width=60):
+    text = repr(value)
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _nonzero(value) -> bool:
+    return value is not None and Decimal(str(value)) != Decimal("0")
+
+
+class ProviderImporter:
+    """
+    Chunked, transactional upsert of ProviderV2 rows plus their carrier and
+    regional center links.
+
+    ``match`` picks how rows find existing providers: ``"id"`` for exports
+    that carry provider ids, ``"name_address"`` for third-party lists.
+    ``create=False`` only updates, ``update=False`` only creates.
+
+    With a ``geocoder``, rows flagged ``geocode`` are geocoded in one batch
+    per chunk; ``require_coordinates`` then skips those that fail. Dry runs
+    don't geocode (or skip rows for missing coordinates).
+    """
+
+    def __init__(
+        self,
+        match: str = MATCH_NAME_ADDRESS,
+        *,
+        create: bool = True,
+        update: bool = True,
+        replace_carriers: bool = False,
+        dry_run: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        geocoder=None,
+        require_coordinates: bool = False,
+        provider_model=None,
+    ):
+        self.match = match
+        self.create = create
+        self.update = update
+        self.replace_carriers = replace_carriers
+        self.dry_run = dry_run
+        self.chunk_size = chunk_size
+        self.geocoder = geocoder
+        self.require_coordinates = require_coordinates
+        if provider_model is None:
+            from locations.models import ProviderV2 as provider_model
+        self.provider_model = provider_model
+        # Carrier / regional center models, imported on first use.
+        self.models = None
+        self.report = ImportReport()
+
+        # Rows already handled this run, so later duplicates in the same file
+        # update the provider written for the earlier row.
+        self._seen: Dict[Any, Any] = {}
+        self._seen_dedup: Dict[Tuple[str, str], Any] = {}
+        # id() of providers instantiated but not yet written (all of them
+        # in a dry run), which still count as creates when seen again.
+        self._unsaved = set()
+        # id() of providers matched by the current chunk.
+        self._touched = set()
+        self._carriers: Optional[Dict[str, Any]] = None
+        self._regional_centers: Optional[List[Tuple[str, Any]]] = None
+
+    # Public ---------------------------------------------------------------
+
+    def run(self, rows: Iterable[ProviderRow]) -> ImportReport:
+        """Import ``rows`` (any iterable, consumed lazily) and return the report."""
+        report = self.report
+        for chunk in _chunks(rows, self.chunk_size):
+            seen, seen_dedup = dict(self._seen), dict(self._seen_dedup)
+            self._touched = set()
+            # Each chunk reports into its own ImportReport, merged on commit.
+            self.report = ImportReport()
+            try:
+                self._run_chunk(chunk)
+            except DatabaseError as exc:
+                self._rollback_state(seen, seen_dedup)
+                first = chunk[0].label or chunk[0].name
+                report.errors.append(f"Chunk starting at {first!r} rolled back: {exc}")
+                logger.exception("Provider import chunk failed")
+            else:
+                report.merge(self.report)
+            finally:
+                self.report = report
+        if not self.dry_run and (
+            report.created or report.updated or report.carrier_links or report.regional_center_links
+        ):
+            # bulk_create/bulk_update skip the signals that invalidate facets.
+            from .facets import bump_provider_facets
+
+            bump_provider_facets()
+        return self.report
+
+    def _rollback_state(self, seen, seen_dedup):
+        """
+        Forget what a rolled-back chunk did: providers it created or
+        modified are dropped from the matching state (so later chunks reload
+        them from the database), and carriers it created are reloaded.
+        """
+        touched = self._touched
+        self._seen = {key: p for key, p in seen.items() if id(p) not in touched}
+        self._seen_dedup = {key: p for key, p in seen_dedup.items() if id(p) not in touched}
+        self._unsaved -= touched
+        self._carriers = None
+
+    # Chunk pipeline -------------------------------------------------------
+
+    def _run_chunk(self, chunk: List[ProviderRow]):
+        self._geocode(chunk)
+        existing = self._load_existing(chunk)
+
+        to_create: Dict[int, Any] = {}
+        to_update: Dict[int, Any] = {}
+        changed_fields = set()
+        links: List[Tuple[Any, ProviderRow]] = []
+
+        for row in chunk:
+            if not row.name:
+                self.report.skipped += 1
+                continue
+            if self.require_coordinates and row.geocode and not self.dry_run and not (
+                _nonzero(row.data.get("latitude")) and _nonzero(row.data.get("longitude"))
+            ):
+                self.report.skipped += 1
+                continue
+
+            provider, is_new = self._resolve(row, existing)
+            if provider is None:
+                self.report.skipped += 1
+                continue
+
+            if id(provider) in to_create or id(provider) in to_update:
+                self.report.duplicates += 1
+            label = f"{row.name} ({row.address})" if row.address else row.name
+
+            if is_new:
+                for key, value in row.data.items():
+                    setattr(provider, key, value)
+                self._sync_location(provider, row.data)
+                if id(provider) not in to_create:
+                    self.report.created.append(label)
+                to_create[id(provider)] = provider
+            else:
+                changes = self._apply(provider, row.data)
+                if changes:
+                    self.report.updated.setdefault(label, {}).update(changes)
+                    changed_fields.update(changes)
+                    to_update[id(provider)] = provider
+                elif id(provider) not in to_update:
+                    self.report.unchanged += 1
+
+            self._remember(row, provider)
+            self._touched.add(id(provider))
+            links.append((provider, row))
+
+        if self.dry_run:
+            if any(row.carriers or row.regional_centers for _, row in links):
+                self._count_links(links)
+            return
+
+        with transaction.atomic():
+            if to_create:
+                self.provider_model.objects.bulk_create(
+                    list(to_create.values()), batch_size=self.chunk_size
+                )
+            if to_update:
+                now = timezone.now()
+                for provider in to_update.values():
+                    provider.updated_at = now
+                self.provider_model.objects.bulk_update(
+                    list(to_update.values()),
+                    sorted(changed_fields | {"updated_at"}),
+                    batch_size=self.chunk_size,
+                )
+            if any(row.carriers for _, row in links):
+                self._write_carrier_links(links)
+            if any(row.regional_centers for _, row in links):
+                self._write_regional_center_links(links)
+        self._unsaved.clear()
+
+    def _geocode(self, chunk: List[ProviderRow]):
+        if not self.geocoder or self.dry_run:
+            return
+        wanted = [row for row in chunk if row.geocode and row.address]
+        if not wanted:
+            return
+        results = self.geocoder.geocode_many(row.address for row in wanted)
+        for row in wanted:
+            result = results.get(row.address)
+            if result is None:
+                self.report.geocode_failed += 1
+                continue
+            row.data["latitude"], row.data["longitude"] = result.as_decimal()
+            self.report.geocoded += 1
+
+    def _load_existing(self, chunk: List[ProviderRow]) -> Dict[str, Dict]:
+        """One query: candidate providers for every row in the chunk."""
+        manager = self.provider_model.objects
+        by_id, by_name_address, by_dedup = {}, {}, {}
+        if self.match == MATCH_ID:
+            ids = {row.provider_id for row in chunk if row.provider_id}
+            queryset = manager.filter(id__in=ids) if ids else []
+        else:
+            names = {row.name for row in chunk if row.name}
+            queryset = manager.filter(name__in=names) if names else []
+        if hasattr(queryset, "defer"):
+            queryset = queryset.defer("embedding")
+        for provider in queryset:
+            by_id[str(provider.id)] = provider
+            by_name_address.setdefault((provider.name, provider.address or ""), provider)
+            key = provider_dedup_key(provider.name, provider.phone)
+            if key[1]:
+                by_dedup.setdefault(key, provider)
+        return {"id": by_id, "name_address": by_name_address, "dedup": by_dedup}
+
+    def _resolve(self, row: ProviderRow, existing: Dict[str, Dict]):
+        """Return ``(provider, is_new)``; provider is None when the row is skipped."""
+        if self.match == MATCH_ID:
+            key = str(row.provider_id) if row.provider_id else None
+            provider = self._seen.get(key) or existing["id"].get(key)
+        else:
+            key = (row.name, row.address)
+            provider = self._seen.get(key) or existing["name_address"].get(key)
+        if provider is None:
+            dedup = provider_dedup_key(row.name, row.data.get("phone"))
+            if dedup[1]:
+                provider = self._seen_dedup.get(dedup) or existing["dedup"].get(dedup)
+        if provider is not None:
+            is_new = id(provider) in self._unsaved
+            if not is_new and not self.update:
+                return None, False
+            return provider, is_new
+        if not self.create:
+            return None, False
+        provider = self.provider_model(id=row.provider_id) if row.provider_id else self.provider_model()
+        self._unsaved.add(id(provider))
+        return provider, True
+
+    def _remember(self, row: ProviderRow, provider):
+        key = str(row.provider_id or provider.id) if self.match == MATCH_ID else (row.name, row.address)
+        self._seen[key] = provider
+        dedup = provider_dedup_key(provider.name, provider.phone)
+        if dedup[1]:
+            self._seen_dedup[dedup] = provider
+
+    def _apply(self, provider, data: Dict[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+        """Assign ``data`` to an existing provider; return ``{field: (old, new)}``."""
+        changes = {}
+        for key, value in data.items():
+            old = getattr(provider, key, None)
+            if old != value:
+                changes[key] = (old, value)
+                setattr(provider, key, value)
+        changes.update(self._sync_location(provider, data))
+        return changes
+
+    @staticmethod
+    def _sync_location(provider, data: Dict[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Keep latitude/longitude and the PostGIS point in step, as
+        ``ProviderV2.save`` does, since bulk writes bypass ``save``.
+        """
+        changes = {}
+        location = data.get("location")
+        if location is not None:
+            latitude, longitude = Decimal(str(location.y)), Decimal(str(location.x))
+            for key, value in (("latitude", latitude), ("longitude", longitude)):
+                if getattr(provider, key, None) != value:
+                    changes[key] = (getattr(provider, key, None), value)
+                    setattr(provider, key, value)
+            return changes
+        if "latitude" in data or "longitude" in data or getattr(provider, "location", None) is None:
+            latitude, longitude = getattr(provider, "latitude", None), getattr(provider, "longitude", None)
+            if _nonzero(latitude) and _nonzero(longitude):
+                from django.contrib.gis.geos import Point
+
+                point = Point(float(longitude), float(latitude), srid=4326)
+                old = getattr(provider, "location", None)
+                if old is None or (old.x, old.y) != (point.x, point.y):
+                    changes["location"] = (old, point)
+                    provider.location = point
+        return changes
+
+    # Links ----------------------------------------------------------------
+
+    def _models(self):
+        if self.models is None:
+            from locations import models
+
+            self.models = models
+        return self.models
+
+    def _carrier_map(self) -> Dict[str, Any]:
+        if self._carriers is None:
+            self._carriers = {
+                carrier.name.lower(): carrier
+                for carrier in self._models().InsuranceCarrier.objects.all()
+            }
+        return self._carriers
+
+    def _regional_center_list(self) -> List[Tuple[str, Any]]:
+        if self._regional_centers is None:
+            self._regional_centers = [
+                ((center.regional_center or "").lower(), center)
+                for center in self._models().RegionalCenter.objects.only("id", "regional_center")
+            ]
+        return self._regional_centers
+
+    def resolve_regional_center(self, name):
+        """
+        A RegionalCenter instance is returned as is; a name resolves by exact
+        (case-insensitive) match, else the first center containing it.
+        """
+        if hasattr(name, "pk"):
+            return name
+        needle = (name or "").strip().lower()
+        if not needle:
+            return None
+        centers = self._regional_center_list()
+        for center_name, center in centers:
+            if center_name == needle:
+                return center
+        for center_name, center in centers:
+            if needle in center_name:
+                return center
+        return None
+
+    def _count_links(self, links):
+        carriers = self._carrier_map()
+        new_names = {
+            name.lower()
+            for _, row in links
+            for name in row.carriers
+            if name.lower() not in carriers
+        }
+        self.report.carriers_created += len(new_names)
+        self.report.carrier_links += sum(len(row.carriers) for _, row in links)
+        self.report.regional_center_links += sum(len(row.regional_centers) for _, row in links)
+
+    def _write_carrier_links(self, links):
+        carriers = self._carrier_map()
+        InsuranceCarrier = self._models().InsuranceCarrier
+        ProviderInsuranceCarrier = self._models().ProviderInsuranceCarrier
+
+        missing = {}
+        for _, row in links:
+            for name in row.carriers:
+                if name.lower() not in carriers:
+                    missing.setdefault(name.lower(), name)
+        if missing:
+            InsuranceCarrier.objects.bulk_create(
+                [InsuranceCarrier(name=name, description="Imported from CSV") for name in missing.values()],
+                ignore_conflicts=True,
+            )
+            for carrier in InsuranceCarrier.objects.filter(name__in=list(missing.values())):
+                carriers[carrier.name.lower()] = carrier
+            self.report.carriers_created += len(missing)
+
+        if self.replace_carriers:
+            replaced = [provider.pk for provider, row in links if row.carriers]
+            if replaced:
+                ProviderInsuranceCarrier.objects.filter(provider_id__in=replaced).delete()
+
+        rows = {
+            (provider.pk, carriers[name.lower()].pk)
+            for provider, row in links
+            for name in row.carriers
+            if name.lower() in carriers
+        }
+        if rows:
+            ProviderInsuranceCarrier.objects.bulk_create(
+                [
+                    ProviderInsuranceCarrier(provider_id=provider_id, insurance_carrier_id=carrier_id)
+                    for provider_id, carrier_id in rows
+                ],
+                ignore_conflicts=True,
+            )
+        self.report.carrier_links += len(rows)
+
+    def _write_regional_center_links(self, links):
+        ProviderRegionalCenter = self._models().ProviderRegionalCenter
+        rows = set()
+        for provider, row in links:
+            for name in row.regional_centers:
+                center = self.resolve_regional_center(name)
+                if center is not None:
+                    rows.add((provider.pk, center.pk))
+        if rows:
+            ProviderRegionalCenter.objects.bulk_create(
+                [
+                    ProviderRegionalCenter(provider_id=provider_id, regional_center_id=center_id)
+                    for provider_id, center_id in rows
+                ],
+                ignore_conflicts=True,
+            )
+        self.report.regional_center_links += len(rows)
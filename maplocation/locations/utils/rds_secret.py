@@ -43,3 +43,24 @@ def get_rds_settings(secret_id: str = DEFAULT_SECRET_ID, *, use_postgis: bool =
         "PORT": str(blob["port"]),
         "OPTIONS": {"sslmode": blob.get("sslmode", "require")},
     }
+
+
+def register_rds_connection(alias: str = "rds", *, use_postgis: bool = False) -> str:
+    """Add production RDS to django.db.connections under ``alias``.
+
+    Connection behaviour (autocommit, timeouts, TZ) is copied from the
+    ``default`` database so both sides of a sync behave the same.
+    """
+    from django.db import connections
+
+    default_db = connections["default"].settings_dict
+    connections.databases[alias] = {
+        **get_rds_settings(use_postgis=use_postgis),
+        "ATOMIC_REQUESTS": default_db.get("ATOMIC_REQUESTS", False),
+        "AUTOCOMMIT": default_db.get("AUTOCOMMIT", True),
+        "CONN_MAX_AGE": default_db.get("CONN_MAX_AGE", 0),
+        "CONN_HEALTH_CHECKS": default_db.get("CONN_HEALTH_CHECKS", False),
+        "TIME_ZONE": default_db.get("TIME_ZONE", None),
+        "TEST": default_db.get("TEST", {}),
+    }
+    return alias
@@ -0,0 +1,359 @@
+"""
+Build regional center service areas from ZIP (ZCTA) boundary polygons.
+
+``load_zip_boundaries`` loads Census ZCTA polygons into ``zip_boundary``
+once. ``ServiceAreaBuilder`` then unions each center's ``zip_codes``
+in PostGIS (one grouped ``ST_Union`` over all centers, staged in a temp
+table). In the same transaction it writes ``service_area`` for every
+center with one UPDATE, plus ``service_area_simplified`` at each
+tolerance. The map uses those simplified variants at low zoom.
+
+The staged unions also give the coverage diagnostics reported by
+``generate_service_areas`` and ``audit_zip_coverage --boundaries``:
+ZIPs listed by several centers, listed ZIPs without a boundary, polygon
+overlaps between centers, and gaps (holes in the combined coverage and
+the unassigned ZIPs inside them).
+"""
+
+import io
+import json
+import logging
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .gazetteer import CA_ZIP_PREFIXES
+
+logger = logging.getLogger(__name__)
+
+# Degrees; roughly 50 m, 200 m and 1 km at LA's latitude.
+DEFAULT_TOLERANCES = (0.0005, 0.002, 0.01)
+# Overlaps and holes smaller than this (km²) are digitizing slivers.
+MIN_DIAGNOSTIC_AREA_KM2 = 0.05
+CHUNK_SIZE = 500
+
+# ZCTA code property across Census vintages and common conversions.
+ZCTA_PROPERTIES = ("ZCTA5CE20", "ZCTA5CE10", "GEOID20", "GEOID10", "ZCTA5", "zip_code", "ZIP")
+
+STAGE_TABLE = "_service_area_stage"
+# RegionalCenterViewSet.service_area_boundaries response, per tolerance key.
+BOUNDARIES_CACHE_KEY = "regional_centers_service_area_boundaries:{}"
+
+
+def tolerance_key(tolerance: float) -> str:
+    """Key used in ``service_area_simplified``: 0.002 -> '0.002'."""
+    return f"{tolerance:g}"
+
+
+# ---------------------------------------------------------------------------
+# ZCTA boundary loading
+# ---------------------------------------------------------------------------
+
+
+def open_geojson(path: str) -> dict:
+    """Read a GeoJSON FeatureCollection from ``.geojson``/``.json`` or a ``.zip`` holding one."""
+    if path.lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            member = next(
+                (n for n in archive.namelist() if n.lower().endswith((".geojson", ".json"))),
+                None,
+            )
+            if member is None:
+                raise ValueError(f"No .geojson file in {path}")
+            with archive.open(member) as fh:
+                return json.load(io.TextIOWrapper(fh, encoding="utf-8"))
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def read_zcta_features(
+    data: dict, prefixes: Sequence[str] = CA_ZIP_PREFIXES
+) -> Iterator[Tuple[str, dict]]:
+    """``(zip_code, geometry)`` for each polygonal ZCTA feature whose code starts with a prefix."""
+    prefixes = tuple(prefixes)
+    for feature in data.get("features", []):
+        props = feature.get("properties") or {}
+        code = next((str(props[p]) for p in ZCTA_PROPERTIES if props.get(p)), None)
+        geometry = feature.get("geometry") or {}
+        if not code or geometry.get("type") not in ("Polygon", "MultiPolygon"):
+            continue
+        code = code.zfill(5)
+        if prefixes and not code.startswith(prefixes):
+            continue
+        yield code, geometry
+
+
+def upsert_zip_boundaries(
+    rows: Iterable[Tuple[str, dict]], using: str = "default", chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Insert or replace ``zip_boundary`` rows. Geometry is parsed by PostGIS
+    (``ST_GeomFromGeoJSON`` over a JSON recordset), one statement per chunk.
+    """
+    from django.db import connections, transaction
+
+    sql = """
+        INSERT INTO zip_boundary (zip_code, geom, updated_at)
+        SELECT t.zip_code,
+               ST_Multi(ST_CollectionExtract(ST_MakeValid(
+                   ST_SetSRID(ST_GeomFromGeoJSON(t.geometry), 4326)), 3)),
+               now()
+        FROM jsonb_to_recordset(%s::jsonb) AS t(zip_code text, geometry text)
+        ON CONFLICT (zip_code) DO UPDATE
+            SET geom = EXCLUDED.geom, updated_at = EXCLUDED.updated_at
+    """
+    total = 0
+    batch: List[dict] = []
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        for zip_code, geometry in rows:
+            batch.append({"zip_code": zip_code, "geometry": json.dumps(geometry)})
+            if len(batch) >= chunk_size:
+                cursor.execute(sql, [json.dumps(batch)])
+                total += len(batch)
+                batch = []
+        if batch:
+            cursor.execute(sql, [json.dumps(batch)])
+            total += len(batch)
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Diagnostics
+# ---------------------------------------------------------------------------
+
+
+def find_duplicate_zips(center_zips: Mapping[str, Iterable[str]]) -> Dict[str, List[str]]:
+    """ZIP -> names of the centers listing it, for ZIPs listed by more than one center."""
+    by_zip: Dict[str, List[str]] = {}
+    for name, zips in center_zips.items():
+        for zip_code in set(zips or []):
+            by_zip.setdefault(zip_code, []).append(name)
+    return {z: sorted(names) for z, names in sorted(by_zip.items()) if len(names) > 1}
+
+
+@dataclass
+class CoverageReport:
+    """What a build produced (or would produce) and where coverage is inconsistent."""
+
+    source: str = "zip_codes"
+    dry_run: bool = False
+    # center name -> number of ZIP polygons unioned
+    built: Dict[str, int] = field(default_factory=dict)
+    # centers whose listed ZIPs have no boundary at all
+    empty: List[str] = field(default_factory=list)
+    # center name -> listed ZIPs with no row in zip_boundary
+    missing_boundaries: Dict[str, List[str]] = field(default_factory=dict)
+    duplicate_zips: Dict[str, List[str]] = field(default_factory=dict)
+    # (center, center, km²)
+    overlaps: List[Tuple[str, str, float]] = field(default_factory=list)
+    # (km², unassigned ZIPs inside the hole)
+    gaps: List[Tuple[float, List[str]]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing_boundaries or self.duplicate_zips or self.overlaps or self.gaps)
+
+    def lines(self, limit: int = 20) -> List[str]:
+        out = []
+        if self.built:
+            out.append(f"Service areas from {self.source}: {len(self.built)} centers")
+            for name, count in sorted(self.built.items()):
+                out.append(f"  {name}: {count} ZIP polygons" if self.source == "zip_codes" else f"  {name}")
+        if self.empty:
+            out.append(f"Centers with no ZIP boundaries: {', '.join(sorted(self.empty))}")
+        for name, zips in sorted(self.missing_boundaries.items()):
+            shown = ", ".join(zips[:limit]) + (" ..." if len(zips) > limit else "")
+            out.append(f"No boundary for {len(zips)} ZIPs of {name}: {shown}")
+        if self.duplicate_zips:
+            out.append(f"ZIPs listed by more than one center: {len(self.duplicate_zips)}")
+            for zip_code, names in list(self.duplicate_zips.items())[:limit]:
+                out.append(f"  {zip_code}: {', '.join(names)}")
+        if self.overlaps:
+            out.append(f"Overlapping service areas: {len(self.overlaps)}")
+            for a, b, km2 in self.overlaps[:limit]:
+                out.append(f"  {a} / {b}: {km2:.2f} km²")
+        if self.gaps:
+            out.append(f"Coverage gaps: {len(self.gaps)}")
+            for km2, zips in self.gaps[:limit]:
+                detail = f" (unassigned ZIPs: {', '.join(zips)})" if zips else ""
+                out.append(f"  {km2:.2f} km²{detail}")
+        if self.ok:
+            out.append("No overlaps, gaps, duplicate or unmapped ZIPs")
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Builder
+# ---------------------------------------------------------------------------
+
+
+class ServiceAreaBuilder:
+    """Union ZIP boundaries into ``RegionalCenter.service_area`` for all centers at once."""
+
+    def __init__(
+        self,
+        tolerances: Sequence[float] = DEFAULT_TOLERANCES,
+        using: str = "default",
+        min_area_km2: float = MIN_DIAGNOSTIC_AREA_KM2,
+    ):
+        self.tolerances = tuple(sorted(tolerances))
+        self.using = using
+        self.min_area_km2 = min_area_km2
+
+    def build(self, center_ids: Optional[Sequence[int]] = None, dry_run: bool = False) -> CoverageReport:
+        """
+        Union every selected center's ZIP polygons and, unless ``dry_run``,
+        write ``service_area`` / ``service_area_simplified`` in one transaction.
+        Centers whose ZIPs have no boundaries keep their current geometry.
+        """
+        from django.db import connections, transaction
+
+        report = CoverageReport(source="zip_codes", dry_run=dry_run)
+        with transaction.atomic(using=self.using), connections[self.using].cursor() as cursor:
+            self._stage_unions(cursor, center_ids)
+            self._diagnose(cursor, report)
+            if not dry_run:
+                self._write(cursor)
+            cursor.execute(f"DROP TABLE {STAGE_TABLE}")
+
+        if not dry_run:
+            from django.core.cache import cache
+
+            from .service_areas import reset_service_area_index
+
+            reset_service_area_index()
+            keys = {tolerance_key(t) for t in DEFAULT_TOLERANCES + self.tolerances}
+            cache.delete_many([BOUNDARIES_CACHE_KEY.format(k) for k in keys])
+        return report
+
+    def audit(self) -> CoverageReport:
+        """Diagnostics for the service areas currently stored on the centers."""
+        from django.db import connections, transaction
+
+        report = CoverageReport(source="service_area", dry_run=True)
+        with transaction.atomic(using=self.using), connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE {STAGE_TABLE} ON COMMIT DROP AS
+                SELECT id AS center_id, service_area::geometry AS geom,
+                       0 AS matched, NULL::text[] AS missing
+                FROM regional_centers
+                WHERE service_area IS NOT NULL
+                """
+            )
+            self._diagnose(cursor, report)
+            cursor.execute(f"DROP TABLE {STAGE_TABLE}")
+        return report
+
+    def _stage_unions(self, cursor, center_ids):
+        where, params = "", []
+        if center_ids:
+            where, params = "AND rc.id = ANY(%s)", [list(center_ids)]
+        cursor.execute(
+            f"""
+            CREATE TEMP TABLE {STAGE_TABLE} ON COMMIT DROP AS
+            SELECT m.center_id,
+                   ST_Multi(ST_CollectionExtract(ST_MakeValid(ST_Union(b.geom)), 3)) AS geom,
+                   count(b.zip_code) AS matched,
+                   array_agg(m.zip_code ORDER BY m.zip_code)
+                       FILTER (WHERE b.zip_code IS NULL) AS missing
+            FROM (
+                SELECT DISTINCT rc.id AS center_id, z.zip_code
+                FROM regional_centers rc
+                CROSS JOIN LATERAL jsonb_array_elements_text(rc.zip_codes) AS z(zip_code)
+                WHERE jsonb_typeof(rc.zip_codes) = 'array' {where}
+            ) m
+            LEFT JOIN zip_boundary b ON b.zip_code = m.zip_code
+            GROUP BY m.center_id
+            """,
+            params,
+        )
+
+    def _write(self, cursor):
+        simplified = ", ".join(
+            "%s, ST_AsGeoJSON(ST_SimplifyPreserveTopology(s.geom, %s), 6)::jsonb"
+            for _ in self.tolerances
+        )
+        params = []
+        for tolerance in self.tolerances:
+            params.extend([tolerance_key(tolerance), tolerance])
+        cursor.execute(
+            f"""
+            UPDATE regional_centers rc
+            SET service_area = s.geom::geography,
+                service_area_simplified = jsonb_build_object({simplified})
+            FROM {STAGE_TABLE} s
+            WHERE rc.id = s.center_id AND s.geom IS NOT NULL AND NOT ST_IsEmpty(s.geom)
+            """,
+            params,
+        )
+        logger.info("Wrote service areas for %d regional centers", cursor.rowcount)
+
+    def _diagnose(self, cursor, report: CoverageReport):
+        from locations.models import RegionalCenter
+
+        names = {}
+        center_zips = {}
+        for pk, name, zips in RegionalCenter.objects.using(self.using).values_list(
+            "id", "regional_center", "zip_codes"
+        ):
+            names[pk] = name
+            if isinstance(zips, list):
+                center_zips[f"{name} (#{pk})"] = zips
+        report.duplicate_zips = find_duplicate_zips(center_zips)
+
+        cursor.execute(
+            f"SELECT center_id, geom IS NULL OR ST_IsEmpty(geom), matched, missing FROM {STAGE_TABLE}"
+        )
+        for center_id, empty, matched, missing in cursor.fetchall():
+            name = names.get(center_id, f"#{center_id}")
+            if empty:
+                report.empty.append(name)
+            else:
+                report.built[name] = matched
+            if missing:
+                report.missing_boundaries[name] = list(missing)
+
+        cursor.execute(
+            f"""
+            SELECT a.center_id, b.center_id,
+                   ST_Area(ST_Intersection(a.geom, b.geom)::geography) / 1e6 AS km2
+            FROM {STAGE_TABLE} a
+            JOIN {STAGE_TABLE} b
+              ON a.center_id < b.center_id
+             AND a.geom && b.geom
+             AND ST_Relate(a.geom, b.geom, '2********')
+            ORDER BY km2 DESC
+            """
+        )
+        report.overlaps = [
+            (names.get(a, f"#{a}"), names.get(b, f"#{b}"), km2)
+            for a, b, km2 in cursor.fetchall()
+            if km2 >= self.min_area_km2
+        ]
+
+        cursor.execute(
+            f"""
+            WITH coverage AS (
+                SELECT ST_Union(geom) AS geom FROM {STAGE_TABLE}
+                WHERE geom IS NOT NULL AND NOT ST_IsEmpty(geom)
+            ),
+            parts AS (SELECT (ST_Dump(geom)).geom AS geom FROM coverage),
+            holes AS (
+                SELECT ST_MakePolygon(ST_InteriorRingN(p.geom, n)) AS geom
+                FROM parts p, generate_series(1, ST_NumInteriorRings(p.geom)) AS n
+            )
+            SELECT ST_Area(h.geom::geography) / 1e6 AS km2,
+                   ARRAY(
+                       SELECT zb.zip_code FROM zip_boundary zb
+                       WHERE zb.geom && h.geom
+                         AND ST_Within(ST_PointOnSurface(zb.geom), h.geom)
+                       ORDER BY zb.zip_code
+                   )
+            FROM holes h
+            ORDER BY km2 DESC
+            """
+        )
+        report.gaps = [
+            (km2, list(zips)) for km2, zips in cursor.fetchall() if km2 >= self.min_area_km2
+        ]
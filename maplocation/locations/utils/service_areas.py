@@ -0,0 +1,507 @@
+"""
+Point-in-polygon regional center lookup against ``RegionalCenter.service_area``.
+
+Two interchangeable paths:
+
+- PostGIS: ``ST_Intersects`` against the GiST-indexed ``service_area``
+  column (migration 0035). Single points go through the ORM; batches of
+  points and the provider -> regional center assignment are one spatial
+  join each.
+- In-process: when the database is not PostGIS (SQLite dev DB, GIS libs
+  unavailable) service areas are loaded once into a ``ServiceAreaIndex``,
+  an STR-packed R-tree over polygon bounding boxes with an exact
+  ray-casting test on the candidates. Polygons come from ``ST_AsGeoJSON``
+  when possible, otherwise from the GeoJSON file named by
+  ``settings.SERVICE_AREAS_GEOJSON`` (features matched to centers by name).
+
+Several overlapping areas can contain a point; matches are ordered by
+distance to each center's office.
+"""
+
+import json
+import logging
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (min_x, min_y, max_x, max_y) in lng/lat degrees
+BBox = Tuple[float, float, float, float]
+Ring = Sequence[Sequence[float]]
+Polygon = Sequence[Ring]
+
+NODE_CAPACITY = 8
+# Feature properties tried, in order, for a regional center name.
+NAME_PROPERTIES = ("regional_center", "REGIONALCENTER", "name", "NAME")
+CHUNK_SIZE = 1000
+
+
+# ---------------------------------------------------------------------------
+# Geometry
+# ---------------------------------------------------------------------------
+
+
+def geometry_polygons(geometry: Dict[str, Any]) -> List[Polygon]:
+    """Polygons of a GeoJSON Polygon / MultiPolygon / GeometryCollection."""
+    if not geometry:
+        return []
+    kind = geometry.get("type")
+    if kind == "Polygon":
+        return [geometry["coordinates"]]
+    if kind == "MultiPolygon":
+        return list(geometry["coordinates"])
+    if kind == "GeometryCollection":
+        return [p for g in geometry.get("geometries", []) for p in geometry_polygons(g)]
+    return []
+
+
+def ring_contains(ring: Ring, x: float, y: float) -> bool:
+    """Even-odd ray casting test for one linear ring (closed or not)."""
+    inside = False
+    xj, yj = ring[-1][0], ring[-1][1]
+    for pt in ring:
+        xi, yi = pt[0], pt[1]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        xj, yj = xi, yi
+    return inside
+
+
+def polygon_contains(polygon: Polygon, x: float, y: float) -> bool:
+    """Inside the exterior ring and outside every hole."""
+    if not polygon or not ring_contains(polygon[0], x, y):
+        return False
+    return not any(ring_contains(hole, x, y) for hole in polygon[1:])
+
+
+def polygons_bbox(polygons: Sequence[Polygon]) -> BBox:
+    xs = [pt[0] for polygon in polygons for pt in polygon[0]]
+    ys = [pt[1] for polygon in polygons for pt in polygon[0]]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _bbox_contains(bbox: BBox, x: float, y: float) -> bool:
+    return bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3]
+
+
+def _merge(boxes: Iterable[BBox]) -> BBox:
+    boxes = list(boxes)
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    )
+
+
+class STRtree:
+    """
+    Static R-tree bulk-loaded with Sort-Tile-Recursive packing.
+
+    ``entries`` are ``(bbox, item)``; ``query_point`` returns the items
+    whose bbox contains the point, touching O(log n) nodes.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[BBox, Any]], node_capacity: int = NODE_CAPACITY):
+        self.node_capacity = max(2, node_capacity)
+        level = [(bbox, item, None) for bbox, item in entries]
+        self._size = len(level)
+        while len(level) > self.node_capacity:
+            level = self._pack(level)
+        self._root = (_merge(n[0] for n in level), None, level) if level else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _pack(self, nodes):
+        cap = self.node_capacity
+        leaves = math.ceil(len(nodes) / cap)
+        slice_count = math.ceil(math.sqrt(leaves))
+        slice_size = slice_count * cap
+
+        def cx(node):
+            return node[0][0] + node[0][2]
+
+        def cy(node):
+            return node[0][1] + node[0][3]
+
+        parents = []
+        by_x = sorted(nodes, key=cx)
+        for s in range(0, len(by_x), slice_size):
+            column = sorted(by_x[s : s + slice_size], key=cy)
+            for g in range(0, len(column), cap):
+                children = column[g : g + cap]
+                parents.append((_merge(c[0] for c in children), None, children))
+        return parents
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        if self._root is None or not _bbox_contains(self._root[0], x, y):
+            return []
+        hits = []
+        stack = [self._root]
+        while stack:
+            _, item, children = stack.pop()
+            if children is None:
+                hits.append(item)
+                continue
+            stack.extend(c for c in children if _bbox_contains(c[0], x, y))
+        return hits
+
+
+@dataclass
+class ServiceArea:
+    center_id: int
+    polygons: List[Polygon]
+    center: Optional[Tuple[float, float]] = None  # office (lat, lng)
+    bbox: BBox = field(init=False)
+
+    def __post_init__(self):
+        self.bbox = polygons_bbox(self.polygons)
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        return any(polygon_contains(p, longitude, latitude) for p in self.polygons)
+
+
+class ServiceAreaIndex:
+    """In-process point-in-service-area lookup (the non-PostGIS path)."""
+
+    def __init__(self, areas: Iterable[ServiceArea]):
+        self.areas: Dict[int, ServiceArea] = {}
+        entries = []
+        for area in areas:
+            self.areas[area.center_id] = area
+            # One tree entry per polygon keeps the boxes of far-flung
+            # multipolygon parts (islands, exclaves) tight.
+            for polygon in area.polygons:
+                entries.append((polygons_bbox([polygon]), (area, polygon)))
+        self._tree = STRtree(entries)
+
+    def __len__(self) -> int:
+        return len(self.areas)
+
+    def locate(self, latitude: float, longitude: float) -> List[int]:
+        """Ids of the centers whose service area contains the point, nearest office first."""
+        found = {}
+        for area, polygon in self._tree.query_point(longitude, latitude):
+            if area.center_id not in found and polygon_contains(polygon, longitude, latitude):
+                found[area.center_id] = area
+        return [
+            area.center_id
+            for area in sorted(found.values(), key=lambda a: _office_distance(a, latitude, longitude))
+        ]
+
+    def locate_many(self, points: Iterable[Tuple[float, float]]) -> List[List[int]]:
+        return [self.locate(lat, lng) for lat, lng in points]
+
+    @classmethod
+    def from_geojson(cls, data: Dict[str, Any], centers: Dict[str, Tuple[int, Any]]) -> "ServiceAreaIndex":
+        """
+        Build from a FeatureCollection. ``centers`` maps a lowercased center
+        name to ``(id, (lat, lng) or None)``; unmatched features are skipped.
+        """
+        areas = []
+        for feature in data.get("features", []):
+            props = feature.get("properties") or {}
+            name = next((props[p] for p in NAME_PROPERTIES if props.get(p)), None)
+            polygons = geometry_polygons(feature.get("geometry"))
+            match = centers.get(str(name).strip().lower()) if name else None
+            if not match or not polygons:
+                logger.debug("Skipping service area feature %r", name)
+                continue
+            areas.append(ServiceArea(match[0], polygons, match[1]))
+        return cls(areas)
+
+
+def _office_distance(area: ServiceArea, latitude: float, longitude: float) -> float:
+    if not area.center:
+        return math.inf
+    dlat = area.center[0] - latitude
+    dlng = (area.center[1] - longitude) * math.cos(math.radians(latitude))
+    return dlat * dlat + dlng * dlng
+
+
+# ---------------------------------------------------------------------------
+# Database paths
+# ---------------------------------------------------------------------------
+
+
+def postgis_available(using: str = "default") -> bool:
+    from django.db import connections
+
+    return bool(getattr(connections[using].ops, "postgis", False))
+
+
+def _center_offices() -> Dict[int, Optional[Tuple[float, float]]]:
+    from locations.models import RegionalCenter
+
+    return {
+        pk: (lat, lng) if lat is not None and lng is not None else None
+        for pk, lat, lng in RegionalCenter.objects.values_list("id", "latitude", "longitude")
+    }
+
+
+def load_service_area_index() -> ServiceAreaIndex:
+    """Service areas from ``ST_AsGeoJSON`` (PostGIS) or ``SERVICE_AREAS_GEOJSON``."""
+    from django.conf import settings
+    from django.db import DatabaseError, connection
+
+    offices = _center_offices()
+    if postgis_available():
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id, ST_AsGeoJSON(service_area) FROM regional_centers "
+                    "WHERE service_area IS NOT NULL"
+                )
+                areas = [
+                    ServiceArea(pk, geometry_polygons(json.loads(geojson)), offices.get(pk))
+                    for pk, geojson in cursor.fetchall()
+                ]
+            return ServiceAreaIndex(a for a in areas if a.polygons)
+        except DatabaseError as exc:
+            logger.warning("Could not load service areas from PostGIS: %s", exc)
+
+    path = getattr(settings, "SERVICE_AREAS_GEOJSON", "")
+    if not path:
+        logger.warning("No PostGIS and SERVICE_AREAS_GEOJSON unset; service area lookups disabled")
+        return ServiceAreaIndex([])
+
+    from locations.models import RegionalCenter
+
+    centers = {
+        name.strip().lower(): (pk, offices.get(pk))
+        for pk, name in RegionalCenter.objects.values_list("id", "regional_center")
+    }
+    with open(path, encoding="utf-8") as fh:
+        return ServiceAreaIndex.from_geojson(json.load(fh), centers)
+
+
+_index: Optional[ServiceAreaIndex] = None
+_lock = threading.Lock()
+
+
+def get_service_area_index() -> ServiceAreaIndex:
+    """Process-wide service area index, loaded on first use."""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = load_service_area_index()
+                logger.info("Loaded %d regional center service areas", len(_index))
+    return _index
+
+
+def reset_service_area_index() -> None:
+    """Drop the cached index so the next lookup reloads it (after editing service areas)."""
+    global _index
+    with _lock:
+        _index = None
+
+
+def _points_values(points: Sequence[Tuple[float, float]]) -> Tuple[str, List[float]]:
+    rows = ", ".join(["(%s, %s::float8, %s::float8)"] * len(points))
+    params = []
+    for i, (lat, lng) in enumerate(points):
+        params.extend([i, lng, lat])
+    return rows, params
+
+
+def classify_points(points: Sequence[Tuple[float, float]]) -> List[List[int]]:
+    """
+    Regional center ids serving each ``(lat, lng)``, nearest office first.
+
+    One spatial join per ``CHUNK_SIZE`` points on PostGIS; the in-process
+    index otherwise.
+    """
+    points = [(float(lat), float(lng)) for lat, lng in points]
+    if not postgis_available():
+        return get_service_area_index().locate_many(points)
+
+    from django.db import connection
+
+    results: List[List[int]] = [[] for _ in points]
+    for start in range(0, len(points), CHUNK_SIZE):
+        chunk = points[start : start + CHUNK_SIZE]
+        values, params = _points_values(chunk)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH pts (idx, lng, lat) AS (VALUES {values}),
+                     geo AS (
+                         SELECT idx, ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography AS g
+                         FROM pts
+                     )
+                SELECT geo.idx, rc.id
+                FROM geo
+                JOIN regional_centers rc
+                  ON rc.service_area IS NOT NULL AND ST_Intersects(rc.service_area, geo.g)
+                ORDER BY geo.idx, ST_Distance(rc.location, geo.g) NULLS LAST, rc.id
+                """,
+                params,
+            )
+            for idx, center_id in cursor.fetchall():
+                results[start + idx].append(center_id)
+    return results
+
+
+def find_centers_for_point(latitude: float, longitude: float) -> List[Any]:
+    """``RegionalCenter``s whose service area contains the point, nearest office first."""
+    from locations.models import RegionalCenter
+
+    if postgis_available():
+        from django.contrib.gis.db.models.functions import Distance
+        from django.contrib.gis.geos import Point
+
+        point = Point(longitude, latitude, srid=4326)
+        return list(
+            RegionalCenter.objects.filter(service_area__intersects=point)
+            .annotate(distance=Distance("location", point))
+            .order_by("distance", "id")
+        )
+
+    ids = get_service_area_index().locate(latitude, longitude)
+    by_id = RegionalCenter.objects.in_bulk(ids)
+    return [by_id[pk] for pk in ids if pk in by_id]
+
+
+# ---------------------------------------------------------------------------
+# Provider assignment
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class AssignmentResult:
+    assigned: int = 0
+    unmatched: int = 0
+    created: int = 0
+    made_primary: int = 0
+    demoted: int = 0
+    # provider id -> regional center id
+    assignments: Dict[Any, int] = field(default_factory=dict)
+
+
+def _provider_assignments_postgis(provider_ids=None) -> Tuple[Dict[Any, int], int]:
+    from django.db import connection
+
+    where = ""
+    params: List[Any] = []
+    if provider_ids is not None:
+        where = "AND p.id::text = ANY(%s)"
+        params.append([str(pk) for pk in provider_ids])
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT DISTINCT ON (p.id) p.id, rc.id
+            FROM providers_v2 p
+            JOIN regional_centers rc
+              ON rc.service_area IS NOT NULL AND ST_Intersects(rc.service_area, p.location)
+            WHERE p.location IS NOT NULL {where}
+            ORDER BY p.id, ST_Distance(rc.location, p.location) NULLS LAST, rc.id
+            """,
+            params,
+        )
+        assignments = dict(cursor.fetchall())
+        cursor.execute(
+            f"SELECT count(*) FROM providers_v2 p WHERE p.location IS NOT NULL {where}",
+            params,
+        )
+        located = cursor.fetchone()[0]
+    return assignments, located
+
+
+def _provider_assignments_in_process(provider_ids=None) -> Tuple[Dict[Any, int], int]:
+    from locations.models import ProviderV2
+
+    index = get_service_area_index()
+    qs = ProviderV2.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    if provider_ids is not None:
+        qs = qs.filter(id__in=list(provider_ids))
+    assignments = {}
+    located = 0
+    for pk, lat, lng in qs.values_list("id", "latitude", "longitude").iterator(chunk_size=CHUNK_SIZE):
+        located += 1
+        centers = index.locate(float(lat), float(lng))
+        if centers:
+            assignments[pk] = centers[0]
+    return assignments, located
+
+
+def assign_providers_to_service_areas(provider_ids=None, dry_run: bool = False) -> AssignmentResult:
+    """
+    Link every located provider to the regional center whose service area
+    contains it, as that provider's primary center.
+
+    Missing links are bulk-created; an existing link to the containing
+    center is marked primary and any other primary link of that provider is
+    demoted. Links are never deleted (a provider may still work with
+    several centers). Providers outside every service area are untouched.
+    """
+    from django.db import transaction
+
+    from locations.models import ProviderRegionalCenter
+
+    if postgis_available():
+        assignments, located = _provider_assignments_postgis(provider_ids)
+    else:
+        assignments, located = _provider_assignments_in_process(provider_ids)
+
+    result = AssignmentResult(
+        assigned=len(assignments), unmatched=located - len(assignments), assignments=assignments
+    )
+    if not assignments:
+        return result
+
+    to_create = []
+    promote_ids: List[int] = []
+    demote_ids: List[int] = []
+    provider_ids = list(assignments)
+    for start in range(0, len(provider_ids), CHUNK_SIZE):
+        chunk = provider_ids[start : start + CHUNK_SIZE]
+        existing: Dict[Any, Dict[int, Tuple[int, bool]]] = {}
+        for link_id, provider_id, center_id, is_primary in ProviderRegionalCenter.objects.filter(
+            provider_id__in=chunk
+        ).values_list("id", "provider_id", "regional_center_id", "is_primary"):
+            existing.setdefault(provider_id, {})[center_id] = (link_id, is_primary)
+
+        for provider_id in chunk:
+            center_id = assignments[provider_id]
+            links = existing.get(provider_id, {})
+            if center_id not in links:
+                to_create.append(
+                    ProviderRegionalCenter(
+                        provider_id=provider_id, regional_center_id=center_id, is_primary=True
+                    )
+                )
+            elif not links[center_id][1]:
+                promote_ids.append(links[center_id][0])
+            demote_ids.extend(
+                link_id
+                for other_id, (link_id, is_primary) in links.items()
+                if other_id != center_id and is_primary
+            )
+
+    result.created = len(to_create)
+    result.made_primary = len(promote_ids)
+    result.demoted = len(demote_ids)
+    if dry_run:
+        return result
+
+    with transaction.atomic():
+        ProviderRegionalCenter.objects.bulk_create(
+            to_create, batch_size=CHUNK_SIZE, ignore_conflicts=True
+        )
+        for start in range(0, len(promote_ids), CHUNK_SIZE):
+            ProviderRegionalCenter.objects.filter(
+                id__in=promote_ids[start : start + CHUNK_SIZE]
+            ).update(is_primary=True)
+        for start in range(0, len(demote_ids), CHUNK_SIZE):
+            ProviderRegionalCenter.objects.filter(
+                id__in=demote_ids[start : start + CHUNK_SIZE]
+            ).update(is_primary=False)
+
+    from .facets import bump_provider_facets
+
+    bump_provider_facets()
+    return result
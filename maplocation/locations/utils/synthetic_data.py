@@ -0,0 +1,197 @@
+"""
+Synthetic provider data for benchmarks and load tests.
+
+Seeds the seven LA regional centers with their ZIP sets, a fixed list of
+insurance carriers, and N providers scattered around real LA ZIP
+centroids, with therapy types, age groups and diagnoses drawn from the
+model's choices and a few carrier and regional center links each.
+Everything is created with
+``bulk_create`` and tagged (``SYNTHETIC_PREFIX`` in provider names and
+regional center names, ``SYNTHETIC_CARRIER_DESCRIPTION`` on carriers) so
+``clear_synthetic_data`` removes it without touching real rows.
+
+Used by the endpoint benchmarks (``benchmarks/``) and the
+``seed_synthetic_data`` management command.
+"""
+
+import random
+from typing import Dict, List, Sequence, Tuple
+
+from django.db import transaction
+
+SYNTHETIC_PREFIX = "Synthetic "
+SYNTHETIC_CARRIER_DESCRIPTION = "synthetic benchmark carrier"
+
+# (name, office latitude, office longitude, {zip: (lat, lng)}) for the
+# seven LA regional centers; ZIP centroids are approximate.
+LA_REGIONAL_CENTERS: Sequence[Tuple[str, float, float, Dict[str, Tuple[float, float]]]] = (
+    (
+        "Eastern Los Angeles Regional Center", 34.0953, -118.1270,
+        {"91801": (34.0907, -118.1276), "91803": (34.0745, -118.1440), "90022": (34.0237, -118.1560),
+         "90201": (33.9708, -118.1709), "90640": (34.0156, -118.1112), "90280": (33.9447, -118.1926)},
+    ),
+    (
+        "Frank D. Lanterman Regional Center", 34.0628, -118.3087,
+        {"90004": (34.0762, -118.3090), "90010": (34.0604, -118.3119), "90019": (34.0488, -118.3396),
+         "90026": (34.0766, -118.2646), "90027": (34.1040, -118.2925), "91205": (34.1383, -118.2478)},
+    ),
+    (
+        "Harbor Regional Center", 33.8358, -118.3406,
+        {"90501": (33.8328, -118.3139), "90503": (33.8397, -118.3543), "90710": (33.7990, -118.2990),
+         "90731": (33.7323, -118.2797), "90745": (33.8236, -118.2650), "90277": (33.8296, -118.3879)},
+    ),
+    (
+        "North Los Angeles County Regional Center", 34.2197, -118.4698,
+        {"91343": (34.2390, -118.4796), "91402": (34.2225, -118.4492), "91405": (34.2005, -118.4479),
+         "91335": (34.2006, -118.5390), "91350": (34.4418, -118.5095), "93534": (34.6900, -118.1490)},
+    ),
+    (
+        "San Gabriel/Pomona Regional Center", 34.0633, -117.7560,
+        {"91766": (34.0416, -117.7577), "91767": (34.0813, -117.7363), "91706": (34.0966, -117.9690),
+         "91744": (34.0290, -117.9366), "91790": (34.0672, -117.9379), "91773": (34.1010, -117.8157)},
+    ),
+    (
+        "South Central Los Angeles Regional Center", 33.9903, -118.2813,
+        {"90001": (33.9731, -118.2479), "90002": (33.9490, -118.2467), "90003": (33.9642, -118.2728),
+         "90044": (33.9527, -118.2920), "90220": (33.8808, -118.2367), "90262": (33.9239, -118.2016)},
+    ),
+    (
+        "Westside Regional Center", 33.9865, -118.3928,
+        {"90034": (34.0290, -118.4005), "90045": (33.9591, -118.4009), "90066": (34.0023, -118.4309),
+         "90230": (33.9969, -118.3948), "90291": (33.9930, -118.4649), "90301": (33.9567, -118.3587)},
+    ),
+)
+
+INSURANCE_CARRIERS = (
+    "Medi-Cal", "Kaiser Permanente", "Blue Shield", "Anthem", "Aetna", "Cigna",
+    "United Healthcare", "Health Net", "L.A. Care", "Molina", "Tricare", "Regional Center",
+)
+PROVIDER_KINDS = ("Therapy", "Clinic", "Pediatric", "Assessment", "Early Intervention")
+WORDS = ("Bright", "Sunrise", "Harbor", "Valley", "Pacific", "Hope", "Little Steps", "Kind", "Coastal", "Oak")
+
+# ~0.02 degrees: providers spread a mile or two around each ZIP centroid.
+JITTER_DEGREES = 0.02
+
+
+def _sample(rng: random.Random, values: Sequence[str], low: int, high: int) -> List[str]:
+    return rng.sample(list(values), rng.randint(low, high))
+
+
+def seed_synthetic_data(providers: int, seed: int = 0, batch_size: int = 2000) -> Dict[str, int]:
+    """
+    Create the regional centers, carriers and ``providers`` providers.
+    Deterministic for a given ``seed``. Returns row counts per table.
+    """
+    from locations.models import (
+        InsuranceCarrier,
+        ProviderInsuranceCarrier,
+        ProviderRegionalCenter,
+        ProviderV2,
+        RegionalCenter,
+    )
+
+    from .facets import bump_provider_facets
+    from .service_areas import postgis_available
+
+    therapy_types = [value for value, _ in ProviderV2.THERAPY_TYPE_CHOICES]
+    age_groups = [value for value, _ in ProviderV2.AGE_GROUP_CHOICES if value != "All Ages"]
+    diagnoses = [value for value, _ in ProviderV2.DIAGNOSIS_CHOICES if value != "Other"]
+    rng = random.Random(seed)
+    use_points = postgis_available()
+    if use_points:
+        from django.contrib.gis.geos import Point
+
+    with transaction.atomic():
+        centers = []
+        for name, lat, lng, zips in LA_REGIONAL_CENTERS:
+            office_zip = next(iter(zips))
+            center = RegionalCenter(
+                regional_center=f"{SYNTHETIC_PREFIX}{name}",
+                address=f"{rng.randint(100, 9999)} Main St",
+                city="Los Angeles",
+                state="CA",
+                zip_code=office_zip,
+                county_served="Los Angeles",
+                latitude=lat,
+                longitude=lng,
+                zip_codes=list(zips),
+                is_la_regional_center=True,
+            )
+            if use_points:
+                center.location = Point(lng, lat, srid=4326)
+            centers.append(center)
+        centers = RegionalCenter.objects.bulk_create(centers)
+
+        existing = set(InsuranceCarrier.objects.filter(name__in=INSURANCE_CARRIERS).values_list("name", flat=True))
+        InsuranceCarrier.objects.bulk_create(
+            InsuranceCarrier(name=name, description=SYNTHETIC_CARRIER_DESCRIPTION)
+            for name in INSURANCE_CARRIERS
+            if name not in existing
+        )
+        carriers = list(InsuranceCarrier.objects.filter(name__in=INSURANCE_CARRIERS))
+
+        rows, carrier_links, center_links = [], [], []
+        for i in range(providers):
+            center_index = rng.randrange(len(centers))
+            zips = LA_REGIONAL_CENTERS[center_index][3]
+            zip_code = rng.choice(list(zips))
+            lat = zips[zip_code][0] + rng.uniform(-JITTER_DEGREES, JITTER_DEGREES)
+            lng = zips[zip_code][1] + rng.uniform(-JITTER_DEGREES, JITTER_DEGREES)
+            provider_carriers = rng.sample(carriers, rng.randint(0, 4))
+            provider = ProviderV2(
+                name=f"{SYNTHETIC_PREFIX}{rng.choice(WORDS)} {rng.choice(PROVIDER_KINDS)} {i}",
+                type=rng.choice(PROVIDER_KINDS),
+                phone=f"(555) {i // 10000 % 1000:03d}-{i % 10000:04d}",
+                address=f"{rng.randint(100, 19999)} Synthetic Ave, Los Angeles, CA {zip_code}",
+                latitude=round(lat, 8),
+                longitude=round(lng, 8),
+                insurance_accepted=", ".join(carrier.name for carrier in provider_carriers),
+                therapy_types=_sample(rng, therapy_types, 1, 3),
+                age_groups=_sample(rng, age_groups, 0, 3),
+                diagnoses_treated=_sample(rng, diagnoses, 1, 3),
+            )
+            if use_points:
+                provider.location = Point(float(provider.longitude), float(provider.latitude), srid=4326)
+            rows.append(provider)
+            carrier_links.extend(
+                ProviderInsuranceCarrier(provider=provider, insurance_carrier=carrier)
+                for carrier in provider_carriers
+            )
+            if rng.random() < 0.6:
+                center_links.append(
+                    ProviderRegionalCenter(provider=provider, regional_center=centers[center_index], is_primary=True)
+                )
+
+        ProviderV2.objects.bulk_create(rows, batch_size=batch_size)
+        ProviderInsuranceCarrier.objects.bulk_create(carrier_links, batch_size=batch_size)
+        ProviderRegionalCenter.objects.bulk_create(center_links, batch_size=batch_size)
+
+    # bulk_create sends no signals.
+    bump_provider_facets()
+    return {
+        "regional_centers": len(centers),
+        "insurance_carriers": len(carriers),
+        "providers": len(rows),
+        "provider_insurance_carriers": len(carrier_links),
+        "provider_regional_centers": len(center_links),
+    }
+
+
+def clear_synthetic_data() -> Dict[str, int]:
+    """Delete everything ``seed_synthetic_data`` created (links cascade)."""
+    from locations.models import InsuranceCarrier, ProviderV2, RegionalCenter
+
+    from .facets import bump_provider_facets
+
+    with transaction.atomic():
+        deleted = {
+            "providers": ProviderV2.objects.filter(name__startswith=SYNTHETIC_PREFIX).delete()[0],
+            "regional_centers": RegionalCenter.objects.filter(
+                regional_center__startswith=SYNTHETIC_PREFIX
+            ).delete()[0],
+            "insurance_carriers": InsuranceCarrier.objects.filter(
+                description=SYNTHETIC_CARRIER_DESCRIPTION
+            ).delete()[0],
+        }
+    bump_provider_facets()
+    return deleted
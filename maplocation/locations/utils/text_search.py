@@ -0,0 +1,148 @@
+"""
+Ranked full-text search shared by the viewsets and the agent tools.
+
+``providers_v2``, ``locations_location`` and ``hmgl.location`` each have a
+stored, generated ``search_vector`` tsvector (name weighted A, type /
+organization B, descriptions C, address D) with a GIN index, plus pg_trgm
+GIN indexes on name and address (migration 0037). A row matches when its
+vector matches the query or the query is trigram word-similar to the name
+or address, so "Pasadna" and "speach" still find results. Matches are
+ordered by ``ts_rank_cd`` plus the best trigram similarity.
+
+Both predicates are index-backed, so latency stays flat as tables grow.
+Off PostgreSQL (SQLite tests), and for ``hmgl.location`` after a reload
+dropped its vector (until ``clean_hmgl_locations`` restores it), the
+search falls back to OR'd ``icontains``.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+SEARCH_CONFIG = "english"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    """How to search one model: trigram columns plus the icontains fallback fields."""
+
+    trigram: Tuple[str, ...]
+    fallback: Tuple[str, ...]
+
+
+# Keyed by model label; the tsvector columns are defined in migration 0037.
+SEARCH_SPECS: Dict[str, SearchSpec] = {
+    "locations.ProviderV2": SearchSpec(
+        trigram=("name", "address"),
+        fallback=("name", "type", "description", "address", "insurance_accepted"),
+    ),
+    "locations.Location": SearchSpec(
+        trigram=("name", "address"),
+        fallback=("name", "description", "address", "city", "state"),
+    ),
+    "locations.HMGLLocation": SearchSpec(
+        trigram=("name", "address1"),
+        fallback=("name", "organization", "city", "address1", "description_html"),
+    ),
+}
+
+
+def spec_for(model) -> Optional[SearchSpec]:
+    return SEARCH_SPECS.get(model._meta.label)
+
+
+def any_terms_query(text: str) -> str:
+    """``to_tsquery`` input matching any word of ``text`` ("aba | pasadena")."""
+    return " | ".join(_TERM_RE.findall(text))
+
+
+def search_sql(table: str, spec: SearchSpec, match_any: bool = False) -> Tuple[str, str]:
+    """
+    ``(match, rank)`` SQL fragments for ``table`` (``db_table``, unquoted).
+
+    Both take the query text as every ``%s``: ``match`` needs it
+    ``1 + len(spec.trigram)`` times and ``rank`` the same.
+    """
+    quoted = f'"{table}"'
+    vector = f"{quoted}.search_vector"
+    if match_any:
+        tsquery = f"to_tsquery('{SEARCH_CONFIG}', %s)"
+    else:
+        tsquery = f"websearch_to_tsquery('{SEARCH_CONFIG}', %s)"
+    columns = [f'{quoted}."{column}"' for column in spec.trigram]
+
+    match = " OR ".join([f"{vector} @@ {tsquery}"] + [f"%s <%% {column}" for column in columns])
+    similarity = ", ".join(f"coalesce(word_similarity(%s, {column}), 0)" for column in columns)
+    rank = f"ts_rank_cd({vector}, {tsquery}, 32) + greatest({similarity})"
+    return f"({match})", rank
+
+
+def _search_params(text: str, spec: SearchSpec, match_any: bool) -> List[str]:
+    tsquery_text = any_terms_query(text) if match_any else text
+    return [tsquery_text] + [text] * len(spec.trigram)
+
+
+def search_vector_present(model) -> bool:
+    """Migrations keep managed tables' vectors; the HMGL loader can drop its own."""
+    if model._meta.managed:
+        return True
+    from .hmgl import table_columns
+
+    return "search_vector" in table_columns()
+
+
+def ranked_search(queryset, text: str, spec: Optional[SearchSpec] = None, match_any: bool = False, order: bool = True):
+    """
+    Filter ``queryset`` to rows matching ``text`` and annotate
+    ``search_rank``; ordered by it (best first) unless ``order`` is False.
+
+    ``match_any`` ORs the words instead of the web-search AND semantics;
+    the agent tools use it for free-text questions.
+    """
+    text = (text or "").strip()
+    spec = spec or spec_for(queryset.model)
+    if not text or spec is None:
+        return queryset
+    if match_any and not any_terms_query(text):
+        return queryset.none()
+
+    if connection.vendor != "postgresql" or not search_vector_present(queryset.model):
+        terms = _TERM_RE.findall(text) if match_any else [text]
+        q = Q()
+        for term in terms:
+            for field in spec.fallback:
+                q |= Q(**{f"{field}__icontains": term})
+        return queryset.filter(q)
+
+    match, rank = search_sql(queryset.model._meta.db_table, spec, match_any)
+    params = _search_params(text, spec, match_any)
+    queryset = queryset.filter(RawSQL(match, params, output_field=BooleanField())).annotate(
+        search_rank=RawSQL(rank, params, output_field=FloatField())
+    )
+    if order:
+        queryset = queryset.order_by("-search_rank", *(queryset.query.order_by or ("pk",)))
+    return queryset
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    Drop-in ``SearchFilter`` using :func:`ranked_search` for models in
+    ``SEARCH_SPECS``. List it after ``OrderingFilter`` so relevance wins
+    over the default ordering; an explicit ``?ordering=`` still applies.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        spec = spec_for(queryset.model)
+        if spec is None:
+            return super().filter_queryset(request, queryset, view)
+        text = " ".join(self.get_search_terms(request))
+        explicit_ordering = bool(request.query_params.get(api_settings.ORDERING_PARAM))
+        return ranked_search(queryset, text, spec, order=not explicit_ordering)
@@ -1,9 +1,10 @@
+import logging
 from collections import defaultdict
 
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.http import JsonResponse
+from django.http import JsonResponse, QueryDict
 from django.views.decorators.http import require_GET
 from django.db import connection
 from django.db.models import Q, Avg
@@ -12,12 +13,18 @@ from django.conf import settings
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 
-
-def _provider_dedup_key(name, phone):
-    """Normalized signature used to detect duplicate ProviderV2 rows."""
-    name_key = (name or "").strip().lower()
-    phone_key = "".join(ch for ch in (phone or "") if ch.isdigit())
-    return name_key, phone_key
+from .utils.provider_geo import (
+    GENERIC_INSURANCE,
+    PRIVATE_PAY,
+    REGIONAL_CENTER_FUNDING,
+    get_provider_geo_index,
+    index_within_radius,
+    insurance_search_filter,
+    sql_within_radius,
+)
+from .utils.service_areas import postgis_available
+from .utils.provider_import import provider_dedup_key as _provider_dedup_key
+from .utils.text_search import RankedSearchFilter, ranked_search
 
 # from django.contrib.gis.geos import Point
 # from django.contrib.gis.measure import D
@@ -62,6 +69,13 @@ import math
 from rest_framework.decorators import api_view
 from django.db.models.expressions import RawSQL
 
+logger = logging.getLogger(__name__)
+
+# Batch endpoints (regional-centers/by_zip_codes, providers-v2/search_batch)
+MAX_BATCH_ZIP_CODES = 100
+MAX_BATCH_SEARCHES = 25
+BATCH_SEARCH_FIELDS = ("q", "location", "radius", "lat", "lng", "age", "diagnosis", "specialization", "insurance")
+
 
 @require_GET
 def health_check(request):
@@ -101,8 +115,8 @@ class LocationViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = LocationSerializer
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        RankedSearchFilter,
     ]
     filterset_fields = ["category", "price_level", "has_parking", "is_accessible"]
     search_fields = ["name", "description", "address", "city", "state"]
@@ -155,25 +169,20 @@ class LocationViewSet(viewsets.ReadOnlyModelViewSet):
             return Response(serializer_data)
 
         except Exception as e:
-            # Log the error for debugging
-            import traceback
-
-            print(f"Error in nearby endpoint: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("Error in nearby endpoint")
             return Response(
                 {"error": "An unexpected error occurred", "detail": str(e)}, status=500
             )
 
     @action(detail=False, methods=["get"])
     def filters(self, request):
-        """Return available filter options"""
-        categories = LocationCategory.objects.all()
-        price_levels = Location.objects.values_list("price_level", flat=True).distinct()
+        """Return available filter options (cached; see locations/utils/facets.py)"""
+        from .utils.facets import get_location_filter_options
 
+        options = get_location_filter_options()
         return Response(
             {
-                "categories": LocationCategorySerializer(categories, many=True).data,
-                "price_levels": sorted(list(price_levels)),
+                **options,
                 "amenities": [
                     {"id": "has_parking", "name": "Parking Available"},
                     {"id": "is_accessible", "name": "Accessibility Features"},
@@ -211,6 +220,7 @@ class RegionalCenterViewSet(viewsets.ReadOnlyModelViewSet):
     - GET /api/regional-centers/service_area_boundaries/ - **CRITICAL** Returns GeoJSON with all LA County
       regional centers including their polygon geometries AND complete ZIP code arrays for each center
     - GET /api/regional-centers/lookup_by_zip/?zip_code={zip} - Find regional center for specific ZIP code
+    - GET /api/regional-centers/by_zip_codes/?zip_codes={zip},{zip} - Regional center for each of up to 100 ZIPs
     - GET /api/regional-centers/nearby/?lat={lat}&lng={lng}&radius={miles} - Find centers near coordinates
     - GET /api/regional-centers/by_location/?location={address_or_zip} - Geocode and find centers
 
@@ -419,12 +429,17 @@ class RegionalCenterViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"])
     def by_service_area(self, request):
         """
-        Find regional centers that serve a specific geographic point.
+        Find regional centers whose service area contains a geographic point.
         Query parameters:
-        - lat: Latitude (required)
-        - lng: Longitude (required)
+        - lat: Latitude (required unless points is given)
+        - lng: Longitude (required unless points is given)
+        - points: Batch of "lat,lng" pairs separated by ";" (max 1000),
+          classified in one spatial query
         """
         try:
+            if request.query_params.get("points"):
+                return self._by_service_area_batch(request.query_params["points"])
+
             lat = request.query_params.get("lat")
             lng = request.query_params.get("lng")
 
@@ -453,6 +468,56 @@ class RegionalCenterViewSet(viewsets.ReadOnlyModelViewSet):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _by_service_area_batch(self, raw_points):
+        from .utils.service_areas import classify_points
+
+        points = []
+        for index, pair in enumerate(raw_points.split(";")):
+            if not pair.strip():
+                continue
+            parts = pair.split(",")
+            try:
+                if len(parts) != 2:
+                    raise ValueError
+                lat, lng = float(parts[0]), float(parts[1])
+                if not (math.isfinite(lat) and math.isfinite(lng)):
+                    raise ValueError
+            except ValueError:
+                return Response(
+                    {"error": f'Invalid point {pair.strip()!r} at position {index}: expected "lat,lng"'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                return Response(
+                    {"error": f"Point {pair.strip()!r} at position {index} is out of range"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            points.append((lat, lng))
+        if len(points) > 1000:
+            return Response(
+                {"error": "At most 1000 points per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        matches = classify_points(points)
+        centers = RegionalCenter.objects.in_bulk({pk for ids in matches for pk in ids})
+        serialized = {
+            pk: data
+            for pk, data in zip(
+                centers, self.get_serializer(list(centers.values()), many=True).data
+            )
+        }
+        return Response(
+            [
+                {
+                    "lat": lat,
+                    "lng": lng,
+                    "regional_centers": [serialized[pk] for pk in ids if pk in serialized],
+                }
+                for (lat, lng), ids in zip(points, matches)
+            ]
+        )
+
     @action(detail=True, methods=["get"])
     def providers(self, request, pk=None):
         """Get providers associated with this regional center"""
@@ -505,15 +570,78 @@ class RegionalCenterViewSet(viewsets.ReadOnlyModelViewSet):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=False, methods=["get"])
+    def by_zip_codes(self, request):
+        """
+        Batch by_zip_code: the regional center serving each ZIP, resolved in
+        one query per lookup stage instead of one request per ZIP.
+        Query parameters:
+        - zip_codes: Comma-separated ZIP codes (required, max 100)
+        Returns {"results": {zip: center or null}} in request order.
+        """
+        try:
+            zip_codes = [
+                z.strip()
+                for value in request.query_params.getlist("zip_codes")
+                for z in value.split(",")
+                if z.strip()
+            ]
+            if not zip_codes:
+                return Response(
+                    {"error": "zip_codes is required"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if len(set(zip_codes)) > MAX_BATCH_ZIP_CODES:
+                return Response(
+                    {"error": f"At most {MAX_BATCH_ZIP_CODES} ZIP codes per request"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            found = RegionalCenter.find_by_zip_codes(zip_codes)
+            centers = {c.pk: c for c in found.values() if c is not None}
+            serialized = dict(
+                zip(centers, self.get_serializer(list(centers.values()), many=True).data)
+            )
+            return Response(
+                {
+                    "results": {
+                        z: serialized[c.pk] if c is not None else None
+                        for z, c in found.items()
+                    }
+                }
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
     @action(detail=False, methods=["get"])
     def service_area_boundaries(self, request):
         """
         Get real geographic service area boundaries for LA Regional Centers.
         Returns GeoJSON with actual geographic boundaries that fit together like puzzle pieces.
         Cached for 1 hour since this data rarely changes.
+        Query parameters:
+        - tolerance: Simplification tolerance in degrees (default 0.002),
+          rounded to the closest one precomputed by generate_service_areas
         """
+        from .utils.service_area_builder import (
+            BOUNDARIES_CACHE_KEY,
+            DEFAULT_TOLERANCES,
+            tolerance_key,
+        )
+
+        try:
+            requested = float(request.query_params.get("tolerance", 0.002))
+        except ValueError:
+            return Response(
+                {"error": "Invalid tolerance"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        tolerance = min(DEFAULT_TOLERANCES, key=lambda t: abs(t - requested))
+
         # Check cache first
-        cache_key = "regional_centers_service_area_boundaries"
+        cache_key = BOUNDARIES_CACHE_KEY.format(tolerance_key(tolerance))
         cached_data = cache.get(cache_key)
         if cached_data is not None:
             return Response(cached_data)
@@ -554,7 +682,9 @@ class RegionalCenterViewSet(viewsets.ReadOnlyModelViewSet):
                             "zip_code": center.zip_code,
                             "address_street": center.address,
                         },
-                        "geometry": self._create_service_area_geometry(center),
+                        "geometry": self._create_service_area_geometry(
+                            center, tolerance
+                        ),
                     }
                     features.append(feature)
 
@@ -571,11 +701,17 @@ class RegionalCenterViewSet(viewsets.ReadOnlyModelViewSet):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _create_service_area_geometry(self, center):
+    def _create_service_area_geometry(self, center, tolerance=0.002):
         """
         Get the stored service area geometry from the database.
         This should contain realistic geographic boundaries that fit together like puzzle pieces.
         """
+        # ZIP-union polygons from generate_service_areas, keyed by tolerance
+        simplified = center.service_area_simplified
+        if simplified and isinstance(simplified, dict):
+            closest = min(simplified, key=lambda key: abs(float(key) - tolerance))
+            return simplified[closest]
+
         if center.service_areas and isinstance(center.service_areas, dict):
             # Return the stored GeoJSON geometry
             return center.service_areas.get("geometry")
@@ -698,8 +834,8 @@ class ProviderV2ViewSet(viewsets.ModelViewSet):
     serializer_class = ProviderV2Serializer
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        RankedSearchFilter,
     ]
     # Use real ProviderV2 fields
     search_fields = [
@@ -908,6 +1044,188 @@ class ProviderV2ViewSet(viewsets.ModelViewSet):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _search_queryset(self, params, base=None):
+        """
+        Providers matching the comprehensive_search filters in ``params``
+        (a QueryDict). Shared with ``filters`` for scoped facet counts and
+        with ``search_batch``, which passes the deduplicated ``base`` it
+        computed once for every search in the batch.
+        """
+        query = params.get("q", "")
+        location = params.get("location")
+        radius = float(params.get("radius", 15))
+        lat = params.get("lat")
+        lng = params.get("lng")
+        age = params.get("age")
+        diagnosis = params.get("diagnosis")
+
+        # Get all insurance filter values (can be multiple)
+        insurance_filters = params.getlist("insurance")
+        specialization = params.get("specialization")
+
+        # Start with the same deduplicated provider set used by list().
+        providers = self.get_queryset() if base is None else base
+
+        # Search point from coordinates, or address geocoding (fallback)
+        point = None
+        if lat and lng:
+            try:
+                point = (float(lat), float(lng))
+            except (ValueError, TypeError):
+                pass  # Skip location filtering if coordinates are invalid
+        elif location:
+            point = RegionalCenter.geocode_address(location)
+
+        # Without PostGIS the radius, therapy, age and (when every value is
+        # an indexed carrier) insurance filters run as one masked search
+        # over the in-memory index (utils/provider_geo.py).
+        in_memory = bool(point) and not postgis_available(providers.db)
+        index_insurance = None
+        if in_memory and insurance_filters:
+            index_insurance = insurance_search_filter(
+                get_provider_geo_index(providers.db), insurance_filters
+            )
+
+        # Apply ranked full-text search (name, type, description, address,
+        # insurance); results stay ordered by relevance through later filters
+        if query:
+            providers = ranked_search(providers, query)
+
+        # Apply insurance filters using ProviderInsuranceCarrier relationship
+        if insurance_filters and index_insurance is None:
+            from locations.models import ProviderInsuranceCarrier, InsuranceCarrier
+
+            insurance_q = Q()
+            for insurance_type in insurance_filters:
+                insurance_lower = insurance_type.lower()
+
+                # Map common insurance type names to carriers in the database
+                if insurance_lower in GENERIC_INSURANCE:
+                    # Get all providers that accept ANY insurance
+                    # This returns providers that have at least one insurance carrier relationship
+                    insurance_provider_ids = (
+                        ProviderInsuranceCarrier.objects.values_list(
+                            "provider_id", flat=True
+                        ).distinct()
+                    )
+                    insurance_q |= Q(id__in=insurance_provider_ids)
+                elif insurance_lower in PRIVATE_PAY:
+                    # Private pay is implicit - all providers accept it
+                    # For now, don't filter out any providers for private pay
+                    pass
+                elif insurance_lower in REGIONAL_CENTER_FUNDING:
+                    # Filter by Regional Center insurance carrier
+                    try:
+                        carrier = InsuranceCarrier.objects.get(
+                            name__iexact="Regional Center"
+                        )
+                        carrier_provider_ids = (
+                            ProviderInsuranceCarrier.objects.filter(
+                                insurance_carrier=carrier
+                            ).values_list("provider_id", flat=True)
+                        )
+                        insurance_q |= Q(id__in=carrier_provider_ids)
+                    except InsuranceCarrier.DoesNotExist:
+                        # Fallback: search in legacy field
+                        insurance_q |= Q(
+                            insurance_accepted__icontains="regional center"
+                        )
+                else:
+                    # Try to match specific insurance carrier names
+                    try:
+                        carrier = InsuranceCarrier.objects.get(
+                            name__iexact=insurance_type
+                        )
+                        carrier_provider_ids = (
+                            ProviderInsuranceCarrier.objects.filter(
+                                insurance_carrier=carrier
+                            ).values_list("provider_id", flat=True)
+                        )
+                        insurance_q |= Q(id__in=carrier_provider_ids)
+                    except InsuranceCarrier.DoesNotExist:
+                        # Fallback: search in legacy insurance_accepted text field
+                        insurance_q |= Q(
+                            insurance_accepted__icontains=insurance_type
+                        )
+
+            if insurance_q:
+                providers = providers.filter(insurance_q)
+
+        # Apply specialization filter (diagnosis) using text field operations
+        if specialization:
+            providers = providers.filter(type__icontains=specialization)
+
+        # Apply diagnosis filter using JSON field operations
+        if diagnosis:
+            # Count how many providers have diagnosis data
+            providers_with_diagnosis_data = (
+                providers.exclude(diagnoses_treated__isnull=True)
+                .exclude(diagnoses_treated=[])
+                .count()
+            )
+            total_providers = providers.count()
+
+            # Only apply diagnosis filter if at least 10% of providers have diagnosis data
+            # This prevents filtering to 2-3 providers when the field is rarely populated
+            if (
+                total_providers > 0
+                and (providers_with_diagnosis_data / total_providers) >= 0.1
+            ):
+                diagnosis_filtered = providers.filter(
+                    diagnoses_treated__contains=[diagnosis]
+                )
+                if diagnosis_filtered.exists():
+                    providers = diagnosis_filtered
+            # Otherwise skip diagnosis filter (field not widely populated yet)
+
+        # Apply therapy filters (multiple allowed) using JSON field operations
+        therapy_values = params.getlist("therapy")
+        if therapy_values and not in_memory:
+            # Try to filter by therapy types, but if no results, fall back to no therapy filter
+            therapy_filtered = providers.filter(
+                therapy_types__contains=therapy_values
+            )
+            if therapy_filtered.exists():
+                providers = therapy_filtered
+            # If no providers match therapy filter, keep all providers (lenient approach)
+
+        # Apply location-based filtering around the search point
+        if in_memory:
+            providers = index_within_radius(
+                providers,
+                *point,
+                radius,
+                therapy_types=therapy_values,
+                age_group=age if age and age.lower() != "all ages" else None,
+                insurance=index_insurance,
+            )
+        elif point:
+            providers = sql_within_radius(providers, *point, radius)
+
+        # Apply age filtering
+        if age and not in_memory:
+            # "All Ages" means no age filter - user wants all providers regardless of age
+            # Also skip filter if user explicitly selects "All Ages" as they want to see everything
+            if age.lower() == "all ages":
+                # No filtering - return all providers regardless of age groups
+                pass
+            else:
+                # Filter by specific age group
+                # Include providers that:
+                # 1. Have the specific age group in their age_groups array
+                # 2. Have "All Ages" in their array (they serve all ages)
+                # 3. Have NULL age_groups (defaulted to "All Ages" in serializer)
+                age_filtered = providers.filter(
+                    Q(age_groups__contains=[age])
+                    | Q(age_groups__contains=["All Ages"])
+                    | Q(age_groups__isnull=True)
+                )
+                if age_filtered.exists():
+                    providers = age_filtered
+                # If no providers match age filter, keep all providers (lenient approach)
+
+        return providers
+
     @action(detail=False, methods=["get"])
     def comprehensive_search(self, request):
         """
@@ -924,273 +1242,94 @@ class ProviderV2ViewSet(viewsets.ModelViewSet):
         - diagnosis: Diagnosis for specialization filtering
         """
         try:
-            query = request.query_params.get("q", "")
-            location = request.query_params.get("location")
-            radius = float(request.query_params.get("radius", 15))
-            lat = request.query_params.get("lat")
-            lng = request.query_params.get("lng")
-            age = request.query_params.get("age")
-            diagnosis = request.query_params.get("diagnosis")
-
-            # Get all insurance filter values (can be multiple)
-            insurance_filters = request.query_params.getlist("insurance")
-            specialization = request.query_params.get("specialization")
-
-            # Start with the same deduplicated provider set used by list().
-            providers = self.get_queryset()
-
-            # Apply text search
-            if query:
-                # Text search across common text fields, including address
-                providers = providers.filter(
-                    Q(name__icontains=query)
-                    | Q(address__icontains=query)
-                    | Q(type__icontains=query)
-                    | Q(description__icontains=query)
-                    | Q(insurance_accepted__icontains=query)
-                )
-
-            # Apply insurance filters using ProviderInsuranceCarrier relationship
-            if insurance_filters:
-                from locations.models import ProviderInsuranceCarrier, InsuranceCarrier
-
-                insurance_q = Q()
-                for insurance_type in insurance_filters:
-                    insurance_lower = insurance_type.lower()
-
-                    # Map common insurance type names to carriers in the database
-                    if insurance_lower in [
-                        "insurance",
-                        "accepts insurance",
-                        "private insurance",
-                    ]:
-                        # Get all providers that accept ANY insurance
-                        # This returns providers that have at least one insurance carrier relationship
-                        insurance_provider_ids = (
-                            ProviderInsuranceCarrier.objects.values_list(
-                                "provider_id", flat=True
-                            ).distinct()
-                        )
-                        insurance_q |= Q(id__in=insurance_provider_ids)
-                    elif insurance_lower in [
-                        "private pay",
-                        "private payment",
-                        "self pay",
-                    ]:
-                        # Private pay is implicit - all providers accept it
-                        # For now, don't filter out any providers for private pay
-                        pass
-                    elif insurance_lower in [
-                        "regional center",
-                        "regional center funding",
-                    ]:
-                        # Filter by Regional Center insurance carrier
-                        try:
-                            carrier = InsuranceCarrier.objects.get(
-                                name__iexact="Regional Center"
-                            )
-                            carrier_provider_ids = (
-                                ProviderInsuranceCarrier.objects.filter(
-                                    insurance_carrier=carrier
-                                ).values_list("provider_id", flat=True)
-                            )
-                            insurance_q |= Q(id__in=carrier_provider_ids)
-                        except InsuranceCarrier.DoesNotExist:
-                            # Fallback: search in legacy field
-                            insurance_q |= Q(
-                                insurance_accepted__icontains="regional center"
-                            )
-                    else:
-                        # Try to match specific insurance carrier names
-                        try:
-                            carrier = InsuranceCarrier.objects.get(
-                                name__iexact=insurance_type
-                            )
-                            carrier_provider_ids = (
-                                ProviderInsuranceCarrier.objects.filter(
-                                    insurance_carrier=carrier
-                                ).values_list("provider_id", flat=True)
-                            )
-                            insurance_q |= Q(id__in=carrier_provider_ids)
-                        except InsuranceCarrier.DoesNotExist:
-                            # Fallback: search in legacy insurance_accepted text field
-                            insurance_q |= Q(
-                                insurance_accepted__icontains=insurance_type
-                            )
-
-                if insurance_q:
-                    providers = providers.filter(insurance_q)
-
-            # Apply specialization filter (diagnosis) using text field operations
-            if specialization:
-                providers = providers.filter(type__icontains=specialization)
-
-            # Apply diagnosis filter using JSON field operations
-            if diagnosis:
-                # Count how many providers have diagnosis data
-                providers_with_diagnosis_data = (
-                    providers.exclude(diagnoses_treated__isnull=True)
-                    .exclude(diagnoses_treated=[])
-                    .count()
-                )
-                total_providers = providers.count()
-
-                # Only apply diagnosis filter if at least 10% of providers have diagnosis data
-                # This prevents filtering to 2-3 providers when the field is rarely populated
-                if (
-                    total_providers > 0
-                    and (providers_with_diagnosis_data / total_providers) >= 0.1
-                ):
-                    diagnosis_filtered = providers.filter(
-                        diagnoses_treated__contains=[diagnosis]
-                    )
-                    if diagnosis_filtered.exists():
-                        providers = diagnosis_filtered
-                # Otherwise skip diagnosis filter (field not widely populated yet)
-
-            # Apply therapy filters (multiple allowed) using JSON field operations
-            therapy_values = request.query_params.getlist("therapy")
-            if therapy_values:
-                # Try to filter by therapy types, but if no results, fall back to no therapy filter
-                therapy_filtered = providers.filter(
-                    therapy_types__contains=therapy_values
-                )
-                if therapy_filtered.exists():
-                    providers = therapy_filtered
-                # If no providers match therapy filter, keep all providers (lenient approach)
-
-            # Apply location-based filtering using provided coordinates
-            if lat and lng:
-                try:
-                    lat_float = float(lat)
-                    lng_float = float(lng)
-
-                    # Get IDs of already filtered providers
-                    filtered_provider_ids = list(providers.values_list("id", flat=True))
-                    print(
-                        f"🔍 [comprehensive_search] Radius: {radius} miles, Providers before distance filter: {len(filtered_provider_ids)}"
-                    )
-
-                    if filtered_provider_ids:
-                        # Filter by distance using raw SQL with proper parameterization
-                        from django.db import connection
-
-                        # Build placeholders for the IN clause
-                        placeholders = ",".join(["%s"] * len(filtered_provider_ids))
-
-                        with connection.cursor() as cursor:
-                            # Use proper parameterized query
-                            sql = f"""
-                                SELECT id FROM providers_v2 
-                                WHERE id IN ({placeholders})
-                                AND latitude IS NOT NULL AND longitude IS NOT NULL
-                                AND (3959 * acos(cos(radians(%s)) * cos(radians(latitude)) * 
-                                cos(radians(longitude) - radians(%s)) + sin(radians(%s)) * 
-                                sin(radians(latitude)))) < %s
-                            """
-                            params = list(filtered_provider_ids) + [
-                                lat_float,
-                                lng_float,
-                                lat_float,
-                                radius,
-                            ]
-                            cursor.execute(sql, params)
-                            nearby_ids = [row[0] for row in cursor.fetchall()]
-
-                        print(
-                            f"🎯 [comprehensive_search] Providers after {radius} mile radius filter: {len(nearby_ids)}"
-                        )
-                        providers = providers.filter(id__in=nearby_ids)
-                    else:
-                        # If no providers match the non-geographic filters, return empty queryset
-                        providers = providers.none()
-                except (ValueError, TypeError):
-                    pass  # Skip location filtering if coordinates are invalid
-
-            # Apply location-based filtering using address geocoding (fallback)
-            elif location:
-                coordinates = RegionalCenter.geocode_address(location)
-                if coordinates:
-                    lat_coord, lng_coord = coordinates
-
-                    # Get IDs of already filtered providers
-                    filtered_provider_ids = list(providers.values_list("id", flat=True))
-
-                    if filtered_provider_ids:
-                        # Filter by distance using raw SQL with proper parameterization
-                        from django.db import connection
-
-                        # Build placeholders for the IN clause
-                        placeholders = ",".join(["%s"] * len(filtered_provider_ids))
-
-                        with connection.cursor() as cursor:
-                            # Use proper parameterized query
-                            sql = f"""
-                                SELECT id FROM providers_v2 
-                                WHERE id IN ({placeholders})
-                                AND latitude IS NOT NULL AND longitude IS NOT NULL
-                                AND (3959 * acos(cos(radians(%s)) * cos(radians(latitude)) * 
-                                cos(radians(longitude) - radians(%s)) + sin(radians(%s)) * 
-                                sin(radians(latitude)))) < %s
-                            """
-                            params = list(filtered_provider_ids) + [
-                                lat_coord,
-                                lng_coord,
-                                lat_coord,
-                                radius,
-                            ]
-                            cursor.execute(sql, params)
-                            nearby_ids = [row[0] for row in cursor.fetchall()]
-
-                        providers = providers.filter(id__in=nearby_ids)
-                    else:
-                        # If no providers match the non-geographic filters, return empty queryset
-                        providers = providers.none()
-
-            # Apply age filtering
-            if age:
-                # "All Ages" means no age filter - user wants all providers regardless of age
-                # Also skip filter if user explicitly selects "All Ages" as they want to see everything
-                if age.lower() == "all ages":
-                    # No filtering - return all providers regardless of age groups
-                    pass
-                else:
-                    # Filter by specific age group
-                    # Include providers that:
-                    # 1. Have the specific age group in their age_groups array
-                    # 2. Have "All Ages" in their array (they serve all ages)
-                    # 3. Have NULL age_groups (defaulted to "All Ages" in serializer)
-                    age_filtered = providers.filter(
-                        Q(age_groups__contains=[age])
-                        | Q(age_groups__contains=["All Ages"])
-                        | Q(age_groups__isnull=True)
-                    )
-                    if age_filtered.exists():
-                        providers = age_filtered
-                    # If no providers match age filter, keep all providers (lenient approach)
+            providers = self._search_queryset(request.query_params)
 
             # Apply limit - increased to support larger radius searches
             providers = providers[:1000]  # Support large radius searches
 
-            print(
-                f"✅ [comprehensive_search] Final provider count after all filters: {len(providers)}"
-            )
+            logger.debug("comprehensive_search: %d providers after filters", len(providers))
 
             serializer = self.get_serializer(providers, many=True)
             return Response(serializer.data)
 
         except Exception as e:
-            # Log the full error for debugging
-            import traceback
+            logger.exception("Error in comprehensive_search")
 
-            print("\n" + "=" * 80)
-            print("❌ ERROR in comprehensive_search:")
-            print(f"Error type: {type(e).__name__}")
-            print(f"Error message: {str(e)}")
-            print("Full traceback:")
-            traceback.print_exc()
-            print("=" * 80 + "\n")
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @action(detail=False, methods=["post"])
+    def search_batch(self, request):
+        """
+        Several comprehensive_search queries in one request.
+        Body:
+        - searches: list of objects with comprehensive_search parameters
+          (q, location, radius, lat, lng, age, diagnosis, specialization,
+          insurance as a string or list); max 25
+        - limit: providers returned per search (default 10, max 100)
+        Returns {"results": [{"count": n, "providers": [...]}]} in request
+        order; count is the number of matches before the limit (max 1000).
+
+        The deduplicated provider set is computed once for the whole batch
+        and every returned provider is loaded and serialized once.
+        """
+        searches = request.data.get("searches")
+        if not isinstance(searches, list) or not searches:
+            return Response(
+                {"error": "searches must be a non-empty list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(searches) > MAX_BATCH_SEARCHES:
+            return Response(
+                {"error": f"At most {MAX_BATCH_SEARCHES} searches per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            limit = max(1, min(int(request.data.get("limit", 10)), 100))
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "limit must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
+        try:
+            base = self.get_queryset()
+            matches = []
+            for search in searches:
+                if not isinstance(search, dict):
+                    return Response(
+                        {"error": "Each search must be an object"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                providers = self._search_queryset(search_query_dict(search), base=base)
+                matches.append(list(providers.values_list("id", flat=True)[:1000]))
+
+            shown = {pk for ids in matches for pk in ids[:limit]}
+            providers = list(ProviderV2.objects.filter(id__in=shown))
+            serialized = {
+                provider.pk: data
+                for provider, data in zip(
+                    providers, self.get_serializer(providers, many=True).data
+                )
+            }
+            return Response(
+                {
+                    "results": [
+                        {
+                            "count": len(ids),
+                            "providers": [serialized[pk] for pk in ids[:limit]],
+                        }
+                        for ids in matches
+                    ]
+                }
+            )
+
+        except ValueError:
+            return Response(
+                {"error": "Invalid numeric values"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
@@ -1274,11 +1413,7 @@ class ProviderV2ViewSet(viewsets.ModelViewSet):
                 from locations.models import ProviderInsuranceCarrier, InsuranceCarrier
 
                 insurance_lower = insurance.lower()
-                if insurance_lower in [
-                    "insurance",
-                    "accepts insurance",
-                    "private insurance",
-                ]:
+                if insurance_lower in GENERIC_INSURANCE:
                     # Get all providers that accept ANY insurance
                     insurance_provider_ids = (
                         ProviderInsuranceCarrier.objects.values_list(
@@ -1363,16 +1498,7 @@ class ProviderV2ViewSet(viewsets.ModelViewSet):
                 {"error": "Regional center not found"}, status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            # Log the full error for debugging
-            import traceback
-
-            print("\n" + "=" * 80)
-            print("❌ ERROR in by_regional_center:")
-            print(f"Error type: {type(e).__name__}")
-            print(f"Error message: {str(e)}")
-            print("Full traceback:")
-            traceback.print_exc()
-            print("=" * 80 + "\n")
+            logger.exception("Error in by_regional_center")
 
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1397,34 +1523,49 @@ class ProviderV2ViewSet(viewsets.ModelViewSet):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    # comprehensive_search parameters that narrow the provider set
+    SEARCH_FILTER_PARAMS = (
+        "q",
+        "location",
+        "lat",
+        "lng",
+        "age",
+        "diagnosis",
+        "insurance",
+        "specialization",
+        "therapy",
+    )
+
     @action(detail=False, methods=["get"])
     def filters(self, request):
-        """Get available filter options"""
+        """
+        Get available filter options with provider counts per value.
+        Accepts the comprehensive_search parameters (q, location/lat/lng,
+        radius, age, diagnosis, insurance, specialization, therapy); when
+        any is given, counts are scoped to the matching providers.
+        """
+        from .utils.facets import get_provider_facets, get_scoped_provider_facets
+
         try:
-            # Get unique values for common filters
-            specializations = set()
-            insurance_types = set()
-            areas = set()
-
-            for provider in ProviderV2.objects.all():
-                if provider.specializations:
-                    specializations.update(
-                        [s.strip() for s in provider.specializations.split(",")]
-                    )
-                if provider.insurance_accepted:
-                    insurance_types.update(
-                        [i.strip() for i in provider.insurance_accepted.split(",")]
-                    )
-                if provider.coverage_areas:
-                    areas.update(
-                        [a.strip() for a in provider.coverage_areas.split(",")]
-                    )
+            params = request.query_params
+            scoped = any(params.get(name) for name in self.SEARCH_FILTER_PARAMS)
+            if scoped:
+                filters = {name: params.getlist(name) for name in params}
+                index = get_scoped_provider_facets(
+                    lambda: self._search_queryset(params), filters
+                )
+            else:
+                index = get_provider_facets(self.get_queryset)
 
+            facets = index["facets"]
             return Response(
                 {
-                    "specializations": sorted(list(specializations)),
-                    "insurance_types": sorted(list(insurance_types)),
-                    "coverage_areas": sorted(list(areas)),
+                    "specializations": sorted(f["value"] for f in facets["specializations"]),
+                    "insurance_types": sorted(f["value"] for f in facets["insurance_carriers"]),
+                    "coverage_areas": sorted(f["value"] for f in facets["regional_centers"]),
+                    "facets": facets,
+                    "scoped": scoped,
+                    "version": index["version"],
                 }
             )
 
@@ -1434,6 +1575,71 @@ class ProviderV2ViewSet(viewsets.ModelViewSet):
             )
 
 
+def search_query_dict(search):
+    """comprehensive_search parameters from a JSON object; list values repeat."""
+    params = QueryDict(mutable=True)
+    for field in BATCH_SEARCH_FIELDS:
+        value = search.get(field)
+        if value in (None, "", []):
+            continue
+        values = value if isinstance(value, list) else [value]
+        params.setlist(field, [str(v) for v in values])
+    return params
+
+
+def provider_search_querysets(param_sets):
+    """
+    comprehensive_search's filtering outside a request, one queryset per
+    QueryDict in ``param_sets`` over a shared deduplicated base. Used by
+    in-process callers such as the kindd_mcp local backend.
+    """
+    view = ProviderV2ViewSet(action="comprehensive_search")
+    base = view.get_queryset()
+    return [view._search_queryset(params, base=base) for params in param_sets]
+
+
+@api_view(["GET"])
+def nearby(request):
+    """
+    Every map layer around one point in a single request and query
+    (see locations/utils/nearby.py).
+    Query parameters:
+    - lat, lng: Point (or zip / location instead)
+    - zip: ZIP code, resolved with the local gazetteer
+    - location: City or address, resolved with the local gazetteer
+    - radius: Search radius in miles (default: 10, max: 50)
+    - layers: Comma-separated layer[:limit] list, e.g. providers:20,hmgl,service_area
+      (default: every layer at its default limit)
+    """
+    from .utils.gazetteer import get_gazetteer
+    from .utils.nearby import available_layers, get_nearby, parse_layers
+
+    params = request.query_params
+    try:
+        radius = float(params.get("radius", 10))
+        layers = parse_layers(params.get("layers"), available_layers())
+        if params.get("lat") and params.get("lng"):
+            lat, lng = float(params["lat"]), float(params["lng"])
+        else:
+            text = params.get("zip") or params.get("location")
+            if not text:
+                return Response(
+                    {"error": "lat and lng, zip, or location is required"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            coordinates = get_gazetteer().coordinates(text)
+            if not coordinates:
+                return Response(
+                    {"error": f"Could not resolve location: {text}"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            lat, lng = coordinates
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(get_nearby(lat, lng, radius, layers))
+
+
 @api_view(["GET"])
 def california_counties(request):
     """
@@ -1509,6 +1715,25 @@ def api_documentation(request):
             "insurance_carriers": f"{base_url}insurance-carriers/",
             "service_models": f"{base_url}service-models/",
         },
+        "map_endpoints": {
+            "description": "Combined map data in one request",
+            "endpoints": {
+                "nearby": {
+                    "url": f"{base_url}nearby/",
+                    "method": "GET",
+                    "description": "Providers, regional centers, the containing service area, HMGL and locations near a point, one query, cached per geohash cell",
+                    "parameters": {
+                        "lat": "Latitude (or zip / location)",
+                        "lng": "Longitude (or zip / location)",
+                        "zip": "ZIP code",
+                        "location": "City or address",
+                        "radius": "Search radius in miles (default: 10, max: 50)",
+                        "layers": "layer[:limit] list: providers, regional_centers, service_area, hmgl, locations",
+                    },
+                    "example": f"{base_url}nearby/?zip=91101&layers=providers:20,service_area,hmgl:10",
+                },
+            },
+        },
         "broken_endpoints": {
             "description": "These endpoints exist in the router but return 500 errors - they should be removed or fixed",
             "endpoints": [
@@ -1535,6 +1760,13 @@ def api_documentation(request):
                     "parameters": {"zip_code": "5-digit ZIP code (required)"},
                     "example": f"{base_url}regional-centers/lookup_by_zip/?zip_code=90001",
                 },
+                "by_zip_codes": {
+                    "url": f"{base_url}regional-centers/by_zip_codes/",
+                    "method": "GET",
+                    "description": "Regional Center for each of several ZIP codes in one request",
+                    "parameters": {"zip_codes": "Comma-separated ZIP codes (required, max 100)"},
+                    "example": f"{base_url}regional-centers/by_zip_codes/?zip_codes=90001,91101",
+                },
                 "nearby": {
                     "url": f"{base_url}regional-centers/nearby/",
                     "method": "GET",
@@ -1600,6 +1832,16 @@ def api_documentation(request):
                     },
                     "example": f"{base_url}providers-v2/comprehensive_search/?lat=34.0522&lng=-118.2437&radius=25",
                 },
+                "search_batch": {
+                    "url": f"{base_url}providers-v2/search_batch/",
+                    "method": "POST",
+                    "description": "Several comprehensive_search queries in one request",
+                    "parameters": {
+                        "searches": "List of comprehensive_search parameter objects (required, max 25)",
+                        "limit": "Providers returned per search (default: 10, max 100)",
+                    },
+                    "example": '{"searches": [{"q": "speech", "location": "90001"}, {"q": "ABA", "location": "90001"}], "limit": 5}',
+                },
                 "nearby": {
                     "url": f"{base_url}providers-v2/nearby/",
                     "method": "GET",
@@ -1688,8 +1930,8 @@ class HMGLLocationViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = HMGLLocationSerializer
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        RankedSearchFilter,
     ]
     filterset_fields = ["city", "state", "is_county", "organization"]
     search_fields = ["name", "organization", "city", "address1", "description_html"]
@@ -1727,29 +1969,8 @@ class HMGLLocationViewSet(viewsets.ReadOnlyModelViewSet):
         radius = float(request.query_params.get("radius", 25))
         limit = int(request.query_params.get("limit", 50))
 
-        # Use PostGIS spatial query with the geom field
-        from django.contrib.gis.geos import Point
-        from django.contrib.gis.db.models.functions import Distance as DistanceFunc
-
-        point = Point(lng, lat, srid=4326)
-
-        # Convert miles to degrees (approximate: 1 degree ≈ 69 miles at equator)
-        # Works well for California latitudes
-        radius_degrees = radius / 69.0
-
-        # Query locations with geom field using PostGIS (dwithin with degrees)
-        locations = (
-            HMGLLocation.objects.filter(
-                geom__isnull=False, geom__dwithin=(point, radius_degrees)
-            )
-            .annotate(calculated_distance=DistanceFunc("geom", point))
-            .order_by("calculated_distance")[:limit]
-        )
-
-        # Convert distance to miles for serializer
-        for loc in locations:
-            if loc.calculated_distance:
-                loc.calculated_distance = loc.calculated_distance.mi
+        # Geography KNN: true-meter radius, nearest first, distance in miles
+        locations = HMGLLocation.find_nearby(lat, lng, radius, limit)
 
         serializer = HMGLLocationSerializer(locations, many=True)
         return Response(
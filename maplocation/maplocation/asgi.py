@@ -3,6 +3,14 @@ ASGI config for maplocation project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+This is the production entry point (see Procfile / docker-entrypoint.sh):
+
+    gunicorn maplocation.asgi:application -k uvicorn_worker.UvicornWorker
+
+The streaming LLM views return async SSE bodies to ASGI requests
+(llm/streaming.py), which run on the event loop here instead of holding a
+sync worker per stream; WSGI requests get sync bodies.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
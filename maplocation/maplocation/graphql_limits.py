@@ -0,0 +1,188 @@
+"""
+Depth and complexity limits for /graphql/.
+
+Both checks are validation rules, so an over-limit query is rejected
+before any resolver runs. Complexity counts one point per selected field.
+A field returning a list multiplies its sub-selection by its size:
+
+- with a ``limit`` argument, the value the resolver will see: a literal,
+  a ``$variable`` from the request (or its declared default), or the
+  argument's default, capped at ``MAX_LIMIT``;
+- without one, the size registered with :func:`list_size_hint` (a cached
+  row count for root lists such as ``allLocations``), else ``MAX_LIMIT``
+  for a root field and ``DEFAULT_LIST_SIZE`` for a nested relation.
+
+Configure with GRAPHQL_MAX_DEPTH and GRAPHQL_MAX_COMPLEXITY in settings.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphene.validation import depth_limit_validator
+from graphene_django.views import GraphQLView
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLInt,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    Undefined,
+    ValidationRule,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+    parse,
+    validate,
+    value_from_ast,
+)
+
+# Upper bound for every `limit` argument (locations/schema.py clamps to it).
+MAX_LIMIT = 200
+DEFAULT_LIST_SIZE = 10
+LIST_SIZE_CACHE_SECONDS = 300
+
+# "Type.field" -> callable returning the list's real size
+LIST_SIZE_HINTS: Dict[str, Callable[[], int]] = {}
+
+
+def list_size_hint(type_name: str, field_name: str):
+    """Register the size of an unbounded list field (cached LIST_SIZE_CACHE_SECONDS)."""
+
+    def register(size: Callable[[], int]) -> Callable[[], int]:
+        LIST_SIZE_HINTS[f"{type_name}.{field_name}"] = size
+        return size
+
+    return register
+
+
+def _hinted_size(key: str) -> Optional[int]:
+    size = LIST_SIZE_HINTS.get(key)
+    if size is None:
+        return None
+    return cache.get_or_set(f"graphql:list_size:{key}", size, LIST_SIZE_CACHE_SECONDS)
+
+
+def operation_variables(operation: OperationDefinitionNode, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The request's variables over the operation's declared defaults."""
+    values = {}
+    for definition in operation.variable_definitions or ():
+        if definition.default_value is not None:
+            values[definition.variable.name.value] = value_from_ast(definition.default_value, GraphQLInt)
+    values.update(variables or {})
+    return values
+
+
+def _limit_size(argument, node: FieldNode, variables: Dict[str, Any]) -> int:
+    value = Undefined
+    for given in node.arguments or ():
+        if given.name.value != "limit":
+            continue
+        if isinstance(given.value, VariableNode):
+            value = variables.get(given.value.name.value, Undefined)
+        else:
+            value = value_from_ast(given.value, GraphQLInt)
+    if value is Undefined:
+        value = argument.default_value
+    if not isinstance(value, int) or isinstance(value, bool):
+        return MAX_LIMIT  # null or unresolvable: assume the cap
+    return max(1, min(value, MAX_LIMIT))
+
+
+def list_size(schema, parent_type, field, node: FieldNode, variables: Dict[str, Any]) -> int:
+    limit = field.args.get("limit")
+    if limit is not None:
+        return _limit_size(limit, node, variables)
+    hinted = _hinted_size(f"{parent_type.name}.{node.name.value}")
+    if hinted is not None:
+        return max(1, hinted)
+    return MAX_LIMIT if parent_type is schema.query_type else DEFAULT_LIST_SIZE
+
+
+def selection_cost(schema, selection_set, parent_type, fragments, seen=frozenset(), variables=None) -> int:
+    variables = variables or {}
+    cost = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            name = selection.name.value
+            field = getattr(parent_type, "fields", {}).get(name)
+            if field is None or name.startswith("__"):
+                continue
+            child = 0
+            if selection.selection_set is not None:
+                child = selection_cost(
+                    schema, selection.selection_set, get_named_type(field.type), fragments, seen, variables
+                )
+            multiplier = 1
+            if is_list_type(get_nullable_type(field.type)):
+                multiplier = list_size(schema, parent_type, field, selection, variables)
+            cost += 1 + multiplier * child
+        elif isinstance(selection, InlineFragmentNode):
+            condition = selection.type_condition
+            fragment_type = schema.get_type(condition.name.value) if condition else parent_type
+            cost += selection_cost(schema, selection.selection_set, fragment_type, fragments, seen, variables)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = fragments.get(name)
+            if fragment is None or name in seen:
+                continue  # reported by the standard fragment rules
+            fragment_type = schema.get_type(fragment.type_condition.name.value)
+            cost += selection_cost(schema, fragment.selection_set, fragment_type, fragments, seen | {name}, variables)
+    return cost
+
+
+def complexity_limit_validator(max_complexity: int, variables: Optional[Dict[str, Any]] = None):
+    class ComplexityLimitRule(ValidationRule):
+        def enter_operation_definition(self, node, *_args):
+            schema = self.context.schema
+            fragments = {
+                definition.name.value: definition
+                for definition in self.context.document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            }
+            root = schema.get_root_type(node.operation)
+            if root is None:
+                return
+            cost = selection_cost(
+                schema, node.selection_set, root, fragments, variables=operation_variables(node, variables)
+            )
+            if cost > max_complexity:
+                name = node.name.value if node.name else "anonymous"
+                self.report_error(
+                    GraphQLError(
+                        f"'{name}' has complexity {cost}, exceeding the maximum of {max_complexity}.",
+                        node,
+                    )
+                )
+
+    return ComplexityLimitRule
+
+
+def validation_rules(variables: Optional[Dict[str, Any]] = None):
+    return (
+        depth_limit_validator(max_depth=settings.GRAPHQL_MAX_DEPTH),
+        complexity_limit_validator(settings.GRAPHQL_MAX_COMPLEXITY, variables),
+    )
+
+
+class LimitedGraphQLView(GraphQLView):
+    """GraphQLView that enforces the depth and complexity limits."""
+
+    def execute_graphql_request(self, request, data, query, variables, operation_name, show_graphiql=False):
+        if query:
+            try:
+                document = parse(query)
+            except Exception:
+                pass  # the parent view reports syntax errors
+            else:
+                rules = validation_rules(variables if isinstance(variables, dict) else None)
+                errors = validate(self.schema.graphql_schema, document, rules)
+                if errors:
+                    return ExecutionResult(errors=errors)
+        return super().execute_graphql_request(
+            request, data, query, variables, operation_name, show_graphiql
+        )
@@ -0,0 +1,268 @@
+"""
+Shared rate limiter: sliding-window request limits and token buckets.
+
+Every worker consults the same store, so a limit of 30/minute means 30 per
+minute across the deployment rather than per gunicorn worker. With
+RATE_LIMIT_REDIS_URL set the state lives in Redis (or anything speaking
+its protocol and Lua scripting, e.g. Valkey or ElastiCache), and each
+check is one atomic script call. Without it, or when Redis is
+unreachable, each process keeps the same state in memory under a lock.
+A failed Redis call opens a circuit breaker for RATE_LIMIT_BREAKER_SECONDS:
+meanwhile checks go straight to process memory instead of each waiting
+out the socket timeout, and ``is_shared()`` reports False so callers with
+another shared store (the response report throttle's database window)
+can use it.
+
+- ``hit(key, limit, window)``: sliding-window counter. The previous fixed
+  window's count is weighted by how much of it still overlaps the sliding
+  window, which smooths the burst a fixed window allows at its edges.
+- ``take(key, capacity, period, cost)``: token bucket refilled at
+  ``capacity`` per ``period`` seconds. ``allow_debt`` charges even past
+  zero, for costs only known afterwards (Bedrock tokens); a later
+  ``take(..., cost=0)`` is refused until the debt is repaid.
+
+    limiter = get_rate_limiter()
+    if not limiter.hit(f"ask:{ip}", 30, 60).allowed:
+        ...
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "rl:"
+
+
+@dataclass
+class Decision:
+    allowed: bool
+    retry_after: float = 0.0  # seconds until a retry could succeed
+    remaining: float = 0.0
+
+
+# Sliding-window counter. KEYS: current window, previous window.
+# ARGV: limit, window ms, elapsed ms in the current window.
+# Returns {allowed, estimated count before this hit}.
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimated = previous * (window - elapsed) / window + current
+if estimated + 1 > limit then
+  return {0, tostring(estimated)}
+end
+redis.call('INCR', KEYS[1])
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return {1, tostring(estimated)}
+"""
+
+# Token bucket. KEYS: bucket hash.
+# ARGV: capacity, refill per ms, now ms, cost, allow debt (0/1).
+# Returns {allowed, tokens left}.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if ARGV[5] == '1' or tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - math.min(tokens, 0)) / rate) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class MemoryBackend:
+    """Per-process state with the same semantics as the Redis scripts."""
+
+    max_keys = 10_000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key -> (window index, current count, previous count, window ms)
+        self._windows: Dict[str, Tuple[int, int, int, int]] = {}
+        # key -> (tokens, updated ms, expires ms)
+        self._buckets: Dict[str, Tuple[float, int, int]] = {}
+
+    def _prune(self, now_ms: int) -> None:
+        """Drop idle keys, like the Redis expiries."""
+        if len(self._windows) > self.max_keys:
+            self._windows = {
+                key: state for key, state in self._windows.items() if now_ms < (state[0] + 2) * state[3]
+            }
+        if len(self._buckets) > self.max_keys:
+            self._buckets = {key: state for key, state in self._buckets.items() if now_ms < state[2]}
+
+    def sliding_window(self, key: str, limit: int, window_ms: int, now_ms: int) -> Tuple[bool, float]:
+        index, elapsed = divmod(now_ms, window_ms)
+        with self._lock:
+            stored_index, current, previous, _ = self._windows.get(key, (index, 0, 0, window_ms))
+            if stored_index != index:
+                previous = current if stored_index == index - 1 else 0
+                current = 0
+            estimated = previous * (window_ms - elapsed) / window_ms + current
+            allowed = estimated + 1 <= limit
+            self._windows[key] = (index, current + allowed, previous, window_ms)
+            self._prune(now_ms)
+        return allowed, estimated
+
+    def token_bucket(
+        self, key: str, capacity: float, rate_per_ms: float, now_ms: int, cost: float, allow_debt: bool
+    ) -> Tuple[bool, float]:
+        with self._lock:
+            tokens, ts, _ = self._buckets.get(key, (capacity, now_ms, 0))
+            tokens = min(capacity, tokens + max(0, now_ms - ts) * rate_per_ms)
+            allowed = allow_debt or tokens >= cost
+            if allowed:
+                tokens -= cost
+            expires = now_ms + math.ceil((capacity - min(tokens, 0)) / rate_per_ms) + 1000
+            self._buckets[key] = (tokens, now_ms, expires)
+            self._prune(now_ms)
+        return allowed, tokens
+
+
+class RedisBackend:
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+        self._sliding_window = self.client.register_script(SLIDING_WINDOW_SCRIPT)
+        self._token_bucket = self.client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def sliding_window(self, key: str, limit: int, window_ms: int, now_ms: int) -> Tuple[bool, float]:
+        index, elapsed = divmod(now_ms, window_ms)
+        # The hash tag keeps both windows in one cluster slot.
+        keys = [f"{KEY_PREFIX}{{{key}}}:{index}", f"{KEY_PREFIX}{{{key}}}:{index - 1}"]
+        allowed, estimated = self._sliding_window(keys=keys, args=[limit, window_ms, elapsed])
+        return bool(allowed), float(estimated)
+
+    def token_bucket(
+        self, key: str, capacity: float, rate_per_ms: float, now_ms: int, cost: float, allow_debt: bool
+    ) -> Tuple[bool, float]:
+        allowed, tokens = self._token_bucket(
+            keys=[f"{KEY_PREFIX}{key}"],
+            args=[capacity, repr(rate_per_ms), now_ms, cost, int(allow_debt)],
+        )
+        return bool(allowed), float(tokens)
+
+
+class SharedLimiterUnavailable(RuntimeError):
+    """The shared backend is down and the caller asked not to fall back to process state."""
+
+
+class RateLimiter:
+    def __init__(self, backend=None, breaker_seconds: Optional[float] = None):
+        self.backend = backend or MemoryBackend()
+        # Used for a call when the shared backend is unreachable.
+        self.fallback = self.backend if isinstance(self.backend, MemoryBackend) else MemoryBackend()
+        if breaker_seconds is None:
+            breaker_seconds = getattr(settings, "RATE_LIMIT_BREAKER_SECONDS", 10)
+        self.breaker_seconds = breaker_seconds
+        self._open_until = 0.0  # time.monotonic() before which the backend is skipped
+
+    def shared_available(self) -> bool:
+        """A shared backend that is not behind an open breaker."""
+        return self.backend is not self.fallback and time.monotonic() >= self._open_until
+
+    def _call(self, method: str, *args, fallback: bool = True):
+        if self.backend is not self.fallback and time.monotonic() < self._open_until:
+            if not fallback:
+                raise SharedLimiterUnavailable("shared rate limiter circuit is open")
+            return getattr(self.fallback, method)(*args)
+        try:
+            return getattr(self.backend, method)(*args)
+        except Exception as exc:
+            if self.backend is self.fallback:
+                raise
+            self._open_until = time.monotonic() + self.breaker_seconds
+            logger.warning(
+                "Shared rate limiter unavailable, using process-local state for %ss: %s",
+                self.breaker_seconds,
+                exc,
+            )
+            if not fallback:
+                raise SharedLimiterUnavailable(str(exc)) from exc
+            return getattr(self.fallback, method)(*args)
+
+    def hit(self, key: str, limit: int, window_seconds: float, fallback: bool = True) -> Decision:
+        """
+        Count one request against ``limit`` per ``window_seconds``. With
+        ``fallback=False`` an unavailable shared backend raises
+        :class:`SharedLimiterUnavailable` instead of counting in process.
+        """
+        window_ms = max(1, int(window_seconds * 1000))
+        now_ms = int(time.time() * 1000)
+        allowed, estimated = self._call("sliding_window", key, limit, window_ms, now_ms, fallback=fallback)
+        if allowed:
+            return Decision(True, remaining=max(0.0, limit - estimated - 1))
+        # Wait for the current window to end: the previous one's weight
+        # then starts draining.
+        return Decision(False, retry_after=(window_ms - now_ms % window_ms) / 1000)
+
+    def take(
+        self,
+        key: str,
+        capacity: float,
+        period_seconds: float,
+        cost: float = 1.0,
+        allow_debt: bool = False,
+    ) -> Decision:
+        """Take ``cost`` from a bucket refilled at ``capacity`` per ``period_seconds``."""
+        rate_per_ms = capacity / (period_seconds * 1000)
+        now_ms = int(time.time() * 1000)
+        allowed, tokens = self._call("token_bucket", key, capacity, rate_per_ms, now_ms, cost, allow_debt)
+        if allowed:
+            return Decision(True, remaining=tokens)
+        return Decision(False, retry_after=math.ceil((cost - tokens) / rate_per_ms) / 1000, remaining=tokens)
+
+
+def _build_backend():
+    url = getattr(settings, "RATE_LIMIT_REDIS_URL", "")
+    if not url:
+        return MemoryBackend()
+    try:
+        return RedisBackend(url)
+    except ImportError:
+        logger.warning("RATE_LIMIT_REDIS_URL is set but the redis package is not installed")
+        return MemoryBackend()
+
+
+_limiter: Optional[RateLimiter] = None
+_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _limiter
+    if _limiter is None:
+        with _lock:
+            if _limiter is None:
+                _limiter = RateLimiter(_build_backend())
+    return _limiter
+
+
+def reset_rate_limiter() -> None:
+    global _limiter
+    with _lock:
+        _limiter = None
+
+
+def is_shared() -> bool:
+    """Whether limits are enforced across processes (a reachable Redis backend)."""
+    limiter = get_rate_limiter()
+    return isinstance(limiter.backend, RedisBackend) and limiter.shared_available()
@@ -0,0 +1,266 @@
+"""
+Per-request instrumentation: SQL query count and time, cache hits and
+misses, geocoding calls, and time spent in Bedrock and Tavily.
+
+``RequestProfileMiddleware`` profiles a sampled share of requests
+(REQUEST_PROFILE_SAMPLE_RATE; every request under DEBUG). A profiled
+response gets a ``Server-Timing`` header, one structured log line on this
+module's logger, and, with REQUEST_PROFILE_OTEL on, an OpenTelemetry span
+exported through the Langfuse OTLP endpoint that
+``llm.observability.configure_langfuse_otel`` sets up.
+
+Outside the middleware, the same numbers are available from the
+context-manager API:
+
+    with profile() as p:            # a management command, a shell session
+        RegionalCenter.find_by_zip_code("90001")
+    p.as_dict()
+
+    with timed("bedrock"):          # instrumentation points; no-ops unless
+        ...                         # a profile is active
+    incr("cache_hit")
+
+Unprofiled requests pay one context-variable lookup per SQL query and
+cache read.
+"""
+
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)
+_MISSING = object()
+
+
+@dataclass
+class RequestProfile:
+    """Counters and timings collected while the profile is active."""
+
+    started: float = field(default_factory=time.perf_counter)
+    total_ms: float = 0.0
+    queries: int = 0
+    db_ms: float = 0.0
+    counters: Dict[str, int] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def incr(self, name: str, count: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + count
+
+    def add_time(self, name: str, ms: float, count: int = 1) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + ms
+        self.incr(name, count)
+
+    def finish(self) -> None:
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+
+    def as_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "total_ms": round(self.total_ms, 2),
+            "db_queries": self.queries,
+            "db_ms": round(self.db_ms, 2),
+        }
+        data.update(self.counters)
+        data.update({f"{name}_ms": round(ms, 2) for name, ms in self.timings.items()})
+        return data
+
+    def server_timing(self) -> str:
+        """The ``Server-Timing`` header value."""
+        metrics = [
+            f"total;dur={self.total_ms:.1f}",
+            f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"',
+        ]
+        metrics += [
+            f'{name};dur={ms:.1f};desc="{self.counters.get(name, 0)} calls"'
+            for name, ms in self.timings.items()
+        ]
+        hits, misses = self.counters.get("cache_hit", 0), self.counters.get("cache_miss", 0)
+        if hits or misses:
+            metrics.append(f'cache;desc="{hits} hits, {misses} misses"')
+        return ", ".join(metrics)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    return _current.get()
+
+
+def incr(name: str, count: int = 1) -> None:
+    """Bump a counter on the active profile, if any."""
+    request_profile = _current.get()
+    if request_profile is not None:
+        request_profile.incr(name, count)
+
+
+@contextmanager
+def timed(name: str, count: int = 1) -> Iterator[None]:
+    """Add the block's wall time (and ``count`` calls) under ``name``."""
+    request_profile = _current.get()
+    if request_profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        request_profile.add_time(name, (time.perf_counter() - started) * 1000, count)
+
+
+@contextmanager
+def profile() -> Iterator[RequestProfile]:
+    """Profile everything the block does on this thread or task."""
+    install()
+    request_profile = RequestProfile()
+    token = _current.set(request_profile)
+    try:
+        yield request_profile
+    finally:
+        request_profile.finish()
+        _current.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+
+def _query_wrapper(execute, sql, params, many, context):
+    request_profile = _current.get()
+    if request_profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        request_profile.queries += 1
+        request_profile.db_ms += (time.perf_counter() - started) * 1000
+
+
+def _wrap_connection(connection, **kwargs) -> None:
+    if _query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_query_wrapper)
+
+
+_installed = False
+
+
+def install() -> None:
+    """Wrap SQL execution on every current and future connection (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    connection_created.connect(_wrap_connection, dispatch_uid="request_profile")
+    for connection in connections.all(initialized_only=True):
+        _wrap_connection(connection)
+    _installed = True
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class InstrumentedCacheMixin:
+    """
+    Counts ``cache_hit`` / ``cache_miss`` for reads made under a profile
+    (``get_many`` goes through ``get`` on the stock backends).
+    """
+
+    def get(self, key, default=None, version=None):
+        request_profile = _current.get()
+        if request_profile is None:
+            return super().get(key, default, version)
+        value = super().get(key, _MISSING, version)
+        request_profile.incr("cache_miss" if value is _MISSING else "cache_hit")
+        return default if value is _MISSING else value
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# OpenTelemetry
+# ---------------------------------------------------------------------------
+
+_tracer: Any = None
+
+
+def _get_tracer():
+    """A tracer on the global provider, exporting to Langfuse if nothing else set one up."""
+    global _tracer
+    if _tracer is None:
+        try:
+            from opentelemetry import trace
+            from opentelemetry.sdk.trace import TracerProvider
+        except ImportError:
+            logger.warning("REQUEST_PROFILE_OTEL is on but opentelemetry-sdk is not installed")
+            _tracer = False
+            return None
+
+        from llm.observability import configure_langfuse_otel
+
+        if configure_langfuse_otel() and not isinstance(trace.get_tracer_provider(), TracerProvider):
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+            provider = TracerProvider()
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+            trace.set_tracer_provider(provider)
+        _tracer = trace.get_tracer(__name__)
+    return _tracer or None
+
+
+def _export_span(name: str, started_ns: int, attributes: Dict[str, Any]) -> None:
+    tracer = _get_tracer()
+    if tracer is None:
+        return
+    span = tracer.start_span(name, start_time=started_ns)
+    span.set_attributes({f"request_profile.{key}": value for key, value in attributes.items()})
+    span.end()
+
+
+# ---------------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------------
+
+
+class RequestProfileMiddleware:
+    """Profiles a sample of requests; see the module docstring."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install()
+
+    def __call__(self, request):
+        rate = 1.0 if settings.DEBUG else getattr(settings, "REQUEST_PROFILE_SAMPLE_RATE", 0.0)
+        if rate <= 0 or random.random() >= rate:
+            return self.get_response(request)
+
+        started_ns = time.time_ns()
+        with profile() as request_profile:
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match else request.path
+        attributes = {
+            "method": request.method,
+            "route": route,
+            "status": response.status_code,
+            **request_profile.as_dict(),
+        }
+        if getattr(settings, "REQUEST_PROFILE_SERVER_TIMING", True):
+            response["Server-Timing"] = request_profile.server_timing()
+        logger.info("Request profile", extra=attributes)
+        if getattr(settings, "REQUEST_PROFILE_OTEL", False):
+            _export_span(f"{request.method} {route}", started_ns, attributes)
+        return response
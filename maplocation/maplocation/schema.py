@@ -3,7 +3,7 @@ import locations.schema
 import users.schema
 
 
-class Query(users.schema.Query, graphene.ObjectType):
+class Query(users.schema.Query, locations.schema.Query, graphene.ObjectType):
     pass
 
 
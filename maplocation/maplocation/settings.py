@@ -65,8 +65,13 @@ INSTALLED_APPS = [
 
 # GraphQL settings
 GRAPHENE = {"SCHEMA": "maplocation.schema.schema"}
+# Queries over these limits are rejected before execution (maplocation/graphql_limits.py)
+GRAPHQL_MAX_DEPTH = int(os.environ.get("GRAPHQL_MAX_DEPTH", "8"))
+GRAPHQL_MAX_COMPLEXITY = int(os.environ.get("GRAPHQL_MAX_COMPLEXITY", "5000"))
 
 MIDDLEWARE = [
+    # First, so profiled timings cover every other middleware
+    "maplocation.request_profile.RequestProfileMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "maplocation.middleware.BasicAuthMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -285,7 +290,8 @@ BASIC_AUTH_PASSWORD = os.environ.get("BASIC_AUTH_PASSWORD", "")
 # Each Gunicorn worker has its own cache, which is fine for our use case
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        # LocMemCache that counts hits/misses for request profiles
+        "BACKEND": "maplocation.request_profile.InstrumentedLocMemCache",
         "LOCATION": "unique-snowflake",
         "TIMEOUT": 300,  # 5 minutes default timeout
         "OPTIONS": {
@@ -299,6 +305,30 @@ CACHE_TIMEOUT_REGIONAL_CENTERS = 3600  # 1 hour - rarely changes
 CACHE_TIMEOUT_SERVICE_AREAS = 3600  # 1 hour - rarely changes
 CACHE_TIMEOUT_PROVIDERS = 300  # 5 minutes - may change more often
 CACHE_TIMEOUT_PROVIDER_SEARCH = 60  # 1 minute - search results
+# Facet/filter-option indexes, keyed on a version read from the database
+# (locations/utils/facets.py); each process re-reads it at most this often
+CACHE_TIMEOUT_FACETS = 3600
+VERSION_CHECK_SECONDS = int(os.environ.get("VERSION_CHECK_SECONDS", "5"))
+# /api/nearby/ combined map layers, cached per geohash cell
+CACHE_TIMEOUT_NEARBY = 300
+# Geohash length for /api/nearby/ point snapping (7 ~ 150 m cells)
+NEARBY_GEOHASH_PRECISION = int(os.environ.get("NEARBY_GEOHASH_PRECISION", "7"))
+
+# ============================================================================
+# Geocoding (locations/utils/geocoder.py)
+# ============================================================================
+MAPBOX_ACCESS_TOKEN = os.environ.get("MAPBOX_ACCESS_TOKEN", "")
+# mapbox | nominatim | stub. Empty picks mapbox when a token is set.
+GEOCODER_BACKEND = os.environ.get("GEOCODER_BACKEND", "")
+GEOCODER_RATE_PER_SECOND = float(os.environ.get("GEOCODER_RATE_PER_SECOND", "10"))
+GEOCODER_CONCURRENCY = int(os.environ.get("GEOCODER_CONCURRENCY", "8"))
+# Unresolvable addresses are retried after this many days.
+GEOCODER_MISS_TTL_DAYS = int(os.environ.get("GEOCODER_MISS_TTL_DAYS", "30"))
+
+# Service area GeoJSON for point-in-polygon lookups when the database has no
+# PostGIS (locations/utils/service_areas.py), e.g.
+# ../map-frontend/public/assets/geo/la_rc_7.geojson
+SERVICE_AREAS_GEOJSON = os.environ.get("SERVICE_AREAS_GEOJSON", "")
 
 # ============================================================================
 # AWS Configuration
@@ -318,6 +348,30 @@ LLM_TEMPERATURE = 0.3
 AUTISM_RAG_API_URL = os.environ.get("AUTISM_RAG_API_URL", "http://127.0.0.1:8000")
 AUTISM_RAG_TIMEOUT_SECONDS = int(os.environ.get("AUTISM_RAG_TIMEOUT_SECONDS", "45"))
 
+# ============================================================================
+# Rate limiting (maplocation/rate_limit.py, llm/throttles.py)
+# ============================================================================
+# Shared limiter store, e.g. redis://cache.example:6379/0. Empty keeps the
+# state per process, so LLM throttle limits apply per worker.
+RATE_LIMIT_REDIS_URL = os.environ.get("RATE_LIMIT_REDIS_URL", "")
+# After a failed Redis call, skip Redis (process-local state) for this long
+RATE_LIMIT_BREAKER_SECONDS = float(os.environ.get("RATE_LIMIT_BREAKER_SECONDS", "10"))
+# Bedrock tokens (input + output) per minute across all workers; 0 disables
+BEDROCK_TOKENS_PER_MINUTE = int(os.environ.get("BEDROCK_TOKENS_PER_MINUTE", "0"))
+
+# ============================================================================
+# Request profiling (maplocation/request_profile.py)
+# ============================================================================
+# Share of requests profiled (0-1): SQL, cache, geocoding and Bedrock/Tavily
+# time. DEBUG profiles every request.
+REQUEST_PROFILE_SAMPLE_RATE = float(os.environ.get("REQUEST_PROFILE_SAMPLE_RATE", "0.01"))
+# Add a Server-Timing header to profiled responses
+REQUEST_PROFILE_SERVER_TIMING = (
+    os.environ.get("REQUEST_PROFILE_SERVER_TIMING", "true").lower() == "true"
+)
+# Export profiled requests as OpenTelemetry spans (Langfuse OTLP endpoint)
+REQUEST_PROFILE_OTEL = os.environ.get("REQUEST_PROFILE_OTEL", "false").lower() == "true"
+
 # ============================================================================
 # Logging
 # ============================================================================
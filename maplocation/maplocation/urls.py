@@ -27,7 +27,8 @@ from drf_spectacular.views import (
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
-from graphene_django.views import GraphQLView
+
+from .graphql_limits import LimitedGraphQLView
 
 # Customize admin site
 admin.site.site_header = "CHLA Provider Portal"
@@ -52,7 +53,7 @@ urlpatterns = [
         SpectacularRedocView.as_view(url_name="schema"),
         name="redoc",
     ),
-    path("graphql/", csrf_exempt(GraphQLView.as_view(graphiql=True))),
+    path("graphql/", csrf_exempt(LimitedGraphQLView.as_view(graphiql=True))),
     path(
         "basic/", TemplateView.as_view(template_name="vue_app/basic.html"), name="basic"
     ),
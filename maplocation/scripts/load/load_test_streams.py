@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Concurrent SSE stream load test: how many chat streams one worker carries
+while the map API stays responsive.
+
+Opens ``--streams`` concurrent POSTs to a streaming LLM endpoint and, while
+they run, probes a cheap GET endpoint every ``--probe-interval`` seconds.
+Under the WSGI sync worker each stream pins a worker thread, so probes
+queue behind the streams. Under ASGI (uvicorn workers) probe latency
+should stay flat until the Bedrock side is saturated.
+
+    # one worker so the numbers are per worker
+    gunicorn maplocation.asgi:application -k uvicorn_worker.UvicornWorker -w 1
+    python scripts/load/load_test_streams.py --streams 1,10,25,50
+
+    # compare with the WSGI deployment
+    gunicorn maplocation.wsgi:application -w 1 --threads 2
+    python scripts/load/load_test_streams.py --streams 1,10,25
+
+Needs httpx (installed with langsmith). Streams call Bedrock, so point it
+at a non-production environment.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_BODY = {
+    "query": "What ABA providers near 91101 accept Medi-Cal?",
+    "context": {"zip_code": "91101"},
+    "locale": "en",
+}
+
+
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def run_stream(client, url, body):
+    started = time.perf_counter()
+    first_event = None
+    events = 0
+    async with client.stream("POST", url, json=body) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.startswith("data: "):
+                events += 1
+                if first_event is None:
+                    first_event = time.perf_counter() - started
+    return first_event, time.perf_counter() - started, events
+
+
+async def probe(client, url, interval, stop, latencies):
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            await client.get(url)
+            latencies.append(time.perf_counter() - started)
+        except httpx.HTTPError:
+            latencies.append(float("inf"))
+        await asyncio.sleep(interval)
+
+
+async def run_level(base_url, args, concurrency):
+    limits = httpx.Limits(max_connections=concurrency + 5)
+    timeout = httpx.Timeout(args.timeout)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        stop = asyncio.Event()
+        probe_latencies = []
+        prober = asyncio.create_task(
+            probe(client, args.probe_path, args.probe_interval, stop, probe_latencies)
+        )
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(run_stream(client, args.stream_path, DEFAULT_BODY) for _ in range(concurrency)),
+            return_exceptions=True,
+        )
+        wall = time.perf_counter() - started
+        stop.set()
+        await prober
+
+    ok = [r for r in results if not isinstance(r, BaseException)]
+    ttfb = [r[0] for r in ok if r[0] is not None]
+    totals = [r[1] for r in ok]
+    print(
+        f"{concurrency:>5} streams | ok {len(ok):>4} | wall {wall:6.1f}s"
+        f" | first event p50 {percentile(ttfb, 50):5.2f}s p95 {percentile(ttfb, 95):5.2f}s"
+        f" | stream p50 {percentile(totals, 50):5.2f}s"
+        f" | probe p50 {percentile(probe_latencies, 50) * 1000:7.1f}ms"
+        f" p95 {percentile(probe_latencies, 95) * 1000:7.1f}ms"
+    )
+    if len(ok) < len(results):
+        errors = {type(r).__name__ for r in results if isinstance(r, BaseException)}
+        print(f"        errors: {', '.join(sorted(errors))}")
+    return wall, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--stream-path", default="/api/llm/stream/")
+    parser.add_argument("--probe-path", default="/api/health/")
+    parser.add_argument("--streams", default="1,10,25", help="Comma-separated concurrency levels")
+    parser.add_argument("--probe-interval", type=float, default=0.25)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    print(f"Streaming {args.stream_path}, probing {args.probe_path} on {args.base_url}")
+    baseline = None
+    for level in (int(n) for n in args.streams.split(",")):
+        wall, totals = asyncio.run(run_level(args.base_url, args, level))
+        if level == 1 and totals:
+            baseline = totals[0]
+        elif baseline:
+            # 1.0 = every stream ran fully in parallel; `level` = fully serialized.
+            print(f"        serialization factor {wall / baseline:.2f} (ideal 1.00, serial {level})")
+    if totals:
+        print(f"Median stream {statistics.median(totals):.2f}s at the last level")
+
+
+if __name__ == "__main__":
+    main()